@@ -0,0 +1,58 @@
+"""Benchmark rendering of localized game messages.
+
+Compares ``Locale.get`` against calling ``str.format`` on the raw template, which
+is what every call used to do.
+
+Usage: python scripts/bench_locale.py [--number N]
+"""
+
+import timeit
+import argparse
+
+from rich.table import Table
+from rich.console import Console
+
+from llm_werewolf.core.locale import Locale, get_catalog
+
+CASES: list[tuple[str, dict[str, object]]] = [
+    ("voting_phase", {}),
+    ("night_begins", {"round_number": 3}),
+    ("player_eliminated", {"player": "Alice", "role": "Seer"}),
+    ("cupid_links", {"player1": "Alice", "player2": "Bob"}),
+]
+
+
+def best_ns(stmt: str, number: int, namespace: dict[str, object]) -> float:
+    """Time a statement and return the best nanoseconds per call over five runs."""
+    timer = timeit.Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main() -> None:
+    """Time ``Locale.get`` for typical messages in every language."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+    console = Console()
+
+    load = best_ns(
+        "get_catalog.cache_clear(); Locale('zh-TW')",
+        20,
+        {"get_catalog": get_catalog, "Locale": Locale},
+    )
+    console.print(f"Load, compile and validate zh-TW: {load / 1000:.0f} us")
+
+    table = Table("language", "key", "str.format (ns)", "Locale.get (ns)")
+    for language in ("en-US", "zh-TW", "zh-CN"):
+        locale = Locale(language)
+        for key, kwargs in CASES:
+            namespace = {"locale": locale, "key": key, "kwargs": kwargs}
+            namespace["text"] = locale.messages[key]
+            baseline = best_ns("text.format(**kwargs)", args.number, namespace)
+            rendered = best_ns("locale.get(key, **kwargs)", args.number, namespace)
+            table.add_row(language, key, f"{baseline:.0f}", f"{rendered:.0f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import random
 from pathlib import Path
 
 import fire
@@ -6,21 +7,165 @@ from rich.console import Console
 
 from llm_werewolf.core import GameEngine
 from llm_werewolf.core.agent import create_agent
+from llm_werewolf.core.types import RoleProtocol, AgentProtocol
 from llm_werewolf.core.utils import load_config
 from llm_werewolf.core.config import create_game_config_from_player_count
-from llm_werewolf.core.locale import Locale
+from llm_werewolf.core.replay import Cassette, save_cassette
+from llm_werewolf.core.archive import GameArchive
+from llm_werewolf.core.journal import EventJournal
+from llm_werewolf.core.tracing import configure_tracing
+from llm_werewolf.core.io_writer import BackgroundWriter
 from llm_werewolf.core.role_registry import create_roles
 from llm_werewolf.ui.console_presenter import ConsolePresenter
 
 console = Console()
 
 
-def main(config: str) -> None:
+def _start_game(
+    engine: GameEngine,
+    players: list[AgentProtocol],
+    roles: list[RoleProtocol],
+    resume: str | None,
+    seed: int | None = None,
+    record: bool = False,
+) -> Cassette | None:
+    """Set up a new game, or restore one from a checkpoint.
+
+    Args:
+        engine: The game engine.
+        players: Agents in configuration order.
+        roles: Role classes for a new game.
+        resume: Checkpoint file to restore, if any.
+        seed: Random seed for a new game, if any.
+        record: Record the agents' responses for a replay; requires a seed.
+
+    Returns:
+        Cassette | None: The cassette being recorded, if any.
+    """
+    if resume:
+        # setup_game numbers players in configuration order
+        agent_factory = {f"player_{idx}": agent for idx, agent in enumerate(players, start=1)}
+        engine.load_checkpoint(resume, agent_factory)
+        return None
+    if record and seed is not None:
+        return engine.setup_recorded_game(players, seed)
+    if seed is not None:
+        random.seed(seed)
+    engine.setup_game(players=players, roles=roles)
+    return None
+
+
+def _attach_writers(
+    engine: GameEngine,
+    journal: str | None,
+    checkpoints: str | None,
+    resume: str | None,
+    binary_checkpoints: bool,
+    delta_checkpoints: int,
+) -> None:
+    """Stream the game to a journal and phase checkpoints, as requested.
+
+    Args:
+        engine: The game engine.
+        journal: Directory to stream every event to, if any.
+        checkpoints: Directory to write phase checkpoints to, if any.
+        resume: Checkpoint file being resumed; its directory gets the new checkpoints
+            when ``checkpoints`` is not set.
+        binary_checkpoints: Write checkpoints in the compact binary format.
+        delta_checkpoints: Full checkpoint every N phases with deltas between; 0 is off.
+    """
+    if journal or checkpoints or resume:
+        # The journal and the checkpoints share one writer thread, in write order
+        engine.io_writer = BackgroundWriter()
+    if journal:
+        engine.journal = EventJournal(journal, writer=engine.io_writer)
+    if checkpoints or resume:
+        engine.checkpoint_dir = Path(checkpoints) if checkpoints else Path(resume).parent
+        engine.binary_checkpoints = binary_checkpoints
+        engine.delta_checkpoints = delta_checkpoints
+
+
+def _save_outputs(
+    engine: GameEngine,
+    archive: str | None,
+    seed: int | None,
+    cassette: Cassette | None,
+    cassette_path: str | None,
+) -> None:
+    """Store a finished game in the archive and write its cassette, as requested.
+
+    Args:
+        engine: The engine that played the game.
+        archive: SQLite database to add the game to, if any.
+        seed: The seed the game was started with, if known.
+        cassette: The recorded cassette, if any.
+        cassette_path: File to write the cassette to, if any.
+    """
+    if archive:
+        with GameArchive(archive) as game_archive:
+            game_id = game_archive.add_game(engine, seed=seed)
+        logfire.info("game_archived", archive=archive, game_id=game_id)
+    if cassette is not None and cassette_path:
+        save_cassette(cassette, cassette_path)
+        logfire.info("cassette_saved", cassette=cassette_path, seed=cassette.seed)
+
+
+def _print_results(engine: GameEngine) -> None:
+    """Print the roles of the surviving and the eliminated players.
+
+    Args:
+        engine: The engine that played the game.
+    """
+    if not engine.game_state:
+        return
+
+    locale = engine.locale
+    console.print(locale.get("alive_players"))
+    for player in engine.game_state.get_alive_players():
+        console.print(
+            locale.get("player_role_info", name=player.name, role=player.get_role_name())
+        )
+
+    console.print(locale.get("dead_players"))
+    for player in engine.game_state.get_dead_players():
+        console.print(
+            locale.get("player_role_info", name=player.name, role=player.get_role_name())
+        )
+
+
+def main(
+    config: str,
+    journal: str | None = None,
+    checkpoints: str | None = None,
+    resume: str | None = None,
+    binary_checkpoints: bool = False,
+    delta_checkpoints: int = 0,
+    archive: str | None = None,
+    seed: int | None = None,
+    cassette: str | None = None,
+    trace: str | None = None,
+) -> None:
     """Run Werewolf game in console mode (auto-play).
 
     Args:
         config: Path to the YAML configuration file
+        journal: Optional directory to stream every game event to as JSON lines
+        checkpoints: Optional directory to write a checkpoint to before every phase
+        resume: Optional checkpoint file to continue a game from; the players must
+            match the configuration the game was started with. A journal that
+            already holds the game is rewound to the checkpoint
+        binary_checkpoints: Write checkpoints in the compact binary format instead of JSON
+        delta_checkpoints: Write only every N-th checkpoint in full and the ones in between
+            as deltas against the previous phase; 0 writes every checkpoint in full
+        archive: Optional SQLite database to add the finished game to
+        seed: Optional random seed for a new game
+        cassette: Optional file to record every agent response to, so the game can be
+            replayed with ``GameEngine.replay``; a seed is picked if none is given
+        trace: Optional OTLP/HTTP collector URL or JSON-lines file to export the game,
+            round, phase, decision and LLM call spans to
     """
+    if trace:
+        configure_tracing(trace)
     config_path = Path(config)
     players_config = load_config(config_path=config_path)
 
@@ -34,51 +179,41 @@ def main(config: str) -> None:
     ]
     roles = create_roles(role_names=game_config.role_names)
 
-    # Initialize locale and game engine with language support
-    locale = Locale(players_config.language)
+    # Initialize game engine with language support and share its locale
     engine = GameEngine(game_config, language=players_config.language)
+    locale = engine.locale
 
     # Set up beautified console presenter
     presenter = ConsolePresenter(locale)
     engine.on_event = presenter.present_event
-
-    engine.setup_game(players=players, roles=roles)
-    logfire.info("game_created", config_path=str(config_path), num_players=num_players)
+    _attach_writers(engine, journal, checkpoints, resume, binary_checkpoints, delta_checkpoints)
+
+    if cassette and seed is None:
+        seed = random.randrange(2**31)  # noqa: S311
+    recording = _start_game(engine, players, roles, resume, seed=seed, record=bool(cassette))
+    logfire.info(
+        "game_resumed" if resume else "game_created",
+        config_path=str(config_path),
+        num_players=num_players,
+        checkpoint=resume,
+    )
 
     console.print(
         f"[green]{locale.get('config_loaded', config_path=config_path.resolve())}[/green]"
     )
+    if resume:
+        console.print(f"[green]{locale.get('game_resumed', checkpoint=resume)}[/green]")
     console.print(f"[cyan]{locale.get('player_count_info', num_players=num_players)}[/cyan]")
     console.print(f"[cyan]{locale.get('interface_mode')}[/cyan]")
 
     try:
         result = engine.play_game()
         console.print(f"\n{result}")
+        _print_results(engine)
 
-        if engine.game_state:
-            alive = engine.game_state.get_alive_players()
-            dead = engine.game_state.get_dead_players()
-
-            console.print(locale.get("alive_players"))
-            for player in alive:
-                console.print(
-                    locale.get("player_role_info", name=player.name, role=player.get_role_name())
-                )
-
-            console.print(locale.get("dead_players"))
-            for player in dead:
-                console.print(
-                    locale.get("player_role_info", name=player.name, role=player.get_role_name())
-                )
-
+        _save_outputs(engine, archive, seed, recording, cassette)
     except KeyboardInterrupt:
-        # Use locale for interruption message
-        if players_config.language == "zh-TW":
-            console.print("\n遊戲已由使用者中止。")
-        elif players_config.language == "zh-CN":
-            console.print("\n游戏已由用户中止。")
-        else:
-            console.print("\nGame interrupted by user.")
+        console.print(locale.get("game_interrupted"))
     except Exception as exc:
         logfire.error(
             "game_execution_error",
@@ -86,14 +221,14 @@ def main(config: str) -> None:
             config_path=str(config_path),
             num_players=num_players,
         )
-        # Use locale for error message
-        if players_config.language == "zh-TW":
-            console.print(f"[red]執行遊戲時發生錯誤: {exc}[/red]")
-        elif players_config.language == "zh-CN":
-            console.print(f"[red]执行游戏时发生错误: {exc}[/red]")
-        else:
-            console.print(f"[red]Error executing game: {exc}[/red]")
+        console.print(f"[red]{locale.get('game_error', error=exc)}[/red]")
         raise
+    finally:
+        if engine.journal is not None:
+            engine.journal.close()
+        if engine.io_writer is not None:
+            engine.io_writer.close()
+        logfire.force_flush()
 
 
 def entry() -> None:
@@ -2,6 +2,7 @@ import re
 import random
 
 from llm_werewolf.core.types import AgentProtocol, PlayerProtocol
+from llm_werewolf.core.tracing import decision_span
 
 
 class ActionSelector:
@@ -274,17 +275,19 @@ class ActionSelector:
             phase,
         )
 
-        try:
-            response = agent.get_response(prompt)
-            target = ActionSelector.parse_target_selection(response, possible_targets, allow_skip)
-
-            if target is not None or allow_skip:
-                return target
+        with decision_span("target", agent, role_name) as span:
+            try:
+                response = agent.get_response(prompt)
+                target = ActionSelector.parse_target_selection(
+                    response, possible_targets, allow_skip
+                )
 
-            if fallback_random:
-                return random.choice(possible_targets)  # noqa: S311
+                if target is not None or allow_skip:
+                    return target
+            except Exception:
+                span.set_attribute("failed", True)
 
-        except Exception:
+            span.set_attribute("fallback", fallback_random)
             if fallback_random:
                 return random.choice(possible_targets)  # noqa: S311
 
@@ -319,11 +322,13 @@ class ActionSelector:
             role_name, question, context, round_number, phase
         )
 
-        try:
-            response = agent.get_response(prompt)
-            return ActionSelector.parse_yes_no(response)
-        except Exception:
-            return False
+        with decision_span("yes_no", agent, role_name) as span:
+            try:
+                response = agent.get_response(prompt)
+                return ActionSelector.parse_yes_no(response)
+            except Exception:
+                span.set_attribute("failed", True)
+                return False
 
     @staticmethod
     def select_target(
@@ -381,7 +386,9 @@ class ActionSelector:
             str: The agent's response.
         """
         full_prompt = f"{context}\n\n{prompt}"
-        try:
-            return agent.get_response(full_prompt)
-        except Exception:
-            return ""
+        with decision_span("free_response", agent) as span:
+            try:
+                return agent.get_response(full_prompt)
+            except Exception:
+                span.set_attribute("failed", True)
+                return ""
@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
+from typing import ClassVar
 
 from llm_werewolf.core.types import ActionType, PlayerProtocol, GameStateProtocol
 
 
 class Action(ABC):
-    """Abstract base class for all game actions."""
+    """Abstract base class for all game actions.
+
+    Subclasses declare how the engine schedules them through class attributes.
+    """
+
+    __slots__ = ("actor", "game_state")
+
+    priority: ClassVar[int] = 0
+    """Resolution priority; higher executes first."""
+
+    blockable: ClassVar[bool] = True
+    """Whether a Nightmare Wolf block prevents the action."""
 
     def __init__(self, actor: PlayerProtocol, game_state: GameStateProtocol) -> None:
         """Initialize the action.
@@ -5,6 +5,8 @@ from llm_werewolf.core.actions.base import Action
 class VoteAction(Action):
     """Action for voting during the day."""
 
+    __slots__ = ("target",)
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -35,6 +37,8 @@ class VoteAction(Action):
 class HunterShootAction(Action):
     """Action for hunter to shoot when dying."""
 
+    __slots__ = ("target",)
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -1,10 +1,21 @@
-from llm_werewolf.core.types import ActionType, PlayerProtocol, GameStateProtocol
+from llm_werewolf.core.types import (
+    Camp,
+    ActionType,
+    Capability,
+    ActionPriority,
+    PlayerProtocol,
+    GameStateProtocol,
+)
 from llm_werewolf.core.actions.base import Action
 
 
 class WitchSaveAction(Action):
     """Action for witch to save a player."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.WITCH
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -45,6 +56,10 @@ class WitchSaveAction(Action):
 class WitchPoisonAction(Action):
     """Action for witch to poison a player."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.WITCH
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -83,6 +98,10 @@ class WitchPoisonAction(Action):
 class SeerCheckAction(Action):
     """Action for seer to check a player."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.SEER
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -104,22 +123,19 @@ class SeerCheckAction(Action):
         """Validate the seer check."""
         return self.actor.is_alive() and self.target.is_alive()
 
-    def execute(self) -> list[str]:
-        """Execute the seer check."""
-        result = self.target.get_camp()
-
-        # HiddenWolf appears as villager to Seer (check by role name)
-        if self.target.role.name == "HiddenWolf":
-            result = "villager"
+    def get_result(self) -> str:
+        """Get the camp the Seer sees for the target.
 
-        # BloodMoonApostle (untransformed) appears as villager to Seer
-        if (
-            self.target.role.name == "Blood Moon Apostle"
-            and hasattr(self.target.role, "transformed")
-            and not self.target.role.transformed
-        ):
-            result = "villager"
+        Returns:
+            str: The target's camp, or villager if the target is disguised.
+        """
+        if self.game_state.capabilities.has(self.target, Capability.APPEARS_AS_VILLAGER):
+            return Camp.VILLAGER.value
+        return self.target.get_camp()
 
+    def execute(self) -> list[str]:
+        """Execute the seer check."""
+        result = self.get_result()
         self.game_state.seer_checked[self.game_state.round_number] = self.target.player_id
         return [f"Seer checks {self.target.name}: {result}"]
 
@@ -127,6 +143,10 @@ class SeerCheckAction(Action):
 class GuardProtectAction(Action):
     """Action for guard to protect a player."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.GUARD
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -168,6 +188,10 @@ class GuardProtectAction(Action):
 class CupidLinkAction(Action):
     """Action for Cupid to link two players as lovers."""
 
+    __slots__ = ("target1", "target2")
+
+    priority = ActionPriority.CUPID
+
     def __init__(
         self,
         actor: PlayerProtocol,
@@ -222,6 +246,10 @@ class CupidLinkAction(Action):
 class RavenMarkAction(Action):
     """Action for Raven to mark a player for extra votes."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.RAVEN
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -252,6 +280,10 @@ class RavenMarkAction(Action):
 class GraveyardKeeperCheckAction(Action):
     """Action for Graveyard Keeper to check a dead player."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.GRAVEYARD_KEEPER
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -285,6 +317,8 @@ class GraveyardKeeperCheckAction(Action):
 class KnightDuelAction(Action):
     """Action for Knight to duel a player during the day."""
 
+    __slots__ = ("target",)
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -1,10 +1,14 @@
-from llm_werewolf.core.types import ActionType, PlayerProtocol, GameStateProtocol
+from llm_werewolf.core.types import ActionType, ActionPriority, PlayerProtocol, GameStateProtocol
 from llm_werewolf.core.actions.base import Action
 
 
 class WerewolfVoteAction(Action):
     """Action for a werewolf to vote for a kill target."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.WEREWOLF
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -35,6 +39,10 @@ class WerewolfVoteAction(Action):
 class WerewolfKillAction(Action):
     """Action for werewolves to kill a player (legacy - kept for compatibility)."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.WEREWOLF
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -65,6 +73,10 @@ class WerewolfKillAction(Action):
 class WhiteWolfKillAction(Action):
     """Action for White Wolf to kill another werewolf."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.WHITE_WOLF
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -118,6 +130,10 @@ class WhiteWolfKillAction(Action):
 class WolfBeautyCharmAction(Action):
     """Action for Wolf Beauty to charm a player."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.WEREWOLF
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -158,6 +174,10 @@ class WolfBeautyCharmAction(Action):
 class GuardianWolfProtectAction(Action):
     """Action for Guardian Wolf to protect a werewolf."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.GUARD
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -192,6 +212,11 @@ class GuardianWolfProtectAction(Action):
 class NightmareWolfBlockAction(Action):
     """Action for Nightmare Wolf to block a player's ability."""
 
+    __slots__ = ("target",)
+
+    priority = ActionPriority.NIGHTMARE_WOLF
+    blockable = False
+
     def __init__(
         self, actor: PlayerProtocol, target: PlayerProtocol, game_state: GameStateProtocol
     ) -> None:
@@ -1,15 +1,28 @@
 import os
 import re
+import time
 import random
 from functools import cached_property
 
 import dotenv
 from openai import OpenAI
-from pydantic import Field, BaseModel, ConfigDict, computed_field
+from pydantic import Field, BaseModel, ConfigDict, PrivateAttr, computed_field
+from openai.types import CompletionUsage
 from rich.console import Console
 from openai.types.shared import ReasoningEffort
 
+from llm_werewolf.core.mcts import (
+    DEFAULT_ROLLOUTS,
+    DEFAULT_MAX_ROUNDS,
+    RolloutSearch,
+    answer_for,
+    parse_options,
+    knowledge_from_beliefs,
+)
 from llm_werewolf.core.config import PlayerConfig
+from llm_werewolf.core.engine import GameEngine
+from llm_werewolf.core.beliefs import BeliefTracker
+from llm_werewolf.core.tracing import trace_span
 
 dotenv.load_dotenv()
 
@@ -171,6 +184,7 @@ class LLMAgent(BaseAgent):
     language: str = Field(...)
     chat_history: list[dict[str, str]] = Field(default=[])
     decision_history: list[str] = Field(default=[])
+    _pending_usage: dict[str, float] = PrivateAttr(default_factory=dict)
 
     @computed_field
     @cached_property
@@ -194,22 +208,59 @@ class LLMAgent(BaseAgent):
         message += f"\nPlease respond in {self.language}."
         self.chat_history.append({"role": "user", "content": message})
 
-        if self.reasoning_effort:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=self.chat_history,
-                reasoning_effort=self.reasoning_effort,
-                stream=False,
-            )
-        else:
-            response = self.client.chat.completions.create(
-                model=self.model, messages=self.chat_history, stream=False
-            )
+        completions = self.client.chat.completions.with_raw_response
+        with trace_span("llm call {model}", model=self.model, player=self.name) as span:
+            started = time.perf_counter()
+            if self.reasoning_effort:
+                raw_response = completions.create(
+                    model=self.model,
+                    messages=self.chat_history,
+                    reasoning_effort=self.reasoning_effort,
+                    stream=False,
+                )
+            else:
+                raw_response = completions.create(
+                    model=self.model, messages=self.chat_history, stream=False
+                )
+            response = raw_response.parse()
+            usage = response.usage
+            self._record_usage(usage, time.perf_counter() - started)
+            span.set_attributes({
+                "prompt_tokens": usage.prompt_tokens if usage else 0,
+                "completion_tokens": usage.completion_tokens if usage else 0,
+                "retries": raw_response.retries_taken,
+            })
 
         full_response = response.choices[0].message.content or ""
         self.chat_history.append({"role": "assistant", "content": full_response})
         return full_response
 
+    def _record_usage(self, usage: CompletionUsage | None, seconds: float) -> None:
+        """Add one model call to the usage reported by ``take_usage``.
+
+        Args:
+            usage: Token counts reported by the API, if any.
+            seconds: Wall-clock duration of the call.
+        """
+        pending = self._pending_usage
+        pending["prompt_tokens"] = pending.get("prompt_tokens", 0) + (
+            usage.prompt_tokens if usage else 0
+        )
+        pending["completion_tokens"] = pending.get("completion_tokens", 0) + (
+            usage.completion_tokens if usage else 0
+        )
+        pending["latency_ms"] = pending.get("latency_ms", 0.0) + seconds * 1000
+
+    def take_usage(self) -> dict[str, float]:
+        """Return the tokens and latency of the model calls since the previous call.
+
+        Returns:
+            dict[str, float]: Prompt and completion tokens and latency in
+                milliseconds, or an empty dict if no call was made.
+        """
+        usage, self._pending_usage = self._pending_usage, {}
+        return usage
+
     def add_decision(self, decision: str) -> None:
         """Add a decision to the decision history.
 
@@ -231,9 +282,92 @@ class LLMAgent(BaseAgent):
         return "\n\nYour previous actions:\n" + "\n".join(f"- {d}" for d in self.decision_history)
 
 
+class MCTSAgent(DemoAgent):
+    """CPU-only agent that picks votes and night targets by Monte Carlo search.
+
+    The engine attaches the agent to its player at setup. Target and yes/no
+    decisions are searched with ``RolloutSearch``; speeches use the canned
+    ``DemoAgent`` responses.
+    """
+
+    model: str = Field(default="mcts")
+    rollouts: int = Field(default=DEFAULT_ROLLOUTS, description="Simulated games per decision")
+    workers: int = Field(default=0, description="Worker processes; 0 searches in-process")
+    max_rounds: int = Field(default=DEFAULT_MAX_ROUNDS, description="Round limit of a rollout")
+
+    _engine: GameEngine | None = PrivateAttr(default=None)
+    _player_id: str | None = PrivateAttr(default=None)
+    _search: RolloutSearch | None = PrivateAttr(default=None)
+    _beliefs: BeliefTracker | None = PrivateAttr(default=None)
+    _seen_events: int = PrivateAttr(default=0)
+
+    def attach(self, engine: object, player_id: str) -> None:
+        """Attach the agent to the game and player it controls.
+
+        Args:
+            engine: The game engine running the game.
+            player_id: ID of the agent's player.
+        """
+        self._engine = engine if isinstance(engine, GameEngine) else None
+        self._player_id = player_id
+        self._beliefs = None
+        self._seen_events = 0
+
+    def _update_beliefs(self, engine: GameEngine, player_id: str) -> BeliefTracker:
+        """Feed the events logged since the last decision to the belief tracker.
+
+        Args:
+            engine: The attached engine.
+            player_id: ID of the agent's player.
+
+        Returns:
+            BeliefTracker: The up-to-date beliefs of the agent's player.
+
+        Raises:
+            RuntimeError: If the game is not initialized.
+        """
+        beliefs = self._beliefs
+        if beliefs is None:
+            if engine.game_state is None:
+                msg = "Game not initialized"
+                raise RuntimeError(msg)
+            beliefs = self._beliefs = BeliefTracker.from_game_state(engine.game_state, player_id)
+        events = engine.event_logger.events
+        beliefs.observe_all(events[self._seen_events :])
+        self._seen_events = len(events)
+        return beliefs
+
+    def get_response(self, message: str) -> str:
+        """Search target and yes/no decisions, answer anything else like ``DemoAgent``.
+
+        Args:
+            message: The prompt message.
+
+        Returns:
+            str: The agent's response.
+        """
+        options = parse_options(message)
+        if (
+            not options
+            or self._engine is None
+            or self._engine.game_state is None
+            or self._player_id is None
+        ):
+            return super().get_response(message)
+
+        if self._search is None:
+            self._search = RolloutSearch(
+                rollouts=self.rollouts, workers=self.workers, max_rounds=self.max_rounds
+            )
+        beliefs = self._update_beliefs(self._engine, self._player_id)
+        knowledge = knowledge_from_beliefs(beliefs)
+        choice = self._search.choose(self._engine, knowledge, options)
+        return answer_for(message, choice) or super().get_response(message)
+
+
 def create_agent(
     config: PlayerConfig, language: str = "en-US"
-) -> DemoAgent | HumanAgent | LLMAgent:
+) -> DemoAgent | HumanAgent | LLMAgent | MCTSAgent:
     """Create an agent instance from player configuration.
 
     Args:
@@ -241,7 +375,7 @@ def create_agent(
         language: Language code for the agent (e.g., "en-US", "zh-TW").
 
     Returns:
-        DemoAgent | HumanAgent | LLMAgent: Created agent instance.
+        DemoAgent | HumanAgent | LLMAgent | MCTSAgent: Created agent instance.
 
     Raises:
         ValueError: If configuration is invalid or API key is missing.
@@ -254,6 +388,11 @@ def create_agent(
     if model == "demo":
         return DemoAgent(name=config.name, model="demo")
 
+    if model == "mcts":
+        return MCTSAgent(
+            name=config.name, model="mcts", rollouts=config.rollouts, workers=config.workers
+        )
+
     api_key = None
     if config.api_key_env:
         api_key = os.getenv(config.api_key_env)
@@ -0,0 +1,352 @@
+"""SQLite archive of finished games.
+
+``GameArchive`` stores the configuration, players, role assignment, events,
+votes and outcome of every ingested game in a local SQLite database, with
+indexes on model, role, winner and round. Aggregate questions such as the win
+rate of a role for one model at a given table size then become indexed queries
+instead of scans over saved JSON files.
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, NamedTuple
+from pathlib import Path
+import sqlite3
+from contextlib import contextmanager
+from collections.abc import Iterable, Iterator, Sequence
+
+from typing_extensions import Self
+
+from llm_werewolf.core.types import EventType, GamePhase
+
+if TYPE_CHECKING:
+    from llm_werewolf.core.engine import GameEngine
+
+SCHEMA_VERSION = 1
+"""Version of the table layout created by ``GameArchive``."""
+
+VOTE_EVENT_TYPES = {EventType.VOTE_CAST: "day", EventType.SHERIFF_VOTE_CAST: "sheriff"}
+"""Events copied into the ``votes`` table, with the kind of vote they record."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS games (
+    game_id INTEGER PRIMARY KEY,
+    seed INTEGER,
+    num_players INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    config TEXT NOT NULL,
+    winner TEXT,
+    rounds INTEGER NOT NULL,
+    ended_at TEXT
+);
+CREATE TABLE IF NOT EXISTS players (
+    game_id INTEGER NOT NULL REFERENCES games (game_id),
+    player_id TEXT NOT NULL,
+    seat INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    model TEXT NOT NULL,
+    role TEXT NOT NULL,
+    camp TEXT NOT NULL,
+    survived INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    PRIMARY KEY (game_id, player_id)
+);
+CREATE TABLE IF NOT EXISTS events (
+    game_id INTEGER NOT NULL REFERENCES games (game_id),
+    seq INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    round_number INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    message TEXT NOT NULL,
+    data TEXT NOT NULL,
+    visible_to TEXT,
+    PRIMARY KEY (game_id, seq)
+);
+CREATE TABLE IF NOT EXISTS votes (
+    game_id INTEGER NOT NULL REFERENCES games (game_id),
+    round_number INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    voter_id TEXT NOT NULL,
+    target_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_games_winner ON games (winner, num_players);
+CREATE INDEX IF NOT EXISTS idx_games_num_players ON games (num_players);
+CREATE INDEX IF NOT EXISTS idx_players_role_model ON players (role, model, won);
+CREATE INDEX IF NOT EXISTS idx_players_model ON players (model, won);
+CREATE INDEX IF NOT EXISTS idx_events_round ON events (round_number, event_type);
+CREATE INDEX IF NOT EXISTS idx_events_type ON events (event_type);
+CREATE INDEX IF NOT EXISTS idx_votes_game_round ON votes (game_id, round_number);
+"""
+
+_WIN_RATE_SQL = (
+    "SELECT COUNT(*), COALESCE(SUM(p.won), 0) FROM players AS p JOIN games AS g USING (game_id)"
+)
+
+
+class WinRate(NamedTuple):
+    """Result of a win-rate query."""
+
+    players: int
+    """Number of matching player seats."""
+
+    wins: int
+    """How many of them were on the winning side."""
+
+    @property
+    def rate(self) -> float:
+        """Fraction of matching seats that won, or 0.0 if nothing matched."""
+        return self.wins / self.players if self.players else 0.0
+
+
+def _player_won(winner: str, camp: str, is_lover: bool) -> bool:
+    """Decide whether a player was on the winning side.
+
+    Args:
+        winner: The winning camp, as stored in ``GameState.winner``.
+        camp: The player's camp at the end of the game.
+        is_lover: Whether the player was one of the lovers.
+
+    Returns:
+        bool: True if the player won.
+    """
+    return is_lover if winner == "lover" else camp == winner
+
+
+class GameArchive:
+    """SQLite database of finished games.
+
+    Every ``add_game`` call runs in a transaction. Wrap many calls in
+    ``transaction()`` (or use ``add_games``) to insert a whole batch with one
+    commit. The connection belongs to the thread that opened the archive.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """Open the archive, creating the tables and indexes if needed.
+
+        Args:
+            path: Database file, or ``":memory:"`` for a temporary archive.
+        """
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self._depth = 0
+
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+            (str(SCHEMA_VERSION),),
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> Self:
+        """Use the archive as a context manager.
+
+        Returns:
+            GameArchive: This archive.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the archive when leaving the context.
+
+        Args:
+            *exc_info: Exception information, if any.
+        """
+        self.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group inserts into one transaction, committed when the outermost block ends.
+
+        Nested blocks join the outer transaction. If the block raises, everything
+        since the outermost block started is rolled back.
+
+        Yields:
+            None: Control to the block.
+        """
+        if self._depth == 0:
+            self.connection.execute("BEGIN")
+        self._depth += 1
+        try:
+            yield
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self.connection.execute("ROLLBACK")
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            self.connection.execute("COMMIT")
+
+    def add_game(self, engine: "GameEngine", seed: int | None = None) -> int:
+        """Ingest a finished game.
+
+        Args:
+            engine: The engine that played the game.
+            seed: The random seed the game was played with, if known.
+
+        Returns:
+            int: The archive ID of the game.
+
+        Raises:
+            ValueError: If the game has not ended.
+        """
+        state = engine.game_state
+        if state is None or state.phase != GamePhase.ENDED or state.winner is None:
+            msg = "Only finished games can be archived"
+            raise ValueError(msg)
+
+        events = engine.get_events()
+        with self.transaction():
+            cursor = self.connection.execute(
+                "INSERT INTO games (seed, num_players, language, config, winner, rounds, ended_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    seed,
+                    len(state.players),
+                    engine.locale.language,
+                    engine.config.model_dump_json(),
+                    state.winner,
+                    state.round_number,
+                    events[-1].timestamp.isoformat() if events else None,
+                ),
+            )
+            game_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        game_id,
+                        player.player_id,
+                        seat,
+                        player.name,
+                        player.ai_model,
+                        player.get_role_name(),
+                        player.get_camp(),
+                        player.is_alive(),
+                        _player_won(state.winner, player.get_camp(), player.is_lover()),
+                    )
+                    for seat, player in enumerate(state.players)
+                ],
+            )
+            self.connection.executemany(
+                "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        game_id,
+                        seq,
+                        event.event_type.value,
+                        event.round_number,
+                        event.phase,
+                        event.timestamp.isoformat(),
+                        event.message,
+                        json.dumps(event.data, ensure_ascii=False),
+                        None if event.visible_to is None else json.dumps(event.visible_to),
+                    )
+                    for seq, event in enumerate(events)
+                ],
+            )
+            self.connection.executemany(
+                "INSERT INTO votes VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        game_id,
+                        event.round_number,
+                        VOTE_EVENT_TYPES[event.event_type],
+                        event.data["voter_id"],
+                        event.data["target_id"],
+                    )
+                    for event in events
+                    if event.event_type in VOTE_EVENT_TYPES
+                ],
+            )
+        return game_id
+
+    def add_games(
+        self, engines: Iterable["GameEngine"], seeds: Sequence[int | None] | None = None
+    ) -> list[int]:
+        """Ingest a batch of finished games in a single transaction.
+
+        Args:
+            engines: The engines that played the games.
+            seeds: The seed of each game, in the same order, if known.
+
+        Returns:
+            list[int]: The archive IDs of the games.
+        """
+        engines = list(engines)
+        if seeds is None:
+            seeds = [None] * len(engines)
+        with self.transaction():
+            return [
+                self.add_game(engine, seed) for engine, seed in zip(engines, seeds, strict=True)
+            ]
+
+    def count_games(self) -> int:
+        """Count the archived games.
+
+        Returns:
+            int: Number of games.
+        """
+        (count,) = self.connection.execute("SELECT COUNT(*) FROM games").fetchone()
+        return count
+
+    def win_rate(
+        self, role: str | None = None, model: str | None = None, num_players: int | None = None
+    ) -> WinRate:
+        """Compute how often matching player seats were on the winning side.
+
+        Args:
+            role: Only count seats with this role name, e.g. ``"Alpha Wolf"``.
+            model: Only count seats played by this model.
+            num_players: Only count games with this many players.
+
+        Returns:
+            WinRate: Matching seats and how many of them won.
+        """
+        conditions = []
+        parameters: list[Any] = []
+        for column, value in (
+            ("p.role", role),
+            ("p.model", model),
+            ("g.num_players", num_players),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        # Only the fixed column names above are formatted in; values stay parameters
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        players, wins = self.connection.execute(_WIN_RATE_SQL + where, parameters).fetchone()
+        return WinRate(players=players, wins=wins)
+
+    def query(self, sql: str, parameters: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        """Run a read query against the archive.
+
+        The statement runs with ``PRAGMA query_only`` on, so it cannot change the
+        archive.
+
+        Args:
+            sql: The SQL statement, using ``?`` placeholders.
+            parameters: Values for the placeholders.
+
+        Returns:
+            list[tuple[Any, ...]]: The result rows.
+
+        Raises:
+            sqlite3.OperationalError: If the statement tries to write.
+        """
+        self.connection.execute("PRAGMA query_only = ON")
+        try:
+            return self.connection.execute(sql, parameters).fetchall()
+        finally:
+            self.connection.execute("PRAGMA query_only = OFF")
@@ -0,0 +1,398 @@
+"""Per-observer beliefs about the hidden role assignment.
+
+``BeliefTracker`` keeps, for every player, the set of roles that player can still
+have from one observer's point of view. Each set is a bitmask over the distinct
+role classes in the deal, stored in a compact array, and events narrow the masks
+as they are observed. The counts in the deal are propagated after every update,
+so a role whose copies are all accounted for is removed from everyone else.
+"""
+
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Sequence
+
+from llm_werewolf.core.types import Camp, Event, EventType, Capability, EventRecord
+from llm_werewolf.core.game_state import GameState
+from llm_werewolf.core.roles.base import Role
+
+MAX_ROLE_TYPES = 64
+"""Maximum number of distinct role classes in one deal (bits per mask)."""
+
+_FITTING_ITERATIONS = 25
+"""Maximum rounds of proportional fitting when estimating role probabilities."""
+
+_FITTING_TOLERANCE = 1e-4
+"""Fitting stops once no role's copies are off by more than this fraction."""
+
+
+class BeliefTracker:
+    """Role assignments consistent with what one observer has seen.
+
+    Hard evidence narrows the candidate masks: the observer's own role (and pack
+    for werewolves), roles revealed by eliminations, Idiot reveals and death shots,
+    and the observer's own Seer checks. Votes are only tallied; they are not hard
+    evidence, but callers can weigh them against the role probabilities.
+
+    Roles can change hands during a game (the Thief and the Magician swap them),
+    so an observed event that contradicts what is known about a player resets
+    that player's candidates before it is applied, and one that still cannot fit
+    the deal is ignored rather than raised.
+    """
+
+    __slots__ = (
+        "_camp_masks",
+        "_counts",
+        "_fitted",
+        "_index",
+        "_masks",
+        "_names",
+        "_role_bits",
+        "_roles",
+        "_votes",
+        "observer_id",
+        "player_ids",
+    )
+
+    def __init__(
+        self, observer_id: str, player_ids: Sequence[str], role_pool: Sequence[type[Role]]
+    ) -> None:
+        """Initialize the tracker with every role possible for every player.
+
+        Args:
+            observer_id: ID of the player whose point of view is tracked.
+            player_ids: IDs of all players in seating order.
+            role_pool: Role classes dealt in the game, one per player.
+
+        Raises:
+            ValueError: If the pool does not match the players or has too many role types.
+        """
+        if len(role_pool) != len(player_ids):
+            msg = f"Role pool has {len(role_pool)} roles for {len(player_ids)} players"
+            raise ValueError(msg)
+
+        counts = Counter(role_pool)
+        if len(counts) > MAX_ROLE_TYPES:
+            msg = f"At most {MAX_ROLE_TYPES} role types are supported, got {len(counts)}"
+            raise ValueError(msg)
+
+        self.observer_id = observer_id
+        self.player_ids = list(player_ids)
+        self._index = {player_id: i for i, player_id in enumerate(self.player_ids)}
+        self._roles: list[type[Role]] = list(counts)
+        self._role_bits = {role_cls: 1 << i for i, role_cls in enumerate(self._roles)}
+        self._counts = array("H", counts.values())
+        self._names = {role_cls.get_shared_config().name: role_cls for role_cls in self._roles}
+
+        # A Seer result is consistent with the role's camp, and a "villager"
+        # result also with any role that can appear as a villager.
+        self._camp_masks: dict[str, int] = dict.fromkeys((camp.value for camp in Camp), 0)
+        for role_cls, bit in self._role_bits.items():
+            config = role_cls.get_shared_config()
+            self._camp_masks[config.camp.value] |= bit
+            if config.capabilities & Capability.APPEARS_AS_VILLAGER:
+                self._camp_masks[Camp.VILLAGER.value] |= bit
+
+        full = (1 << len(self._roles)) - 1
+        self._masks = array("Q", [full] * len(self.player_ids))
+        self._votes = array("H", bytes(2 * len(self.player_ids) ** 2))
+        self._fitted: list[list[float]] | None = None
+
+    @classmethod
+    def from_game_state(cls, game_state: GameState, observer_id: str) -> "BeliefTracker":
+        """Create a tracker seeded with what a player knows at the start of the game.
+
+        The player knows their own role, and werewolves also know their pack.
+
+        Args:
+            game_state: The game state.
+            observer_id: ID of the observing player.
+
+        Returns:
+            BeliefTracker: The seeded tracker.
+
+        Raises:
+            ValueError: If the observer is not in the game.
+        """
+        players = game_state.players
+        tracker = cls(observer_id, [p.player_id for p in players], [type(p.role) for p in players])
+
+        me = game_state.get_player(observer_id)
+        if me is None:
+            msg = f"Unknown observer: {observer_id}"
+            raise ValueError(msg)
+        tracker.fix_role(observer_id, type(me.role))
+        if me.role.camp == Camp.WEREWOLF:
+            for player in players:
+                if player.role.camp == Camp.WEREWOLF:
+                    tracker.fix_role(player.player_id, type(player.role))
+        return tracker
+
+    def observe(self, event: Event | EventRecord) -> None:
+        """Update the beliefs with one event, if the observer can see it.
+
+        Args:
+            event: A logged game event.
+        """
+        if not event.is_visible_to(self.observer_id):
+            return
+
+        data = event.data
+        event_type = event.event_type
+        if event_type == EventType.VOTE_CAST:
+            voter = self._index.get(data.get("voter_id", ""))
+            target = self._index.get(data.get("target_id", ""))
+            if voter is not None and target is not None:
+                self._votes[voter * len(self.player_ids) + target] += 1
+        elif event_type in {EventType.PLAYER_ELIMINATED, EventType.ROLE_REVEALED}:
+            self._reveal(data.get("player_id", ""), data.get("role"))
+        elif event_type == EventType.HUNTER_REVENGE:
+            self._reveal(data.get("shooter_id", ""), data.get("role"))
+        elif event_type == EventType.SEER_CHECKED:
+            camp_mask = self._camp_masks.get(data.get("result", ""))
+            if camp_mask is not None and data.get("target_id") in self._index:
+                self._observe_restriction(data["target_id"], camp_mask)
+
+    def observe_all(self, events: Iterable[Event | EventRecord]) -> None:
+        """Update the beliefs with a sequence of events.
+
+        Args:
+            events: Logged game events, in order.
+        """
+        for event in events:
+            self.observe(event)
+
+    def _reveal(self, player_id: str, role_name: object) -> None:
+        """Fix a player's role from a role name carried by an event.
+
+        Args:
+            player_id: ID of the player whose role was revealed.
+            role_name: Display name of the role, if the event carries one.
+        """
+        role_cls = self._names.get(role_name) if isinstance(role_name, str) else None
+        if role_cls is not None and player_id in self._index:
+            self._observe_restriction(player_id, self._role_bits[role_cls])
+
+    def _observe_restriction(self, player_id: str, mask: int) -> None:
+        """Apply observed evidence, allowing for roles that changed hands.
+
+        Evidence that leaves the player no candidate role means their role was
+        swapped: their candidates are reset first, and the roles they could have
+        had are given back to every other player but the observer, since the swap
+        may have moved them anywhere. If the evidence still does not fit the
+        deal, the masks are left as they were.
+
+        Args:
+            player_id: ID of the player.
+            mask: Bitmask of the roles the player may have.
+        """
+        index = self._index[player_id]
+        masks = self._masks
+        saved = array("Q", masks)
+        if not masks[index] & mask:
+            observer = self._index.get(self.observer_id)
+            for i in range(len(masks)):
+                if i != observer:
+                    masks[i] |= saved[index]
+            masks[index] = (1 << len(self._roles)) - 1
+        try:
+            self._restrict(player_id, mask)
+        except ValueError:
+            self._masks = saved
+        self._fitted = None
+
+    def fix_role(self, player_id: str, role_cls: type[Role]) -> None:
+        """Record that a player has a given role.
+
+        Args:
+            player_id: ID of the player.
+            role_cls: The player's role class.
+
+        Raises:
+            ValueError: If the role is not in the deal or contradicts earlier evidence.
+        """
+        bit = self._role_bits.get(role_cls)
+        if bit is None:
+            msg = f"{role_cls.__name__} is not in the deal"
+            raise ValueError(msg)
+        self._restrict(player_id, bit)
+
+    def _restrict(self, player_id: str, mask: int) -> None:
+        """Intersect a player's candidate roles with a mask and propagate.
+
+        Args:
+            player_id: ID of the player.
+            mask: Bitmask of the roles the player may have.
+
+        Raises:
+            ValueError: If no candidate role is left.
+        """
+        index = self._index[player_id]
+        narrowed = self._masks[index] & mask
+        if narrowed == self._masks[index]:
+            return
+        if not narrowed:
+            msg = f"Evidence about {player_id} contradicts earlier observations"
+            raise ValueError(msg)
+        self._masks[index] = narrowed
+        self._fitted = None
+        self._propagate()
+
+    def _propagate(self) -> None:
+        """Apply the role counts until no mask changes.
+
+        A role whose copies are all held by players known to have it is removed
+        from every other player, and a role that only as many players as it has
+        copies can still have is fixed on those players.
+
+        Raises:
+            ValueError: If the masks can no longer fit the deal.
+        """
+        masks = self._masks
+        changed = True
+        while changed:
+            changed = False
+            for role_index, count in enumerate(self._counts):
+                bit = 1 << role_index
+                holders = [i for i, mask in enumerate(masks) if mask & bit]
+                fixed = [i for i in holders if masks[i] == bit]
+                if len(fixed) > count or len(holders) < count:
+                    msg = f"No assignment of {self._roles[role_index].__name__} fits the evidence"
+                    raise ValueError(msg)
+                if len(fixed) == count and len(holders) > count:
+                    for i in holders:
+                        if masks[i] != bit:
+                            masks[i] &= ~bit
+                            if not masks[i]:
+                                msg = f"Evidence about {self.player_ids[i]} leaves no role"
+                                raise ValueError(msg)
+                    changed = True
+                elif len(holders) == count and len(fixed) < count:
+                    for i in holders:
+                        masks[i] = bit
+                    changed = True
+
+    def candidates(self, player_id: str) -> list[type[Role]]:
+        """Get the roles a player can still have.
+
+        Args:
+            player_id: ID of the player.
+
+        Returns:
+            list[type[Role]]: Candidate role classes.
+        """
+        mask = self._masks[self._index[player_id]]
+        return [role_cls for role_cls, bit in self._role_bits.items() if mask & bit]
+
+    def known_role(self, player_id: str) -> type[Role] | None:
+        """Get a player's role if only one is possible.
+
+        Args:
+            player_id: ID of the player.
+
+        Returns:
+            type[Role] | None: The role class, or None if it is still uncertain.
+        """
+        mask = self._masks[self._index[player_id]]
+        if mask & (mask - 1):
+            return None
+        return self._roles[mask.bit_length() - 1]
+
+    def known_camp(self, player_id: str) -> Camp | None:
+        """Get a player's camp if all candidate roles share it.
+
+        Args:
+            player_id: ID of the player.
+
+        Returns:
+            Camp | None: The camp, or None if it is still uncertain.
+        """
+        camps = {role_cls.get_shared_config().camp for role_cls in self.candidates(player_id)}
+        return camps.pop() if len(camps) == 1 else None
+
+    def role_probabilities(self, player_id: str) -> dict[type[Role], float]:
+        """Estimate the probability of each candidate role for a player.
+
+        The estimate spreads every role's remaining copies over the players who
+        can hold it, balancing rows and columns by iterative proportional fitting.
+
+        Args:
+            player_id: ID of the player.
+
+        Returns:
+            dict[type[Role], float]: Probability of each candidate role.
+        """
+        weights = self._fit()[self._index[player_id]]
+        return {role_cls: weights[i] for i, role_cls in enumerate(self._roles) if weights[i]}
+
+    def camp_probability(self, player_id: str, camp: Camp) -> float:
+        """Estimate the probability that a player belongs to a camp.
+
+        Args:
+            player_id: ID of the player.
+            camp: The camp.
+
+        Returns:
+            float: Probability between 0 and 1.
+        """
+        return sum(
+            probability
+            for role_cls, probability in self.role_probabilities(player_id).items()
+            if role_cls.get_shared_config().camp == camp
+        )
+
+    def vote_count(self, voter_id: str, target_id: str) -> int:
+        """Get how many times one player has voted for another.
+
+        Args:
+            voter_id: ID of the voter.
+            target_id: ID of the target.
+
+        Returns:
+            int: Number of observed votes.
+        """
+        return self._votes[self._index[voter_id] * len(self.player_ids) + self._index[target_id]]
+
+    def _scale_columns(self, matrix: list[list[float]]) -> bool:
+        """Scale every role's column to sum to its number of copies.
+
+        Args:
+            matrix: Player-by-role weights, scaled in place.
+
+        Returns:
+            bool: True if every column was already within tolerance.
+        """
+        converged = True
+        for r, count in enumerate(self._counts):
+            column = sum(row[r] for row in matrix)
+            if column:
+                scale = count / column
+                if abs(scale - 1.0) > _FITTING_TOLERANCE:
+                    converged = False
+                for row in matrix:
+                    row[r] *= scale
+        return converged
+
+    def _fit(self) -> list[list[float]]:
+        """Get the fitted player-by-role probability matrix, computing it if stale.
+
+        Returns:
+            list[list[float]]: One row of role probabilities per player.
+        """
+        if self._fitted is not None:
+            return self._fitted
+
+        role_count = len(self._roles)
+        matrix = [
+            [1.0 if mask >> r & 1 else 0.0 for r in range(role_count)] for mask in self._masks
+        ]
+        for _ in range(_FITTING_ITERATIONS):
+            if self._scale_columns(matrix):
+                break
+            for row in matrix:
+                total = sum(row)
+                if total:
+                    for r in range(role_count):
+                        row[r] /= total
+
+        self._fitted = matrix
+        return matrix
@@ -0,0 +1,423 @@
+"""Compact binary encoding for snapshot models.
+
+A binary snapshot starts with a fixed header (magic, format version, flags) and
+is followed by a body that may be zlib compressed. The body holds a table of
+every distinct string, so player IDs, names and role names are stored once and
+referenced by index everywhere else, and then the model's fields in declaration
+order.
+
+Values are laid out by column: a list of models is written as one column per
+field, a list of strings as one array of table indexes, and so on, with the
+encoding of each column derived from the field's type annotation. Free-form
+values (``Any``, and lists or dicts of them) are written as one compact JSON
+string per column. Decoding a column is then a single array read or JSON parse
+instead of a Python call per value.
+
+Decoding can skip pydantic validation and build the models directly, which is
+the fast path for trusted files written by this module.
+"""
+
+import json
+import zlib
+from array import array
+import types
+import struct
+from typing import Any, Union, TypeVar, get_args, get_origin
+from itertools import chain, pairwise, accumulate
+from collections.abc import Callable
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+M = TypeVar("M", bound=BaseModel)
+
+MAGIC = b"LWSN"
+"""First bytes of every binary snapshot."""
+
+FORMAT_VERSION = 1
+"""Version of the binary layout written by ``encode_snapshot``."""
+
+_FLAG_COMPRESSED = 0x01
+
+_HEADER = struct.Struct("<4sBBH")
+_U32 = struct.Struct("<I")
+_NONE_INDEX = 0xFFFFFFFF
+
+
+def is_binary_snapshot(data: bytes) -> bool:
+    """Check whether data starts with the binary snapshot magic.
+
+    Args:
+        data: File contents, or at least their first bytes.
+
+    Returns:
+        bool: True if the data is a binary snapshot.
+    """
+    return data[: len(MAGIC)] == MAGIC
+
+
+class _Writer:
+    """Output buffer with the string table being built."""
+
+    __slots__ = ("buffer", "strings")
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer and string table."""
+        self.buffer = bytearray()
+        self.strings: dict[str, int] = {}
+
+    def index(self, value: str) -> int:
+        """Get the table index of a string, adding it if new.
+
+        Args:
+            value: The string.
+
+        Returns:
+            int: Its index in the string table.
+        """
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def array(self, typecode: str, values: list[int]) -> None:
+        """Append integers as a packed array.
+
+        Args:
+            typecode: The ``array`` type code, e.g. ``"I"`` or ``"q"``.
+            values: The integers.
+        """
+        self.buffer += array(typecode, values).tobytes()
+
+
+class _Reader:
+    """Cursor over a decoded body with its string table."""
+
+    __slots__ = ("data", "offset", "strings")
+
+    def __init__(self, data: bytes, strings: list[str], offset: int) -> None:
+        """Initialize the reader.
+
+        Args:
+            data: The body.
+            strings: The decoded string table.
+            offset: Position of the first column after the table.
+        """
+        self.data = data
+        self.strings = strings
+        self.offset = offset
+
+    def array(self, typecode: str, count: int) -> array:
+        """Read a packed array of integers.
+
+        Args:
+            typecode: The ``array`` type code used when writing.
+            count: Number of items.
+
+        Returns:
+            array: The integers.
+        """
+        values = array(typecode)
+        end = self.offset + values.itemsize * count
+        values.frombytes(self.data[self.offset : end])
+        self.offset = end
+        return values
+
+
+_Encode = Callable[[_Writer, list[Any]], None]
+_Decode = Callable[[_Reader, int, bool], list[Any]]
+
+
+def _encode_str(writer: _Writer, values: list[str]) -> None:
+    writer.array("I", [writer.index(value) for value in values])
+
+
+def _decode_str(reader: _Reader, count: int, construct: bool) -> list[str]:
+    return list(map(reader.strings.__getitem__, reader.array("I", count)))
+
+
+def _encode_optional_str(writer: _Writer, values: list[str | None]) -> None:
+    index = writer.index
+    writer.array("I", [_NONE_INDEX if value is None else index(value) for value in values])
+
+
+def _decode_optional_str(reader: _Reader, count: int, construct: bool) -> list[str | None]:
+    strings = reader.strings
+    return [None if i == _NONE_INDEX else strings[i] for i in reader.array("I", count)]
+
+
+def _encode_bool(writer: _Writer, values: list[bool]) -> None:
+    writer.buffer += bytes(map(bool, values))
+
+
+def _decode_bool(reader: _Reader, count: int, construct: bool) -> list[bool]:
+    return list(map(bool, reader.array("B", count)))
+
+
+def _encode_int(writer: _Writer, values: list[int]) -> None:
+    writer.array("q", values)
+
+
+def _decode_int(reader: _Reader, count: int, construct: bool) -> list[int]:
+    return reader.array("q", count).tolist()
+
+
+def _encode_value(writer: _Writer, values: list[Any]) -> None:
+    """Append a column of free-form values as one compact JSON string.
+
+    Args:
+        writer: The output buffer.
+        values: JSON-serializable values.
+    """
+    text = json.dumps(values, ensure_ascii=False, separators=(",", ":"))
+    writer.array("I", [writer.index(text)])
+
+
+def _decode_value(reader: _Reader, count: int, construct: bool) -> list[Any]:
+    return from_json(reader.strings[reader.array("I", 1)[0]])
+
+
+_VALUE_CODEC: tuple[_Encode, _Decode] = (_encode_value, _decode_value)
+
+
+def _split(flat: list[Any], lengths: array) -> list[list[Any]]:
+    """Cut a flattened column back into the lists it was made from.
+
+    Args:
+        flat: The concatenated items.
+        lengths: Length of each list.
+
+    Returns:
+        list[list[Any]]: The lists.
+    """
+    return [flat[start:end] for start, end in pairwise(accumulate(lengths, initial=0))]
+
+
+def _list_codec(item: tuple[_Encode, _Decode]) -> tuple[_Encode, _Decode]:
+    """Build the codec of a list column from the codec of its items.
+
+    The lengths of the lists come first, then all items as one column.
+
+    Args:
+        item: Codec of the item column.
+
+    Returns:
+        tuple[_Encode, _Decode]: Functions writing and reading the column.
+    """
+    encode_items, decode_items = item
+
+    def encode(writer: _Writer, values: list[list[Any]]) -> None:
+        writer.array("I", [len(value) for value in values])
+        encode_items(writer, list(chain.from_iterable(values)))
+
+    def decode(reader: _Reader, count: int, construct: bool) -> list[list[Any]]:
+        lengths = reader.array("I", count)
+        return _split(decode_items(reader, sum(lengths), construct), lengths)
+
+    return encode, decode
+
+
+def _dict_codec(item: tuple[_Encode, _Decode]) -> tuple[_Encode, _Decode]:
+    """Build the codec of a string-keyed dict column from the codec of its values.
+
+    The sizes of the dicts come first, then all keys and all values as columns.
+
+    Args:
+        item: Codec of the value column.
+
+    Returns:
+        tuple[_Encode, _Decode]: Functions writing and reading the column.
+    """
+    encode_items, decode_items = item
+
+    def encode(writer: _Writer, values: list[dict[str, Any]]) -> None:
+        writer.array("I", [len(value) for value in values])
+        _encode_str(writer, [key for value in values for key in value])
+        encode_items(writer, [item for value in values for item in value.values()])
+
+    def decode(reader: _Reader, count: int, construct: bool) -> list[dict[str, Any]]:
+        lengths = reader.array("I", count)
+        total = sum(lengths)
+        keys = _split(_decode_str(reader, total, construct), lengths)
+        items = _split(decode_items(reader, total, construct), lengths)
+        return [dict(zip(k, v, strict=True)) for k, v in zip(keys, items, strict=True)]
+
+    return encode, decode
+
+
+def _construct(model: type[M], values: dict[str, Any]) -> M:
+    """Build a model from complete field values without validation.
+
+    This does what ``model_construct`` does for a dict that already holds every
+    field, without its per-field default handling.
+
+    Args:
+        model: The model class.
+        values: A value for every field.
+
+    Returns:
+        M: The model instance.
+    """
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _model_codec(model: type[BaseModel]) -> tuple[_Encode, _Decode]:
+    """Build the codec of a model column, one sub-column per field.
+
+    Args:
+        model: The model class.
+
+    Returns:
+        tuple[_Encode, _Decode]: Functions writing and reading the column.
+    """
+    fields = [(name, *_field_codec(info.annotation)) for name, info in model.model_fields.items()]
+    names = [name for name, _, _ in fields]
+
+    def encode(writer: _Writer, values: list[BaseModel]) -> None:
+        for name, encode_field, _ in fields:
+            encode_field(writer, [getattr(value, name) for value in values])
+
+    def decode(reader: _Reader, count: int, construct: bool) -> list[Any]:
+        columns = [decode_field(reader, count, construct) for _, _, decode_field in fields]
+        rows = [dict(zip(names, row, strict=True)) for row in zip(*columns, strict=True)]
+        if construct:
+            return [_construct(model, row) for row in rows]
+        return rows
+
+    return encode, decode
+
+
+def _is_model(annotation: Any) -> bool:  # noqa: ANN401
+    """Check whether an annotation is a pydantic model class.
+
+    Args:
+        annotation: A type annotation.
+
+    Returns:
+        bool: True for model classes.
+    """
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _field_codec(annotation: Any) -> tuple[_Encode, _Decode]:  # noqa: ANN401
+    """Pick the column encoding of a field from its type annotation.
+
+    Args:
+        annotation: The field's annotation.
+
+    Returns:
+        tuple[_Encode, _Decode]: Functions writing and reading the column.
+    """
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    codec = _VALUE_CODEC
+    if annotation is str:
+        codec = (_encode_str, _decode_str)
+    elif annotation is bool:
+        codec = (_encode_bool, _decode_bool)
+    elif annotation is int:
+        codec = (_encode_int, _decode_int)
+    elif origin in {Union, types.UnionType} and set(args) == {str, type(None)}:
+        codec = (_encode_optional_str, _decode_optional_str)
+    elif _is_model(annotation):
+        codec = _model_codec(annotation)
+    elif origin is list and _field_codec(args[0]) is not _VALUE_CODEC:
+        codec = _list_codec(_field_codec(args[0]))
+    elif origin is dict and args[0] is str and _field_codec(args[1]) is not _VALUE_CODEC:
+        codec = _dict_codec(_field_codec(args[1]))
+    return codec
+
+
+_codecs: dict[type[BaseModel], tuple[_Encode, _Decode]] = {}
+
+
+def _codec(model: type[BaseModel]) -> tuple[_Encode, _Decode]:
+    """Get the cached codec of a top-level model.
+
+    Args:
+        model: The model class.
+
+    Returns:
+        tuple[_Encode, _Decode]: Functions writing and reading a column of instances.
+    """
+    codec = _codecs.get(model)
+    if codec is None:
+        codec = _codecs[model] = _model_codec(model)
+    return codec
+
+
+def encode_snapshot(snapshot: BaseModel, compress: bool = True) -> bytes:
+    """Encode a snapshot model in the binary format.
+
+    Args:
+        snapshot: The snapshot, e.g. a ``GameStateSnapshot``.
+        compress: Whether to zlib-compress the body.
+
+    Returns:
+        bytes: The header followed by the body.
+    """
+    writer = _Writer()
+    writer.index(type(snapshot).__name__)
+    encode, _ = _codec(type(snapshot))
+    encode(writer, [snapshot])
+
+    encoded = [value.encode() for value in writer.strings]
+    table = bytearray(_U32.pack(len(encoded)))
+    table += array("I", [len(value) for value in encoded]).tobytes()
+    table += b"".join(encoded)
+    body = bytes(table + writer.buffer)
+
+    flags = 0
+    if compress:
+        body = zlib.compress(body)
+        flags |= _FLAG_COMPRESSED
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, flags, 0) + body
+
+
+def decode_snapshot(data: bytes, model: type[M], validate: bool = True) -> M:
+    """Decode a binary snapshot.
+
+    Args:
+        data: Bytes produced by ``encode_snapshot``.
+        model: The expected snapshot class.
+        validate: Whether to validate with pydantic. Without validation the
+            models are built directly, which is faster for trusted files.
+
+    Returns:
+        M: The decoded snapshot.
+
+    Raises:
+        ValueError: If the data is not a binary snapshot of the expected class
+            and format version.
+    """
+    magic, version, flags, _ = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        msg = "Not a binary snapshot"
+        raise ValueError(msg)
+    if version != FORMAT_VERSION:
+        msg = f"Unsupported binary snapshot version {version}"
+        raise ValueError(msg)
+
+    body = data[_HEADER.size :]
+    if flags & _FLAG_COMPRESSED:
+        body = zlib.decompress(body)
+
+    (count,) = _U32.unpack_from(body, 0)
+    ends = list(accumulate(array("I", body[4 : 4 + 4 * count]), initial=4 + 4 * count))
+    strings = [body[start:end].decode() for start, end in pairwise(ends)]
+
+    if not strings or strings[0] != model.__name__:
+        msg = f"Binary snapshot does not contain a {model.__name__}"
+        raise ValueError(msg)
+
+    _, decode = _codec(model)
+    (decoded,) = decode(_Reader(body, strings, ends[-1]), 1, not validate)
+    if validate:
+        return model.model_validate(decoded)
+    return decoded
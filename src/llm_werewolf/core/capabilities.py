@@ -0,0 +1,78 @@
+from array import array
+from collections.abc import Sequence
+
+from llm_werewolf.core.types import Capability, PlayerChange, PlayerProtocol
+
+_REFRESH_ON = frozenset({PlayerChange.ROLE_TRANSFORMED, PlayerChange.ROLE_REVEALED})
+
+
+class CapabilityTable:
+    """Capability flags of every player in a game, indexed by seat.
+
+    The table is built once when the game state is created, so rule checks are a
+    dict lookup plus an array read instead of comparing role names. Roles whose
+    capabilities change (a transformation or a reveal) notify their player, and
+    the affected row is recomputed from ``Role.get_capabilities``.
+    """
+
+    __slots__ = ("_flags", "_seats")
+
+    def __init__(self, players: Sequence[PlayerProtocol]) -> None:
+        """Initialize the table.
+
+        Args:
+            players: All players in the game, in seat order.
+        """
+        self._seats = {player.player_id: seat for seat, player in enumerate(players)}
+        self._flags = array("H", (int(player.role.get_capabilities()) for player in players))
+        for player in players:
+            player.add_listener(self._on_player_change)
+
+    def has(self, player: PlayerProtocol, capability: Capability) -> bool:
+        """Check whether a player currently has a capability.
+
+        Args:
+            player: The player to check.
+            capability: The capability flag to test.
+
+        Returns:
+            bool: True if the player has the capability.
+        """
+        seat = self._seats.get(player.player_id)
+        if seat is None:
+            return bool(player.role.get_capabilities() & capability)
+        return bool(self._flags[seat] & capability)
+
+    def get(self, player: PlayerProtocol) -> Capability:
+        """Get all capability flags of a player.
+
+        Args:
+            player: The player to look up.
+
+        Returns:
+            Capability: The player's current flags.
+        """
+        seat = self._seats.get(player.player_id)
+        if seat is None:
+            return player.role.get_capabilities()
+        return Capability(self._flags[seat])
+
+    def refresh(self, player: PlayerProtocol) -> None:
+        """Recompute a player's flags from their role.
+
+        Args:
+            player: The player whose role state changed.
+        """
+        seat = self._seats.get(player.player_id)
+        if seat is not None:
+            self._flags[seat] = int(player.role.get_capabilities())
+
+    def _on_player_change(self, player: PlayerProtocol, change: PlayerChange) -> None:
+        """Refresh a player's row when their role state changed.
+
+        Args:
+            player: The player that changed.
+            change: The kind of change that occurred.
+        """
+        if change in _REFRESH_ON:
+            self.refresh(player)
@@ -12,6 +12,7 @@ class PlayerConfig(BaseModel):
     Agent type is determined by the model field:
     - model="human": Human player via console input
     - model="demo": Random response bot for testing
+    - model="mcts": CPU-only Monte Carlo search bot
     - model=<model_name> + base_url: LLM agent with ChatCompletion API
     """
 
@@ -20,7 +21,7 @@ class PlayerConfig(BaseModel):
         ...,
         title="Model Name",
         description="The model name of your player",
-        examples=["gpt-5", "human", "demo"],
+        examples=["gpt-5", "human", "demo", "mcts"],
     )
     base_url: str | None = Field(
         default=None,
@@ -37,13 +38,22 @@ class PlayerConfig(BaseModel):
     reasoning_effort: ReasoningEffort | None = Field(
         default=None, title="Reasoning Effort", description="Reasoning effort level for LLM"
     )
+    rollouts: int = Field(
+        default=64, ge=1, title="Rollouts", description="Simulated games per decision (mcts only)"
+    )
+    workers: int = Field(
+        default=0,
+        ge=0,
+        title="Worker Processes",
+        description="Processes running rollouts in parallel; 0 runs them in-process (mcts only)",
+    )
 
     @field_validator("base_url")
     @classmethod
     def validate_base_url(cls, v: str | None, info: ValidationInfo) -> str | None:
         """Validate that base_url is provided for LLM models."""
         model = info.data.get("model", "")
-        if model not in {"human", "demo"} and not v:
+        if model not in {"human", "demo", "mcts"} and not v:
             msg = f"base_url is required for LLM model '{model}'"
             raise ValueError(msg)
         return v
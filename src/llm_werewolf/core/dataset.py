@@ -0,0 +1,460 @@
+"""Columnar export of player decisions for analytics and fine-tuning.
+
+``DecisionDataset`` turns the decision events of finished games, from a live
+engine or a ``GameArchive``, into one row per decision (vote, night action,
+speech, ...) and stores the rows as NumPy arrays in an ``.npz`` file or, when
+pyarrow is installed, as an Arrow table. Loading a dataset is then one array
+read per column instead of one Python object per event.
+
+``PromptShardWriter`` writes the prompt and response pairs of agents that keep
+a conversation to numbered JSONL shards for fine-tuning.
+
+This module needs NumPy, which is an optional dependency:
+``pip install llm_werewolf[sim]``.
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, NamedTuple
+from pathlib import Path
+from itertools import pairwise
+from collections import defaultdict
+from collections.abc import Mapping, Iterable, Iterator
+
+from typing_extensions import Self
+
+from llm_werewolf.core.types import USAGE_FIELDS, ActionType, EventRecord, MemoryAgentProtocol
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - exercised only without the extra
+    msg = "The decision dataset requires numpy; install it with `pip install llm_werewolf[sim]`"
+    raise ImportError(msg) from e
+
+try:
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:  # pragma: no cover - Arrow output is optional
+    pa = None
+    feather = None
+
+if TYPE_CHECKING:
+    from llm_werewolf.core.engine import GameEngine
+    from llm_werewolf.core.archive import GameArchive
+
+DECISION_COLUMNS: dict[str, Any] = {
+    "game": np.int32,
+    "round": np.int16,
+    "phase": str,
+    "player_id": str,
+    "model": str,
+    "role": str,
+    "decision": str,
+    "target_id": str,
+    "correct": np.int8,
+    "prompt_tokens": np.int32,
+    "completion_tokens": np.int32,
+    "latency_ms": np.float32,
+}
+"""Column names of a decision dataset and their NumPy dtypes."""
+
+SUPPORTIVE_DECISIONS = frozenset({
+    ActionType.GUARD_PROTECT.value,
+    ActionType.WITCH_SAVE.value,
+    ActionType.SHERIFF_VOTE.value,
+    ActionType.SHERIFF_TRANSFER.value,
+})
+"""Decisions that are correct when the target is on the actor's side; others aim at opponents."""
+
+UNSCORED_DECISIONS = frozenset({ActionType.CUPID_LINK.value})
+"""Targeted decisions that have no right or wrong side."""
+
+
+class Seat(NamedTuple):
+    """Ground truth about one player of a game."""
+
+    model: str
+    role: str
+    camp: str
+
+
+def _target_of(data: Mapping[str, Any]) -> str:
+    """Get the player a decision was aimed at.
+
+    Args:
+        data: The data of the decision event.
+
+    Returns:
+        str: The target's player ID, or an empty string for decisions without one.
+    """
+    return data.get("target_id") or data.get("to_player_id") or data.get("player1_id") or ""
+
+
+def _is_correct(decision: str, actor: Seat | None, target: Seat | None) -> int:
+    """Score a decision against the players' camps.
+
+    Args:
+        decision: The decision kind.
+        actor: The acting player.
+        target: The target player.
+
+    Returns:
+        int: 1 if correct, 0 if not, -1 if the decision cannot be scored.
+    """
+    if actor is None or target is None or decision in UNSCORED_DECISIONS:
+        return -1
+    same_side = actor.camp == target.camp
+    return int(same_side if decision in SUPPORTIVE_DECISIONS else not same_side)
+
+
+def _engine_seats(engine: "GameEngine") -> dict[str, Seat]:
+    """Get the ground truth about the players of an engine's game.
+
+    Args:
+        engine: The engine.
+
+    Returns:
+        dict[str, Seat]: Seat of each player ID.
+    """
+    players = engine.game_state.players if engine.game_state else []
+    return {
+        player.player_id: Seat(player.ai_model, player.get_role_name(), player.get_camp())
+        for player in players
+    }
+
+
+class DecisionDataset:
+    """Decisions of many games, collected row by row and exported as columns.
+
+    Correctness is scored against the camps the players had at the end of the
+    game. Usage columns are -1 (tokens) and NaN (latency) for agents that do
+    not measure usage, such as demo agents.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty dataset."""
+        self._columns: dict[str, list[Any]] = {name: [] for name in DECISION_COLUMNS}
+        self.games = 0
+
+    def __len__(self) -> int:
+        """Count the decision rows.
+
+        Returns:
+            int: Number of rows.
+        """
+        return len(self._columns["game"])
+
+    def _add_row(
+        self,
+        game: int,
+        round_number: int,
+        phase: str,
+        decision: str,
+        actor_id: str,
+        target_id: str,
+        seats: Mapping[str, Seat],
+        usage: Mapping[str, float],
+    ) -> None:
+        """Append one decision row.
+
+        Args:
+            game: The game number.
+            round_number: Round of the decision.
+            phase: Phase of the decision.
+            decision: The decision kind.
+            actor_id: The deciding player.
+            target_id: The target player, or an empty string.
+            seats: Ground truth about the game's players.
+            usage: Model usage of the decision, if measured.
+        """
+        actor = seats.get(actor_id)
+        columns = self._columns
+        columns["game"].append(game)
+        columns["round"].append(round_number)
+        columns["phase"].append(phase)
+        columns["player_id"].append(actor_id)
+        columns["model"].append(actor.model if actor else "")
+        columns["role"].append(actor.role if actor else "")
+        columns["decision"].append(decision)
+        columns["target_id"].append(target_id)
+        columns["correct"].append(_is_correct(decision, actor, seats.get(target_id)))
+        columns["prompt_tokens"].append(usage.get("prompt_tokens", -1))
+        columns["completion_tokens"].append(usage.get("completion_tokens", -1))
+        columns["latency_ms"].append(usage.get("latency_ms", np.nan))
+
+    def _add_event(
+        self,
+        game: int,
+        round_number: int,
+        phase: str,
+        data: Mapping[str, Any] | None,
+        seats: Mapping[str, Seat],
+    ) -> None:
+        """Append the decision rows of one event, if it records decisions.
+
+        The werewolves' kill event holds one decision per werewolf vote.
+
+        Args:
+            game: The game number.
+            round_number: Round of the event.
+            phase: Phase of the event.
+            data: The event data.
+            seats: Ground truth about the game's players.
+        """
+        if not data or "decision" not in data:
+            return
+        decision = data["decision"]
+        if "votes" in data:
+            usage = data.get("usage", {})
+            for voter_id, target_id in data["votes"].items():
+                self._add_row(
+                    game,
+                    round_number,
+                    phase,
+                    decision,
+                    voter_id,
+                    target_id,
+                    seats,
+                    usage.get(voter_id, {}),
+                )
+            return
+        self._add_row(
+            game,
+            round_number,
+            phase,
+            decision,
+            data.get("actor_id", ""),
+            _target_of(data),
+            seats,
+            {key: data[key] for key in USAGE_FIELDS if key in data},
+        )
+
+    def add_game(
+        self, events: Iterable[EventRecord], seats: Mapping[str, Seat], game: int | None = None
+    ) -> int:
+        """Add the decisions of one game.
+
+        Args:
+            events: The game's events.
+            seats: Ground truth about each player ID.
+            game: Number of the game in the dataset; defaults to the number of
+                games added before.
+
+        Returns:
+            int: The game number used.
+        """
+        game = self.games if game is None else game
+        for event in events:
+            self._add_event(game, event.round_number, event.phase, event.data, seats)
+        self.games += 1
+        return game
+
+    def add_engine(self, engine: "GameEngine", game: int | None = None) -> int:
+        """Add the decisions of the game an engine played.
+
+        Args:
+            engine: The engine.
+            game: Number of the game in the dataset; defaults to the number of
+                games added before.
+
+        Returns:
+            int: The game number used.
+        """
+        return self.add_game(engine.get_events(), _engine_seats(engine), game)
+
+    def add_archive(self, archive: "GameArchive") -> int:
+        """Add the decisions of every archived game, numbered by archive ID.
+
+        Args:
+            archive: The archive.
+
+        Returns:
+            int: Number of games added.
+        """
+        seats: dict[int, dict[str, Seat]] = defaultdict(dict)
+        for game_id, player_id, model, role, camp in archive.query(
+            "SELECT game_id, player_id, model, role, camp FROM players"
+        ):
+            seats[game_id][player_id] = Seat(model, role, camp)
+
+        for game_id, round_number, phase, data in archive.query(
+            "SELECT game_id, round_number, phase, data FROM events"
+            " WHERE data LIKE '%\"decision\"%' ORDER BY game_id, seq"
+        ):
+            self._add_event(game_id, round_number, phase, json.loads(data), seats[game_id])
+        self.games += len(seats)
+        return len(seats)
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Build one NumPy array per column.
+
+        Returns:
+            dict[str, np.ndarray]: Arrays keyed by the names in ``DECISION_COLUMNS``.
+        """
+        return {
+            name: np.array(self._columns[name], dtype=dtype)
+            for name, dtype in DECISION_COLUMNS.items()
+        }
+
+    def save_npz(self, file_path: str | Path, compress: bool = True) -> None:
+        """Write the dataset to an ``.npz`` file.
+
+        Args:
+            file_path: Path to the file.
+            compress: Whether to compress the arrays.
+        """
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        save = np.savez_compressed if compress else np.savez
+        save(path, **self.to_arrays())
+
+    def to_arrow(self) -> "pa.Table":
+        """Build an Arrow table, with the string columns dictionary-encoded.
+
+        Returns:
+            pa.Table: The decision table.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if pa is None:
+            msg = "Arrow export requires pyarrow; install it with `pip install pyarrow`"
+            raise ImportError(msg)
+        columns = {}
+        for name, array in self.to_arrays().items():
+            column = pa.array(array)
+            columns[name] = column.dictionary_encode() if array.dtype.kind == "U" else column
+        return pa.table(columns)
+
+    def save_arrow(self, file_path: str | Path) -> None:
+        """Write the dataset to an Arrow IPC (Feather) file.
+
+        Args:
+            file_path: Path to the file.
+        """
+        table = self.to_arrow()
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        feather.write_feather(table, path)
+
+
+def load_decisions(file_path: str | Path) -> dict[str, np.ndarray]:
+    """Load a dataset written by ``DecisionDataset.save_npz``.
+
+    Args:
+        file_path: Path to the ``.npz`` file.
+
+    Returns:
+        dict[str, np.ndarray]: One array per column.
+    """
+    with np.load(file_path) as arrays:
+        return {name: arrays[name] for name in arrays.files}
+
+
+def _exchanges(chat_history: Iterable[Mapping[str, str]]) -> Iterator[tuple[str, str]]:
+    """Pair every user message with the assistant reply that follows it.
+
+    Args:
+        chat_history: The conversation, in OpenAI message format.
+
+    Yields:
+        tuple[str, str]: The prompt and the response.
+    """
+    for prompt, reply in pairwise(chat_history):
+        if prompt["role"] == "user" and reply["role"] == "assistant":
+            yield prompt["content"], reply["content"]
+
+
+class PromptShardWriter:
+    """Writes prompt and response pairs to numbered JSONL shards.
+
+    Shards are named ``shard-00000.jsonl`` and so on, each holding at most
+    ``shard_size`` records. Opening a directory that already has shards
+    continues with a new shard after the highest-numbered one, so existing
+    shards are never overwritten.
+    """
+
+    def __init__(self, directory: str | Path, shard_size: int = 10_000) -> None:
+        """Open the writer.
+
+        Args:
+            directory: Directory for the shards; created if missing.
+            shard_size: Maximum number of records per shard.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.shard_size = shard_size
+        numbers = [
+            int(path.stem.removeprefix("shard-"))
+            for path in self.directory.glob("shard-*.jsonl")
+            if path.stem.removeprefix("shard-").isdigit()
+        ]
+        self._shard = max(numbers, default=-1) + 1
+        self._count = 0
+        self._file = None
+
+    def write(self, record: Mapping[str, Any]) -> None:
+        """Append one record, starting a new shard when the current one is full.
+
+        Args:
+            record: The record.
+        """
+        if self._file is None or self._count >= self.shard_size:
+            self.close()
+            # Exclusive mode: never overwrite a shard that is already on disk
+            self._file = (self.directory / f"shard-{self._shard:05d}.jsonl").open(
+                "x", encoding="utf-8"
+            )
+            self._shard += 1
+            self._count = 0
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._count += 1
+
+    def add_engine(self, engine: "GameEngine", game: int = 0) -> int:
+        """Write the exchanges of every agent in an engine's game that keeps a conversation.
+
+        Args:
+            engine: The engine.
+            game: Game number stored with each record.
+
+        Returns:
+            int: Number of records written.
+        """
+        seats = _engine_seats(engine)
+        written = 0
+        for player in engine.game_state.players if engine.game_state else []:
+            if not isinstance(player.agent, MemoryAgentProtocol):
+                continue
+            seat = seats[player.player_id]
+            for prompt, completion in _exchanges(player.agent.chat_history):
+                self.write({
+                    "game": game,
+                    "player_id": player.player_id,
+                    "model": seat.model,
+                    "role": seat.role,
+                    "prompt": prompt,
+                    "completion": completion,
+                })
+                written += 1
+        return written
+
+    def close(self) -> None:
+        """Close the current shard."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> Self:
+        """Use the writer as a context manager.
+
+        Returns:
+            PromptShardWriter: This writer.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the writer when leaving the context.
+
+        Args:
+            *exc_info: Exception information, if any.
+        """
+        self.close()
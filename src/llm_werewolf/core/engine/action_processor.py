@@ -1,6 +1,8 @@
+from typing import Any
+from operator import attrgetter
 from collections.abc import Callable
 
-from llm_werewolf.core.types import EventType, ActionPriority
+from llm_werewolf.core.types import EventType
 from llm_werewolf.core.locale import Locale
 from llm_werewolf.core.game_state import GameState
 from llm_werewolf.core.actions.base import Action
@@ -11,11 +13,68 @@ from llm_werewolf.core.actions.villager import (
     WitchPoisonAction,
     GuardProtectAction,
 )
-from llm_werewolf.core.actions.werewolf import (
-    WhiteWolfKillAction,
-    WolfBeautyCharmAction,
-    NightmareWolfBlockAction,
-)
+from llm_werewolf.core.actions.werewolf import WhiteWolfKillAction, WolfBeautyCharmAction
+
+ActionLogger = Callable[[Any, Any], None]
+
+_ACTION_LOGGERS: dict[type[Action], ActionLogger | None] = {}
+"""Event emitter of each action class, keyed on the exact class.
+
+Populated when this module is imported; other classes are added on first use.
+"""
+
+_by_priority = attrgetter("priority")
+
+
+def logs_action(*action_types: type[Action]) -> Callable[[ActionLogger], ActionLogger]:
+    """Register a processor method as the event emitter for some action classes.
+
+    Args:
+        *action_types: The action classes whose execution the method logs.
+
+    Returns:
+        Callable[[ActionLogger], ActionLogger]: Decorator returning the method unchanged.
+    """
+
+    def register(logger: ActionLogger) -> ActionLogger:
+        for action_type in action_types:
+            _ACTION_LOGGERS[action_type] = logger
+        return logger
+
+    return register
+
+
+def _resolve_logger(action_type: type[Action]) -> ActionLogger | None:
+    """Find and cache the emitter of an action class registered on none of its own.
+
+    Subclasses of a logged action emit its event; the nearest registered base
+    class wins. The result, None included, is stored under the exact class so
+    later dispatch is a single lookup.
+
+    Args:
+        action_type: The action class.
+
+    Returns:
+        ActionLogger | None: The emitter, or None if the class logs no event.
+    """
+    logger = next(
+        (_ACTION_LOGGERS[base] for base in action_type.__mro__ if base in _ACTION_LOGGERS), None
+    )
+    _ACTION_LOGGERS[action_type] = logger
+    return logger
+
+
+def _decision_data(action: Action, **data: object) -> dict[str, object]:
+    """Build the data of an event that records an action as a decision.
+
+    Args:
+        action: The executed action.
+        **data: Event-specific data.
+
+    Returns:
+        dict[str, object]: The data with the decision kind and the acting player.
+    """
+    return {"decision": action.get_action_type().value, "actor_id": action.actor.player_id} | data
 
 
 class ActionProcessorMixin:
@@ -25,34 +84,6 @@ class ActionProcessorMixin:
     locale: Locale
     _log_event: Callable
 
-    @staticmethod
-    def _get_action_priority(action: Action) -> int:
-        """Get action priority. Higher number = higher priority (executes first).
-
-        Args:
-            action: The action to get priority for.
-
-        Returns:
-            int: Priority value (higher executes first).
-        """
-        # Priority map ordered from highest to lowest priority
-        priority_map = {
-            "CupidLinkAction": ActionPriority.CUPID.value,
-            "NightmareWolfBlockAction": ActionPriority.NIGHTMARE_WOLF.value,
-            "GuardProtectAction": ActionPriority.GUARD.value,
-            "GuardianWolfProtectAction": ActionPriority.GUARD.value,
-            "WerewolfVoteAction": ActionPriority.WEREWOLF.value,
-            "WerewolfKillAction": ActionPriority.WEREWOLF.value,
-            "WolfBeautyCharmAction": ActionPriority.WEREWOLF.value,
-            "WhiteWolfKillAction": ActionPriority.WHITE_WOLF.value,
-            "WitchSaveAction": ActionPriority.WITCH.value,
-            "WitchPoisonAction": ActionPriority.WITCH.value,
-            "SeerCheckAction": ActionPriority.SEER.value,
-            "GraveyardKeeperCheckAction": ActionPriority.GRAVEYARD_KEEPER.value,
-            "RavenMarkAction": ActionPriority.RAVEN.value,
-        }
-        return priority_map.get(action.__class__.__name__, 0)
-
     def _is_actor_blocked(self, action: Action) -> bool:
         """Check if actor is blocked by Nightmare Wolf.
 
@@ -65,67 +96,58 @@ class ActionProcessorMixin:
         if not self.game_state or not self.game_state.nightmare_blocked:
             return False
 
-        if not hasattr(action, "actor"):
-            return False
-
-        if isinstance(action, NightmareWolfBlockAction):
+        if not action.blockable:
             return False
 
         return action.actor.player_id == self.game_state.nightmare_blocked
 
+    @logs_action(GuardProtectAction)
     def _log_guard_action(self, action: GuardProtectAction) -> None:
         """Log guard protection action."""
         self._log_event(
             EventType.GUARD_PROTECTED,
             self.locale.get("guard_protected", target=action.target.name),
-            data={"target_id": action.target.player_id},
+            data=_decision_data(action, target_id=action.target.player_id),
         )
         if action.actor.agent and self.game_state:
             action.actor.agent.add_decision(
                 f"Round {self.game_state.round_number}: Protected {action.target.name}"
             )
 
+    @logs_action(WitchSaveAction)
     def _log_witch_save_action(self, action: WitchSaveAction) -> None:
         """Log witch save action."""
         self._log_event(
             EventType.WITCH_SAVED,
             self.locale.get("witch_saved", target=action.target.name),
-            data={"target_id": action.target.player_id},
+            data=_decision_data(action, target_id=action.target.player_id),
         )
         if action.actor.agent and self.game_state:
             action.actor.agent.add_decision(
                 f"Round {self.game_state.round_number}: Used save potion on {action.target.name}"
             )
 
+    @logs_action(WitchPoisonAction)
     def _log_witch_poison_action(self, action: WitchPoisonAction) -> None:
         """Log witch poison action."""
         self._log_event(
             EventType.MESSAGE,
             self.locale.get("witch_uses_poison", target=action.target.name),
-            data={"target_id": action.target.player_id},
+            data=_decision_data(action, target_id=action.target.player_id),
         )
         if action.actor.agent and self.game_state:
             action.actor.agent.add_decision(
                 f"Round {self.game_state.round_number}: Used poison on {action.target.name}"
             )
 
+    @logs_action(SeerCheckAction)
     def _log_seer_action(self, action: SeerCheckAction) -> None:
         """Log seer check action."""
-        result = action.target.get_camp()
-        # HiddenWolf appears as villager to Seer
-        if action.target.role.name == "HiddenWolf":
-            result = "villager"
-        # BloodMoonApostle (untransformed) appears as villager to Seer
-        if (
-            action.target.role.name == "Blood Moon Apostle"
-            and hasattr(action.target.role, "transformed")
-            and not action.target.role.transformed
-        ):
-            result = "villager"
+        result = action.get_result()
         self._log_event(
             EventType.SEER_CHECKED,
             self.locale.get("seer_checked", target=action.target.name, result=result),
-            data={"target_id": action.target.player_id, "result": result},
+            data=_decision_data(action, target_id=action.target.player_id, result=result),
             visible_to=[action.actor.player_id],
         )
         if action.actor.agent and self.game_state:
@@ -133,6 +155,7 @@ class ActionProcessorMixin:
                 f"Round {self.game_state.round_number}: Checked {action.target.name}, result: {result}"
             )
 
+    @logs_action(CupidLinkAction)
     def _log_cupid_action(self, action: CupidLinkAction) -> None:
         """Log cupid link action."""
         self._log_event(
@@ -140,49 +163,46 @@ class ActionProcessorMixin:
             self.locale.get(
                 "cupid_links", player1=action.target1.name, player2=action.target2.name
             ),
-            data={"player1_id": action.target1.player_id, "player2_id": action.target2.player_id},
+            data=_decision_data(
+                action, player1_id=action.target1.player_id, player2_id=action.target2.player_id
+            ),
         )
         if action.actor.agent and self.game_state:
             action.actor.agent.add_decision(
                 f"Round {self.game_state.round_number}: Linked {action.target1.name} and {action.target2.name} as lovers"
             )
 
+    @logs_action(WhiteWolfKillAction)
     def _log_white_wolf_action(self, action: WhiteWolfKillAction) -> None:
         """Log white wolf kill action."""
         self._log_event(
             EventType.MESSAGE,
             self.locale.get("white_wolf_kills", target=action.target.name),
-            data={"target_id": action.target.player_id},
+            data=_decision_data(action, target_id=action.target.player_id),
         )
 
+    @logs_action(WolfBeautyCharmAction)
     def _log_wolf_beauty_action(self, action: WolfBeautyCharmAction) -> None:
         """Log wolf beauty charm action."""
         self._log_event(
             EventType.MESSAGE,
             self.locale.get("wolf_beauty_charms", target=action.target.name),
-            data={"target_id": action.target.player_id},
+            data=_decision_data(action, target_id=action.target.player_id),
         )
 
     def _log_action_event(self, action: Action) -> None:
-        """Log event for specific action types.
+        """Log the event registered for the action's class, if any.
 
         Args:
             action: The action to log.
         """
-        if isinstance(action, GuardProtectAction):
-            self._log_guard_action(action)
-        elif isinstance(action, WitchSaveAction):
-            self._log_witch_save_action(action)
-        elif isinstance(action, WitchPoisonAction):
-            self._log_witch_poison_action(action)
-        elif isinstance(action, SeerCheckAction):
-            self._log_seer_action(action)
-        elif isinstance(action, CupidLinkAction):
-            self._log_cupid_action(action)
-        elif isinstance(action, WhiteWolfKillAction):
-            self._log_white_wolf_action(action)
-        elif isinstance(action, WolfBeautyCharmAction):
-            self._log_wolf_beauty_action(action)
+        action_type = type(action)
+        try:
+            logger = _ACTION_LOGGERS[action_type]
+        except KeyError:
+            logger = _resolve_logger(action_type)
+        if logger is not None:
+            logger(self, action)
 
     def process_actions(self, actions: list) -> list[str]:
         """Process a list of actions.
@@ -196,7 +216,7 @@ class ActionProcessorMixin:
         messages = []
 
         # Sort by priority: higher priority value = executes first
-        sorted_actions = sorted(actions, key=self._get_action_priority, reverse=True)
+        sorted_actions = sorted(actions, key=_by_priority, reverse=True)
 
         for action in sorted_actions:
             # Check if actor is blocked by Nightmare Wolf
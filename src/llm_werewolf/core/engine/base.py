@@ -1,21 +1,59 @@
 import random
 from typing import TYPE_CHECKING, Any
 from pathlib import Path
+from contextlib import ExitStack
+from collections.abc import Iterable, Sequence
 
 from rich.console import Console
-
-from llm_werewolf.core.types import Event, EventType, GamePhase, RoleProtocol, AgentProtocol
+from typing_extensions import Self
+
+from llm_werewolf.core.types import (
+    EventType,
+    GamePhase,
+    EventRecord,
+    RoleProtocol,
+    AgentProtocol,
+    UsageAgentProtocol,
+    GameAwareAgentProtocol,
+)
 from llm_werewolf.core.config import GameConfig
 from llm_werewolf.core.events import EventLogger
 from llm_werewolf.core.locale import Locale
 from llm_werewolf.core.player import Player
+from llm_werewolf.core.replay import (
+    Cassette,
+    ReplayAgent,
+    ReplayResult,
+    CassettePlayer,
+    RecordingAgent,
+    CassetteExhaustedError,
+    journal_game,
+    first_divergence,
+)
+from llm_werewolf.core.tracing import trace_span
 from llm_werewolf.core.victory import VictoryChecker
 from llm_werewolf.core.game_state import GameState
-from llm_werewolf.core.serialization import load_game_state, save_game_state
+from llm_werewolf.core.transcript import Transcript
+from llm_werewolf.core.role_registry import create_roles
+from llm_werewolf.core.serialization import (
+    CheckpointChain,
+    CheckpointSnapshot,
+    load_checkpoint,
+    load_game_state,
+    save_checkpoint,
+    save_game_state,
+    restore_rng_state,
+    restore_game_state,
+    serialize_checkpoint,
+    restore_agent_memories,
+)
 from llm_werewolf.core.event_formatter import EventFormatter
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Mapping, Callable
+
+    from llm_werewolf.core.journal import EventJournal
+    from llm_werewolf.core.io_writer import BackgroundWriter
 
 console = Console()
 
@@ -38,12 +76,18 @@ class GameEngineBase:
         self._last_phase: str = ""  # Track phase changes for separators
 
         # Global discussion history for context management
-        self.public_discussion_history: list[str] = []  # All players can see
-        self.werewolf_discussion_history: list[str] = []  # Only werewolves can see
-
-        self.on_event: Callable[[Event], None] = self._default_print_event
-
-    def _default_print_event(self, event: Event) -> None:
+        self.public_discussion_history = Transcript()  # All players can see
+        self.werewolf_discussion_history = Transcript()  # Only werewolves
+
+        self.on_event: Callable[[EventRecord], None] = self._default_print_event
+        self.journal: EventJournal | None = None  # Optional on-disk copy of every event
+        self.io_writer: BackgroundWriter | None = None  # Writes phase checkpoints off-thread
+        self.checkpoint_dir: Path | None = None  # Where phase checkpoints go, if enabled
+        self.binary_checkpoints = False  # Write phase checkpoints in the compact binary format
+        self.delta_checkpoints = 0  # Full checkpoint every N phases, deltas between; 0 is off
+        self._checkpoint_chain: CheckpointChain | None = None
+
+    def _default_print_event(self, event: EventRecord) -> None:
         """Default event handler that prints to console.
 
         This can be overridden by TUI or other interfaces.
@@ -93,8 +137,14 @@ class GameEngineBase:
             )
             player_objects.append(player)
 
+        # Per-game logs start empty so a reused engine does not carry over old games
+        self.event_logger.clear_events()
+        self.public_discussion_history.clear()
+        self.werewolf_discussion_history.clear()
+
         self.game_state = GameState(player_objects)
         self.victory_checker = VictoryChecker(self.game_state)
+        self._attach_agents()
 
         self._log_event(
             EventType.GAME_STARTED,
@@ -102,6 +152,93 @@ class GameEngineBase:
             data={"player_count": len(player_objects)},
         )
 
+    def setup_recorded_game(self, players: list[AgentProtocol], seed: int) -> Cassette:
+        """Start a new game and record every agent response for ``replay``.
+
+        The ``random`` module is seeded with ``seed`` and the roles are created
+        from the configuration, so a replay deals the same roles. The returned
+        cassette fills up while the game is played; save it afterwards with
+        ``save_cassette``.
+
+        Args:
+            players: List of agent instances with name and model attributes.
+            seed: Seed for the game's random draws.
+
+        Returns:
+            Cassette: The cassette the responses are recorded into.
+
+        Raises:
+            RuntimeError: If the engine has no game configuration.
+        """
+        if self.config is None:
+            msg = "A game configuration is required to record a game"
+            raise RuntimeError(msg)
+
+        cassette = Cassette(
+            seed=seed,
+            language=self.locale.language,
+            config=self.config,
+            players=[CassettePlayer(name=agent.name, model=agent.model) for agent in players],
+        )
+        recorders = [
+            RecordingAgent(agent, seat, seed=f"{seed}:{index}")
+            for index, (agent, seat) in enumerate(zip(players, cassette.players, strict=True))
+        ]
+        random.seed(seed)
+        self.setup_game(players=recorders, roles=create_roles(self.config.role_names))
+        return cassette
+
+    @classmethod
+    def replay(
+        cls, cassette: Cassette, expected: Iterable[EventRecord] | str | Path, game: int = 0
+    ) -> ReplayResult:
+        """Play a recorded game again and compare it with the recorded events.
+
+        The game runs on a fresh engine with the cassette's seed, configuration
+        and responses, so no model is called. The state of the ``random`` module
+        is restored afterwards.
+
+        Args:
+            cassette: The recorded seed, configuration and responses.
+            expected: The recorded events, or a journal directory to read them from.
+            game: Number of the recorded game in the journal.
+
+        Returns:
+            ReplayResult: The replayed events and the first divergence, if any.
+        """
+        if isinstance(expected, (str, Path)):
+            expected = journal_game(expected, game)
+
+        engine = cls(cassette.config, language=cassette.language)
+        engine.on_event = lambda event: None
+        agents = [ReplayAgent(seat) for seat in cassette.players]
+
+        random_state = random.getstate()
+        random.seed(cassette.seed)
+        error = None
+        try:
+            engine.setup_game(players=agents, roles=create_roles(cassette.config.role_names))
+            engine.play_game()
+        except CassetteExhaustedError as exc:
+            error = str(exc)
+        finally:
+            random.setstate(random_state)
+
+        if error is None:
+            error = next((agent.error for agent in agents if agent.error), None)
+        events = list(engine.get_events())
+        return ReplayResult(
+            events=events, divergence=first_divergence(expected, events), error=error
+        )
+
+    def _attach_agents(self) -> None:
+        """Give agents that read the game (e.g. search agents) access to it."""
+        if not self.game_state:
+            return
+        for player in self.game_state.players:
+            if isinstance(player.agent, GameAwareAgentProtocol):
+                player.agent.attach(self, player.player_id)
+
     def assign_roles(self) -> dict[str, str]:
         """Assign roles to players (already done in setup_game).
 
@@ -153,6 +290,10 @@ class GameEngineBase:
     ) -> None:
         """Log an event and notify listeners.
 
+        Decision events name the decision and the acting player in ``decision``
+        and ``actor_id``; the model usage of the actor's agent since its previous
+        decision is added to their data.
+
         Args:
             event_type: Type of the event.
             message: Event message.
@@ -162,6 +303,9 @@ class GameEngineBase:
         if not self.game_state:
             return
 
+        if data and "decision" in data:
+            data |= self._take_usage(data.get("actor_id"))
+
         event = self.event_logger.create_event(
             event_type=event_type,
             round_number=self.game_state.round_number,
@@ -170,9 +314,26 @@ class GameEngineBase:
             data=data,
             visible_to=visible_to,
         )
+        if self.journal is not None:
+            self.journal.append(event)
 
         self.on_event(event)
 
+    def _take_usage(self, player_id: str | None) -> dict[str, float]:
+        """Collect the model usage of a player's agent since its previous decision.
+
+        Args:
+            player_id: ID of the player, or None.
+
+        Returns:
+            dict[str, float]: Values for ``USAGE_FIELDS``, or an empty dict if the
+                agent does not measure usage.
+        """
+        player = self.game_state.get_player(player_id) if player_id and self.game_state else None
+        if player is None or not isinstance(player.agent, UsageAgentProtocol):
+            return {}
+        return player.agent.take_usage()
+
     def _get_public_discussion_context(self) -> str:
         """Get formatted public discussion history as context.
 
@@ -182,7 +343,7 @@ class GameEngineBase:
         if not self.public_discussion_history:
             return ""
 
-        return "\n\nPrevious discussion:\n" + "\n".join(self.public_discussion_history)
+        return "\n\nPrevious discussion:\n" + self.public_discussion_history.render()
 
     def _get_werewolf_discussion_context(self) -> str:
         """Get formatted werewolf discussion history as context.
@@ -193,7 +354,35 @@ class GameEngineBase:
         if not self.werewolf_discussion_history:
             return ""
 
-        return "\n\nWerewolf team discussion:\n" + "\n".join(self.werewolf_discussion_history)
+        return "\n\nWerewolf team discussion:\n" + self.werewolf_discussion_history.render()
+
+    def fork(self, agents: "Mapping[str, AgentProtocol] | None" = None) -> Self:
+        """Create a silent engine that plays on with a fork of the current game.
+
+        The fork's events are logged to its own event logger and not displayed,
+        and its discussion transcripts start empty. Use policy agents to run phase
+        functions (``step``, ``run_night_phase``...) on the fork for what-if search
+        without calling the original agents.
+
+        Args:
+            agents: Agent for each player ID in the fork. Players without an entry
+                have no agent and are skipped when the engine asks for decisions.
+
+        Returns:
+            Self: The forked engine, of the same class as this one.
+
+        Raises:
+            RuntimeError: If game is not initialized.
+        """
+        if not self.game_state:
+            msg = "Game not initialized"
+            raise RuntimeError(msg)
+
+        engine = type(self)(self.config, self.locale.language)
+        engine.on_event = lambda event: None
+        engine.game_state = self.game_state.fork(agents)
+        engine.victory_checker = VictoryChecker(engine.game_state)
+        return engine
 
     def get_game_state(self) -> GameState | None:
         """Get the current game state.
@@ -203,55 +392,80 @@ class GameEngineBase:
         """
         return self.game_state
 
-    def get_events(self) -> list[Event]:
+    def get_events(self) -> Sequence[EventRecord]:
         """Get all game events.
 
         Returns:
-            list[Event]: List of events.
+            Sequence[EventRecord]: All logged events, oldest first.
         """
         return self.event_logger.events
 
     def play_game(self) -> str:
         """Run the main game loop.
 
+        The loop starts at the current phase, so a game restored with
+        ``load_checkpoint`` continues where the checkpoint was taken. A checkpoint
+        is written before every phase when ``checkpoint_dir`` is set. The game,
+        each round and each phase are traced as nested spans (see ``tracing``).
+
         Returns:
             str: The final game result.
         """
         if not self.game_state:
             return "Game not initialized"
 
-        while not self.check_victory():
-            self.game_state.reset_deaths()
-
-            self.run_night_phase()
-
-            if self.check_victory():
-                break
-
-            # Sheriff election (only on first day)
-            if self.game_state.round_number == 1 and not self.game_state.sheriff_election_done:
-                self.game_state.next_phase()  # Move to SHERIFF_ELECTION
-                self.execute_sheriff_election()
-
-            if self.check_victory():
-                break
-
-            self.game_state.next_phase()  # Move to DAY_DISCUSSION
-            self.run_day_phase()
-
-            self.game_state.next_phase()  # Move to DAY_VOTING
-            self.run_voting_phase()
-
-            if self.check_victory():
-                break
-
-            self.game_state.next_phase()  # Move to next NIGHT
+        with (
+            trace_span("game", players=len(self.game_state.players)) as game_span,
+            ExitStack() as round_span,
+        ):
+            round_number = None
+            while True:
+                phase = self.game_state.phase
+                # Voting always follows the day discussion, with no victory check between
+                if phase != GamePhase.DAY_VOTING and self.check_victory():
+                    break
+
+                if phase == GamePhase.ENDED:
+                    break
+                if self.game_state.round_number != round_number:
+                    round_number = self.game_state.round_number
+                    round_span.close()
+                    round_span.enter_context(trace_span("round {round}", round=round_number))
+                if phase in {GamePhase.SETUP, GamePhase.NIGHT}:
+                    self.game_state.reset_deaths()
+                self.checkpoint()
+
+                self._run_phase(phase)
+
+                if phase != GamePhase.DAY_DISCUSSION and self.check_victory():
+                    break
+
+                # Night moves to SHERIFF_ELECTION on the first day, else to DAY_DISCUSSION
+                self.game_state.next_phase()
+            game_span.set_attribute("winner", self.game_state.winner or "")
 
         if self.game_state.winner:
             return self.locale.get("game_over", winner=self.game_state.winner)
 
         return self.locale.get("game_ended", winner="unknown", reason="")
 
+    def _run_phase(self, phase: GamePhase) -> None:
+        """Run the handler of a phase; setup runs the first night.
+
+        Args:
+            phase: The phase to run.
+        """
+        round_number = self.game_state.round_number if self.game_state else 0
+        with trace_span("{phase} phase", phase=phase.value, round=round_number):
+            if phase == GamePhase.SHERIFF_ELECTION:
+                self.execute_sheriff_election()
+            elif phase == GamePhase.DAY_DISCUSSION:
+                self.run_day_phase()
+            elif phase == GamePhase.DAY_VOTING:
+                self.run_voting_phase()
+            else:
+                self.run_night_phase()
+
     def step(self) -> list[str]:
         """Execute one step of the game (one phase)."""
         if not self.game_state:
@@ -262,6 +476,7 @@ class GameEngineBase:
 
         phase_messages = []
         current_phase = self.game_state.get_phase()
+        self.checkpoint()
 
         if current_phase == GamePhase.SETUP:
             self.game_state.next_phase()
@@ -318,3 +533,126 @@ class GameEngineBase:
         """
         self.game_state = load_game_state(file_path, agent_factory)
         self.victory_checker = VictoryChecker(self.game_state)
+        self._attach_agents()
+
+    def checkpoint(self) -> Path | None:
+        """Write a checkpoint for the current phase if ``checkpoint_dir`` is set.
+
+        Files are named after the round and phase (e.g. ``round-03-4-day_voting.json``)
+        so they sort in play order, with a ``.snap`` suffix when ``binary_checkpoints``
+        is set. When ``delta_checkpoints`` is N, only every N-th checkpoint is written
+        in full and the ones between are ``.delta.json`` files holding what changed
+        since the previous phase. The journal, if any, is synced first so that it
+        holds at least every event in the checkpoint.
+
+        With an ``io_writer`` the checkpoint is only serialized here and the file
+        is written on the writer thread, after a sync barrier that covers a journal
+        sharing the writer, so the engine never waits on the disk.
+
+        Returns:
+            Path | None: The checkpoint file, or None if checkpoints are disabled.
+                With an ``io_writer`` the file may not be written yet.
+        """
+        if self.checkpoint_dir is None or not self.game_state:
+            return None
+
+        phase = self.game_state.phase
+        stem = Path(self.checkpoint_dir) / (
+            f"round-{self.game_state.round_number:02d}-"
+            f"{list(GamePhase).index(phase)}-{phase.value}"
+        )
+        if self.journal is not None and self.journal.writer is not self.io_writer:
+            self.journal.sync()
+        if self.io_writer is not None:
+            self.io_writer.request_sync()
+
+        if self.delta_checkpoints > 0:
+            if self._checkpoint_chain is None:
+                self._checkpoint_chain = CheckpointChain(
+                    self.delta_checkpoints, binary=self.binary_checkpoints, writer=self.io_writer
+                )
+            return self._checkpoint_chain.save(self._serialize_checkpoint(), stem)
+
+        path = stem.with_name(stem.name + (".snap" if self.binary_checkpoints else ".json"))
+        save_checkpoint(
+            self._serialize_checkpoint(),
+            path,
+            binary=self.binary_checkpoints,
+            writer=self.io_writer,
+        )
+        return path
+
+    def _serialize_checkpoint(self) -> CheckpointSnapshot:
+        """Serialize the running game for a checkpoint.
+
+        Returns:
+            CheckpointSnapshot: The checkpoint of the current game.
+
+        Raises:
+            RuntimeError: If game is not initialized.
+        """
+        if not self.game_state:
+            msg = "Game not initialized"
+            raise RuntimeError(msg)
+
+        return serialize_checkpoint(
+            self.game_state,
+            self.event_logger.events,
+            self.public_discussion_history,
+            self.werewolf_discussion_history,
+            language=self.locale.language,
+        )
+
+    def save_checkpoint(self, file_path: str | Path, binary: bool = False) -> None:
+        """Save everything needed to resume the game to a file.
+
+        Besides the game state this covers the event log, both discussion
+        transcripts, the memory of agents that keep a conversation, and the state
+        of the ``random`` module.
+
+        Args:
+            file_path: Path to save the checkpoint.
+            binary: Whether to use the compact binary format instead of JSON.
+
+        Raises:
+            RuntimeError: If game is not initialized.
+        """
+        save_checkpoint(self._serialize_checkpoint(), file_path, binary=binary)
+
+    def load_checkpoint(
+        self, file_path: str | Path, agent_factory: dict[str, Any] | None = None
+    ) -> None:
+        """Restore a game saved with ``save_checkpoint``; ``play_game`` then resumes it.
+
+        An attached journal is rewound to the checkpoint, so the events replayed
+        after it are not journaled twice.
+
+        Args:
+            file_path: Path to load the checkpoint from.
+            agent_factory: Optional dictionary mapping player_id to agent instances.
+                          Agents that keep a conversation get their saved memory back.
+        """
+        if self.io_writer is not None:
+            # The file, or the chain it belongs to, may still be queued
+            self.io_writer.flush()
+        checkpoint = load_checkpoint(file_path)
+        # The next checkpoint starts a new chain rather than diffing another game
+        self._checkpoint_chain = None
+
+        self.game_state = restore_game_state(checkpoint.game_state, agent_factory)
+        self.victory_checker = VictoryChecker(self.game_state)
+
+        self.event_logger.clear_events()
+        events = [EventRecord.from_dict(payload) for payload in checkpoint.events]
+        for event in events:
+            self.event_logger.log_event(event)
+        if self.journal is not None:
+            self.journal.rewind(events)
+        self.public_discussion_history.clear()
+        self.public_discussion_history.extend(checkpoint.public_discussion)
+        self.werewolf_discussion_history.clear()
+        self.werewolf_discussion_history.extend(checkpoint.werewolf_discussion)
+
+        restore_agent_memories(self.game_state, checkpoint.agent_memory)
+        restore_rng_state(checkpoint)
+        self._attach_agents()
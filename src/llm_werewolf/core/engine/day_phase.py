@@ -4,7 +4,9 @@ from collections.abc import Callable
 
 from llm_werewolf.core.types import EventType, GamePhase, PlayerProtocol
 from llm_werewolf.core.locale import Locale
+from llm_werewolf.core.tracing import decision_span
 from llm_werewolf.core.game_state import GameState
+from llm_werewolf.core.transcript import Transcript
 
 
 class DayPhaseMixin:
@@ -13,7 +15,7 @@ class DayPhaseMixin:
     game_state: GameState | None
     locale: Locale
     _log_event: Callable
-    public_discussion_history: list[str]
+    public_discussion_history: Transcript
     _get_public_discussion_context: Callable[[], str]
 
     def _build_discussion_context(self, player: PlayerProtocol) -> str:
@@ -28,25 +30,15 @@ class DayPhaseMixin:
         if not self.game_state:
             return ""
 
+        public = self.game_state.get_public_context()
         context_parts = [
             f"You are {player.name}, a {player.get_role_name()}.",
-            f"Current: Round {self.game_state.round_number} - Day Discussion Phase",
+            f"Current: Round {public.round_number} - Day Discussion Phase",
             "",
+            public.night_deaths_text(","),
+            f"\nAlive players: {public.alive_text}",
         ]
 
-        if self.game_state.night_deaths:
-            deaths = [
-                self.game_state.get_player(pid).name
-                for pid in self.game_state.night_deaths
-                if self.game_state.get_player(pid)
-            ]
-            context_parts.append(f"Last night, {', '.join(deaths)} died.")
-        else:
-            context_parts.append("No one died last night.")
-
-        alive_players = [p.name for p in self.game_state.get_alive_players()]
-        context_parts.append(f"\nAlive players: {', '.join(alive_players)}")
-
         # Include player's decision history (safe, no sensitive info)
         if player.agent:
             decision_context = player.agent.get_decision_context()
@@ -111,12 +103,15 @@ class DayPhaseMixin:
                 game_context = self._build_discussion_context(player)
 
                 try:
-                    speech = player.agent.get_response(game_context)
+                    with decision_span("speech", player.agent, player.get_role_name()):
+                        speech = player.agent.get_response(game_context)
 
                     self._log_event(
                         EventType.PLAYER_SPEECH,
                         self.locale.get("player_speech", player=player.name, speech=speech),
                         data={
+                            "decision": "speech",
+                            "actor_id": player.player_id,
                             "player_id": player.player_id,
                             "player_name": player.name,
                             "speech": speech,
@@ -3,7 +3,7 @@
 import random
 from collections.abc import Callable
 
-from llm_werewolf.core.types import Camp, EventType, PlayerProtocol
+from llm_werewolf.core.types import Camp, EventType, ActionType, Capability, PlayerProtocol
 from llm_werewolf.core.locale import Locale
 from llm_werewolf.core.game_state import GameState
 from llm_werewolf.core.action_selector import ActionSelector
@@ -191,7 +191,12 @@ class DeathHandlerMixin:
                     self.locale.get(
                         "sheriff_badge_transferred", sheriff=sheriff.name, target=target.name
                     ),
-                    data={"from_player_id": sheriff.player_id, "to_player_id": target.player_id},
+                    data={
+                        "decision": ActionType.SHERIFF_TRANSFER.value,
+                        "actor_id": sheriff.player_id,
+                        "from_player_id": sheriff.player_id,
+                        "to_player_id": target.player_id,
+                    },
                 )
             else:
                 # Tear the badge
@@ -267,16 +272,20 @@ class DeathHandlerMixin:
             self.game_state.day_deaths.add(target.player_id)
 
         # Log appropriate event based on role
+        is_hunter = shooter.get_camp() != Camp.WEREWOLF
         event_msg = (
             self.locale.get("hunter_shoots", hunter=shooter.name, target=target.name)
-            if shooter.role.name == "Hunter"
+            if is_hunter
             else self.locale.get("alpha_wolf_shoots", alpha=shooter.name, target=target.name)
         )
+        decision = ActionType.HUNTER_SHOOT if is_hunter else ActionType.ALPHA_WOLF_SHOOT
 
         self._log_event(
             EventType.HUNTER_REVENGE,
             event_msg,
             data={
+                "decision": decision.value,
+                "actor_id": shooter.player_id,
                 "shooter_id": shooter.player_id,
                 "target_id": target.player_id,
                 "role": role_name,
@@ -316,7 +325,7 @@ class DeathHandlerMixin:
             if not player:
                 continue
 
-            if player.role.name in ("Hunter", "AlphaWolf"):
+            if self.game_state.capabilities.has(player, Capability.DEATH_SHOT):
                 # Check if poisoned
                 death_cause = self.game_state.death_causes.get(player_id)
                 if death_cause == "witch_poison":
@@ -4,9 +4,11 @@ import random
 from typing import TYPE_CHECKING
 from collections.abc import Callable
 
-from llm_werewolf.core.types import Camp, EventType, GamePhase
+from llm_werewolf.core.types import Camp, EventType, GamePhase, ActionType
 from llm_werewolf.core.locale import Locale
+from llm_werewolf.core.tracing import decision_span
 from llm_werewolf.core.game_state import GameState
+from llm_werewolf.core.transcript import Transcript
 
 if TYPE_CHECKING:
     from llm_werewolf.core.actions.base import Action
@@ -18,9 +20,10 @@ class NightPhaseMixin:
     game_state: GameState | None
     locale: Locale
     _log_event: Callable
+    _take_usage: Callable[[str | None], dict[str, float]]
     process_actions: Callable
     resolve_deaths: Callable
-    werewolf_discussion_history: list[str]
+    werewolf_discussion_history: Transcript
     _get_werewolf_discussion_context: Callable[[], str]
 
     def _run_werewolf_discussion(self) -> list[str]:
@@ -58,17 +61,18 @@ class NightPhaseMixin:
 
         target_names = [p.name for p in possible_targets]
         werewolf_names = [w.name for w in werewolves]
+        # The pack and the targets are the same for every werewolf in this discussion
+        shared_parts = [
+            f"Current: Round {self.game_state.round_number} - Night Phase",
+            f"You are working with these werewolves: {', '.join(werewolf_names)}.",
+            f"Available targets: {', '.join(target_names)}.",
+        ]
 
         # Each werewolf discusses
         for werewolf in werewolves:
             if werewolf.agent:
                 # Build discussion context with werewolf history
-                context_parts = [
-                    f"You are {werewolf.name}, a Werewolf.",
-                    f"Current: Round {self.game_state.round_number} - Night Phase",
-                    f"You are working with these werewolves: {', '.join(werewolf_names)}.",
-                    f"Available targets: {', '.join(target_names)}.",
-                ]
+                context_parts = [f"You are {werewolf.name}, a Werewolf.", *shared_parts]
 
                 # Include werewolf discussion history
                 werewolf_history = self._get_werewolf_discussion_context()
@@ -84,7 +88,10 @@ class NightPhaseMixin:
                 context = "\n".join(context_parts)
 
                 try:
-                    speech = werewolf.agent.get_response(context)
+                    with decision_span(
+                        "werewolf_discussion", werewolf.agent, werewolf.get_role_name()
+                    ):
+                        speech = werewolf.agent.get_response(context)
 
                     self._log_event(
                         EventType.PLAYER_DISCUSSION,
@@ -92,6 +99,8 @@ class NightPhaseMixin:
                             "werewolf_discussion", player=werewolf.name, speech=speech
                         ),
                         data={
+                            "decision": "werewolf_discussion",
+                            "actor_id": werewolf.player_id,
                             "player_id": werewolf.player_id,
                             "player_name": werewolf.name,
                             "speech": speech,
@@ -155,7 +164,17 @@ class NightPhaseMixin:
                 self._log_event(
                     EventType.WEREWOLF_KILLED,
                     self.locale.get("werewolf_target", target=target.name),
-                    data={"target_id": selected_target_id, "target_name": target.name},
+                    data={
+                        "decision": ActionType.WEREWOLF_KILL.value,
+                        "target_id": selected_target_id,
+                        "target_name": target.name,
+                        "votes": dict(self.game_state.werewolf_votes),
+                        "usage": {
+                            voter_id: usage
+                            for voter_id in self.game_state.werewolf_votes
+                            if (usage := self._take_usage(voter_id))
+                        },
+                    },
                 )
 
         return messages
@@ -2,11 +2,14 @@
 
 from collections.abc import Callable
 
-from llm_werewolf.core.types import EventType, PlayerProtocol
+from llm_werewolf.core.types import EventType, ActionType, PlayerProtocol
 from llm_werewolf.core.locale import Locale
 from llm_werewolf.core.game_state import GameState
 from llm_werewolf.core.action_selector import ActionSelector
 
+_CAMPAIGN_BRIEFING = "SHERIFF ELECTION:\nThe sheriff election is now open. As sheriff, you will have:\n- 1.5x voting power during day voting phases\n- The ability to transfer the sheriff badge to another player when you die\n- Additional speaking authority and influence\n\nHowever, becoming sheriff also:\n- May draw attention to you (good or bad depending on your role)\n- May make you a target for werewolves if you're a villager\n- May help you mislead the village if you're a werewolf\n\nConsider your role and strategy before deciding."
+"""Campaign rules shown to every player; the same for the whole game."""
+
 
 class SheriffElectionMixin:
     """Mixin for handling sheriff election phase logic."""
@@ -101,18 +104,7 @@ class SheriffElectionMixin:
             f"You are {player.name}, a {player.get_role_name()}.",
             f"Current: Round {self.game_state.round_number} - Sheriff Election",
             "",
-            "SHERIFF ELECTION:",
-            "The sheriff election is now open. As sheriff, you will have:",
-            "- 1.5x voting power during day voting phases",
-            "- The ability to transfer the sheriff badge to another player when you die",
-            "- Additional speaking authority and influence",
-            "",
-            "However, becoming sheriff also:",
-            "- May draw attention to you (good or bad depending on your role)",
-            "- May make you a target for werewolves if you're a villager",
-            "- May help you mislead the village if you're a werewolf",
-            "",
-            "Consider your role and strategy before deciding.",
+            _CAMPAIGN_BRIEFING,
         ]
 
         return "\n".join(context_parts)
@@ -144,7 +136,12 @@ class SheriffElectionMixin:
             self._log_event(
                 EventType.SHERIFF_CANDIDATE_SPEECH,
                 self.locale.get("candidate_speech", candidate=candidate.name, speech=speech),
-                data={"player_id": candidate.player_id, "speech": speech},
+                data={
+                    "decision": "sheriff_speech",
+                    "actor_id": candidate.player_id,
+                    "player_id": candidate.player_id,
+                    "speech": speech,
+                },
             )
 
     def _build_speech_context(
@@ -209,6 +206,8 @@ class SheriffElectionMixin:
         )
 
         vote_counts: dict[str, int] = {c.player_id: 0 for c in candidates}
+        # Voters who are not candidates themselves all see the same candidate list
+        all_candidate_names = ", ".join(c.name for c in candidates)
 
         for voter in voters:
             if not voter.agent:
@@ -221,7 +220,13 @@ class SheriffElectionMixin:
                 # Only one candidate and they can't vote for themselves
                 continue
 
-            context = self._build_sheriff_voting_context(voter, available_candidates)
+            context = self._build_sheriff_voting_context(
+                voter,
+                available_candidates,
+                candidate_names=all_candidate_names
+                if len(available_candidates) == len(candidates)
+                else None,
+            )
             vote_target = ActionSelector.select_target(
                 voter.agent, context, available_candidates, "Vote for sheriff", allow_skip=True
             )
@@ -233,7 +238,12 @@ class SheriffElectionMixin:
                     self.locale.get(
                         "sheriff_vote_cast", voter=voter.name, candidate=vote_target.name
                     ),
-                    data={"voter_id": voter.player_id, "target_id": vote_target.player_id},
+                    data={
+                        "decision": ActionType.SHERIFF_VOTE.value,
+                        "actor_id": voter.player_id,
+                        "voter_id": voter.player_id,
+                        "target_id": vote_target.player_id,
+                    },
                 )
             else:
                 self._log_event(
@@ -243,13 +253,17 @@ class SheriffElectionMixin:
         return vote_counts
 
     def _build_sheriff_voting_context(
-        self, player: PlayerProtocol, candidates: list[PlayerProtocol]
+        self,
+        player: PlayerProtocol,
+        candidates: list[PlayerProtocol],
+        candidate_names: str | None = None,
     ) -> str:
         """Build context for sheriff voting.
 
         Args:
             player: The player who will vote.
             candidates: List of sheriff candidates.
+            candidate_names: The candidates' names already joined, if shared by voters.
 
         Returns:
             str: Context message for the player's agent.
@@ -257,14 +271,15 @@ class SheriffElectionMixin:
         if not self.game_state:
             return ""
 
-        candidate_names = [c.name for c in candidates]
+        if candidate_names is None:
+            candidate_names = ", ".join(c.name for c in candidates)
 
         context_parts = [
             f"You are {player.name}, a {player.get_role_name()}.",
             f"Current: Round {self.game_state.round_number} - Sheriff Election (Voting Phase)",
             "",
             "SHERIFF VOTING:",
-            f"Candidates: {', '.join(candidate_names)}",
+            f"Candidates: {candidate_names}",
             "",
             "Vote for who you think should be sheriff.",
             "Consider:",
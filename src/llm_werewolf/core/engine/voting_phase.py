@@ -2,7 +2,7 @@
 
 from collections.abc import Callable
 
-from llm_werewolf.core.types import EventType, GamePhase, PlayerProtocol
+from llm_werewolf.core.types import EventType, GamePhase, ActionType, Capability, PlayerProtocol
 from llm_werewolf.core.locale import Locale
 from llm_werewolf.core.actions import VoteAction
 from llm_werewolf.core.game_state import GameState
@@ -22,11 +22,15 @@ class VotingPhaseMixin:
     _handle_death_abilities: Callable
     _get_public_discussion_context: Callable[[], str]
 
-    def _build_voting_context(self, player: PlayerProtocol) -> str:
+    def _build_voting_context(
+        self, player: PlayerProtocol, discussion_history: str | None = None
+    ) -> str:
         """Build context for voting phase.
 
         Args:
             player: The player who will vote.
+            discussion_history: The formatted public discussion, if already built for
+                this voting round.
 
         Returns:
             str: Context message for the player's agent.
@@ -34,25 +38,15 @@ class VotingPhaseMixin:
         if not self.game_state:
             return ""
 
+        public = self.game_state.get_public_context()
         context_parts = [
             f"You are {player.name}, a {player.get_role_name()}.",
-            f"Current: Round {self.game_state.round_number} - Voting Phase",
+            f"Current: Round {public.round_number} - Voting Phase",
             "",
+            public.night_deaths_text(":"),
+            f"\nAlive players: {public.alive_text}",
         ]
 
-        if self.game_state.night_deaths:
-            deaths = [
-                self.game_state.get_player(pid).name
-                for pid in self.game_state.night_deaths
-                if self.game_state.get_player(pid)
-            ]
-            context_parts.append(f"Last night: {', '.join(deaths)} died.")
-        else:
-            context_parts.append("No one died last night.")
-
-        alive_players = [p.name for p in self.game_state.get_alive_players()]
-        context_parts.append(f"\nAlive players: {', '.join(alive_players)}")
-
         # Include player's decision history (safe, no sensitive info)
         if player.agent:
             decision_context = player.agent.get_decision_context()
@@ -60,7 +54,8 @@ class VotingPhaseMixin:
                 context_parts.append(decision_context)
 
         # Include the full discussion history for informed voting
-        discussion_history = self._get_public_discussion_context()
+        if discussion_history is None:
+            discussion_history = self._get_public_discussion_context()
         if discussion_history:
             context_parts.append(discussion_history)
 
@@ -82,6 +77,8 @@ class VotingPhaseMixin:
             return []
 
         vote_actions: list[Action] = []
+        # No one speaks while votes are collected, so the history is shared by all voters
+        discussion_history = self._get_public_discussion_context()
         for player in self.game_state.get_alive_players():
             if not player.can_vote():
                 continue
@@ -91,7 +88,7 @@ class VotingPhaseMixin:
                 continue
 
             if player.agent:
-                context = self._build_voting_context(player)
+                context = self._build_voting_context(player, discussion_history)
                 target_player = ActionSelector.get_target_from_agent(
                     agent=player.agent,
                     role_name=player.get_role_name(),
@@ -127,6 +124,8 @@ class VotingPhaseMixin:
                         "vote_cast", voter=action.actor.name, target=action.target.name
                     ),
                     data={
+                        "decision": ActionType.VOTE.value,
+                        "actor_id": action.actor.player_id,
                         "voter_id": action.actor.player_id,
                         "voter_name": action.actor.name,
                         "target_id": action.target.player_id,
@@ -177,13 +176,10 @@ class VotingPhaseMixin:
 
         eliminated_id = eliminated.player_id
 
-        # Special case: Idiot reveals instead of dying
-        if (
-            eliminated.role.name == "Idiot"
-            and hasattr(eliminated.role, "revealed")
-            and not eliminated.role.revealed
-        ):
-            eliminated.role.revealed = True
+        # Special case: the Idiot reveals instead of dying
+        capabilities = self.game_state.capabilities
+        if capabilities.has(eliminated, Capability.SURVIVES_FIRST_VOTE):
+            eliminated.role.reveal()
             eliminated.disable_voting()
             self._log_event(
                 EventType.ROLE_REVEALED,
@@ -206,7 +202,7 @@ class VotingPhaseMixin:
         )
 
         # Handle Elder penalty
-        if eliminated.role.name == "Elder":
+        if capabilities.has(eliminated, Capability.EXECUTION_PENALTY):
             self._handle_elder_penalty()
             self._log_event(
                 EventType.ROLE_REVEALED,
@@ -4,7 +4,7 @@ from typing import ClassVar
 
 from rich.text import Text
 
-from llm_werewolf.core.types import Event, EventType
+from llm_werewolf.core.types import EventType, EventRecord
 
 
 class EventFormatter:
@@ -46,7 +46,7 @@ class EventFormatter:
     }
 
     @classmethod
-    def format_event(cls, event: Event, include_timestamp: bool = True) -> Text:
+    def format_event(cls, event: EventRecord, include_timestamp: bool = True) -> Text:
         """Format an event as Rich Text with appropriate styling.
 
         Args:
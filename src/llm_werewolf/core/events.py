@@ -1,20 +1,138 @@
-from llm_werewolf.core.types import Event, EventType
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+
+from llm_werewolf.core.types import Event, EventType, EventRecord
+from llm_werewolf.core.spill_log import DEFAULT_WINDOW, create_event_log
+
+
+class EventView(Sequence[EventRecord]):
+    """Read-only view over a subset of logged events.
+
+    The view holds positions into the underlying event sequence instead of copies of
+    the events, so building it is cheap and events are resolved on access.
+    """
+
+    __slots__ = ("_events", "_positions")
+
+    def __init__(self, events: Sequence[EventRecord], positions: Sequence[int]) -> None:
+        """Initialize the view.
+
+        Args:
+            events: The underlying event sequence.
+            positions: Positions of the events in the view, in order.
+        """
+        self._events = events
+        self._positions = positions
+
+    def __len__(self) -> int:
+        """Get the number of events in the view.
+
+        Returns:
+            int: Number of events.
+        """
+        return len(self._positions)
+
+    def __getitem__(self, index: int | slice) -> "EventRecord | EventView":
+        """Get an event, or a sub-view for a slice.
+
+        Args:
+            index: Position within the view, or a slice of the view.
+
+        Returns:
+            EventRecord | EventView: The event at that position, or a narrower view.
+        """
+        if isinstance(index, slice):
+            return EventView(self._events, self._positions[index])
+        return self._events[self._positions[index]]
+
+    def __iter__(self) -> Iterator[EventRecord]:
+        """Iterate over the events in the view.
+
+        Returns:
+            Iterator[EventRecord]: Iterator over the events.
+        """
+        events = self._events
+        return (events[pos] for pos in self._positions)
+
+    def __repr__(self) -> str:
+        """Repr of the view.
+
+        Returns:
+            str: View representation.
+        """
+        return f"EventView(count={len(self._positions)})"
+
+
+def _new_index() -> array:
+    """Create an empty position index.
+
+    Returns:
+        array: Compact array of unsigned event positions.
+    """
+    return array("L")
 
 
 class EventLogger:
-    """Logs and manages game events."""
+    """Logs and manages game events.
+
+    Besides the event list, the logger keeps position indexes by event type, round
+    and audience. They are maintained on append, so queries only touch the events
+    they return. Events beyond the in-memory window are spilled to disk and paged
+    back in when a query reaches them.
+    """
 
-    def __init__(self) -> None:
-        """Initialize the event logger."""
-        self.events: list[Event] = []
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        """Initialize the event logger.
 
-    def log_event(self, event: Event) -> None:
+        Args:
+            window: Number of recent events kept in memory.
+        """
+        self.events = create_event_log(window)
+        self._reset_indexes()
+
+    def _reset_indexes(self) -> None:
+        """Reset all secondary indexes."""
+        self._by_type: dict[EventType, array] = {}
+        self._by_round: dict[int, array] = {}
+        self._by_player: dict[str, array] = {}
+        self._round_starts: list[int] = []
+        self._round_start_positions: list[int] = []
+        self._rounds_ordered = True
+
+    def _index_event(self, event: EventRecord, position: int) -> None:
+        """Add an event to the secondary indexes.
+
+        Args:
+            event: The event being logged.
+            position: Position of the event in the log.
+        """
+        self._by_type.setdefault(event.event_type, _new_index()).append(position)
+        self._by_round.setdefault(event.round_number, _new_index()).append(position)
+
+        last_round = self._round_starts[-1] if self._round_starts else None
+        if last_round is None or event.round_number > last_round:
+            self._round_starts.append(event.round_number)
+            self._round_start_positions.append(position)
+        elif event.round_number < last_round:
+            self._rounds_ordered = False
+
+        # Per-player indexes are built lazily on first query, then kept current here.
+        audience = event.audience
+        for player_id, positions in self._by_player.items():
+            if audience is None or player_id in audience:
+                positions.append(position)
+
+    def log_event(self, event: Event | EventRecord) -> None:
         """Log an event.
 
         Args:
-            event: The event to log.
+            event: The event to log. Pydantic events are converted to records.
         """
+        if isinstance(event, Event):
+            event = EventRecord.from_model(event)
         self.events.append(event)
+        self._index_event(event, len(self.events) - 1)
 
     def create_event(
         self,
@@ -24,7 +142,7 @@ class EventLogger:
         message: str,
         data: dict | None = None,
         visible_to: list[str] | None = None,
-    ) -> Event:
+    ) -> EventRecord:
         """Create and log a new event.
 
         Args:
@@ -36,20 +154,56 @@ class EventLogger:
             visible_to: List of player IDs who can see this event.
 
         Returns:
-            Event: The created event.
+            EventRecord: The created event.
         """
-        event = Event(
+        event = EventRecord(
             event_type=event_type,
             round_number=round_number,
             phase=phase,
             message=message,
-            data=data or {},
+            data=data,
             visible_to=visible_to,
         )
         self.log_event(event)
         return event
 
-    def get_events_for_player(self, player_id: str, since_round: int | None = None) -> list[Event]:
+    def _player_index(self, player_id: str) -> array:
+        """Get the positions of all events visible to a player.
+
+        Args:
+            player_id: The player ID.
+
+        Returns:
+            array: Positions of the visible events.
+        """
+        positions = self._by_player.get(player_id)
+        if positions is None:
+            positions = _new_index()
+            positions.extend(
+                pos for pos, event in enumerate(self.events) if event.is_visible_to(player_id)
+            )
+            self._by_player[player_id] = positions
+        return positions
+
+    def _first_position_of_round(self, round_number: int) -> int:
+        """Get the first log position at or after the given round.
+
+        Only valid while rounds have been logged in non-decreasing order.
+
+        Args:
+            round_number: The round number.
+
+        Returns:
+            int: The first position whose round is at least ``round_number``.
+        """
+        idx = bisect_left(self._round_starts, round_number)
+        if idx == len(self._round_starts):
+            return len(self.events)
+        return self._round_start_positions[idx]
+
+    def get_events_for_player(
+        self, player_id: str, since_round: int | None = None
+    ) -> Sequence[EventRecord]:
         """Get all events visible to a specific player.
 
         Args:
@@ -57,29 +211,34 @@ class EventLogger:
             since_round: Only return events from this round onward.
 
         Returns:
-            list[Event]: List of visible events.
+            Sequence[EventRecord]: View of visible events.
         """
-        events = [e for e in self.events if e.is_visible_to(player_id)]
+        positions: Sequence[int] = self._player_index(player_id)
 
         if since_round is not None:
-            events = [e for e in events if e.round_number >= since_round]
+            if self._rounds_ordered:
+                start = bisect_left(positions, self._first_position_of_round(since_round))
+                positions = positions[start:]
+            else:
+                positions = [p for p in positions if self.events[p].round_number >= since_round]
 
-        return events
+        return EventView(self.events, positions)
 
-    def get_recent_events(self, count: int = 10) -> list[Event]:
+    def get_recent_events(self, count: int = 10) -> Sequence[EventRecord]:
         """Get the most recent events.
 
         Args:
             count: Number of events to retrieve.
 
         Returns:
-            list[Event]: Recent events.
+            Sequence[EventRecord]: View of recent events.
         """
-        return self.events[-count:]
+        total = len(self.events)
+        return EventView(self.events, range(max(total - count, 0), total))
 
     def get_events_by_type(
         self, event_type: EventType, round_number: int | None = None
-    ) -> list[Event]:
+    ) -> Sequence[EventRecord]:
         """Get all events of a specific type.
 
         Args:
@@ -87,18 +246,36 @@ class EventLogger:
             round_number: Optionally filter by round number.
 
         Returns:
-            list[Event]: List of matching events.
+            Sequence[EventRecord]: View of matching events.
         """
-        events = [e for e in self.events if e.event_type == event_type]
+        positions: Sequence[int] = self._by_type.get(event_type, ())
 
         if round_number is not None:
-            events = [e for e in events if e.round_number == round_number]
+            if self._rounds_ordered:
+                lo = bisect_left(positions, self._first_position_of_round(round_number))
+                hi = bisect_left(positions, self._first_position_of_round(round_number + 1))
+                positions = positions[lo:hi]
+            else:
+                in_round = set(self._by_round.get(round_number, ()))
+                positions = [p for p in positions if p in in_round]
+
+        return EventView(self.events, positions)
 
-        return events
+    def get_events_by_round(self, round_number: int) -> Sequence[EventRecord]:
+        """Get all events from a specific round.
+
+        Args:
+            round_number: The round number.
+
+        Returns:
+            Sequence[EventRecord]: View of events logged in that round.
+        """
+        return EventView(self.events, self._by_round.get(round_number, ()))
 
     def clear_events(self) -> None:
         """Clear all events."""
         self.events.clear()
+        self._reset_indexes()
 
     def get_event_count(self) -> int:
         """Get the total number of events.
@@ -1,4 +1,18 @@
-from llm_werewolf.core.types import Event, GamePhase, GameStateInfo, PlayerProtocol
+from collections.abc import Mapping, Sequence
+
+from llm_werewolf.core.types import (
+    Event,
+    GamePhase,
+    EventRecord,
+    PlayerChange,
+    AgentProtocol,
+    GameStateInfo,
+    PlayerProtocol,
+)
+from llm_werewolf.core.events import EventView
+from llm_werewolf.core.spill_log import ForkLog, SpillLog, create_event_log
+from llm_werewolf.core.capabilities import CapabilityTable
+from llm_werewolf.core.public_context import PublicContext
 
 
 class GameState:
@@ -12,11 +26,13 @@ class GameState:
         """
         self.players = players
         self.player_dict = {p.player_id: p for p in players}
+        # Built before any VictoryChecker so it refreshes first on role changes
+        self.capabilities = CapabilityTable(players)
 
         self.phase = GamePhase.SETUP
         self.round_number = 0
 
-        self.event_history: list[Event] = []
+        self.event_history: SpillLog[EventRecord] | ForkLog[EventRecord] = create_event_log()
         self.night_deaths: set[str] = set()
         self.day_deaths: set[str] = set()
         self.death_abilities_used: set[str] = set()
@@ -42,12 +58,66 @@ class GameState:
 
         self.winner: str | None = None
 
+        self._public_context: PublicContext | None = None
+        for player in players:
+            player.add_listener(self._on_player_change)
+
     def reset_deaths(self) -> None:
         """Reset the death sets for a new round."""
         self.night_deaths.clear()
         self.day_deaths.clear()
         self.death_abilities_used.clear()
         self.death_causes.clear()
+        self._public_context = None
+
+    def fork(self, agents: Mapping[str, AgentProtocol] | None = None) -> "GameState":
+        """Create an independent copy of the game for what-if search.
+
+        Players and roles are copied with their slots, per-round containers are
+        copied, and the event history is shared up to the fork point. Changes to
+        the fork never affect this game and vice versa. Agents are not copied;
+        pass policy agents (e.g. ``DemoAgent``) to replay engine phases on the fork
+        without calling the original agents.
+
+        Args:
+            agents: Agent for each player ID in the fork. Players without an entry
+                have no agent.
+
+        Returns:
+            GameState: The forked game state.
+        """
+        agents = agents or {}
+        fork = GameState([p.clone(agents.get(p.player_id)) for p in self.players])
+
+        fork.phase = self.phase
+        fork.round_number = self.round_number
+
+        fork.event_history = ForkLog(self.event_history)
+        fork.night_deaths = self.night_deaths.copy()
+        fork.day_deaths = self.day_deaths.copy()
+        fork.death_abilities_used = self.death_abilities_used.copy()
+        fork.death_causes = self.death_causes.copy()
+
+        fork.werewolf_target = self.werewolf_target
+        fork.werewolf_votes = self.werewolf_votes.copy()
+        fork.witch_save_used = self.witch_save_used
+        fork.witch_poison_used = self.witch_poison_used
+        fork.witch_saved_target = self.witch_saved_target
+        fork.witch_poison_target = self.witch_poison_target
+        fork.guard_protected = self.guard_protected
+        fork.guardian_wolf_protected = self.guardian_wolf_protected
+        fork.nightmare_blocked = self.nightmare_blocked
+        fork.seer_checked = self.seer_checked.copy()
+
+        fork.votes = self.votes.copy()
+        fork.raven_marked = self.raven_marked
+
+        fork.sheriff_id = self.sheriff_id
+        fork.sheriff_election_done = self.sheriff_election_done
+        fork.sheriff_votes = self.sheriff_votes.copy()
+
+        fork.winner = self.winner
+        return fork
 
     def get_phase(self) -> GamePhase:
         """Get the current game phase.
@@ -101,6 +171,35 @@ class GameState:
 
         return self.phase
 
+    def get_public_context(self) -> PublicContext:
+        """Get the public context snapshot of the current phase.
+
+        The snapshot is built on first use in a phase and shared by every prompt of
+        that phase. It is rebuilt when the round or phase changes, or when a player
+        dies or is revived.
+
+        Returns:
+            PublicContext: The current snapshot.
+        """
+        context = self._public_context
+        if (
+            context is None
+            or context.round_number != self.round_number
+            or context.phase != self.phase
+        ):
+            context = self._public_context = PublicContext.from_game_state(self)
+        return context
+
+    def _on_player_change(self, player: PlayerProtocol, change: PlayerChange) -> None:
+        """Drop the public context snapshot when a player dies or is revived.
+
+        Args:
+            player: The player that changed.
+            change: The kind of change that occurred.
+        """
+        if change in (PlayerChange.KILLED, PlayerChange.REVIVED):
+            self._public_context = None
+
     def get_alive_players(self, except_ids: list[str] | None = None) -> list[PlayerProtocol]:
         """Get all alive players.
 
@@ -160,24 +259,27 @@ class GameState:
         """
         return sum(1 for p in self.get_alive_players() if p.get_camp() == camp)
 
-    def record_event(self, event: Event) -> None:
+    def record_event(self, event: Event | EventRecord) -> None:
         """Record a game event in history.
 
         Args:
-            event: The event to record.
+            event: The event to record. Pydantic events are converted to records.
         """
+        if isinstance(event, Event):
+            event = EventRecord.from_model(event)
         self.event_history.append(event)
 
-    def get_recent_events(self, count: int = 10) -> list[Event]:
+    def get_recent_events(self, count: int = 10) -> Sequence[EventRecord]:
         """Get the most recent events.
 
         Args:
             count: Number of events to retrieve.
 
         Returns:
-            list[Event]: Recent events.
+            Sequence[EventRecord]: View of recent events.
         """
-        return self.event_history[-count:]
+        total = len(self.event_history)
+        return EventView(self.event_history, range(max(total - count, 0), total))
 
     def add_vote(self, voter_id: str, target_id: str) -> None:
         """Record a vote.
@@ -0,0 +1,353 @@
+"""Shared background writer for game I/O.
+
+The engine thread should never wait on the disk. ``BackgroundWriter`` owns a
+bounded queue and one writer thread: producers only enqueue work, and the thread
+drains the queue in batches and hands each run of items to the sink it belongs
+to. The event journal and phase checkpoints can share one writer, so their files
+are written in the order the engine produced them.
+
+- Backpressure: once ``max_pending`` items are queued, ``submit`` blocks until
+  the writer catches up, so a stalled disk slows the game down instead of
+  growing memory without bound.
+- Flush on phase: ``request_sync`` queues a barrier without waiting for it.
+  Everything queued before the barrier is fsynced before anything queued after
+  it is written. The engine places one before every checkpoint.
+- Shutdown: ``close`` writes what is still queued, fsyncs and stops the thread.
+
+Errors raised by a sink on the writer thread are kept and re-raised in the
+caller's thread by the next ``flush`` or ``close``; the thread carries on with
+the next items. Should the thread still die, waiting callers get an error
+instead of blocking forever.
+"""
+
+import os
+import queue
+from typing import Any, Protocol
+from pathlib import Path
+import threading
+
+from typing_extensions import Self
+
+DEFAULT_MAX_PENDING = 4096
+"""Number of queued items after which ``submit`` blocks."""
+
+DEFAULT_BATCH_SIZE = 256
+"""Maximum number of queued items taken off the queue in one batch."""
+
+_POLL_INTERVAL = 0.1
+"""Seconds between checks that the writer thread is alive while waiting on it."""
+
+
+class WriteSink(Protocol):
+    """Destination of the items queued on a ``BackgroundWriter``."""
+
+    def write_batch(self, items: list[Any], sync: bool) -> None:
+        """Write items in the order they were queued.
+
+        Args:
+            items: The items; empty when only a sync is requested.
+            sync: Whether to fsync after writing.
+        """
+
+
+class _Barrier:
+    """Queue marker that syncs every sink written since the previous barrier."""
+
+    __slots__ = ("done",)
+
+    def __init__(self, done: threading.Event | None = None) -> None:
+        """Initialize the barrier.
+
+        Args:
+            done: Event set once the barrier is passed, if someone waits for it.
+        """
+        self.done = done
+
+
+def write_file_atomic(file_path: str | Path, data: bytes) -> None:
+    """Write a whole file atomically.
+
+    The file is written next to the target, fsynced and then renamed over it, so
+    a crash while writing never leaves a truncated file behind.
+
+    Args:
+        file_path: Path to the file; missing parent directories are created.
+        data: The file content.
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with temp_path.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    temp_path.replace(path)
+
+
+class _FileSink:
+    """Sink that writes ``(path, data)`` items as whole files."""
+
+    def write_batch(self, items: list[tuple[Path, bytes]], sync: bool) -> None:
+        """Write each file atomically; every file is fsynced regardless of ``sync``.
+
+        Args:
+            items: Paths and contents of the files.
+            sync: Whether to fsync after writing.
+        """
+        for path, data in items:
+            write_file_atomic(path, data)
+
+
+_FILES = _FileSink()
+
+_QueueItem = tuple[WriteSink, Any] | _Barrier | None
+
+
+class BackgroundWriter:
+    """Single writer thread with a bounded queue, shared by the I/O of a game."""
+
+    def __init__(
+        self,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        name: str = "game-io",
+    ) -> None:
+        """Start the writer thread.
+
+        Args:
+            max_pending: Number of queued items after which ``submit`` blocks.
+            batch_size: Maximum number of items taken off the queue in one batch.
+            name: Name of the writer thread.
+
+        Raises:
+            ValueError: If ``max_pending`` or ``batch_size`` is less than 1.
+        """
+        if max_pending < 1 or batch_size < 1:
+            msg = "max_pending and batch_size must be at least 1"
+            raise ValueError(msg)
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self._queue: queue.Queue[_QueueItem] = queue.Queue(maxsize=max_pending)
+        # Sinks written since the last barrier, in first-write order
+        self._dirty: dict[WriteSink, None] = {}
+        self._errors: list[tuple[WriteSink, BaseException]] = []
+        self._failure: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        """Check whether the writer is closed.
+
+        Returns:
+            bool: True once ``close`` was called.
+        """
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        """Get the approximate number of queued items.
+
+        Returns:
+            int: Items not yet taken by the writer thread.
+        """
+        return self._queue.qsize()
+
+    def submit(self, sink: WriteSink, item: object) -> None:
+        """Queue an item for a sink, blocking while the queue is full.
+
+        Items must not be changed after they are submitted, since the sink reads
+        them later on the writer thread.
+
+        Args:
+            sink: The sink that writes the item.
+            item: The item.
+
+        Raises:
+            RuntimeError: If the writer is closed or its thread has died.
+        """
+        self._check_open()
+        self._put((sink, item))
+
+    def write_file(self, file_path: str | Path, data: bytes) -> None:
+        """Queue a whole file to be written atomically.
+
+        Args:
+            file_path: Path to the file.
+            data: The file content.
+
+        Raises:
+            RuntimeError: If the writer is closed or its thread has died.
+        """
+        self.submit(_FILES, (Path(file_path), data))
+
+    def request_sync(self) -> None:
+        """Queue a sync barrier without waiting for it.
+
+        Raises:
+            RuntimeError: If the writer is closed or its thread has died.
+        """
+        self._check_open()
+        self._put(_Barrier())
+
+    def flush(self) -> None:
+        """Wait until every queued item is written and fsynced.
+
+        Raises:
+            RuntimeError: If the writer is closed, its thread has died or a sink failed.
+        """
+        self._check_open()
+        done = threading.Event()
+        self._put(_Barrier(done))
+        while not done.wait(_POLL_INTERVAL):
+            self._check_alive()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write the remaining items, fsync and stop the writer thread.
+
+        Raises:
+            RuntimeError: If the writer thread had died or a sink failed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._put(None)
+            self._thread.join()
+        self._check_alive()
+        self._raise_error()
+
+    def __enter__(self) -> Self:
+        """Use the writer as a context manager.
+
+        Returns:
+            BackgroundWriter: This writer.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the writer when leaving the context.
+
+        Args:
+            *exc_info: Exception information, if any.
+        """
+        self.close()
+
+    def _check_open(self) -> None:
+        """Refuse new work once the writer is closed.
+
+        Raises:
+            RuntimeError: If the writer is closed.
+        """
+        if self._closed:
+            msg = "Background writer is closed"
+            raise RuntimeError(msg)
+
+    def _check_alive(self) -> None:
+        """Fail instead of waiting on a writer thread that died.
+
+        Raises:
+            RuntimeError: If the writer thread stopped because of an error.
+        """
+        if self._failure is not None or not (self._closed or self._thread.is_alive()):
+            msg = f"Background writer thread died: {self._failure!r}"
+            raise RuntimeError(msg) from self._failure
+
+    def _put(self, item: _QueueItem) -> None:
+        """Queue an item, blocking while the queue is full and the thread is alive.
+
+        Args:
+            item: The queue item.
+
+        Raises:
+            RuntimeError: If the writer thread died.
+        """
+        while True:
+            self._check_alive()
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL)
+            except queue.Full:
+                continue
+            return
+
+    def _raise_error(self) -> None:
+        """Re-raise the first error from the writer thread in the caller's thread.
+
+        Raises:
+            RuntimeError: If a sink failed since the last check.
+        """
+        if self._errors:
+            sink, error = self._errors[0]
+            self._errors.clear()
+            msg = f"Background write to {type(sink).__name__} failed: {error}"
+            raise RuntimeError(msg) from error
+
+    def _run(self) -> None:
+        """Write queued items in batches until the writer is closed."""
+        running = True
+        try:
+            while running:
+                batch = [self._queue.get()]
+                # This thread is the only consumer, so a non-empty queue cannot block
+                while len(batch) < self.batch_size and not self._queue.empty():
+                    batch.append(self._queue.get())
+                running = self._write(batch)
+        except BaseException as exc:
+            # Kept for the caller's thread, which would otherwise wait forever
+            self._failure = exc
+
+    def _write(self, batch: list[_QueueItem]) -> bool:
+        """Hand a batch to its sinks, one run of consecutive items per call.
+
+        Args:
+            batch: Items taken off the queue, in queue order.
+
+        Returns:
+            bool: False if the batch ends the writer.
+        """
+        running = True
+        run_sink: WriteSink | None = None
+        run: list[Any] = []
+        for entry in batch:
+            if isinstance(entry, tuple):
+                sink, item = entry
+                if sink is not run_sink:
+                    self._deliver(run_sink, run)
+                    run_sink, run = sink, []
+                run.append(item)
+                continue
+            self._deliver(run_sink, run, sync=True)
+            run_sink, run = None, []
+            self._sync_dirty()
+            if entry is None:
+                running = False
+            elif entry.done is not None:
+                entry.done.set()
+        self._deliver(run_sink, run)
+        return running
+
+    def _deliver(self, sink: WriteSink | None, items: list[Any], sync: bool = False) -> None:
+        """Pass items to a sink, keeping any error for the caller.
+
+        Args:
+            sink: The sink, or None for an empty run.
+            items: The items.
+            sync: Whether the sink should fsync.
+        """
+        if sink is None:
+            return
+        try:
+            sink.write_batch(items, sync)
+        except Exception as exc:
+            self._errors.append((sink, exc))
+        if sync:
+            self._dirty.pop(sink, None)
+        else:
+            self._dirty[sink] = None
+
+    def _sync_dirty(self) -> None:
+        """Fsync every sink written since the previous barrier."""
+        for sink in list(self._dirty):
+            self._deliver(sink, [], sync=True)
@@ -0,0 +1,683 @@
+"""Append-only JSONL journal of game events.
+
+``EventJournal`` writes every logged event as one JSON line, so the transcript of
+a game survives a crash. The engine only puts events on the queue of a
+``BackgroundWriter``, whose thread serializes them, writes them in batches,
+fsyncs at phase boundaries and rotates to a new segment file when the current
+one is full.
+
+Alongside the segments the journal keeps a sidecar index with the position of
+the first event of every game, round and phase. ``JournalReader`` memory-maps
+the segments and uses the index to start streaming at any of those points
+without reading what comes before.
+"""
+
+import os
+import json
+import mmap
+import struct
+from typing import IO, NamedTuple
+from pathlib import Path
+from collections.abc import Iterator, Sequence
+
+from typing_extensions import Self
+
+from llm_werewolf.core.types import EventType, GamePhase, EventRecord
+from llm_werewolf.core.io_writer import BackgroundWriter
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+"""Size after which the journal rotates to a new segment file."""
+
+DEFAULT_BATCH_SIZE = 256
+"""Maximum number of queued events written in one batch."""
+
+SYNC_EVENT_TYPES = frozenset({EventType.PHASE_CHANGED, EventType.GAME_ENDED})
+"""Event types after which the journal is fsynced."""
+
+INDEX_NAME = "index.bin"
+"""File name of the sidecar index inside a journal directory."""
+
+_SEGMENT_GLOB = "events-*.jsonl"
+
+_INDEX_HEADER = struct.Struct("<4sB")
+_INDEX_MAGIC = b"LWJX"
+_INDEX_VERSION = 1
+# game, round, phase, segment, offset
+_INDEX_RECORD = struct.Struct("<iiBIQ")
+_PHASES = list(GamePhase)
+_PHASE_CODES = {phase.value: code for code, phase in enumerate(_PHASES)}
+
+_IndexKey = tuple[int, int, str]
+
+
+class JournalPosition(NamedTuple):
+    """Location of an event line inside a journal."""
+
+    segment: int
+    """Number of the segment file."""
+
+    offset: int
+    """Byte offset of the line in the segment."""
+
+
+def _segment_name(index: int) -> str:
+    """Get the file name of a journal segment.
+
+    Args:
+        index: Zero-based segment number.
+
+    Returns:
+        str: The segment file name.
+    """
+    return f"events-{index:05d}.jsonl"
+
+
+def list_segments(directory: str | Path) -> list[Path]:
+    """List the segment files of a journal, oldest first.
+
+    Args:
+        directory: The journal directory.
+
+    Returns:
+        list[Path]: Segment paths in write order.
+    """
+    return sorted(Path(directory).glob(_SEGMENT_GLOB))
+
+
+def _segment_number(path: Path) -> int:
+    """Get the number of a segment from its file name.
+
+    Args:
+        path: The segment path.
+
+    Returns:
+        int: The segment number.
+    """
+    return int(path.stem.removeprefix("events-"))
+
+
+class _Indexer:
+    """Numbers the games of a journal and detects where a new index entry starts.
+
+    Games are counted by their ``GAME_STARTED`` events, so the first game is 0
+    and events logged before it are numbered -1.
+    """
+
+    __slots__ = ("game", "last_key")
+
+    def __init__(self, game: int = -1, last_key: _IndexKey | None = None) -> None:
+        """Initialize the indexer.
+
+        Args:
+            game: Number of the current game, or -1 before the first one.
+            last_key: Key of the last indexed entry.
+        """
+        self.game = game
+        self.last_key = last_key
+
+    def key(self, event_type: str, round_number: int, phase: str) -> _IndexKey | None:
+        """Advance past one event.
+
+        Args:
+            event_type: The event's type.
+            round_number: The event's round.
+            phase: The event's phase.
+
+        Returns:
+            _IndexKey | None: The event's (game, round, phase) if it starts a new
+                index entry, otherwise None.
+        """
+        if event_type == EventType.GAME_STARTED:
+            self.game += 1
+        key = (self.game, round_number, phase)
+        if key == self.last_key:
+            return None
+        self.last_key = key
+        return key
+
+
+def _pack_record(key: _IndexKey, position: JournalPosition) -> bytes:
+    """Encode one index entry.
+
+    Args:
+        key: The (game, round, phase) of the entry.
+        position: Where its first event is.
+
+    Returns:
+        bytes: The fixed-size record.
+    """
+    game, round_number, phase = key
+    return _INDEX_RECORD.pack(game, round_number, _PHASE_CODES[phase], *position)
+
+
+class EventJournal:
+    """Sink of a background writer that appends events to rotating JSONL segment files.
+
+    ``append`` only enqueues the record, so logging an event costs the engine a
+    queue put. Records must not be changed after they are appended, since they
+    are serialized later on the writer thread. Opening a journal on a directory
+    that already has segments continues after the last one, after cutting off a
+    partly written last line left by a crash.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        writer: BackgroundWriter | None = None,
+    ) -> None:
+        """Open the journal on its own writer thread or on a shared one.
+
+        Args:
+            directory: Directory for the segment files; created if missing.
+            max_bytes: Segment size that triggers rotation.
+            batch_size: Maximum number of events written in one batch by the
+                journal's own writer; a shared writer uses its own batch size.
+            writer: Background writer shared with other game I/O. It stays open
+                when the journal is closed. If None, the journal starts its own.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+
+        self._file: IO[bytes]
+        self._index_file: IO[bytes]
+        self._open_files()
+
+        self._owns_writer = writer is None
+        self.writer = writer or BackgroundWriter(batch_size=batch_size, name="event-journal")
+        self._closed = False
+
+    @property
+    def path(self) -> Path:
+        """Get the path of the segment currently written to.
+
+        Returns:
+            Path: The current segment file.
+        """
+        return self.directory / _segment_name(self._segment_index)
+
+    def append(self, event: EventRecord) -> None:
+        """Queue an event for writing, blocking while the writer's queue is full.
+
+        Args:
+            event: The logged event.
+
+        Raises:
+            RuntimeError: If the journal is closed.
+        """
+        self._check_open()
+        self.writer.submit(self, event)
+
+    def sync(self) -> None:
+        """Wait until every queued event is written and fsynced.
+
+        Raises:
+            RuntimeError: If the journal is closed or writing failed.
+        """
+        self._check_open()
+        self.writer.flush()
+
+    def close(self) -> None:
+        """Write the remaining events, fsync and close the segment files.
+
+        The journal's own writer thread is stopped; a shared writer is only
+        flushed.
+
+        Raises:
+            RuntimeError: If writing failed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._owns_writer:
+                self.writer.close()
+            elif not self.writer.closed:
+                self.writer.flush()
+        finally:
+            self._file.close()
+            self._index_file.close()
+
+    def rewind(self, events: Sequence[EventRecord]) -> None:
+        """Make the journal end with the events of a game resumed from a checkpoint.
+
+        A resumed game logs again every event after its checkpoint. If the last
+        game in the journal starts with the checkpoint's events, whatever it
+        logged after them is cut off, so those events are not journaled twice.
+        Otherwise the events are appended, so that the journal still ends with
+        the whole resumed game.
+
+        Args:
+            events: The events restored from the checkpoint.
+
+        Raises:
+            RuntimeError: If the journal is closed or writing failed.
+        """
+        self.sync()
+        end = self._game_prefix_end(events)
+        if end is None:
+            for event in events:
+                self.append(event)
+            return
+
+        self._file.close()
+        self._index_file.close()
+        for path in list_segments(self.directory):
+            if _segment_number(path) > end.segment:
+                path.unlink()
+        with (self.directory / _segment_name(end.segment)).open("r+b") as file:
+            file.truncate(end.offset)
+            os.fsync(file.fileno())
+        self._open_files()
+
+    def write_batch(self, items: list[EventRecord], sync: bool) -> None:
+        """Write events on the writer thread; phase changes and game ends are fsynced.
+
+        Args:
+            items: The events.
+            sync: Whether the writer asked for an fsync.
+        """
+        must_sync = sync or any(event.event_type in SYNC_EVENT_TYPES for event in items)
+        self._write(items, sync=must_sync)
+
+    def __enter__(self) -> Self:
+        """Use the journal as a context manager.
+
+        Returns:
+            EventJournal: This journal.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the journal when leaving the context.
+
+        Args:
+            *exc_info: Exception information, if any.
+        """
+        self.close()
+
+    def _check_open(self) -> None:
+        """Refuse events once the journal is closed.
+
+        Raises:
+            RuntimeError: If the journal is closed.
+        """
+        if self._closed:
+            msg = "Event journal is closed"
+            raise RuntimeError(msg)
+
+    def _open_files(self) -> None:
+        """Open the last segment and the index for appending, repairing a crash."""
+        segments = list_segments(self.directory)
+        if segments:
+            _truncate_torn_line(segments[-1])
+        self._segment_index = _segment_number(segments[-1]) if segments else 0
+        self._file = self._open_segment()
+        self._size = self._file.tell()
+
+        records, self._indexer, complete = _scan_index(self.directory)
+        if not complete:
+            _write_index(self.directory / INDEX_NAME, records)
+        self._index_file = (self.directory / INDEX_NAME).open("ab")
+
+    def _game_prefix_end(self, events: Sequence[EventRecord]) -> JournalPosition | None:
+        """Find where the given events end if the journal's last game starts with them.
+
+        Args:
+            events: The first events of a game.
+
+        Returns:
+            JournalPosition | None: The position just after the last of the events,
+                or None if the last game does not start with them.
+        """
+        records, _, _ = _scan_index(self.directory)
+        if not events or not records:
+            return None
+        game = records[-1][0][0]
+        start = next(position for (number, _, _), position in records if number == game)
+        end = None
+        lines = _journal_lines(self.directory, start)
+        for event in events:
+            position, line = next(lines, (None, b""))
+            if position is None or line != _encode(event):
+                return None
+            end = JournalPosition(position.segment, position.offset + len(line))
+        return end
+
+    def _open_segment(self) -> IO[bytes]:
+        """Open the current segment for appending.
+
+        Returns:
+            IO[bytes]: The open segment file.
+        """
+        return self.path.open("ab")
+
+    def _rotate(self) -> None:
+        """Close the full segment and start the next one."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._segment_index += 1
+        self._file = self._open_segment()
+        self._size = 0
+
+    def _write(self, events: list[EventRecord], sync: bool) -> None:
+        """Write events as JSON lines, rotating when a segment fills up.
+
+        Index entries are appended after the events they point to. The index is
+        not fsynced, since a lost tail is rebuilt from the segments.
+
+        Args:
+            events: The events to write.
+            sync: Whether to fsync after writing.
+        """
+        chunk: list[bytes] = []
+        index_chunk: list[bytes] = []
+        for event in events:
+            line = _encode(event)
+            if self._size and self._size + len(line) > self.max_bytes:
+                self._file.write(b"".join(chunk))
+                chunk = []
+                self._rotate()
+            key = self._indexer.key(event.event_type, event.round_number, event.phase)
+            if key is not None:
+                position = JournalPosition(self._segment_index, self._size)
+                index_chunk.append(_pack_record(key, position))
+            chunk.append(line)
+            self._size += len(line)
+        if chunk:
+            self._file.write(b"".join(chunk))
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+        if index_chunk:
+            self._index_file.write(b"".join(index_chunk))
+            self._index_file.flush()
+
+
+def _encode(event: EventRecord) -> bytes:
+    """Serialize an event as one journal line.
+
+    Args:
+        event: The event.
+
+    Returns:
+        bytes: The JSON line, newline included.
+    """
+    return json.dumps(event.to_dict(), ensure_ascii=False).encode() + b"\n"
+
+
+def _truncate_torn_line(path: Path) -> None:
+    """Cut a partly written last line off a segment.
+
+    Appending after a torn line would glue the next event onto it and make the
+    line unreadable, so the segment is cut back to its last newline first.
+
+    Args:
+        path: The segment file.
+    """
+    with path.open("r+b") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            end = mapped.rfind(b"\n") + 1
+        if end < size:
+            file.truncate(end)
+            os.fsync(file.fileno())
+
+
+def _journal_end(directory: str | Path) -> JournalPosition:
+    """Get the position just past the last byte of a journal.
+
+    Args:
+        directory: The journal directory.
+
+    Returns:
+        JournalPosition: The end of the last segment.
+    """
+    segments = list_segments(directory)
+    if not segments:
+        return JournalPosition(0, 0)
+    return JournalPosition(_segment_number(segments[-1]), segments[-1].stat().st_size)
+
+
+def _segment_lines(path: Path, offset: int) -> Iterator[tuple[int, bytes]]:
+    """Yield the complete lines of a memory-mapped segment from an offset on.
+
+    A partly written last line, left by a crash, is not yielded.
+
+    Args:
+        path: The segment file.
+        offset: Byte offset of the first line to yield.
+
+    Yields:
+        tuple[int, bytes]: Offset and content of each line.
+    """
+    with path.open("rb") as file:
+        if os.fstat(file.fileno()).st_size <= offset:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            end = mapped.find(b"\n", offset)
+            while end >= 0:
+                yield offset, mapped[offset : end + 1]
+                offset = end + 1
+                end = mapped.find(b"\n", offset)
+
+
+def _journal_lines(
+    directory: str | Path, start: JournalPosition
+) -> Iterator[tuple[JournalPosition, bytes]]:
+    """Yield the lines of a journal from a position to the end.
+
+    Args:
+        directory: The journal directory.
+        start: Position of the first line to yield.
+
+    Yields:
+        tuple[JournalPosition, bytes]: Position and content of each line.
+    """
+    for path in list_segments(directory):
+        number = _segment_number(path)
+        if number < start.segment:
+            continue
+        offset = start.offset if number == start.segment else 0
+        for line_offset, line in _segment_lines(path, offset):
+            yield JournalPosition(number, line_offset), line
+
+
+def _read_index(path: Path) -> tuple[list[tuple[_IndexKey, JournalPosition]], bool]:
+    """Read the entries of a sidecar index file.
+
+    Args:
+        path: The index file.
+
+    Returns:
+        tuple[list[tuple[_IndexKey, JournalPosition]], bool]: The entries, and
+            whether the file existed and held only whole records.
+    """
+    if not path.exists():
+        return [], False
+    data = path.read_bytes()
+    header = _INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION)
+    if not data.startswith(header):
+        return [], False
+    body = memoryview(data)[len(header) :]
+    usable = len(body) - len(body) % _INDEX_RECORD.size
+    records = [
+        ((game, round_number, _PHASES[code].value), JournalPosition(segment, offset))
+        for game, round_number, code, segment, offset in _INDEX_RECORD.iter_unpack(body[:usable])
+    ]
+    return records, usable == len(body)
+
+
+def _write_index(path: Path, records: list[tuple[_IndexKey, JournalPosition]]) -> None:
+    """Replace a sidecar index file with the given entries.
+
+    Args:
+        path: The index file.
+        records: Every entry, in journal order.
+    """
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with temp_path.open("wb") as file:
+        file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION))
+        file.write(b"".join(_pack_record(key, position) for key, position in records))
+    temp_path.replace(path)
+
+
+def _scan_index(
+    directory: str | Path,
+) -> tuple[list[tuple[_IndexKey, JournalPosition]], _Indexer, bool]:
+    """Load the sidecar index and add entries for events written after it.
+
+    Only the lines after the last indexed entry are parsed, so this is cheap
+    unless the index is missing. Entries past the end of the journal, whose
+    events were lost in a crash, are dropped.
+
+    Args:
+        directory: The journal directory.
+
+    Returns:
+        tuple[list[tuple[_IndexKey, JournalPosition]], _Indexer, bool]: All
+            entries, the indexer state at the end of the journal, and whether
+            the index file already held all of them.
+    """
+    records, complete = _read_index(Path(directory) / INDEX_NAME)
+    end = _journal_end(directory)
+    while records and records[-1][1] >= end:
+        records.pop()
+        complete = False
+    stored = len(records)
+    if records:
+        last_key, last_position = records[-1]
+        indexer = _Indexer(game=last_key[0], last_key=last_key)
+        lines = _journal_lines(directory, last_position)
+        next(lines, None)  # The line that started the last entry is already counted
+    else:
+        indexer = _Indexer()
+        lines = _journal_lines(directory, JournalPosition(0, 0))
+
+    for position, line in lines:
+        event = json.loads(line)
+        key = indexer.key(event["event_type"], event["round_number"], event["phase"])
+        if key is not None:
+            records.append((key, position))
+    return records, indexer, complete and len(records) == stored
+
+
+class JournalReader:
+    """Memory-mapped reader of a journal that can start at any game, round or phase.
+
+    Events are parsed lazily as they are iterated, so streaming a multi-gigabyte
+    journal never loads a whole segment. The index is loaded on the first seek;
+    call ``refresh`` to pick up events written since then.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize the reader.
+
+        Args:
+            directory: The journal directory.
+        """
+        self.directory = Path(directory)
+        self._positions: dict[tuple[int, ...] | _IndexKey, JournalPosition] | None = None
+
+    @property
+    def positions(self) -> dict[tuple[int, ...] | _IndexKey, JournalPosition]:
+        """Get where each game, round and phase starts.
+
+        Keys are ``(game,)``, ``(game, round)`` and ``(game, round, phase)``; the
+        first occurrence of a key wins.
+
+        Returns:
+            dict[tuple[int, ...] | _IndexKey, JournalPosition]: Start positions.
+        """
+        if self._positions is None:
+            records, _, _ = _scan_index(self.directory)
+            positions: dict[tuple[int, ...] | _IndexKey, JournalPosition] = {}
+            for (game, round_number, phase), position in records:
+                game_number = max(game, 0)
+                positions.setdefault((game_number,), position)
+                positions.setdefault((game_number, round_number), position)
+                positions.setdefault((game_number, round_number, phase), position)
+            self._positions = positions
+        return self._positions
+
+    @property
+    def game_count(self) -> int:
+        """Get the number of games in the journal.
+
+        Returns:
+            int: Number of games.
+        """
+        return sum(1 for key in self.positions if len(key) == 1)
+
+    def refresh(self) -> None:
+        """Drop the loaded index so that the next seek sees new events."""
+        self._positions = None
+
+    def seek(
+        self, game: int, round_number: int | None = None, phase: GamePhase | str | None = None
+    ) -> JournalPosition:
+        """Find the first event of a game, round or phase.
+
+        Args:
+            game: Zero-based game number.
+            round_number: Round within the game, or None for the game's start.
+            phase: Phase within the round, or None for the round's start.
+
+        Returns:
+            JournalPosition: Position of the first matching event.
+
+        Raises:
+            ValueError: If the journal has no such event.
+        """
+        key: tuple[int, ...] | _IndexKey = (game,)
+        if round_number is not None:
+            key = (game, round_number)
+            if phase is not None:
+                key = (game, round_number, GamePhase(phase).value)
+        position = self.positions.get(key)
+        if position is None:
+            msg = f"Journal has no events for {key}"
+            raise ValueError(msg)
+        return position
+
+    def events(
+        self,
+        game: int | None = None,
+        round_number: int | None = None,
+        phase: GamePhase | str | None = None,
+    ) -> Iterator[EventRecord]:
+        """Stream events, from the start or from a game, round or phase on.
+
+        Args:
+            game: Game to start at, or None to read from the beginning.
+            round_number: Round to start at within the game.
+            phase: Phase to start at within the round.
+
+        Yields:
+            EventRecord: The events from the start position to the end of the journal.
+        """
+        start = JournalPosition(0, 0)
+        if game is not None:
+            start = self.seek(game, round_number, phase)
+        for _, line in _journal_lines(self.directory, start):
+            yield EventRecord.from_dict(json.loads(line))
+
+
+def read_journal(directory: str | Path) -> Iterator[EventRecord]:
+    """Read the events of a journal back, oldest first.
+
+    A partly written last line, left by a crash, is skipped.
+
+    Args:
+        directory: The journal directory.
+
+    Returns:
+        Iterator[EventRecord]: The journaled events.
+    """
+    return JournalReader(directory).events()
@@ -0,0 +1,9 @@
+"""Message tables for each supported language, one module per language.
+
+Modules are imported on demand by ``llm_werewolf.core.locale``.
+"""
+
+LANGUAGE_MODULES: dict[str, str] = {"en-US": "en_us", "zh-TW": "zh_tw", "zh-CN": "zh_cn"}
+"""Module name of each supported language code."""
+
+__all__ = ["LANGUAGE_MODULES"]
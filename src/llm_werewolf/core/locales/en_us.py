@@ -0,0 +1,95 @@
+"""Game messages in English (en-US)."""
+
+MESSAGES: dict[str, str] = {
+    # Phase transitions
+    "night_begins": "Night {round_number} begins",
+    "day_begins": "Day {round_number} begins",
+    "voting_phase": "Voting Phase",
+    "game_started": "Game started with {player_count} players",
+    "game_ended": "Game ended. {winner} wins! {reason}",
+    "game_over": "\nGame Over! {winner} camp wins!",
+    # Phase separators
+    "phase_separator": "=" * 60,
+    "night_separator": "🌙 " + "=" * 56 + " 🌙",
+    "day_separator": "☀️  " + "=" * 56 + " ☀️",
+    # Player status
+    "alive_players": "\nAlive Players:",
+    "dead_players": "\nDead Players:",
+    "player_role_info": "- {name} ({role})",
+    # Deaths
+    "player_died": "{player} died",
+    "killed_by_werewolves": "{player} was killed by werewolves",
+    "voted_out": "{player} was voted out",
+    "player_eliminated": "{player} was eliminated by vote. They were a {role}.",
+    "died_of_heartbreak": "{player} died of heartbreak (lover)!",
+    "died_from_charm": "{player} died from Wolf Beauty's charm (Wolf Beauty {wolf_beauty} was eliminated)!",
+    # Voting
+    "vote_cast": "🗳️ {voter} votes for {target}",
+    "vote_summary": "\n📊 Vote Summary:",
+    "vote_count": "  {target}: {count} vote(s) - {voters}",
+    "vote_tied": "Vote tied. No one is eliminated.",
+    "no_votes": "No votes cast.",
+    # Narrator messages
+    "narrator_night_falls": "🌙 Night falls, everyone close your eyes...",
+    "narrator_werewolves_wake": "🐺 Werewolves, please open your eyes and discuss...",
+    "narrator_werewolves_vote": "🐺 Werewolves, please vote for your target...",
+    "narrator_werewolves_sleep": "🐺 Werewolves, close your eyes...",
+    "narrator_daybreak": "☀️ The sun rises, everyone open your eyes...",
+    # Role actions
+    "role_acting": "🎬 {role} ({player}) is acting...",
+    "player_speech": "{player}: {speech}",
+    "werewolf_discussion": "🐺 {player} (Werewolf): {speech}",
+    "werewolf_voting": "🐺 Werewolves are discussing their target...",
+    "werewolf_target": "🐺 Werewolves targeted {target}",
+    "witch_saved": "💊 Witch saved {target}",
+    "witch_poisoned": "☠️ Witch poisoned {target}",
+    "guard_protected": "🛡️ Guard protected {target}",
+    "seer_checked": "🔮 Seer checked {target}: {result}",
+    "hunter_shoots": "🏹 Hunter {hunter} shoots {target}",
+    "alpha_wolf_shoots": "🐺👑 Alpha Wolf {alpha} shoots {target}",
+    "lovers_linked": "💕 Lovers linked: {player1} and {player2}",
+    "white_wolf_kills": "🐺⚪ White Wolf kills {target}",
+    "wolf_beauty_charms": "🐺💋 Wolf Beauty charms {target}",
+    "cupid_links": "💘 Cupid links {player1} and {player2} as lovers",
+    # Special cases
+    "idiot_revealed": "{player} reveals they are the Idiot and survives!",
+    "elder_executed": "The Elder was executed by the village! All villagers lose their special abilities as punishment!",
+    "elder_attacked": "{player} was attacked but survived (Elder)!",
+    "protected_by_guard": "{player} was protected by the guard!",
+    "saved_by_witch": "{player} was saved by the witch!",
+    "poisoned_no_ability": "{player} was poisoned by the Witch and cannot use their death ability.",
+    "death_ability_active": "{player} ({role}) can shoot before dying!",
+    # Sheriff Election
+    "sheriff_campaign_started": "Sheriff election begins. Players may volunteer to campaign for sheriff.",
+    "no_candidates": "No one volunteered to campaign for sheriff. There will be no sheriff this game.",
+    "player_volunteers": "{player} volunteers to campaign for sheriff.",
+    "campaign_speeches_start": "{count} candidates will now give their campaign speeches.",
+    "candidate_speech": "{candidate}'s speech: {speech}",
+    "no_voters": "No non-candidate players available to vote. All players are candidates.",
+    "sheriff_voting_start": "{count} non-candidate player(s) will now vote for sheriff.",
+    "sheriff_vote_cast": "{voter} voted for {candidate}.",
+    "sheriff_vote_abstained": "{voter} abstained from voting.",
+    "sheriff_vote_result": "{candidate} received {votes} vote(s).",
+    "sheriff_tie": "Tie between {candidates}. No sheriff this game.",
+    "sheriff_elected": "{player} has been elected sheriff!",
+    # Sheriff Badge Transfer
+    "sheriff_died_transfer": "Sheriff {sheriff} has died. They may transfer the badge or tear it.",
+    "sheriff_badge_torn": "{sheriff} tore the sheriff badge. There is no sheriff anymore.",
+    "sheriff_badge_transferred": "{sheriff} transferred the sheriff badge to {target}.",
+    # Other abilities
+    "elder_penalty": "All villager abilities disabled due to Elder execution",
+    "nightmare_blocked": "{player} ({role}) was blocked by Nightmare Wolf",
+    "witch_uses_poison": "🧪 Witch used poison on {target}",
+    "witch_poisoned_target": "{target} was poisoned by witch",
+    # Error messages
+    "speech_failed": "{player}: [Speech failed - {error}]",
+    "discussion_failed": "{player}: [Discussion failed - {error}]",
+    # Config
+    "config_loaded": "Loaded configuration: {config_path}",
+    "game_resumed": "Resumed game from checkpoint: {checkpoint}",
+    "player_count_info": "Number of players: {num_players}",
+    "interface_mode": "Interface mode: Console (auto-execute)",
+    # CLI
+    "game_interrupted": "\nGame interrupted by user.",
+    "game_error": "Error executing game: {error}",
+}
@@ -0,0 +1,95 @@
+"""Game messages in Simplified Chinese (zh-CN)."""
+
+MESSAGES: dict[str, str] = {
+    # Phase transitions
+    "night_begins": "第 {round_number} 轮黑夜开始",
+    "day_begins": "第 {round_number} 轮白天开始",
+    "voting_phase": "投票阶段",
+    "game_started": "游戏开始，共有 {player_count} 位玩家",
+    "game_ended": "游戏结束。{winner} 获胜!{reason}",
+    "game_over": "\n游戏结束!{winner} 阵营获胜!",
+    # Phase separators
+    "phase_separator": "=" * 60,
+    "night_separator": "🌙 " + "=" * 56 + " 🌙",
+    "day_separator": "☀️  " + "=" * 56 + " ☀️",
+    # Player status
+    "alive_players": "\n存活玩家: ",
+    "dead_players": "\n淘汰玩家: ",
+    "player_role_info": "- {name}({role})",
+    # Deaths
+    "player_died": "{player} 死亡",
+    "killed_by_werewolves": "{player} 被狼人杀害",
+    "voted_out": "{player} 被投票淘汰",
+    "player_eliminated": "{player} 被投票淘汰，身份是 {role}。",
+    "died_of_heartbreak": "{player} 因爱而死(恋人)!",
+    "died_from_charm": "{player} 被狼美人魅惑而死(狼美人 {wolf_beauty} 被淘汰)!",
+    # Voting
+    "vote_cast": "🗳️ {voter} 投票给 {target}",
+    "vote_summary": "\n📊 投票统计: ",
+    "vote_count": "  {target}: {count} 票 - {voters}",
+    "vote_tied": "投票平手，无人被淘汰。",
+    "no_votes": "无人投票。",
+    # Narrator messages
+    "narrator_night_falls": "🌙 天黑请闭眼...",
+    "narrator_werewolves_wake": "🐺 狼人请睁眼，请讨论并选择目标...",
+    "narrator_werewolves_vote": "🐺 狼人请投票...",
+    "narrator_werewolves_sleep": "🐺 狼人请闭眼...",
+    "narrator_daybreak": "☀️ 天亮了，所有人请睁眼...",
+    # Role actions
+    "role_acting": "🎬 {role}({player})正在行动...",
+    "player_speech": "{player}: {speech}",
+    "werewolf_discussion": "🐺 {player}(狼人): {speech}",
+    "werewolf_voting": "🐺 狼人正在讨论目标...",
+    "werewolf_target": "🐺 狼人选择了 {target}",
+    "witch_saved": "💊 女巫救了 {target}",
+    "witch_poisoned": "☠️ 女巫毒杀了 {target}",
+    "guard_protected": "🛡️ 守卫保护了 {target}",
+    "seer_checked": "🔮 预言家查验了 {target}: {result}",
+    "hunter_shoots": "🏹 猎人 {hunter} 射杀了 {target}",
+    "alpha_wolf_shoots": "🐺👑 狼王 {alpha} 带走了 {target}",
+    "lovers_linked": "💕 恋人连结: {player1} 和 {player2}",
+    "white_wolf_kills": "🐺⚪ 白狼王杀了 {target}",
+    "wolf_beauty_charms": "🐺💋 狼美人魅惑了 {target}",
+    "cupid_links": "💘 丘比特将 {player1} 和 {player2} 连结为恋人",
+    # Special cases
+    "idiot_revealed": "{player} 揭示自己是白痴，幸免于难!",
+    "elder_executed": "长老被村民处决了!所有村民失去特殊能力作为惩罚!",
+    "elder_attacked": "{player} 被攻击但幸存(长老)!",
+    "protected_by_guard": "{player} 被守卫保护了!",
+    "saved_by_witch": "{player} 被女巫救了!",
+    "poisoned_no_ability": "{player} 被女巫毒杀，无法使用死亡技能。",
+    "death_ability_active": "{player}({role})可以在死前射杀一人!",
+    # Sheriff Election
+    "sheriff_campaign_started": "警长选举开始，玩家可以自愿竞选警长。",
+    "no_candidates": "没有人自愿竞选警长，本局没有警长。",
+    "player_volunteers": "{player} 自愿竞选警长。",
+    "campaign_speeches_start": "{count} 位候选人将发表竞选演说。",
+    "candidate_speech": "{candidate} 的演说: {speech}",
+    "no_voters": "没有非候选人可以投票，所有玩家都是候选人。",
+    "sheriff_voting_start": "{count} 位非候选人将投票选举警长。",
+    "sheriff_vote_cast": "{voter} 投票给 {candidate}。",
+    "sheriff_vote_abstained": "{voter} 弃权。",
+    "sheriff_vote_result": "{candidate} 得到 {votes} 票。",
+    "sheriff_tie": "{candidates} 平手，本局没有警长。",
+    "sheriff_elected": "{player} 当选警长!",
+    # Sheriff Badge Transfer
+    "sheriff_died_transfer": "警长 {sheriff} 已死亡，可以选择移交或撕毁警徽。",
+    "sheriff_badge_torn": "{sheriff} 撕毁了警徽，不再有警长。",
+    "sheriff_badge_transferred": "{sheriff} 将警徽移交给 {target}。",
+    # Other abilities
+    "elder_penalty": "长老被处决，所有村民失去特殊能力",
+    "nightmare_blocked": "{player}({role})被梦魇狼封印",
+    "witch_uses_poison": "🧪 女巫对 {target} 使用毒药",
+    "witch_poisoned_target": "{target} 被女巫毒杀",
+    # Error messages
+    "speech_failed": "{player}: [发言失败 - {error}]",
+    "discussion_failed": "{player}: [讨论失败 - {error}]",
+    # Config
+    "config_loaded": "已加载配置文件: {config_path}",
+    "game_resumed": "已从存档点恢复游戏: {checkpoint}",
+    "player_count_info": "玩家人数: {num_players}",
+    "interface_mode": "界面模式: Console(自动执行)",
+    # CLI
+    "game_interrupted": "\n游戏已由用户中止。",
+    "game_error": "执行游戏时发生错误: {error}",
+}
@@ -0,0 +1,95 @@
+"""Game messages in Traditional Chinese (zh-TW)."""
+
+MESSAGES: dict[str, str] = {
+    # Phase transitions
+    "night_begins": "第 {round_number} 輪黑夜開始",
+    "day_begins": "第 {round_number} 輪白天開始",
+    "voting_phase": "投票階段",
+    "game_started": "遊戲開始，共有 {player_count} 位玩家",
+    "game_ended": "遊戲結束。{winner} 獲勝!{reason}",
+    "game_over": "\n遊戲結束!{winner} 陣營獲勝!",
+    # Phase separators
+    "phase_separator": "=" * 60,
+    "night_separator": "🌙 " + "=" * 56 + " 🌙",
+    "day_separator": "☀️  " + "=" * 56 + " ☀️",
+    # Player status
+    "alive_players": "\n存活玩家: ",
+    "dead_players": "\n淘汰玩家: ",
+    "player_role_info": "- {name}({role})",
+    # Deaths
+    "player_died": "{player} 死亡",
+    "killed_by_werewolves": "{player} 被狼人殺害",
+    "voted_out": "{player} 被投票淘汰",
+    "player_eliminated": "{player} 被投票淘汰，身分是 {role}。",
+    "died_of_heartbreak": "{player} 因愛而死(戀人)!",
+    "died_from_charm": "{player} 被狼美人魅惑而死(狼美人 {wolf_beauty} 被淘汰)!",
+    # Voting
+    "vote_cast": "🗳️ {voter} 投票給 {target}",
+    "vote_summary": "\n📊 投票統計: ",
+    "vote_count": "  {target}: {count} 票 - {voters}",
+    "vote_tied": "投票平手，無人被淘汰。",
+    "no_votes": "無人投票。",
+    # Narrator messages
+    "narrator_night_falls": "🌙 天黑請閉眼...",
+    "narrator_werewolves_wake": "🐺 狼人請睜眼，請討論並選擇目標...",
+    "narrator_werewolves_vote": "🐺 狼人請投票...",
+    "narrator_werewolves_sleep": "🐺 狼人請閉眼...",
+    "narrator_daybreak": "☀️ 天亮了，所有人請睜眼...",
+    # Role actions
+    "role_acting": "🎬 {role}({player})正在行動...",
+    "player_speech": "{player}: {speech}",
+    "werewolf_discussion": "🐺 {player}(狼人): {speech}",
+    "werewolf_voting": "🐺 狼人正在討論目標...",
+    "werewolf_target": "🐺 狼人選擇了 {target}",
+    "witch_saved": "💊 女巫救了 {target}",
+    "witch_poisoned": "☠️ 女巫毒殺了 {target}",
+    "guard_protected": "🛡️ 守衛保護了 {target}",
+    "seer_checked": "🔮 預言家查驗了 {target}: {result}",
+    "hunter_shoots": "🏹 獵人 {hunter} 射殺了 {target}",
+    "alpha_wolf_shoots": "🐺👑 狼王 {alpha} 帶走了 {target}",
+    "lovers_linked": "💕 戀人連結: {player1} 和 {player2}",
+    "white_wolf_kills": "🐺⚪ 白狼王殺了 {target}",
+    "wolf_beauty_charms": "🐺💋 狼美人魅惑了 {target}",
+    "cupid_links": "💘 丘比特將 {player1} 和 {player2} 連結為戀人",
+    # Special cases
+    "idiot_revealed": "{player} 揭示自己是白癡，倖免於難!",
+    "elder_executed": "長老被村民處決了!所有村民失去特殊能力作為懲罰!",
+    "elder_attacked": "{player} 被攻擊但倖存(長老)!",
+    "protected_by_guard": "{player} 被守衛保護了!",
+    "saved_by_witch": "{player} 被女巫救了!",
+    "poisoned_no_ability": "{player} 被女巫毒殺，無法使用死亡技能。",
+    "death_ability_active": "{player}({role})可以在死前射殺一人!",
+    # Sheriff Election
+    "sheriff_campaign_started": "警長選舉開始，玩家可以自願競選警長。",
+    "no_candidates": "沒有人自願競選警長，本局沒有警長。",
+    "player_volunteers": "{player} 自願競選警長。",
+    "campaign_speeches_start": "{count} 位候選人將發表競選演說。",
+    "candidate_speech": "{candidate} 的演說: {speech}",
+    "no_voters": "沒有非候選人可以投票，所有玩家都是候選人。",
+    "sheriff_voting_start": "{count} 位非候選人將投票選舉警長。",
+    "sheriff_vote_cast": "{voter} 投票給 {candidate}。",
+    "sheriff_vote_abstained": "{voter} 棄權。",
+    "sheriff_vote_result": "{candidate} 得到 {votes} 票。",
+    "sheriff_tie": "{candidates} 平手，本局沒有警長。",
+    "sheriff_elected": "{player} 當選警長!",
+    # Sheriff Badge Transfer
+    "sheriff_died_transfer": "警長 {sheriff} 已死亡，可以選擇移交或撕毀警徽。",
+    "sheriff_badge_torn": "{sheriff} 撕毀了警徽，不再有警長。",
+    "sheriff_badge_transferred": "{sheriff} 將警徽移交給 {target}。",
+    # Other abilities
+    "elder_penalty": "長老被處決，所有村民失去特殊能力",
+    "nightmare_blocked": "{player}({role})被夢魘狼封印",
+    "witch_uses_poison": "🧪 女巫對 {target} 使用毒藥",
+    "witch_poisoned_target": "{target} 被女巫毒殺",
+    # Error messages
+    "speech_failed": "{player}: [發言失敗 - {error}]",
+    "discussion_failed": "{player}: [討論失敗 - {error}]",
+    # Config
+    "config_loaded": "已載入設定檔: {config_path}",
+    "game_resumed": "已從存檔點恢復遊戲: {checkpoint}",
+    "player_count_info": "玩家人數: {num_players}",
+    "interface_mode": "介面模式: Console(自動執行)",
+    # CLI
+    "game_interrupted": "\n遊戲已由使用者中止。",
+    "game_error": "執行遊戲時發生錯誤: {error}",
+}
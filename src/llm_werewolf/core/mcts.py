@@ -0,0 +1,482 @@
+"""Information-set Monte Carlo search for CPU-only agents.
+
+``MCTSAgent`` plays without a language model. For every target or yes/no decision
+it samples role assignments consistent with what its player knows, plays each
+candidate forward on a forked engine with random policies, and picks the option
+with the best win rate. Rollouts are spread over the options with UCB1 and can
+run in a process pool.
+"""
+
+import re
+import math
+import random
+from typing import NamedTuple
+from contextlib import contextmanager
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from llm_werewolf.core.types import Camp, PlayerChange, AgentProtocol
+from llm_werewolf.core.config import GameConfig
+from llm_werewolf.core.engine import GameEngine
+from llm_werewolf.core.beliefs import BeliefTracker
+from llm_werewolf.core.victory import VictoryChecker
+from llm_werewolf.core.spill_log import create_event_log
+from llm_werewolf.core.game_state import GameState
+from llm_werewolf.core.roles.base import Role
+
+DEFAULT_ROLLOUTS = 64
+"""Number of simulated games per decision."""
+
+DEFAULT_MAX_ROUNDS = 20
+"""Round limit of a rollout; unfinished rollouts count as a draw."""
+
+SKIP = "SKIP"
+"""Option for skipping an action when the prompt allows it."""
+
+_TARGET_LINE = re.compile(r"^(\d+)\. .* \(Player ID: ([^)]+)\)$", re.MULTILINE)
+_SKIP_LINE = re.compile(r"^(\d+)\. SKIP\b", re.MULTILINE)
+_YES_NO_MARKER = "ONLY 'YES' or 'NO'"
+
+
+class Knowledge(NamedTuple):
+    """What one player knows about the hidden roles."""
+
+    player_id: str
+    """The observing player."""
+
+    roles: dict[str, type[Role]]
+    """Players whose exact role is known, including the observer."""
+
+    camps: dict[str, Camp]
+    """Players whose camp is known but not their role (e.g. Seer results)."""
+
+
+def parse_options(message: str) -> list[str]:
+    """Get the options a decision prompt offers.
+
+    Args:
+        message: A prompt built by ``ActionSelector``.
+
+    Returns:
+        list[str]: Target player IDs (plus ``SKIP`` if allowed), ``YES`` and ``NO``
+            for yes/no questions, or an empty list for free-form prompts.
+    """
+    if _YES_NO_MARKER in message:
+        return ["YES", "NO"]
+    options = [player_id for _, player_id in _TARGET_LINE.findall(message)]
+    if options and _SKIP_LINE.search(message):
+        options.append(SKIP)
+    return options
+
+
+def answer_for(message: str, option: str) -> str | None:
+    """Build the response that selects an option in a prompt.
+
+    Args:
+        message: A prompt built by ``ActionSelector``.
+        option: A player ID, ``SKIP``, ``YES`` or ``NO``.
+
+    Returns:
+        str | None: The response, or None if the prompt does not offer the option.
+    """
+    if _YES_NO_MARKER in message:
+        return option if option in {"YES", "NO"} else None
+    if option == SKIP:
+        match = _SKIP_LINE.search(message)
+        return match.group(1) if match else None
+    for number, player_id in _TARGET_LINE.findall(message):
+        if player_id == option:
+            return number
+    return None
+
+
+class RandomPolicy:
+    """Lightweight random policy used for every seat in a rollout.
+
+    It picks a random offered option for target and yes/no prompts and gives a
+    fixed reply to free-form prompts. Unlike the pydantic agents it is cheap to
+    create, so each rollout gets fresh policies.
+    """
+
+    __slots__ = ("model", "name")
+
+    def __init__(self, name: str) -> None:
+        """Initialize the policy.
+
+        Args:
+            name: Display name of the player.
+        """
+        self.name = name
+        self.model = "random"
+
+    def get_response(self, message: str) -> str:
+        """Answer a prompt at random.
+
+        Args:
+            message: The prompt message.
+
+        Returns:
+            str: The response.
+        """
+        options = parse_options(message)
+        if options:
+            return answer_for(message, random.choice(options)) or ""  # noqa: S311
+        return "I agree."
+
+    def add_decision(self, decision: str) -> None:
+        """Ignore the decision; random policies keep no history.
+
+        Args:
+            decision: A summary of the decision.
+        """
+
+    def get_decision_context(self) -> str:
+        """Get the decision history, which is always empty.
+
+        Returns:
+            str: An empty string.
+        """
+        return ""
+
+
+class ForcedChoicePolicy(RandomPolicy):
+    """Random policy that makes one given choice the first time it is offered."""
+
+    __slots__ = ("option", "used")
+
+    def __init__(self, name: str, option: str) -> None:
+        """Initialize the policy.
+
+        Args:
+            name: Display name of the player.
+            option: Option to choose at the first decision that offers it.
+        """
+        super().__init__(name)
+        self.option = option
+        self.used = False
+
+    def get_response(self, message: str) -> str:
+        """Choose the forced option once, then answer at random.
+
+        Args:
+            message: The prompt message.
+
+        Returns:
+            str: The response.
+        """
+        if not self.used:
+            answer = answer_for(message, self.option)
+            if answer is not None:
+                self.used = True
+                return answer
+        return super().get_response(message)
+
+
+def assign_hidden_roles(state: GameState, knowledge: Knowledge, rng: random.Random) -> None:
+    """Deal the roles the observer cannot see at random, in place.
+
+    Known roles stay where they are. The other players' roles are shuffled among
+    them, and players with a known camp get a role of that camp when one is left.
+    Reassigned players get a fresh role of the new class and notify their
+    listeners, so the fork's capability table and victory tallies follow the deal.
+
+    Args:
+        state: A forked game state to rewrite.
+        knowledge: What the observer knows.
+        rng: Random generator for the deal.
+    """
+    hidden = [p for p in state.players if p.player_id not in knowledge.roles]
+    pool: list[type[Role]] = [type(p.role) for p in hidden]
+    rng.shuffle(pool)
+
+    deal: dict[str, type[Role]] = {}
+    for player in hidden:
+        camp = knowledge.camps.get(player.player_id)
+        if camp is None:
+            continue
+        for index, role_cls in enumerate(pool):
+            if role_cls.get_shared_config().camp == camp:
+                deal[player.player_id] = pool.pop(index)
+                break
+
+    unassigned = (p for p in hidden if p.player_id not in deal)
+    deal.update(zip((p.player_id for p in unassigned), pool, strict=False))
+
+    for player in hidden:
+        role_cls = deal[player.player_id]
+        if type(player.role) is not role_cls:
+            player.role = role_cls(player)
+            player.notify_change(PlayerChange.ROLE_TRANSFORMED)
+
+
+@contextmanager
+def _seeded_global_random(seed: int) -> Iterator[None]:
+    """Seed the global ``random`` module and restore its state on exit.
+
+    Args:
+        seed: Seed for the duration of the block.
+
+    Yields:
+        None: Control while the global generator is seeded.
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
+def rollout(
+    engine: GameEngine,
+    knowledge: Knowledge,
+    option: str,
+    rng: random.Random,
+    max_rounds: int = DEFAULT_MAX_ROUNDS,
+) -> float:
+    """Play one sampled game forward with the observer forced to choose an option.
+
+    The engine and the random policies draw from the global ``random`` module, so
+    it is seeded from ``rng`` for the rollout and restored afterwards: the same
+    ``rng`` state always plays the same game, in this process or a worker.
+
+    Args:
+        engine: Engine holding the position to search from; it is not modified.
+        knowledge: What the observer knows.
+        option: The observer's choice at the current decision.
+        rng: Random generator for the role deal and the rollout's play.
+        max_rounds: Round limit of the rollout.
+
+    Returns:
+        float: 1 if the observer's side won, 0 if it lost, 0.5 if unfinished.
+    """
+    agents: dict[str, AgentProtocol] = {
+        p.player_id: RandomPolicy(p.name) for p in engine.game_state.players
+    }
+    me = engine.game_state.get_player(knowledge.player_id)
+    agents[knowledge.player_id] = ForcedChoicePolicy(me.name, option)
+    sim = engine.fork(agents)
+    state = sim.game_state
+    assign_hidden_roles(state, knowledge, rng)
+
+    with _seeded_global_random(rng.getrandbits(64)):
+        while state.winner is None and state.round_number <= max_rounds:
+            sim.step()
+
+    if state.winner is None:
+        return 0.5
+    me = state.get_player(knowledge.player_id)
+    if state.winner == "lover":
+        return float(me.is_lover())
+    return float(state.winner == me.get_camp())
+
+
+class _RolloutJob(NamedTuple):
+    """A batch of rollouts for one option, sent to a worker process."""
+
+    state: GameState
+    config: GameConfig | None
+    language: str
+    knowledge: Knowledge
+    option: str
+    count: int
+    seed: int
+    max_rounds: int
+
+
+def _run_job(job: _RolloutJob) -> float:
+    """Run a batch of rollouts in a worker process.
+
+    Args:
+        job: The batch to run.
+
+    Returns:
+        float: The summed rewards.
+    """
+    engine = GameEngine(job.config, job.language)
+    engine.on_event = lambda event: None
+    engine.game_state = job.state
+    engine.victory_checker = VictoryChecker(job.state)
+    rng = random.Random(job.seed)  # noqa: S311
+    return sum(
+        rollout(engine, job.knowledge, job.option, rng, job.max_rounds) for _ in range(job.count)
+    )
+
+
+class RolloutSearch:
+    """Spends a rollout budget over the options of one decision with UCB1."""
+
+    def __init__(
+        self,
+        rollouts: int = DEFAULT_ROLLOUTS,
+        workers: int = 0,
+        max_rounds: int = DEFAULT_MAX_ROUNDS,
+        exploration: float = math.sqrt(2),
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the search.
+
+        Args:
+            rollouts: Number of simulated games per decision.
+            workers: Number of worker processes; 0 runs rollouts in this process.
+            max_rounds: Round limit of a rollout.
+            exploration: UCB1 exploration constant.
+            seed: Seed for reproducible searches.
+        """
+        self.rollouts = rollouts
+        self.workers = workers
+        self.max_rounds = max_rounds
+        self.exploration = exploration
+        self.rng = random.Random(seed)  # noqa: S311
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _ucb_order(self, totals: list[float], counts: list[int]) -> list[int]:
+        """Rank options by their UCB1 score, untried options first.
+
+        Args:
+            totals: Summed reward per option.
+            counts: Number of rollouts per option.
+
+        Returns:
+            list[int]: Option indexes, best first.
+        """
+        log_total = math.log(max(sum(counts), 1))
+
+        def score(index: int) -> float:
+            if counts[index] == 0:
+                return math.inf
+            mean = totals[index] / counts[index]
+            return mean + self.exploration * math.sqrt(log_total / counts[index])
+
+        return sorted(range(len(counts)), key=score, reverse=True)
+
+    def choose(self, engine: GameEngine, knowledge: Knowledge, options: Sequence[str]) -> str:
+        """Pick the option with the best mean reward.
+
+        Args:
+            engine: Engine holding the current position.
+            knowledge: What the deciding player knows.
+            options: The options of the decision.
+
+        Returns:
+            str: The chosen option.
+        """
+        if len(options) == 1:
+            return options[0]
+
+        totals = [0.0] * len(options)
+        counts = [0] * len(options)
+        if self.workers > 0:
+            self._search_parallel(engine, knowledge, options, totals, counts)
+        else:
+            for _ in range(self.rollouts):
+                index = self._ucb_order(totals, counts)[0]
+                totals[index] += rollout(
+                    engine, knowledge, options[index], self.rng, self.max_rounds
+                )
+                counts[index] += 1
+
+        best = max(range(len(options)), key=lambda i: totals[i] / max(counts[i], 1))
+        return options[best]
+
+    def _search_parallel(
+        self,
+        engine: GameEngine,
+        knowledge: Knowledge,
+        options: Sequence[str],
+        totals: list[float],
+        counts: list[int],
+    ) -> None:
+        """Run the budget in waves of one batch per worker.
+
+        Args:
+            engine: Engine holding the current position.
+            knowledge: What the deciding player knows.
+            options: The options of the decision.
+            totals: Summed reward per option, updated in place.
+            counts: Number of rollouts per option, updated in place.
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        # Workers get a fork without the event history, which may live in a temp file
+        state = engine.game_state.fork()
+        state.event_history = create_event_log()
+        batch = max(1, self.rollouts // (4 * self.workers))
+
+        remaining = self.rollouts
+        while remaining > 0:
+            wave = self._ucb_order(totals, counts)[: self.workers]
+            jobs = []
+            for index in wave:
+                count = min(batch, remaining)
+                if count == 0:
+                    break
+                remaining -= count
+                job = _RolloutJob(
+                    state=state,
+                    config=engine.config,
+                    language=engine.locale.language,
+                    knowledge=knowledge,
+                    option=options[index],
+                    count=count,
+                    seed=self.rng.getrandbits(32),
+                    max_rounds=self.max_rounds,
+                )
+                jobs.append((index, count, self._pool.submit(_run_job, job)))
+            for index, count, future in jobs:
+                totals[index] += future.result()
+                counts[index] += count
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+def knowledge_from_beliefs(beliefs: BeliefTracker) -> Knowledge:
+    """Summarize a belief tracker as the information set used by rollouts.
+
+    Args:
+        beliefs: The observer's belief tracker.
+
+    Returns:
+        Knowledge: Players with a known role, and players with only a known camp.
+    """
+    roles: dict[str, type[Role]] = {}
+    camps: dict[str, Camp] = {}
+    for player_id in beliefs.player_ids:
+        role_cls = beliefs.known_role(player_id)
+        if role_cls is not None:
+            roles[player_id] = role_cls
+            continue
+        camp = beliefs.known_camp(player_id)
+        if camp is not None:
+            camps[player_id] = camp
+    return Knowledge(player_id=beliefs.observer_id, roles=roles, camps=camps)
+
+
+def collect_knowledge(engine: GameEngine, player_id: str) -> Knowledge:
+    """Collect what a player knows about the hidden roles.
+
+    The player's beliefs are rebuilt from the start of the game and every event
+    they could see; see ``BeliefTracker`` for the evidence used.
+
+    Args:
+        engine: The engine running the game.
+        player_id: ID of the observing player.
+
+    Returns:
+        Knowledge: The player's information set.
+
+    Raises:
+        RuntimeError: If the game is not initialized.
+    """
+    if engine.game_state is None:
+        msg = "Game not initialized"
+        raise RuntimeError(msg)
+
+    beliefs = BeliefTracker.from_game_state(engine.game_state, player_id)
+    beliefs.observe_all(engine.event_logger.events)
+    return knowledge_from_beliefs(beliefs)
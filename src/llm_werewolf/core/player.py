@@ -1,8 +1,57 @@
-from llm_werewolf.core.types import PlayerInfo, PlayerStatus, RoleProtocol, AgentProtocol
+from collections.abc import Callable, Iterable
+
+from llm_werewolf.core.types import (
+    PlayerInfo,
+    PlayerChange,
+    PlayerStatus,
+    RoleProtocol,
+    AgentProtocol,
+)
+
+STATUS_BITS: dict[PlayerStatus, int] = {status: 1 << i for i, status in enumerate(PlayerStatus)}
+"""Bit assigned to each player status in the status bitflag."""
+
+_STATUS_SETS: dict[int, frozenset[PlayerStatus]] = {}
+
+_STATE_SLOTS = ("_alive", "_status_bits", "can_vote_flag", "lover_partner_id")
+"""Player slots that change during a game and are copied by ``clone``."""
+
+
+def _statuses_from_bits(bits: int) -> frozenset[PlayerStatus]:
+    """Decode a status bitflag, caching one frozenset per distinct combination.
+
+    Args:
+        bits: The status bitflag.
+
+    Returns:
+        frozenset[PlayerStatus]: The statuses set in the bitflag.
+    """
+    statuses = _STATUS_SETS.get(bits)
+    if statuses is None:
+        statuses = frozenset(s for s, bit in STATUS_BITS.items() if bits & bit)
+        _STATUS_SETS[bits] = statuses
+    return statuses
 
 
 class Player:
-    """Represents a player in the Werewolf game."""
+    """Represents a player in the Werewolf game.
+
+    Players use ``__slots__`` and keep their statuses as an int bitflag; the
+    ``statuses`` property exposes them as a set.
+    """
+
+    __slots__ = (
+        "_alive",
+        "_listeners",
+        "_status_bits",
+        "agent",
+        "ai_model",
+        "can_vote_flag",
+        "lover_partner_id",
+        "name",
+        "player_id",
+        "role",
+    )
 
     def __init__(
         self,
@@ -28,11 +77,34 @@ class Player:
         self.ai_model = ai_model
 
         self._alive = True
-        self.statuses: set[PlayerStatus] = {PlayerStatus.ALIVE}
+        self._status_bits = STATUS_BITS[PlayerStatus.ALIVE]
         self.lover_partner_id: str | None = None
 
         self.can_vote_flag = True
 
+        self._listeners: list[Callable[[Player, PlayerChange], None]] = []
+
+    @property
+    def statuses(self) -> frozenset[PlayerStatus]:
+        """Get the player's current statuses.
+
+        Returns:
+            frozenset[PlayerStatus]: The statuses the player has.
+        """
+        return _statuses_from_bits(self._status_bits)
+
+    @statuses.setter
+    def statuses(self, statuses: Iterable[PlayerStatus]) -> None:
+        """Replace the player's statuses.
+
+        Args:
+            statuses: The statuses the player should have.
+        """
+        bits = 0
+        for status in statuses:
+            bits |= STATUS_BITS[status]
+        self._status_bits = bits
+
     def is_alive(self) -> bool:
         """Check if the player is alive.
 
@@ -43,15 +115,59 @@ class Player:
 
     def kill(self) -> None:
         """Mark the player as dead."""
+        was_alive = self._alive
         self._alive = False
-        self.statuses.discard(PlayerStatus.ALIVE)
-        self.statuses.add(PlayerStatus.DEAD)
+        self._status_bits = (self._status_bits & ~STATUS_BITS[PlayerStatus.ALIVE]) | STATUS_BITS[
+            PlayerStatus.DEAD
+        ]
+        if was_alive:
+            self.notify_change(PlayerChange.KILLED)
 
     def revive(self) -> None:
         """Revive the player (e.g., by Witch's save potion)."""
+        was_alive = self._alive
         self._alive = True
-        self.statuses.discard(PlayerStatus.DEAD)
-        self.statuses.add(PlayerStatus.ALIVE)
+        self._status_bits = (self._status_bits & ~STATUS_BITS[PlayerStatus.DEAD]) | STATUS_BITS[
+            PlayerStatus.ALIVE
+        ]
+        if not was_alive:
+            self.notify_change(PlayerChange.REVIVED)
+
+    def clone(self, agent: AgentProtocol | None = None) -> "Player":
+        """Copy this player's state without listeners.
+
+        Statuses are an int bitflag and the other fields are immutable, so only the
+        role needs a deep copy. Listeners belong to the game state that registered
+        them and are not carried over.
+
+        Args:
+            agent: Agent controlling the copy, or None for no agent.
+
+        Returns:
+            Player: The copied player.
+        """
+        clone = Player(self.player_id, self.name, type(self.role), agent, self.ai_model)
+        for name in _STATE_SLOTS:
+            setattr(clone, name, getattr(self, name))
+        clone.role = self.role.clone(clone)
+        return clone
+
+    def add_listener(self, listener: Callable[["Player", PlayerChange], None]) -> None:
+        """Register a callback for state changes on this player.
+
+        Args:
+            listener: Callable invoked with the player and the change that occurred.
+        """
+        self._listeners.append(listener)
+
+    def notify_change(self, change: PlayerChange) -> None:
+        """Notify registered listeners that this player's state changed.
+
+        Args:
+            change: The kind of change that occurred.
+        """
+        for listener in self._listeners:
+            listener(self, change)
 
     def add_status(self, status: PlayerStatus) -> None:
         """Add a status to the player.
@@ -59,7 +175,7 @@ class Player:
         Args:
             status: The status to add.
         """
-        self.statuses.add(status)
+        self._status_bits |= STATUS_BITS[status]
 
     def remove_status(self, status: PlayerStatus) -> None:
         """Remove a status from the player.
@@ -67,7 +183,7 @@ class Player:
         Args:
             status: The status to remove.
         """
-        self.statuses.discard(status)
+        self._status_bits &= ~STATUS_BITS[status]
 
     def has_status(self, status: PlayerStatus) -> bool:
         """Check if the player has a specific status.
@@ -78,7 +194,7 @@ class Player:
         Returns:
             bool: True if the player has the status.
         """
-        return status in self.statuses
+        return bool(self._status_bits & STATUS_BITS[status])
 
     def can_vote(self) -> bool:
         """Check if the player can vote.
@@ -101,6 +217,7 @@ class Player:
         """
         self.lover_partner_id = partner_id
         self.add_status(PlayerStatus.LOVER)
+        self.notify_change(PlayerChange.LOVER_LINKED)
 
     def is_lover(self) -> bool:
         """Check if the player is a lover.
@@ -144,7 +261,7 @@ class Player:
             player_id=self.player_id,
             name=self.name,
             is_alive=self._alive,
-            statuses=self.statuses.copy(),
+            statuses=set(self.statuses),
             ai_model=self.ai_model,
         )
 
@@ -0,0 +1,69 @@
+from llm_werewolf.core.types import GamePhase, GameStateProtocol
+
+
+class PublicContext:
+    """Public facts shared by every prompt of one game phase.
+
+    Night deaths and the living players are the same for every speaker and voter of a
+    phase, so they are resolved and joined once instead of once per player. Prompt
+    builders combine the snapshot with each player's private slice (name, role and
+    decision history).
+    """
+
+    __slots__ = ("alive_names", "alive_text", "night_death_names", "phase", "round_number")
+
+    def __init__(
+        self,
+        round_number: int,
+        phase: GamePhase,
+        alive_names: tuple[str, ...],
+        night_death_names: tuple[str, ...],
+    ) -> None:
+        """Initialize the snapshot.
+
+        Args:
+            round_number: The round the snapshot was taken in.
+            phase: The phase the snapshot was taken in.
+            alive_names: Names of the living players, in seat order.
+            night_death_names: Names of the players who died last night.
+        """
+        self.round_number = round_number
+        self.phase = phase
+        self.alive_names = alive_names
+        self.night_death_names = night_death_names
+        self.alive_text = ", ".join(alive_names)
+
+    @classmethod
+    def from_game_state(cls, game_state: GameStateProtocol) -> "PublicContext":
+        """Take a snapshot of the public state of a game.
+
+        Args:
+            game_state: The game state to read.
+
+        Returns:
+            PublicContext: The new snapshot.
+        """
+        night_death_names = tuple(
+            player.name
+            for player in map(game_state.get_player, game_state.night_deaths)
+            if player is not None
+        )
+        return cls(
+            round_number=game_state.round_number,
+            phase=game_state.phase,
+            alive_names=tuple(p.name for p in game_state.get_alive_players()),
+            night_death_names=night_death_names,
+        )
+
+    def night_deaths_text(self, separator: str = ",") -> str:
+        """Describe last night's deaths.
+
+        Args:
+            separator: Punctuation between "Last night" and the names.
+
+        Returns:
+            str: A sentence naming the dead, or saying that no one died.
+        """
+        if not self.night_death_names:
+            return "No one died last night."
+        return f"Last night{separator} {', '.join(self.night_death_names)} died."
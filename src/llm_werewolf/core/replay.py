@@ -0,0 +1,303 @@
+"""Record agent responses and replay games from them.
+
+A ``Cassette`` holds the seed, configuration and every response each agent
+gave during a game, including the calls that failed. ``GameEngine.setup_recorded_game`` wraps the agents in
+``RecordingAgent`` to fill one; ``GameEngine.replay`` plays the game again with
+``ReplayAgent`` answering from it and compares the new event stream with the
+recorded one, so rule changes can be checked against real games without calling
+any model.
+
+Agents run on a random stream of their own while recording. The engine's
+``random`` draws then depend only on the seed and the responses, which is what
+makes the replay exact even for agents that use ``random`` themselves.
+"""
+
+import json
+import random
+from typing import Any, NamedTuple
+from pathlib import Path
+from collections.abc import Iterable, Iterator
+
+from pydantic import Field, BaseModel
+
+from llm_werewolf.core.types import USAGE_FIELDS, EventType, EventRecord, AgentProtocol
+from llm_werewolf.core.config import GameConfig
+from llm_werewolf.core.journal import JournalReader
+
+CASSETTE_VERSION = 1
+"""Version of the cassette layout written by ``save_cassette``."""
+
+
+class CassettePlayer(BaseModel):
+    """One seat of a recorded game."""
+
+    name: str
+    model: str
+    responses: list[str] = Field(default_factory=list)
+    # Error message of each failed call, keyed by call number; its response is empty
+    errors: dict[int, str] = Field(default_factory=dict)
+
+
+class Cassette(BaseModel):
+    """Everything needed to play a recorded game again without the agents."""
+
+    version: int = CASSETTE_VERSION
+    seed: int
+    language: str = "en-US"
+    config: GameConfig
+    players: list[CassettePlayer]
+
+
+class CassetteExhaustedError(RuntimeError):
+    """Raised when a replayed agent is asked more questions than were recorded."""
+
+
+class RecordedAgentError(RuntimeError):
+    """Raised by a replayed agent where the recorded agent failed, with its message."""
+
+
+class RecordingAgent:
+    """Agent wrapper that records every response, or failure, into a cassette seat.
+
+    Other attributes, such as the conversation of LLM agents or the ``attach``
+    hook of search agents, are forwarded to the wrapped agent.
+    """
+
+    def __init__(self, agent: AgentProtocol, seat: CassettePlayer, seed: str) -> None:
+        """Wrap an agent.
+
+        Args:
+            agent: The agent that answers.
+            seat: The cassette seat its responses are appended to.
+            seed: Seed of the agent's own random stream.
+        """
+        self.agent = agent
+        self.seat = seat
+        self.name = agent.name
+        self.model = agent.model
+        self._random_state = random.Random(seed).getstate()  # noqa: S311
+
+    def get_response(self, message: str) -> str:
+        """Ask the wrapped agent, on its own random stream, and record the answer.
+
+        A failed call is recorded too, so the replay fails at the same call.
+
+        Args:
+            message: The prompt message.
+
+        Returns:
+            str: The agent's response.
+        """
+        engine_state = random.getstate()
+        random.setstate(self._random_state)
+        try:
+            response = self.agent.get_response(message)
+        except Exception as exc:
+            self.seat.errors[len(self.seat.responses)] = str(exc)
+            self.seat.responses.append("")
+            raise
+        finally:
+            self._random_state = random.getstate()
+            random.setstate(engine_state)
+        self.seat.responses.append(response)
+        return response
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Forward other attributes to the wrapped agent.
+
+        Args:
+            name: The attribute name.
+
+        Returns:
+            Any: The wrapped agent's attribute.
+        """
+        return getattr(self.agent, name)
+
+
+class ReplayAgent:
+    """Agent that answers with the responses recorded for one seat, in order."""
+
+    def __init__(self, seat: CassettePlayer) -> None:
+        """Initialize the agent.
+
+        Args:
+            seat: The recorded seat.
+        """
+        self.name = seat.name
+        self.model = seat.model
+        self.error: str | None = None
+        self._seat = seat
+        self._calls = 0
+
+    def get_response(self, message: str) -> str:
+        """Return the next recorded response, or fail where the recorded agent failed.
+
+        Args:
+            message: The prompt message (ignored).
+
+        Returns:
+            str: The recorded response.
+
+        Raises:
+            RecordedAgentError: If the recorded call failed, with its message.
+            CassetteExhaustedError: If every recorded response was used. The
+                message is also kept in ``error``, since the engine catches
+                agent errors in some phases.
+        """
+        call = self._calls
+        if call >= len(self._seat.responses):
+            msg = f"No recorded response left for {self.name}"
+            self.error = self.error or msg
+            raise CassetteExhaustedError(msg)
+        self._calls += 1
+        if call in self._seat.errors:
+            raise RecordedAgentError(self._seat.errors[call])
+        return self._seat.responses[call]
+
+    def add_decision(self, decision: str) -> None:
+        """Ignore decision summaries; the recorded responses already reflect them.
+
+        Args:
+            decision: A safe summary of the decision.
+        """
+
+    def get_decision_context(self) -> str:
+        """Get the decision history, which a replayed agent does not keep.
+
+        Returns:
+            str: An empty string.
+        """
+        return ""
+
+
+class Divergence(NamedTuple):
+    """First point where a replay differs from the recorded game."""
+
+    index: int
+    """Position of the differing event in both streams."""
+
+    expected: EventRecord | None
+    """The recorded event, or None if the replay produced extra events."""
+
+    actual: EventRecord | None
+    """The replayed event, or None if the replay stopped early."""
+
+    def describe(self) -> str:
+        """Summarize the divergence for a report.
+
+        Returns:
+            str: One line per side.
+        """
+
+        def line(event: EventRecord | None) -> str:
+            if event is None:
+                return "<end of game>"
+            return (
+                f"[round {event.round_number} {event.phase}] {event.event_type}: {event.message}"
+            )
+
+        return (
+            f"Event {self.index} differs\n"
+            f"  recorded: {line(self.expected)}\n"
+            f"  replayed: {line(self.actual)}"
+        )
+
+
+class ReplayResult(NamedTuple):
+    """Outcome of replaying a recorded game."""
+
+    events: list[EventRecord]
+    """Events produced by the replay."""
+
+    divergence: Divergence | None
+    """First difference from the recorded events, or None if they match."""
+
+    error: str | None
+    """Why the replay stopped early, e.g. because the cassette ran out."""
+
+    @property
+    def matched(self) -> bool:
+        """Whether the replay reproduced the recorded game exactly."""
+        return self.divergence is None and self.error is None
+
+
+def _comparable(event: EventRecord) -> dict[str, Any]:
+    """Get the fields of an event that a replay must reproduce.
+
+    The timestamp and the measured model usage are left out, and the rest goes
+    through JSON so that recorded and live events compare alike.
+
+    Args:
+        event: The event.
+
+    Returns:
+        dict[str, Any]: The event without its timestamp and usage.
+    """
+    payload = json.loads(json.dumps(event.to_dict(), ensure_ascii=False))
+    payload.pop("timestamp", None)
+    data = payload.get("data") or {}
+    for key in (*USAGE_FIELDS, "usage"):
+        data.pop(key, None)
+    return payload
+
+
+def first_divergence(
+    expected: Iterable[EventRecord], actual: Iterable[EventRecord]
+) -> Divergence | None:
+    """Find the first event where two event streams differ.
+
+    Args:
+        expected: The recorded events.
+        actual: The replayed events.
+
+    Returns:
+        Divergence | None: The first difference, or None if the streams match.
+    """
+    expected_events = list(expected)
+    actual_events = list(actual)
+    for index in range(max(len(expected_events), len(actual_events))):
+        recorded = expected_events[index] if index < len(expected_events) else None
+        replayed = actual_events[index] if index < len(actual_events) else None
+        if recorded is None or replayed is None or _comparable(recorded) != _comparable(replayed):
+            return Divergence(index=index, expected=recorded, actual=replayed)
+    return None
+
+
+def journal_game(directory: str | Path, game: int = 0) -> Iterator[EventRecord]:
+    """Read the events of one game from a journal.
+
+    Args:
+        directory: The journal directory.
+        game: Zero-based number of the game in the journal.
+
+    Yields:
+        EventRecord: The game's events, up to the start of the next game.
+    """
+    for index, event in enumerate(JournalReader(directory).events(game=game)):
+        if index and event.event_type == EventType.GAME_STARTED:
+            return
+        yield event
+
+
+def save_cassette(cassette: Cassette, file_path: str | Path) -> None:
+    """Write a cassette to a JSON file.
+
+    Args:
+        cassette: The cassette.
+        file_path: Path to the file.
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(cassette.model_dump_json(), encoding="utf-8")
+
+
+def load_cassette(file_path: str | Path) -> Cassette:
+    """Read a cassette from a JSON file.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        Cassette: The cassette.
+    """
+    return Cassette.model_validate_json(Path(file_path).read_bytes())
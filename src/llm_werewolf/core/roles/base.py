@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import ClassVar
 
 from llm_werewolf.core.types import (
     Camp,
+    Capability,
     RoleConfig,
     ActionPriority,
     ActionProtocol,
@@ -9,17 +11,49 @@ from llm_werewolf.core.types import (
     GameStateProtocol,
 )
 
+_SHARED_TYPES = frozenset({type(None), bool, int, str, RoleConfig})
+"""Slot value types that role clones share instead of copying."""
+
+_CONTAINER_TYPES = frozenset({list, dict, set})
+"""Slot value types that role clones copy shallowly."""
+
 
 class Role(ABC):
-    """Abstract base class for all roles in the Werewolf game."""
+    """Abstract base class for all roles in the Werewolf game.
+
+    Roles use ``__slots__`` and share one immutable ``RoleConfig`` per role class, so
+    a game only pays for the per-player state of each role.
+    """
+
+    __slots__ = ("ability_uses", "config", "disabled", "player")
+
+    _shared_configs: ClassVar[dict[type["Role"], RoleConfig]] = {}
+    _state_slots: ClassVar[dict[type["Role"], tuple[str, ...]]] = {}
 
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the role."""
         self.player = player
         self.ability_uses = 0
-        self.config = self.get_config()
+        self.config = self.get_shared_config()
         self.disabled = False  # If True, role abilities are disabled
 
+    @classmethod
+    def get_shared_config(cls) -> RoleConfig:
+        """Get the configuration shared by every instance of this role class.
+
+        Configs are constant per class, so this works without a player, e.g. when
+        building role tables for simulation.
+
+        Returns:
+            RoleConfig: The cached role configuration.
+        """
+        config = Role._shared_configs.get(cls)
+        if config is None:
+            # get_config() only returns constants, so a bare instance is enough
+            config = cls.get_config(cls.__new__(cls))
+            Role._shared_configs[cls] = config
+        return config
+
     @abstractmethod
     def get_config(self) -> RoleConfig:
         """Get the configuration for this role.
@@ -65,6 +99,17 @@ class Role(ABC):
         """
         return self.config.priority
 
+    def get_capabilities(self) -> Capability:
+        """Get the rule-relevant capabilities this role currently has.
+
+        Roles whose capabilities change during the game override this and notify
+        the player's listeners when their state changes.
+
+        Returns:
+            Capability: The capability flags declared by the role config.
+        """
+        return self.config.capabilities
+
     def can_act_tonight(self, player: PlayerProtocol, round_number: int) -> bool:
         """Check if this role can perform an action tonight.
 
@@ -168,6 +213,42 @@ class Role(ABC):
         """Mark that the ability has been used."""
         self.ability_uses += 1
 
+    def clone(self, player: PlayerProtocol) -> "Role":
+        """Copy this role's state onto a new player.
+
+        Every slot declared along the class hierarchy is copied. Immutable values
+        and the shared config are reused, containers are copied, and nested roles
+        (e.g. a Lover's original role) are cloned onto the same player.
+
+        Args:
+            player: The player that owns the copy.
+
+        Returns:
+            Role: The copied role.
+        """
+        cls = type(self)
+        slots = Role._state_slots.get(cls)
+        if slots is None:
+            slots = tuple(
+                name
+                for klass in reversed(cls.__mro__)
+                for name in klass.__dict__.get("__slots__", ())
+                if name != "player"
+            )
+            Role._state_slots[cls] = slots
+
+        clone = cls.__new__(cls)
+        clone.player = player
+        for name in slots:
+            value = getattr(self, name)
+            kind = type(value)
+            if kind in _CONTAINER_TYPES:
+                value = value.copy()
+            elif kind not in _SHARED_TYPES and isinstance(value, Role):
+                value = value.clone(player)
+            setattr(clone, name, value)
+        return clone
+
     def __str__(self) -> str:
         """String representation of the role.
 
@@ -16,6 +16,8 @@ class Thief(Role):
     The role they choose becomes their actual role for the game.
     """
 
+    __slots__ = ("available_roles", "has_chosen")
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Thief role."""
         super().__init__(player)
@@ -57,6 +59,8 @@ class Lover(Role):
     Lovers win together and die together.
     """
 
+    __slots__ = ("original_role", "partner_id")
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Lover role."""
         super().__init__(player)
@@ -98,6 +102,8 @@ class WhiteLoverWolf(Role):
     This is a dynamic role that represents the conflicted state.
     """
 
+    __slots__ = ()
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the White Lover Wolf role."""
         super().__init__(player)
@@ -2,7 +2,9 @@ import logfire
 
 from llm_werewolf.core.types import (
     Camp,
+    Capability,
     RoleConfig,
+    PlayerChange,
     ActionPriority,
     ActionProtocol,
     PlayerProtocol,
@@ -17,6 +19,7 @@ from llm_werewolf.core.actions import (
     GuardProtectAction,
     GraveyardKeeperCheckAction,
 )
+from llm_werewolf.core.tracing import decision_span
 from llm_werewolf.core.roles.base import Role
 from llm_werewolf.core.action_selector import ActionSelector
 
@@ -28,6 +31,8 @@ class Villager(Role):
     Can only vote during the day phase.
     """
 
+    __slots__ = ()
+
     def get_config(self) -> RoleConfig:
         """Get configuration for the Villager role."""
         return RoleConfig(
@@ -54,6 +59,8 @@ class Seer(Role):
     Can check one player each night to see if they are a werewolf or villager.
     """
 
+    __slots__ = ()
+
     def get_config(self) -> RoleConfig:
         """Get configuration for the Seer role."""
         return RoleConfig(
@@ -117,6 +124,8 @@ class Witch(Role):
     Each potion can only be used once per game.
     """
 
+    __slots__ = ("has_poison_potion", "has_save_potion")
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Witch role."""
         super().__init__(player)
@@ -136,6 +145,7 @@ class Witch(Role):
             priority=ActionPriority.WITCH,
             can_act_night=True,
             can_act_day=False,
+            brews_potions=True,
         )
 
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
@@ -158,7 +168,10 @@ class Witch(Role):
                 )
 
                 try:
-                    response = self.player.agent.get_response(prompt)
+                    with decision_span(
+                        "witch_save", self.player.agent, self.player.get_role_name()
+                    ):
+                        response = self.player.agent.get_response(prompt)
                     use_save = ActionSelector.parse_yes_no(response)
 
                     if use_save:
@@ -202,6 +215,8 @@ class Hunter(Role):
     When eliminated (by werewolves or voting), can shoot and eliminate another player.
     """
 
+    __slots__ = ()
+
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
         """Hunter has no night actions."""
         return []
@@ -220,6 +235,7 @@ class Hunter(Role):
             can_act_night=False,
             can_act_day=True,  # Acts when dying
             max_uses=1,
+            death_shot=True,
         )
 
 
@@ -230,6 +246,8 @@ class Guard(Role):
     Cannot protect the same player two nights in a row.
     """
 
+    __slots__ = ("last_protected",)
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Guard role."""
         super().__init__(player)
@@ -248,6 +266,7 @@ class Guard(Role):
             priority=ActionPriority.GUARD,
             can_act_night=True,
             can_act_day=False,
+            protects=True,
         )
 
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
@@ -295,11 +314,27 @@ class Idiot(Role):
     When voted out, reveals identity and survives but loses voting rights.
     """
 
+    __slots__ = ("revealed",)
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Idiot role."""
         super().__init__(player)
         self.revealed = False
 
+    def reveal(self) -> None:
+        """Reveal the card after the first vote and notify the player's listeners."""
+        if self.revealed:
+            return
+        self.revealed = True
+        self.player.notify_change(PlayerChange.ROLE_REVEALED)
+
+    def get_capabilities(self) -> Capability:
+        """Lose the vote immunity once revealed."""
+        flags = self.config.capabilities
+        if self.revealed:
+            flags &= ~Capability.SURVIVES_FIRST_VOTE
+        return flags
+
     def get_config(self) -> RoleConfig:
         """Get configuration for the Idiot role."""
         return RoleConfig(
@@ -313,6 +348,7 @@ class Idiot(Role):
             priority=None,
             can_act_night=False,
             can_act_day=False,
+            survives_first_vote=True,
         )
 
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
@@ -327,6 +363,8 @@ class Elder(Role):
     with special abilities lose their powers.
     """
 
+    __slots__ = ("lives",)
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Elder role."""
         super().__init__(player)
@@ -345,6 +383,8 @@ class Elder(Role):
             priority=None,
             can_act_night=False,
             can_act_day=False,
+            extra_life=True,
+            execution_penalty=True,
         )
 
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
@@ -359,6 +399,8 @@ class Knight(Role):
     they die. If not, the Knight dies.
     """
 
+    __slots__ = ("has_dueled",)
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Knight role."""
         super().__init__(player)
@@ -391,6 +433,8 @@ class Magician(Role):
     Once per game, can swap two players' roles at night.
     """
 
+    __slots__ = ("has_swapped",)
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Magician role."""
         super().__init__(player)
@@ -439,6 +483,8 @@ class Cupid(Role):
     Lovers win together or die together.
     """
 
+    __slots__ = ("has_linked",)
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Cupid role."""
         super().__init__(player)
@@ -470,7 +516,8 @@ class Cupid(Role):
             )
 
             try:
-                response = self.player.agent.get_response(prompt)
+                with decision_span("cupid_link", self.player.agent, self.player.get_role_name()):
+                    response = self.player.agent.get_response(prompt)
                 selected = ActionSelector.parse_multi_target_selection(
                     response, possible_targets, num_targets=2
                 )
@@ -500,6 +547,7 @@ class Cupid(Role):
             can_act_night=True,
             can_act_day=False,
             max_uses=1,
+            links_lovers=True,
         )
 
 
@@ -510,6 +558,8 @@ class Raven(Role):
     during the next day's voting.
     """
 
+    __slots__ = ()
+
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
         """Get the night actions for the Raven role."""
         if not self.player.is_alive():
@@ -550,6 +600,7 @@ class Raven(Role):
             priority=ActionPriority.RAVEN,
             can_act_night=True,
             can_act_day=False,
+            marks_for_vote=True,
         )
 
 
@@ -559,6 +610,8 @@ class GraveyardKeeper(Role):
     Each night, can check if a dead player was a werewolf or villager.
     """
 
+    __slots__ = ()
+
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
         """Get the night actions for the GraveyardKeeper role."""
         if not self.player.is_alive():
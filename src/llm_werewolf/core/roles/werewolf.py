@@ -1,6 +1,8 @@
 from llm_werewolf.core.types import (
     Camp,
+    Capability,
     RoleConfig,
+    PlayerChange,
     ActionPriority,
     ActionProtocol,
     PlayerProtocol,
@@ -24,6 +26,8 @@ class Werewolf(Role):
     They win when werewolves equal or outnumber villagers.
     """
 
+    __slots__ = ()
+
     def get_config(self) -> RoleConfig:
         """Get configuration for the Werewolf role."""
         return RoleConfig(
@@ -94,6 +98,8 @@ class AlphaWolf(Role):
     can take another player down with them.
     """
 
+    __slots__ = ()
+
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
         """Get the night actions for the Alpha Wolf role.
 
@@ -149,6 +155,7 @@ class AlphaWolf(Role):
             priority=ActionPriority.WEREWOLF,
             can_act_night=True,
             can_act_day=True,  # Can shoot when dying
+            death_shot=True,
         )
 
 
@@ -159,6 +166,8 @@ class WhiteWolf(Role):
     This makes the white wolf a lone wolf trying to be the last werewolf standing.
     """
 
+    __slots__ = ()
+
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
         """Get the night actions for the White Wolf role.
 
@@ -250,6 +259,8 @@ class WolfBeauty(Role):
     the charmed player dies too.
     """
 
+    __slots__ = ("charmed_player",)
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Wolf Beauty role."""
         super().__init__(player)
@@ -331,6 +342,7 @@ class WolfBeauty(Role):
             priority=ActionPriority.WEREWOLF,
             can_act_night=True,
             can_act_day=False,
+            charms=True,
         )
 
 
@@ -340,6 +352,8 @@ class GuardianWolf(Role):
     A werewolf who can protect one werewolf from elimination each night.
     """
 
+    __slots__ = ()
+
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
         """Get the night actions for the Guardian Wolf role.
 
@@ -425,6 +439,8 @@ class HiddenWolf(Role):
     A werewolf who appears as a villager when checked by the Seer.
     """
 
+    __slots__ = ()
+
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
         """Get the night actions for the Hidden Wolf role.
 
@@ -481,6 +497,7 @@ class HiddenWolf(Role):
             priority=ActionPriority.WEREWOLF,
             can_act_night=True,
             can_act_day=False,
+            appears_as_villager=True,
         )
 
 
@@ -491,11 +508,27 @@ class BloodMoonApostle(Role):
     Once per game, can turn into a real werewolf.
     """
 
+    __slots__ = ("transformed",)
+
     def __init__(self, player: PlayerProtocol) -> None:
         """Initialize the Blood Moon Apostle role."""
         super().__init__(player)
         self.transformed = False
 
+    def transform(self) -> None:
+        """Turn into a real werewolf and notify the player's listeners."""
+        if self.transformed:
+            return
+        self.transformed = True
+        self.player.notify_change(PlayerChange.ROLE_TRANSFORMED)
+
+    def get_capabilities(self) -> Capability:
+        """Drop the Seer disguise and count toward parity once transformed."""
+        flags = self.config.capabilities
+        if self.transformed:
+            flags = (flags & ~Capability.APPEARS_AS_VILLAGER) | Capability.COUNTS_FOR_PARITY
+        return flags
+
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
         """Get the night actions for the Blood Moon Apostle role."""
         # Only act if transformed into a werewolf
@@ -511,7 +544,7 @@ class BloodMoonApostle(Role):
 
             if not werewolves and self.player.is_alive():
                 # Transform into werewolf
-                self.transformed = True
+                self.transform()
                 return []
 
         # After transformation, can vote like normal werewolf
@@ -556,6 +589,8 @@ class BloodMoonApostle(Role):
             can_act_night=True,  # Needs to check transformation condition every night
             can_act_day=False,
             max_uses=None,  # Can act every night after transformation
+            appears_as_villager=True,  # Until transformed
+            counts_for_parity=False,  # Until transformed
         )
 
 
@@ -565,6 +600,8 @@ class NightmareWolf(Role):
     A werewolf who can block a player from using their ability for one night.
     """
 
+    __slots__ = ()
+
     def get_night_actions(self, game_state: GameStateProtocol) -> list[ActionProtocol]:
         """Get the night actions for the Nightmare Wolf role.
 
@@ -1,16 +1,34 @@
-import json
-from typing import Any
+import random
+from typing import TYPE_CHECKING, Any, TypeVar
 from pathlib import Path
+from collections.abc import Mapping, Sequence
 
 from pydantic import Field, BaseModel
-
-from llm_werewolf.core.types import GamePhase, PlayerStatus, PlayerProtocol, GameStateProtocol
+from pydantic_core import from_json
+
+from llm_werewolf.core.types import (
+    GamePhase,
+    EventRecord,
+    PlayerStatus,
+    AgentProtocol,
+    PlayerProtocol,
+    GameStateProtocol,
+    MemoryAgentProtocol,
+)
 from llm_werewolf.core.player import Player
+from llm_werewolf.core.io_writer import BackgroundWriter, write_file_atomic
 from llm_werewolf.core.game_state import GameState
 from llm_werewolf.core.role_registry import get_role_map
 from llm_werewolf.core.roles.neutral import Thief
 from llm_werewolf.core.roles.villager import Cupid, Elder, Guard, Idiot, Witch, Knight, Magician
 from llm_werewolf.core.roles.werewolf import WolfBeauty, BloodMoonApostle
+from llm_werewolf.core.snapshot_delta import apply_delta, diff_values
+from llm_werewolf.core.binary_snapshot import decode_snapshot, encode_snapshot, is_binary_snapshot
+
+M = TypeVar("M", bound=BaseModel)
+
+if TYPE_CHECKING:
+    from llm_werewolf.core.roles.base import Role
 
 
 class PlayerSnapshot(BaseModel):
@@ -55,10 +73,57 @@ class GameStateSnapshot(BaseModel):
     votes: dict[str, str] = Field(default_factory=dict)
     raven_marked: str | None = None
 
+    # Sheriff
+    sheriff_id: str | None = None
+    sheriff_election_done: bool = False
+    sheriff_votes: dict[str, str] = Field(default_factory=dict)
+
     # Winner
     winner: str | None = None
 
 
+CHECKPOINT_VERSION = 1
+"""Version of the checkpoint format written by ``save_checkpoint``."""
+
+
+class AgentMemorySnapshot(BaseModel):
+    """Serializable memory of an agent that keeps a conversation."""
+
+    chat_history: list[dict[str, str]] = Field(default_factory=list)
+    decision_history: list[str] = Field(default_factory=list)
+
+
+class CheckpointSnapshot(BaseModel):
+    """Everything needed to resume a game at a phase boundary."""
+
+    version: int = CHECKPOINT_VERSION
+    language: str = "en-US"
+
+    game_state: GameStateSnapshot
+    events: list[dict[str, Any]] = Field(default_factory=list)
+    public_discussion: list[str] = Field(default_factory=list)
+    werewolf_discussion: list[str] = Field(default_factory=list)
+    agent_memory: dict[str, AgentMemorySnapshot] = Field(default_factory=dict)
+
+    # State of the ``random`` module, as returned by random.getstate()
+    rng_state: list[Any] | None = None
+
+
+DELTA_SUFFIX = ".delta.json"
+"""File suffix of checkpoint deltas written by ``CheckpointChain``."""
+
+MAX_DELTA_CHAIN = 1000
+"""Longest chain of deltas ``load_checkpoint`` follows before giving up."""
+
+
+class CheckpointDelta(BaseModel):
+    """Changes to a checkpoint since the previous one in the same directory."""
+
+    version: int = CHECKPOINT_VERSION
+    parent: str  # File name of the previous checkpoint, a delta or a full one
+    delta: dict[str, Any] | None = None
+
+
 def _extract_witch_data(role: Witch) -> dict[str, Any]:
     """Extract Witch role data."""
     return {"has_save_potion": role.has_save_potion, "has_poison_potion": role.has_poison_potion}
@@ -74,7 +139,7 @@ def _extract_role_data(player: PlayerProtocol) -> dict[str, Any]:
         dict[str, Any]: Role-specific data.
     """
     role = player.role
-    role_data: dict[str, Any] = {}
+    role_data: dict[str, Any] = {"ability_uses": role.ability_uses, "disabled": role.disabled}
 
     # Use dictionary mapping for simpler roles
     simple_extractors = {
@@ -91,12 +156,12 @@ def _extract_role_data(player: PlayerProtocol) -> dict[str, Any]:
 
     # Special handling for Witch
     if isinstance(role, Witch):
-        return _extract_witch_data(role)
+        return role_data | _extract_witch_data(role)
 
     # Check simple extractors
     for role_class, extractor in simple_extractors.items():
         if isinstance(role, role_class):
-            return extractor(role)
+            return role_data | extractor(role)
 
     return role_data
 
@@ -152,30 +217,89 @@ def serialize_game_state(game_state: GameStateProtocol) -> GameStateSnapshot:
         seer_checked={str(k): v for k, v in game_state.seer_checked.items()},
         votes=game_state.votes,
         raven_marked=game_state.raven_marked,
+        sheriff_id=game_state.sheriff_id,
+        sheriff_election_done=game_state.sheriff_election_done,
+        sheriff_votes=game_state.sheriff_votes,
         winner=game_state.winner,
     )
 
 
-def save_game_state(game_state: GameStateProtocol, file_path: str | Path) -> None:
-    """Save game state to a JSON file.
+def _write_snapshot(
+    snapshot: BaseModel,
+    file_path: str | Path,
+    binary: bool = False,
+    compress: bool = True,
+    indent: int | None = None,
+    writer: BackgroundWriter | None = None,
+) -> None:
+    """Write a snapshot model to a file atomically, as JSON or in the binary format.
+
+    The snapshot is encoded in the caller's thread, since the models it was built
+    from may change once the caller moves on; only the file write is left to
+    ``writer``.
+
+    Args:
+        snapshot: The snapshot model.
+        file_path: Path to the file.
+        binary: Whether to use the binary format instead of JSON.
+        compress: Whether to compress the binary format.
+        indent: JSON indentation, or None for compact JSON.
+        writer: Background writer to queue the file on; written right away if None.
+    """
+    if binary:
+        data = encode_snapshot(snapshot, compress=compress)
+    else:
+        data = snapshot.model_dump_json(indent=indent).encode()
+    if writer is not None:
+        writer.write_file(file_path, data)
+    else:
+        write_file_atomic(file_path, data)
+
+
+def _read_snapshot(file_path: str | Path, model: type[M], validate: bool = True) -> M:
+    """Read a snapshot model from a JSON or binary file.
+
+    The format is detected from the file header.
+
+    Args:
+        file_path: Path to the file.
+        model: The snapshot class.
+        validate: Whether to validate binary snapshots; JSON is always validated.
+
+    Returns:
+        M: The loaded snapshot.
+    """
+    data = Path(file_path).read_bytes()
+    if is_binary_snapshot(data):
+        return decode_snapshot(data, model, validate=validate)
+    return model.model_validate_json(data)
+
+
+def save_game_state(
+    game_state: GameStateProtocol,
+    file_path: str | Path,
+    binary: bool = False,
+    compress: bool = True,
+) -> None:
+    """Save game state to a JSON or binary file.
 
     Args:
         game_state: The game state to save.
         file_path: Path to the save file.
+        binary: Whether to use the compact binary format instead of JSON.
+        compress: Whether to compress the binary format.
     """
     snapshot = serialize_game_state(game_state)
-    path = Path(file_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    with path.open("w", encoding="utf-8") as f:
-        f.write(snapshot.model_dump_json(indent=2))
+    _write_snapshot(snapshot, file_path, binary=binary, compress=compress, indent=2)
 
 
-def load_game_state_snapshot(file_path: str | Path) -> GameStateSnapshot:
-    """Load a game state snapshot from a JSON file.
+def load_game_state_snapshot(file_path: str | Path, validate: bool = True) -> GameStateSnapshot:
+    """Load a game state snapshot from a JSON or binary file.
 
     Args:
         file_path: Path to the save file.
+        validate: Whether to validate binary snapshots. Skipping validation is
+            faster and safe for files written by ``save_game_state``.
 
     Returns:
         GameStateSnapshot: The loaded game state snapshot.
@@ -184,12 +308,7 @@ def load_game_state_snapshot(file_path: str | Path) -> GameStateSnapshot:
         This only loads the snapshot. To restore a full GameState with agents,
         you need to use restore_game_state() which requires agent factory.
     """
-    path = Path(file_path)
-
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    return GameStateSnapshot.model_validate(data)
+    return _read_snapshot(file_path, GameStateSnapshot, validate=validate)
 
 
 def _restore_witch_data(role: Witch, role_data: dict[str, Any]) -> None:
@@ -206,6 +325,8 @@ def _restore_role_data(player: Player, role_data: dict[str, Any]) -> None:
         role_data: The role-specific data to restore.
     """
     role = player.role
+    role.ability_uses = role_data.get("ability_uses", 0)
+    role.disabled = role_data.get("disabled", False)
 
     # Use dictionary mapping for simpler roles
     simple_restorers = {
@@ -246,7 +367,9 @@ def _restore_players(snapshot: GameStateSnapshot, agent_factory: dict[str, Any])
         ValueError: If an unknown role is encountered.
     """
     players: list[Player] = []
-    role_map = get_role_map()
+    role_map: dict[str, type[Role]] = get_role_map()
+    # Snapshots store display names ("Alpha Wolf"), older ones may use registry keys
+    role_map |= {role_cls.get_shared_config().name: role_cls for role_cls in role_map.values()}
 
     for p_snap in snapshot.players:
         # Get role class from registry
@@ -312,6 +435,10 @@ def _restore_game_state_fields(game_state: GameState, snapshot: GameStateSnapsho
     game_state.votes = snapshot.votes
     game_state.raven_marked = snapshot.raven_marked
 
+    game_state.sheriff_id = snapshot.sheriff_id
+    game_state.sheriff_election_done = snapshot.sheriff_election_done
+    game_state.sheriff_votes = snapshot.sheriff_votes
+
     game_state.winner = snapshot.winner
 
 
@@ -359,3 +486,254 @@ def load_game_state(
     """
     snapshot = load_game_state_snapshot(file_path)
     return restore_game_state(snapshot, agent_factory)
+
+
+def serialize_agent_memory(agent: AgentProtocol | None) -> AgentMemorySnapshot | None:
+    """Serialize the conversation an agent keeps, if it keeps one.
+
+    Args:
+        agent: The agent, or None for players without one.
+
+    Returns:
+        AgentMemorySnapshot | None: The agent's memory, or None if it has none.
+    """
+    if not isinstance(agent, MemoryAgentProtocol):
+        return None
+    return AgentMemorySnapshot(
+        chat_history=list(agent.chat_history), decision_history=list(agent.decision_history)
+    )
+
+
+def restore_agent_memory(agent: AgentProtocol | None, memory: AgentMemorySnapshot) -> None:
+    """Give an agent back the conversation it had when the checkpoint was taken.
+
+    Agents that keep no conversation are left as they are.
+
+    Args:
+        agent: The agent, or None for players without one.
+        memory: The saved memory.
+    """
+    if isinstance(agent, MemoryAgentProtocol):
+        agent.chat_history = list(memory.chat_history)
+        agent.decision_history = list(memory.decision_history)
+
+
+def serialize_checkpoint(
+    game_state: GameStateProtocol,
+    events: Sequence[EventRecord],
+    public_discussion: Sequence[str],
+    werewolf_discussion: Sequence[str],
+    language: str = "en-US",
+) -> CheckpointSnapshot:
+    """Serialize a running game and the state of the ``random`` module.
+
+    Args:
+        game_state: The game state.
+        events: All events logged so far.
+        public_discussion: Lines of the public discussion transcript.
+        werewolf_discussion: Lines of the werewolf discussion transcript.
+        language: Language of the game.
+
+    Returns:
+        CheckpointSnapshot: Serialized checkpoint data.
+    """
+    version, internal_state, gauss_next = random.getstate()
+    memories = {
+        player.player_id: memory
+        for player in game_state.players
+        if (memory := serialize_agent_memory(player.agent)) is not None
+    }
+    return CheckpointSnapshot(
+        language=language,
+        game_state=serialize_game_state(game_state),
+        events=[event.to_dict() for event in events],
+        public_discussion=list(public_discussion),
+        werewolf_discussion=list(werewolf_discussion),
+        agent_memory=memories,
+        rng_state=[version, list(internal_state), gauss_next],
+    )
+
+
+def restore_rng_state(checkpoint: CheckpointSnapshot) -> None:
+    """Restore the state of the ``random`` module saved in a checkpoint.
+
+    Args:
+        checkpoint: The checkpoint snapshot.
+    """
+    if checkpoint.rng_state is not None:
+        version, internal_state, gauss_next = checkpoint.rng_state
+        random.setstate((version, tuple(internal_state), gauss_next))
+
+
+def restore_agent_memories(
+    game_state: GameState, memories: Mapping[str, AgentMemorySnapshot]
+) -> None:
+    """Restore every saved agent memory onto the agents of a restored game.
+
+    Args:
+        game_state: The restored game state with its agents.
+        memories: Saved memory for each player ID.
+    """
+    for player_id, memory in memories.items():
+        player = game_state.get_player(player_id)
+        if player is not None:
+            restore_agent_memory(player.agent, memory)
+
+
+def save_checkpoint(
+    checkpoint: CheckpointSnapshot,
+    file_path: str | Path,
+    binary: bool = False,
+    compress: bool = True,
+    writer: BackgroundWriter | None = None,
+) -> None:
+    """Write a checkpoint to a JSON or binary file atomically.
+
+    Args:
+        checkpoint: The checkpoint snapshot.
+        file_path: Path to the checkpoint file.
+        binary: Whether to use the compact binary format instead of JSON.
+        compress: Whether to compress the binary format.
+        writer: Background writer to queue the file on; written right away if None.
+    """
+    _write_snapshot(checkpoint, file_path, binary=binary, compress=compress, writer=writer)
+
+
+def _load_checkpoint_delta(file_path: Path, validate: bool) -> CheckpointSnapshot:
+    """Rebuild a checkpoint from a delta by applying its chain to the full checkpoint.
+
+    Args:
+        file_path: Path to the delta file.
+        validate: Whether to validate a binary base checkpoint.
+
+    Returns:
+        CheckpointSnapshot: The rebuilt checkpoint.
+
+    Raises:
+        ValueError: If the chain of deltas loops back on itself.
+    """
+    deltas: list[CheckpointDelta] = []
+    path = file_path
+    while path.name.endswith(DELTA_SUFFIX):
+        if len(deltas) > MAX_DELTA_CHAIN:
+            msg = f"Checkpoint delta chain of {file_path} does not end in a full checkpoint"
+            raise ValueError(msg)
+        delta = _read_snapshot(path, CheckpointDelta)
+        deltas.append(delta)
+        path = path.with_name(delta.parent)
+
+    # The rebuilt checkpoint is validated once, so a JSON base is only parsed
+    data = path.read_bytes()
+    if is_binary_snapshot(data):
+        base = decode_snapshot(data, CheckpointSnapshot, validate=validate)
+        payload = base.model_dump(mode="json")
+    else:
+        payload = from_json(data)
+    for delta in reversed(deltas):
+        payload = apply_delta(payload, delta.delta)
+    return CheckpointSnapshot.model_validate(payload)
+
+
+def load_checkpoint(file_path: str | Path, validate: bool = True) -> CheckpointSnapshot:
+    """Load a checkpoint from a JSON, binary or delta file.
+
+    A delta file (``*.delta.json``) is rebuilt from the full checkpoint at the
+    start of its chain and the deltas after it.
+
+    Args:
+        file_path: Path to the checkpoint file.
+        validate: Whether to validate binary checkpoints.
+
+    Returns:
+        CheckpointSnapshot: The loaded checkpoint.
+
+    Raises:
+        ValueError: If the checkpoint was written by a newer format version.
+    """
+    path = Path(file_path)
+    if path.name.endswith(DELTA_SUFFIX):
+        checkpoint = _load_checkpoint_delta(path, validate=validate)
+    else:
+        checkpoint = _read_snapshot(path, CheckpointSnapshot, validate=validate)
+    if checkpoint.version > CHECKPOINT_VERSION:
+        msg = f"Unsupported checkpoint version {checkpoint.version}"
+        raise ValueError(msg)
+    return checkpoint
+
+
+class CheckpointChain:
+    """Writes checkpoints as deltas against the previous one, with periodic full ones.
+
+    Every ``base_interval``-th checkpoint, and the first one, is written in full;
+    the ones in between only hold what changed since the previous checkpoint, so
+    their size follows the change per phase rather than the size of the game.
+    ``load_checkpoint`` rebuilds any of them by applying at most
+    ``base_interval - 1`` deltas to the full checkpoint before it.
+    """
+
+    def __init__(
+        self,
+        base_interval: int = 8,
+        binary: bool = False,
+        compress: bool = True,
+        writer: BackgroundWriter | None = None,
+    ) -> None:
+        """Initialize the chain.
+
+        Args:
+            base_interval: How many checkpoints share one full checkpoint.
+            binary: Whether full checkpoints use the compact binary format.
+            compress: Whether to compress the binary format.
+            writer: Background writer to queue the files on; written right away if None.
+
+        Raises:
+            ValueError: If ``base_interval`` is less than 1.
+        """
+        if base_interval < 1:
+            msg = "base_interval must be at least 1"
+            raise ValueError(msg)
+        self.base_interval = base_interval
+        self.binary = binary
+        self.compress = compress
+        self.writer = writer
+        self._previous: dict[str, Any] | None = None
+        self._previous_path: Path | None = None
+        self._since_base = 0
+
+    def save(self, checkpoint: CheckpointSnapshot, file_stem: str | Path) -> Path:
+        """Write a checkpoint, in full or as a delta against the previous one.
+
+        Args:
+            checkpoint: The checkpoint snapshot.
+            file_stem: Path of the file without a suffix; ``.json``, ``.snap`` or
+                ``.delta.json`` is appended.
+
+        Returns:
+            Path: The file written, or queued on ``writer``.
+        """
+        stem = Path(file_stem)
+        payload = checkpoint.model_dump(mode="json")
+        previous_path = self._previous_path
+        if (
+            self._previous is None
+            or previous_path is None
+            or previous_path.parent != stem.parent
+            or previous_path.name.startswith(f"{stem.name}.")
+            or self._since_base + 1 >= self.base_interval
+        ):
+            path = stem.with_name(stem.name + (".snap" if self.binary else ".json"))
+            save_checkpoint(
+                checkpoint, path, binary=self.binary, compress=self.compress, writer=self.writer
+            )
+            self._since_base = 0
+        else:
+            path = stem.with_name(stem.name + DELTA_SUFFIX)
+            delta = CheckpointDelta(
+                parent=previous_path.name, delta=diff_values(self._previous, payload)
+            )
+            _write_snapshot(delta, path, writer=self.writer)
+            self._since_base += 1
+
+        self._previous = payload
+        self._previous_path = path
+        return path
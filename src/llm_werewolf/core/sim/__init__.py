@@ -0,0 +1,22 @@
+"""Array-backed simulation of many games at once.
+
+This package needs NumPy, which is an optional dependency:
+``pip install llm_werewolf[sim]``.
+"""
+
+from llm_werewolf.core.sim.batch import BatchResult, BatchSimulator, shuffled_batch
+from llm_werewolf.core.sim.kernel import NO_PLAYER, Outcome, DeathCause, ArrayGameState
+from llm_werewolf.core.sim.balance import BalanceReport, sweep_presets, simulate_composition
+
+__all__ = [
+    "NO_PLAYER",
+    "ArrayGameState",
+    "BalanceReport",
+    "BatchResult",
+    "BatchSimulator",
+    "DeathCause",
+    "Outcome",
+    "shuffled_batch",
+    "simulate_composition",
+    "sweep_presets",
+]
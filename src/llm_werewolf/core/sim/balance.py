@@ -0,0 +1,87 @@
+"""Role-balance sweeps built on batch rollouts."""
+
+from collections.abc import Iterable
+
+import numpy as np
+from pydantic import Field, BaseModel
+
+from llm_werewolf.core.sim.batch import DEFAULT_MAX_ROUNDS, BatchSimulator, shuffled_batch
+from llm_werewolf.core.sim.kernel import Outcome
+from llm_werewolf.core.role_registry import create_roles
+from llm_werewolf.core.config.presets import create_game_config_from_player_count
+
+DEFAULT_GAMES = 10_000
+"""Number of rollouts per role composition."""
+
+
+class BalanceReport(BaseModel):
+    """Win rates of one role composition under random play."""
+
+    num_players: int = Field(..., description="Number of players")
+    role_names: list[str] = Field(..., description="Role of every seat")
+    games: int = Field(..., description="Number of simulated games")
+    werewolf_win_rate: float = Field(..., description="Share of games won by werewolves")
+    villager_win_rate: float = Field(..., description="Share of games won by villagers")
+    lover_win_rate: float = Field(..., description="Share of games won by the lovers")
+    unfinished_rate: float = Field(..., description="Share of games hitting the round limit")
+    mean_rounds: float = Field(..., description="Average number of rounds played")
+
+
+def simulate_composition(
+    role_names: list[str],
+    games: int = DEFAULT_GAMES,
+    rng: np.random.Generator | None = None,
+    max_rounds: int = DEFAULT_MAX_ROUNDS,
+) -> BalanceReport:
+    """Play a batch of random-policy games with the given roles.
+
+    Args:
+        role_names: Registry name of every seat's role.
+        games: Number of games to simulate.
+        rng: Random generator for seating and decisions.
+        max_rounds: Maximum number of rounds per game.
+
+    Returns:
+        BalanceReport: Win rates of the composition.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    state = shuffled_batch(create_roles(role_names), games, rng)
+    result = BatchSimulator(state, rng=rng, max_rounds=max_rounds).run()
+
+    def rate(outcome: Outcome) -> float:
+        return float(np.mean(result.outcomes == outcome))
+
+    return BalanceReport(
+        num_players=len(role_names),
+        role_names=role_names,
+        games=games,
+        werewolf_win_rate=rate(Outcome.WEREWOLF),
+        villager_win_rate=rate(Outcome.VILLAGER),
+        lover_win_rate=rate(Outcome.LOVER),
+        unfinished_rate=rate(Outcome.NONE),
+        mean_rounds=float(result.rounds.mean()),
+    )
+
+
+def sweep_presets(
+    player_counts: Iterable[int] = range(6, 21),
+    games: int = DEFAULT_GAMES,
+    seed: int | None = None,
+) -> list[BalanceReport]:
+    """Simulate the automatic role composition of every player count.
+
+    Args:
+        player_counts: Player counts to evaluate.
+        games: Number of games per player count.
+        seed: Seed for reproducible sweeps.
+
+    Returns:
+        list[BalanceReport]: One report per player count, in order.
+    """
+    rng = np.random.default_rng(seed)
+    return [
+        simulate_composition(
+            create_game_config_from_player_count(num_players).role_names, games=games, rng=rng
+        )
+        for num_players in player_counts
+    ]
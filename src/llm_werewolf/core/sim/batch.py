@@ -0,0 +1,279 @@
+"""Lockstep random-policy rollouts over a batch of array-backed games."""
+
+from typing import NamedTuple
+from collections.abc import Sequence
+
+import numpy as np
+
+from llm_werewolf.core.types import Camp, Capability
+from llm_werewolf.core.roles.base import Role
+from llm_werewolf.core.sim.kernel import NO_PLAYER, CAMP_CODES, Outcome, ArrayGameState
+
+DEFAULT_MAX_ROUNDS = 30
+"""Round limit after which a rollout is reported as unfinished."""
+
+
+class BatchResult(NamedTuple):
+    """Per-game results of a batch rollout."""
+
+    outcomes: np.ndarray
+    """``Outcome`` code per game; ``Outcome.NONE`` if the round limit was reached."""
+
+    rounds: np.ndarray
+    """Number of rounds played per game."""
+
+    survivors: np.ndarray
+    """Number of living players per game at the end."""
+
+
+class BatchSimulator:
+    """Plays every game of an ``ArrayGameState`` in lockstep with random policies.
+
+    Each phase samples the decisions of all games at once: werewolves pick a random
+    living non-werewolf, the Guard protects a random living player other than last
+    night's, the Witch saves or poisons with fixed probabilities, Cupid links two
+    random players on the first night, the Wolf Beauty charms once, the Raven marks a
+    random player, a random sheriff is chosen on the first day, and every voter votes
+    for a random other living player. A Blood Moon Apostle stays out of the hunt until
+    every other werewolf is dead, then transforms and hunts from the next night on.
+    Games that have finished are masked out, so their state no longer changes.
+
+    Roles whose night action does not change the state (e.g. Seer checks) need no
+    policy; other special abilities are not simulated.
+    """
+
+    def __init__(
+        self,
+        state: ArrayGameState,
+        rng: np.random.Generator | None = None,
+        max_rounds: int = DEFAULT_MAX_ROUNDS,
+        save_chance: float = 0.5,
+        poison_chance: float = 0.3,
+    ) -> None:
+        """Initialize the simulator.
+
+        Args:
+            state: The batch of games to play; it is modified in place.
+            rng: Random generator for all decisions.
+            max_rounds: Maximum number of rounds per game.
+            save_chance: Probability that the Witch saves the werewolf target.
+            poison_chance: Probability that the Witch poisons someone.
+        """
+        self.state = state
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.max_rounds = max_rounds
+        self.save_chance = save_chance
+        self.poison_chance = poison_chance
+
+        n_games = state.n_games
+        self._games = np.arange(n_games)
+        self._save_left = np.ones(n_games, dtype=bool)
+        self._poison_left = np.ones(n_games, dtype=bool)
+        self._guard_last = np.full(n_games, NO_PLAYER, dtype=np.int16)
+        self._not_self = ~np.eye(state.n_players, dtype=bool)
+
+        self._werewolves = state.camp == CAMP_CODES[Camp.WEREWOLF]
+        # Werewolves that do not count toward parity until they transform
+        self._disguised = self._werewolves & ~state.has_capability(Capability.COUNTS_FOR_PARITY)
+        self._witch = state.has_capability(Capability.BREWS_POTIONS)
+        self._guard = state.has_capability(Capability.PROTECTS)
+        self._cupid = state.has_capability(Capability.LINKS_LOVERS)
+        self._wolf_beauty = state.has_capability(Capability.CHARMS)
+        self._raven = state.has_capability(Capability.MARKS_FOR_VOTE)
+
+    def _pick(self, candidates: np.ndarray) -> np.ndarray:
+        """Pick one random candidate seat per game.
+
+        Args:
+            candidates: Boolean mask shaped ``(n_games, n_players)``.
+
+        Returns:
+            np.ndarray: The chosen seat per game, or ``NO_PLAYER`` if none qualify.
+        """
+        scores = self.rng.random(candidates.shape)
+        scores[~candidates] = -1.0
+        choice = scores.argmax(axis=1).astype(np.int16)
+        choice[~candidates.any(axis=1)] = NO_PLAYER
+        return choice
+
+    def _acting(self, role: np.ndarray, active: np.ndarray) -> np.ndarray:
+        """Get the seat of a living, enabled role holder per active game.
+
+        Args:
+            role: Mask of the seats holding the role.
+            active: Mask of the games still in progress.
+
+        Returns:
+            np.ndarray: The acting seat per game, or ``NO_PLAYER``.
+        """
+        state = self.state
+        return self._pick(role & state.alive & ~state.disabled & active[:, None])
+
+    def _without(self, candidates: np.ndarray, seats: np.ndarray) -> np.ndarray:
+        """Remove one seat per game from a candidate mask.
+
+        Args:
+            candidates: Boolean mask shaped ``(n_games, n_players)``.
+            seats: Seat to exclude per game, or ``NO_PLAYER``.
+
+        Returns:
+            np.ndarray: The narrowed mask.
+        """
+        result = candidates.copy()
+        has_seat = seats != NO_PLAYER
+        result[self._games[has_seat], seats[has_seat]] = False
+        return result
+
+    def run_night(self, active: np.ndarray, round_number: int) -> None:
+        """Sample and resolve one night for the active games.
+
+        Args:
+            active: Mask of the games still in progress.
+            round_number: The current round number.
+        """
+        state = self.state
+        state.reset_deaths()
+        state.reset_night_actions()
+        alive = state.alive & active[:, None]
+
+        if round_number == 1:
+            games = np.flatnonzero(self._acting(self._cupid, active) != NO_PLAYER)
+            first = self._pick(alive)
+            second = self._pick(self._without(alive, first))
+            first, second = first[games], second[games]
+            distinct = (first != NO_PLAYER) & (second != NO_PLAYER) & (first != second)
+            state.link_lovers(games[distinct], first[distinct], second[distinct])
+
+        beauty = self._acting(self._wolf_beauty, active)
+        games = np.flatnonzero(beauty != NO_PLAYER)
+        games = games[state.charmed[games, beauty[games]] == NO_PLAYER]
+        charm = self._pick(self._without(alive, beauty))[games]
+        charmed = charm != NO_PLAYER
+        state.charmed[games[charmed], beauty[games[charmed]]] = charm[charmed]
+
+        has_wolf = (alive & self._werewolves & state.parity).any(axis=1)
+        target = self._pick(alive & ~self._werewolves)
+        target[~has_wolf] = NO_PLAYER
+        state.werewolf_target[:] = target
+        self._transform_lone_apostles(alive)
+
+        guard = self._acting(self._guard, active)
+        protect = self._pick(self._without(alive, self._guard_last))
+        protect[guard == NO_PLAYER] = NO_PLAYER
+        state.guard_protected[:] = protect
+        self._guard_last = protect
+
+        witch = self._acting(self._witch, active)
+        has_witch = witch != NO_PLAYER
+        save = (
+            has_witch
+            & self._save_left
+            & (target != NO_PLAYER)
+            & (self.rng.random(state.n_games) < self.save_chance)
+        )
+        state.witch_saved[save] = target[save]
+        self._save_left &= ~save
+
+        poison = (
+            has_witch
+            & ~save
+            & self._poison_left
+            & (self.rng.random(state.n_games) < self.poison_chance)
+        )
+        victim = self._pick(self._without(alive, witch))
+        poison &= victim != NO_PLAYER
+        state.witch_poison[poison] = victim[poison]
+        self._poison_left &= ~poison
+
+        state.resolve_night(self.rng)
+
+    def _transform_lone_apostles(self, alive: np.ndarray) -> None:
+        """Transform disguised werewolves once every other werewolf is dead.
+
+        Like the Blood Moon Apostle, they only hunt from the next night on.
+
+        Args:
+            alive: Mask of the living players in the active games.
+        """
+        state = self.state
+        waiting = alive & self._disguised & ~state.parity
+        lone = ~(alive & self._werewolves & ~self._disguised).any(axis=1)
+        games, players = np.nonzero(waiting & lone[:, None])
+        state.transform(games, players)
+
+    def run_day(self, active: np.ndarray, round_number: int) -> None:
+        """Sample and resolve one day vote for the active games.
+
+        Args:
+            active: Mask of the games still in progress.
+            round_number: The current round number.
+        """
+        state = self.state
+        alive = state.alive & active[:, None]
+
+        if round_number == 1:
+            sheriff = self._pick(alive)
+            games = np.flatnonzero(sheriff != NO_PLAYER)
+            state.set_sheriff(games, sheriff[games])
+
+        raven = self._acting(self._raven, active)
+        mark = self._pick(self._without(alive, raven))
+        mark[raven == NO_PLAYER] = NO_PLAYER
+        state.raven_marked[:] = mark
+
+        # Every voter scores every other living player and votes for the best score
+        valid = alive[:, None, :] & self._not_self[None, :, :]
+        scores = self.rng.random(valid.shape)
+        scores[~valid] = -1.0
+        choice = scores.argmax(axis=2).astype(np.int16)
+        voters = state.can_vote() & active[:, None] & valid.any(axis=2)
+        state.votes[:] = np.where(voters, choice, NO_PLAYER)
+
+        state.resolve_vote(self.rng)
+        state.reset_votes()
+
+    def run(self) -> BatchResult:
+        """Play every game until it ends or the round limit is reached.
+
+        Returns:
+            BatchResult: Outcome, rounds played and survivors per game.
+        """
+        state = self.state
+        outcomes = state.outcomes()
+        rounds = np.zeros(state.n_games, dtype=np.int16)
+
+        for round_number in range(1, self.max_rounds + 1):
+            active = outcomes == Outcome.NONE
+            if not active.any():
+                break
+            rounds[active] = round_number
+
+            self.run_night(active, round_number)
+            outcomes[active] = state.outcomes()[active]
+
+            active = outcomes == Outcome.NONE
+            self.run_day(active, round_number)
+            outcomes[active] = state.outcomes()[active]
+
+        return BatchResult(outcomes=outcomes, rounds=rounds, survivors=state.alive.sum(axis=1))
+
+
+def shuffled_batch(
+    roles: Sequence[type[Role]], n_games: int, rng: np.random.Generator
+) -> ArrayGameState:
+    """Create a batch of games with the same role composition and random seating.
+
+    Args:
+        roles: The role class of every seat.
+        n_games: Number of games in the batch.
+        rng: Random generator for seating.
+
+    Returns:
+        ArrayGameState: The new batch.
+    """
+    table = list(dict.fromkeys(roles))
+    seats = np.array([table.index(role_cls) for role_cls in roles], dtype=np.int16)
+    role_ids = rng.permuted(np.tile(seats, (n_games, 1)), axis=1)
+    return ArrayGameState(
+        role_ids=role_ids, role_configs=[role_cls.get_shared_config() for role_cls in table]
+    )
@@ -0,0 +1,559 @@
+"""Struct-of-arrays game state for fast offline simulation.
+
+``ArrayGameState`` holds a batch of games as NumPy arrays shaped ``(games, players)``.
+Players are plain indices, and the death, voting and victory rules of the object
+model (``DeathHandlerMixin``, ``VotingPhaseMixin`` and ``VictoryChecker``) are
+applied to every game in the batch at once. Decisions that need an agent in the
+object model fall back to the same behaviour as an agent-less player there: death
+shots pick a random living player and the sheriff badge is torn.
+"""
+
+from enum import IntEnum
+from collections.abc import Sequence
+
+from llm_werewolf.core.types import Camp, Capability, RoleConfig, PlayerStatus, VictoryResult
+from llm_werewolf.core.player import STATUS_BITS
+from llm_werewolf.core.game_state import GameState
+from llm_werewolf.core.roles.base import Role
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - exercised only without the extra
+    msg = "The simulation kernel requires numpy; install it with `pip install llm_werewolf[sim]`"
+    raise ImportError(msg) from e
+
+NO_PLAYER = -1
+"""Sentinel index for "no player" in target, partner and vote arrays."""
+
+CAMP_CODES: dict[Camp, int] = {camp: code for code, camp in enumerate(Camp)}
+"""Integer code used for each camp in the ``camp`` array."""
+
+_WEREWOLF = CAMP_CODES[Camp.WEREWOLF]
+_VILLAGER = CAMP_CODES[Camp.VILLAGER]
+_ALIVE = STATUS_BITS[PlayerStatus.ALIVE]
+_DEAD = STATUS_BITS[PlayerStatus.DEAD]
+_LOVER = STATUS_BITS[PlayerStatus.LOVER]
+_SHERIFF = STATUS_BITS[PlayerStatus.SHERIFF]
+_NO_VOTE = STATUS_BITS[PlayerStatus.NO_VOTE]
+
+
+class Outcome(IntEnum):
+    """Outcome of a simulated game."""
+
+    NONE = 0
+    WEREWOLF = 1
+    VILLAGER = 2
+    LOVER = 3
+
+
+class DeathCause(IntEnum):
+    """Recorded cause of death, mirroring ``GameState.death_causes``."""
+
+    NONE = 0
+    WEREWOLF = 1
+    WITCH_POISON = 2
+    VOTE = 3
+
+
+_DEATH_CAUSE_NAMES = {
+    "werewolf": DeathCause.WEREWOLF,
+    "witch_poison": DeathCause.WITCH_POISON,
+    "vote": DeathCause.VOTE,
+}
+
+
+class ArrayGameState:
+    """Array-backed state for a batch of games with the same player count.
+
+    Per-player arrays are shaped ``(n_games, n_players)`` and per-game arrays are
+    shaped ``(n_games,)``. Player references (targets, votes, lover partners) are
+    player indices, with ``NO_PLAYER`` meaning none.
+    """
+
+    def __init__(
+        self,
+        role_ids: "np.ndarray | Sequence[Sequence[int]]",
+        role_configs: Sequence[RoleConfig],
+        player_ids: Sequence[str] | None = None,
+    ) -> None:
+        """Initialize a batch of fresh games.
+
+        Args:
+            role_ids: Role index for every seat, shaped ``(n_games, n_players)``.
+            role_configs: Role config for each role index.
+            player_ids: Player IDs by seat, used for victory results. Defaults to the
+                engine's ``player_1``..``player_n`` naming.
+
+        Raises:
+            ValueError: If ``role_ids`` is not two-dimensional.
+        """
+        role_ids = np.asarray(role_ids, dtype=np.int16)
+        if role_ids.ndim != 2:
+            msg = f"role_ids must be shaped (games, players), got {role_ids.shape}"
+            raise ValueError(msg)
+
+        self.n_games, self.n_players = role_ids.shape
+        self.role_names = tuple(config.name for config in role_configs)
+        self.role_camps = np.array(
+            [CAMP_CODES[config.camp] for config in role_configs], dtype=np.int8
+        )
+        self.role_capabilities = np.array(
+            [int(config.capabilities) for config in role_configs], dtype=np.uint16
+        )
+        self.player_ids = (
+            tuple(player_ids)
+            if player_ids is not None
+            else tuple(f"player_{i}" for i in range(1, self.n_players + 1))
+        )
+
+        shape = role_ids.shape
+        self.role_id = role_ids
+        self.camp = self.role_camps[role_ids]
+        self.capabilities = self.role_capabilities[role_ids]
+        self.alive = np.ones(shape, dtype=bool)
+        self.status = np.full(shape, _ALIVE, dtype=np.int32)
+        self.lover = np.full(shape, NO_PLAYER, dtype=np.int16)
+        self.lives = np.where(self.has_capability(Capability.EXTRA_LIFE), 2, 1).astype(np.int8)
+        self.parity = self.has_capability(Capability.COUNTS_FOR_PARITY)
+        self.charmed = np.full(shape, NO_PLAYER, dtype=np.int16)
+        self.revealed = np.zeros(shape, dtype=bool)
+        self.disabled = np.zeros(shape, dtype=bool)
+        self.votes = np.full(shape, NO_PLAYER, dtype=np.int16)
+        self.death_cause = np.zeros(shape, dtype=np.int8)
+        self.phase_deaths = np.zeros(shape, dtype=bool)
+        self.ability_used = np.zeros(shape, dtype=bool)
+
+        self.sheriff = np.full(self.n_games, NO_PLAYER, dtype=np.int16)
+        self.raven_marked = np.full(self.n_games, NO_PLAYER, dtype=np.int16)
+        self.werewolf_target = np.full(self.n_games, NO_PLAYER, dtype=np.int16)
+        self.witch_saved = np.full(self.n_games, NO_PLAYER, dtype=np.int16)
+        self.witch_poison = np.full(self.n_games, NO_PLAYER, dtype=np.int16)
+        self.guard_protected = np.full(self.n_games, NO_PLAYER, dtype=np.int16)
+
+        self._death_shot = self.has_capability(Capability.DEATH_SHOT)
+        self._survives_vote = self.has_capability(Capability.SURVIVES_FIRST_VOTE)
+        self._execution_penalty = self.has_capability(Capability.EXECUTION_PENALTY)
+
+    @classmethod
+    def from_roles(cls, roles_per_game: Sequence[Sequence[type[Role]]]) -> "ArrayGameState":
+        """Create a batch of fresh games from role classes by seat.
+
+        Args:
+            roles_per_game: For each game, the role class of every seat.
+
+        Returns:
+            ArrayGameState: The new batch.
+        """
+        table: dict[type[Role], int] = {}
+        role_ids = [
+            [table.setdefault(role_cls, len(table)) for role_cls in roles]
+            for roles in roles_per_game
+        ]
+        return cls(
+            role_ids=role_ids, role_configs=[role_cls.get_shared_config() for role_cls in table]
+        )
+
+    @classmethod
+    def from_game_states(cls, states: Sequence[GameState]) -> "ArrayGameState":
+        """Create a batch that mirrors existing object-model game states.
+
+        Args:
+            states: Game states with the same number of players, seated identically.
+
+        Returns:
+            ArrayGameState: The equivalent batch.
+
+        Raises:
+            ValueError: If the states do not share player count and player IDs.
+        """
+        player_ids = tuple(p.player_id for p in states[0].players)
+        for state in states:
+            if tuple(p.player_id for p in state.players) != player_ids:
+                msg = "All game states must have the same seated player IDs"
+                raise ValueError(msg)
+
+        table: dict[type, tuple[int, RoleConfig]] = {}
+        role_ids = []
+        for state in states:
+            row = []
+            for player in state.players:
+                role_cls = type(player.role)
+                if role_cls not in table:
+                    table[role_cls] = (len(table), player.role.config)
+                row.append(table[role_cls][0])
+            role_ids.append(row)
+
+        batch = cls(
+            role_ids=role_ids,
+            role_configs=[config for _, config in table.values()],
+            player_ids=player_ids,
+        )
+        for game, state in enumerate(states):
+            batch._copy_game_state(game, state)
+        return batch
+
+    def _copy_game_state(self, game: int, state: GameState) -> None:
+        """Copy one object-model game state into a row of the batch.
+
+        Args:
+            game: The batch row to fill.
+            state: The game state to copy.
+        """
+        index = {pid: i for i, pid in enumerate(self.player_ids)}
+
+        def seat(player_id: str | None) -> int:
+            return index.get(player_id, NO_PLAYER) if player_id else NO_PLAYER
+
+        for i, player in enumerate(state.players):
+            role = player.role
+            self.alive[game, i] = player.is_alive()
+            bits = 0
+            for status in player.statuses:
+                bits |= STATUS_BITS[status]
+            if not player.can_vote_flag:
+                bits |= _NO_VOTE
+            self.status[game, i] = bits
+            if player.is_lover():
+                self.lover[game, i] = seat(player.lover_partner_id)
+            self.lives[game, i] = getattr(role, "lives", 1)
+            self.parity[game, i] = bool(role.get_capabilities() & Capability.COUNTS_FOR_PARITY)
+            self.charmed[game, i] = seat(getattr(role, "charmed_player", None))
+            self.revealed[game, i] = getattr(role, "revealed", False)
+            self.disabled[game, i] = role.disabled
+
+        for voter_id, target_id in state.votes.items():
+            self.votes[game, seat(voter_id)] = seat(target_id)
+        for player_id, cause in state.death_causes.items():
+            self.death_cause[game, seat(player_id)] = _DEATH_CAUSE_NAMES.get(
+                cause, DeathCause.NONE
+            )
+        for player_id in state.night_deaths | state.day_deaths:
+            self.phase_deaths[game, seat(player_id)] = True
+        for player_id in state.death_abilities_used:
+            self.ability_used[game, seat(player_id)] = True
+
+        self.sheriff[game] = seat(state.sheriff_id)
+        self.raven_marked[game] = seat(state.raven_marked)
+        self.werewolf_target[game] = seat(state.werewolf_target)
+        self.witch_saved[game] = seat(state.witch_saved_target)
+        self.witch_poison[game] = seat(state.witch_poison_target)
+        self.guard_protected[game] = seat(state.guard_protected)
+
+    def has_capability(self, capability: Capability) -> np.ndarray:
+        """Get a mask of the seats whose role declares a capability.
+
+        Args:
+            capability: The capability flag to test.
+
+        Returns:
+            np.ndarray: Boolean mask shaped ``(n_games, n_players)``.
+        """
+        return (self.capabilities & int(capability)) != 0
+
+    def can_vote(self) -> np.ndarray:
+        """Get a mask of the players who can vote.
+
+        Returns:
+            np.ndarray: Boolean mask shaped ``(n_games, n_players)``.
+        """
+        return self.alive & (self.status & _NO_VOTE == 0)
+
+    def link_lovers(self, games: np.ndarray, first: np.ndarray, second: np.ndarray) -> None:
+        """Link pairs of players as lovers.
+
+        Args:
+            games: Game indices.
+            first: First lover per game.
+            second: Second lover per game.
+        """
+        self.lover[games, first] = second
+        self.lover[games, second] = first
+        self.status[games, first] |= _LOVER
+        self.status[games, second] |= _LOVER
+
+    def set_sheriff(self, games: np.ndarray, players: np.ndarray) -> None:
+        """Give the sheriff badge to a player in each game.
+
+        Args:
+            games: Game indices.
+            players: New sheriff per game.
+        """
+        previous = self.sheriff[games]
+        had = previous != NO_PLAYER
+        self.status[games[had], previous[had]] &= ~_SHERIFF
+        self.sheriff[games] = players
+        self.status[games, players] |= _SHERIFF
+
+    def transform(self, games: np.ndarray, players: np.ndarray) -> None:
+        """Mark disguised werewolves as transformed, so they count toward parity.
+
+        Args:
+            games: Game indices.
+            players: Transformed player per game.
+        """
+        self.parity[games, players] = True
+
+    def reset_deaths(self) -> None:
+        """Reset per-round death bookkeeping, like ``GameState.reset_deaths``."""
+        self.phase_deaths[:] = False
+        self.ability_used[:] = False
+        self.death_cause[:] = DeathCause.NONE
+
+    def reset_night_actions(self) -> None:
+        """Clear the night targets for every game."""
+        for targets in (
+            self.werewolf_target,
+            self.witch_saved,
+            self.witch_poison,
+            self.guard_protected,
+        ):
+            targets[:] = NO_PLAYER
+
+    def reset_votes(self) -> None:
+        """Clear day votes and raven marks for every game."""
+        self.votes[:] = NO_PLAYER
+        self.raven_marked[:] = NO_PLAYER
+
+    def kill(self, games: np.ndarray, players: np.ndarray) -> None:
+        """Kill players and record them as deaths of the current phase.
+
+        Args:
+            games: Game indices.
+            players: Player index per game entry.
+        """
+        self.alive[games, players] = False
+        self.status[games, players] = (self.status[games, players] & ~_ALIVE) | _DEAD
+        self.phase_deaths[games, players] = True
+
+    def _kill_partners(self, games: np.ndarray, players: np.ndarray) -> None:
+        """Kill the living lover partners of the given players.
+
+        Args:
+            games: Game indices.
+            players: Players whose partners die of heartbreak.
+        """
+        partners = self.lover[games, players]
+        has_partner = partners != NO_PLAYER
+        games, partners = games[has_partner], partners[has_partner]
+        living = self.alive[games, partners]
+        self.kill(games[living], partners[living])
+
+    def _kill_charmed(self, games: np.ndarray, players: np.ndarray) -> None:
+        """Kill the living players charmed by the given Wolf Beauties.
+
+        Args:
+            games: Game indices.
+            players: Dead players whose charm takes effect.
+        """
+        charmed = self.charmed[games, players]
+        has_charm = charmed != NO_PLAYER
+        games, charmed = games[has_charm], charmed[has_charm]
+        living = self.alive[games, charmed]
+        self.kill(games[living], charmed[living])
+
+    def resolve_night(self, rng: np.random.Generator) -> None:
+        """Resolve night deaths for every game, like ``DeathHandlerMixin.resolve_deaths``.
+
+        Args:
+            rng: Random generator for death shots.
+        """
+        # Werewolf kill: witch save and guard protection cancel it, Elder loses a life
+        games = np.flatnonzero(self.werewolf_target != NO_PLAYER)
+        targets = self.werewolf_target[games]
+        attacked = (targets != self.witch_saved[games]) & (targets != self.guard_protected[games])
+        hit_games, hit_targets = games[attacked], targets[attacked]
+        extra_life = self.lives[hit_games, hit_targets] > 1
+        self.lives[hit_games[extra_life], hit_targets[extra_life]] -= 1
+        hit_games, hit_targets = hit_games[~extra_life], hit_targets[~extra_life]
+        self.kill(hit_games, hit_targets)
+        self._kill_partners(hit_games, hit_targets)
+
+        dead = ~self.alive[games, targets]
+        no_cause = self.death_cause[games, targets] == DeathCause.NONE
+        self.death_cause[games[dead & no_cause], targets[dead & no_cause]] = DeathCause.WEREWOLF
+
+        # Witch poison
+        games = np.flatnonzero(self.witch_poison != NO_PLAYER)
+        targets = self.witch_poison[games]
+        living = self.alive[games, targets]
+        games, targets = games[living], targets[living]
+        self.kill(games, targets)
+        self.death_cause[games, targets] = DeathCause.WITCH_POISON
+        self._kill_partners(games, targets)
+
+        # Dead Wolf Beauties take their charmed player with them
+        games, players = np.nonzero(~self.alive & (self.charmed != NO_PLAYER))
+        self._kill_charmed(games, players)
+
+        self.resolve_death_abilities(rng)
+
+    def resolve_death_abilities(self, rng: np.random.Generator) -> None:
+        """Resolve sheriff badges and death shots for players who died this phase.
+
+        Args:
+            rng: Random generator for death shots.
+        """
+        # The sheriff badge is torn, as for an agent-less sheriff
+        games = np.flatnonzero(self.sheriff != NO_PLAYER)
+        sheriffs = self.sheriff[games]
+        fallen = self.phase_deaths[games, sheriffs] & ~self.ability_used[games, sheriffs]
+        games, sheriffs = games[fallen], sheriffs[fallen]
+        self.ability_used[games, sheriffs] = True
+        self.status[games, sheriffs] &= ~_SHERIFF
+        self.sheriff[games] = NO_PLAYER
+
+        candidates = self.phase_deaths & ~self.ability_used & self._death_shot
+        self.ability_used |= candidates
+        shooters = candidates & (self.death_cause != DeathCause.WITCH_POISON)
+
+        # Shots are rare and order-dependent within a game, so resolve them one by one
+        for game, _shooter in zip(*np.nonzero(shooters), strict=True):
+            targets = np.flatnonzero(self.alive[game])
+            if targets.size == 0:
+                continue
+            target = rng.choice(targets)
+            games, victims = np.array([game]), np.array([target])
+            self.kill(games, victims)
+            self._kill_partners(games, victims)
+
+    def vote_counts(self) -> np.ndarray:
+        """Get weighted vote counts, like ``GameState.get_vote_counts``.
+
+        Returns:
+            np.ndarray: Votes received per player, shaped ``(n_games, n_players)``.
+        """
+        counts = np.zeros(self.votes.shape, dtype=np.float64)
+        games, voters = np.nonzero(self.votes != NO_PLAYER)
+        weights = np.where(self.status[games, voters] & _SHERIFF, 1.5, 1.0)
+        np.add.at(counts, (games, self.votes[games, voters]), weights)
+
+        games = np.flatnonzero(self.raven_marked != NO_PLAYER)
+        counts[games, self.raven_marked[games]] += 1.0
+        return counts
+
+    def resolve_vote(self, rng: np.random.Generator) -> np.ndarray:
+        """Resolve the day vote, like ``VotingPhaseMixin.run_voting_phase``.
+
+        A unique top vote-getter is eliminated; ties and empty votes eliminate no
+        one. An unrevealed Idiot is revealed and loses their vote instead of dying.
+
+        Args:
+            rng: Random generator for death shots.
+
+        Returns:
+            np.ndarray: The eliminated player per game, or ``NO_PLAYER``.
+        """
+        counts = self.vote_counts()
+        top = counts.max(axis=1)
+        unique = (top > 0) & ((counts == top[:, None]).sum(axis=1) == 1)
+        eliminated = np.where(unique, counts.argmax(axis=1), NO_PLAYER).astype(np.int16)
+
+        games = np.flatnonzero(unique)
+        players = eliminated[games]
+
+        reveal = self._survives_vote[games, players] & ~self.revealed[games, players]
+        self.revealed[games[reveal], players[reveal]] = True
+        self.status[games[reveal], players[reveal]] |= _NO_VOTE
+        eliminated[games[reveal]] = NO_PLAYER
+        games, players = games[~reveal], players[~reveal]
+
+        self.kill(games, players)
+        self.death_cause[games, players] = DeathCause.VOTE
+
+        elder_games = games[self._execution_penalty[games, players]]
+        self.disabled[elder_games] |= self.alive[elder_games] & (
+            self.camp[elder_games] == _VILLAGER
+        )
+
+        self._kill_partners(games, players)
+        self._kill_charmed(games, players)
+        self.resolve_death_abilities(rng)
+        return eliminated
+
+    def _tallies(self) -> tuple[np.ndarray, ...]:
+        """Count the living players relevant to victory for every game.
+
+        Returns:
+            tuple[np.ndarray, ...]: Alive, werewolf, parity werewolf, villager and
+                lover counts per game.
+        """
+        alive = self.alive
+        werewolves = alive & (self.camp == _WEREWOLF)
+        return (
+            alive.sum(axis=1),
+            werewolves.sum(axis=1),
+            (werewolves & self.parity).sum(axis=1),
+            (alive & (self.camp == _VILLAGER)).sum(axis=1),
+            (alive & (self.status & _LOVER != 0)).sum(axis=1),
+        )
+
+    def outcomes(self) -> np.ndarray:
+        """Get the outcome of every game, with ``VictoryChecker`` precedence.
+
+        Returns:
+            np.ndarray: ``Outcome`` codes per game.
+        """
+        return self._outcomes(*self._tallies())
+
+    def _outcomes(
+        self,
+        alive: np.ndarray,
+        werewolves: np.ndarray,
+        parity: np.ndarray,
+        villagers: np.ndarray,
+        lovers: np.ndarray,
+    ) -> np.ndarray:
+        """Get the outcome of every game from its victory tallies.
+
+        Args:
+            alive: Living players per game.
+            werewolves: Living werewolves per game.
+            parity: Living werewolves that count toward parity per game.
+            villagers: Living villagers per game.
+            lovers: Living lovers per game.
+
+        Returns:
+            np.ndarray: ``Outcome`` codes per game.
+        """
+        result = np.full(self.n_games, Outcome.NONE, dtype=np.int8)
+        result[werewolves == 0] = Outcome.VILLAGER
+        result[(parity >= villagers) & (parity > 0)] = Outcome.WEREWOLF
+        result[(lovers == 2) & (alive == 2)] = Outcome.LOVER
+        return result
+
+    def check_victory(self, game: int = 0) -> VictoryResult:
+        """Check victory for one game, with the same result as ``VictoryChecker``.
+
+        Args:
+            game: The game index.
+
+        Returns:
+            VictoryResult: The victory check result.
+        """
+        tallies = self._tallies()
+        outcome = Outcome(self._outcomes(*tallies)[game])
+        parity, villagers = int(tallies[2][game]), int(tallies[3][game])
+        living = self.alive[game]
+
+        if outcome == Outcome.LOVER:
+            mask, reason = (
+                living & (self.status[game] & _LOVER != 0),
+                "Only the lovers remain alive",
+            )
+        elif outcome == Outcome.WEREWOLF:
+            mask = living & (self.camp[game] == _WEREWOLF)
+            reason = f"Werewolves ({parity}) equal or outnumber villagers ({villagers})"
+        elif outcome == Outcome.VILLAGER:
+            mask, reason = (
+                living & (self.camp[game] == _VILLAGER),
+                "All werewolves have been eliminated",
+            )
+        else:
+            return VictoryResult(has_winner=False, reason="Game continues")
+
+        return VictoryResult(
+            has_winner=True,
+            winner_camp=outcome.name.lower(),
+            winner_ids=[self.player_ids[i] for i in np.flatnonzero(mask)],
+            reason=reason,
+        )
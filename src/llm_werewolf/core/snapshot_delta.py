@@ -0,0 +1,118 @@
+"""Structural deltas between JSON snapshots.
+
+A delta records only what changed from one JSON value to the next. Most of a
+checkpoint grows by appending (the event log, transcripts, agent conversations)
+or changes in a few fields (deaths, votes, statuses, witch flags, sheriff), so
+a phase-to-phase delta is much smaller than the checkpoint itself.
+
+A delta is a dict with one of these forms:
+
+- ``{"=": value}`` replaces the value.
+- ``{"+": [items]}`` appends items to a list.
+- ``{"*": {key: delta}, "-": [keys]}`` changes entries of a dict, or items of
+  a list keyed by their index as a string, and removes dict keys.
+"""
+
+from typing import Any
+
+JsonValue = Any
+"""A value made of dicts, lists, strings, numbers, booleans and None."""
+
+
+def _diff_lists(old: list[JsonValue], new: list[JsonValue]) -> dict[str, Any]:
+    """Get the delta between two different lists.
+
+    Args:
+        old: The previous list.
+        new: The current list.
+
+    Returns:
+        dict[str, Any]: An append, per-item changes, or a replacement.
+    """
+    if len(new) > len(old) and new[: len(old)] == old:
+        return {"+": new[len(old) :]}
+    if len(new) == len(old):
+        changes = {
+            str(index): delta
+            for index, (before, after) in enumerate(zip(old, new, strict=True))
+            if (delta := diff_values(before, after)) is not None
+        }
+        # Replacing is smaller once most items change, e.g. for the RNG state
+        if len(changes) * 2 <= len(new):
+            return {"*": changes}
+    return {"=": new}
+
+
+def _diff_dicts(old: dict[str, JsonValue], new: dict[str, JsonValue]) -> dict[str, Any]:
+    """Get the delta between two different dicts.
+
+    Args:
+        old: The previous dict.
+        new: The current dict.
+
+    Returns:
+        dict[str, Any]: The changed and removed keys.
+    """
+    changes = {}
+    for key, value in new.items():
+        if key not in old:
+            changes[key] = {"=": value}
+        elif (change := diff_values(old[key], value)) is not None:
+            changes[key] = change
+    delta: dict[str, Any] = {"*": changes}
+    removed = [key for key in old if key not in new]
+    if removed:
+        delta["-"] = removed
+    return delta
+
+
+def diff_values(old: JsonValue, new: JsonValue) -> dict[str, Any] | None:
+    """Get the delta that turns one JSON value into another.
+
+    Args:
+        old: The previous value.
+        new: The current value.
+
+    Returns:
+        dict[str, Any] | None: The delta, or None if the values are equal.
+    """
+    if old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        return _diff_dicts(old, new)
+    if isinstance(old, list) and isinstance(new, list):
+        return _diff_lists(old, new)
+    return {"=": new}
+
+
+def apply_delta(value: JsonValue, delta: dict[str, Any] | None) -> JsonValue:
+    """Apply a delta from ``diff_values`` to the value it was taken against.
+
+    Only the containers on changed paths are copied; ``value`` itself is left
+    unchanged.
+
+    Args:
+        value: The previous value.
+        delta: The delta, or None for no change.
+
+    Returns:
+        JsonValue: The current value.
+    """
+    if delta is None:
+        return value
+    if "=" in delta:
+        return delta["="]
+    if "+" in delta:
+        return [*value, *delta["+"]]
+
+    if isinstance(value, list):
+        items = list(value)
+        for index, item_delta in delta["*"].items():
+            items[int(index)] = apply_delta(items[int(index)], item_delta)
+        return items
+
+    removed = set(delta.get("-", ()))
+    entries = {key: item for key, item in value.items() if key not in removed}
+    for key, item_delta in delta["*"].items():
+        entries[key] = apply_delta(entries.get(key), item_delta)
+    return entries
@@ -0,0 +1,352 @@
+import os
+import json
+from array import array
+import struct
+from typing import IO, TypeVar
+import tempfile
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+
+from llm_werewolf.core.types import EventRecord
+
+T = TypeVar("T")
+
+DEFAULT_WINDOW = 512
+"""Number of most recent items kept in memory by default."""
+
+PAGE_SIZE = 64
+"""Number of spilled records per page; one byte offset is indexed per page."""
+
+_LENGTH = struct.Struct("<I")
+
+
+class SpillLog(Sequence[T]):
+    """Append-only log with a bounded in-memory window.
+
+    The most recent ``window`` items are kept in memory. Older items are encoded and
+    appended to an anonymous temporary segment file, and are paged back in when they
+    are read. Only the byte offset of every ``PAGE_SIZE``-th record is kept in
+    memory, so memory stays flat no matter how long the log grows.
+
+    Indexes are stable: an item keeps its position after it has been spilled.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[T], bytes],
+        decode: Callable[[bytes], T],
+        window: int = DEFAULT_WINDOW,
+    ) -> None:
+        """Initialize the log.
+
+        Args:
+            encode: Serializes an item for the on-disk segment.
+            decode: Restores an item from its serialized form.
+            window: Number of recent items kept in memory.
+
+        Raises:
+            ValueError: If the window is smaller than one item.
+        """
+        if window < 1:
+            msg = f"Window must hold at least one item, got {window}"
+            raise ValueError(msg)
+
+        self._encode = encode
+        self._decode = decode
+        self._window: deque[T] = deque()
+        self._window_size = window
+        self._spilled = 0
+        self._page_offsets = array("Q")
+        self._segment: IO[bytes] | None = None
+        self._page_cache: tuple[int, list[T]] | None = None
+
+    @property
+    def spilled_count(self) -> int:
+        """Get the number of items that live on disk.
+
+        Returns:
+            int: Number of spilled items.
+        """
+        return self._spilled
+
+    def append(self, item: T) -> None:
+        """Append an item, spilling the oldest in-memory item if the window is full.
+
+        Args:
+            item: The item to append.
+        """
+        if len(self._window) >= self._window_size:
+            self._spill(self._window.popleft())
+        self._window.append(item)
+
+    def extend(self, items: Iterator[T] | Sequence[T]) -> None:
+        """Append several items.
+
+        Args:
+            items: The items to append.
+        """
+        for item in items:
+            self.append(item)
+
+    def _spill(self, item: T) -> None:
+        """Write an item to the end of the on-disk segment.
+
+        Args:
+            item: The item leaving the in-memory window.
+        """
+        if self._segment is None:
+            self._segment = tempfile.TemporaryFile(prefix="llm_werewolf_", suffix=".log")  # noqa: SIM115
+
+        payload = self._encode(item)
+        self._segment.seek(0, os.SEEK_END)
+        page, slot = divmod(self._spilled, PAGE_SIZE)
+        if slot == 0:
+            self._page_offsets.append(self._segment.tell())
+        self._segment.write(_LENGTH.pack(len(payload)))
+        self._segment.write(payload)
+        self._spilled += 1
+
+        # The last page grew, so a cached copy of it is stale.
+        if self._page_cache is not None and self._page_cache[0] == page:
+            self._page_cache = None
+
+    def _load_page(self, page: int) -> list[T]:
+        """Read and decode one page of spilled items.
+
+        Args:
+            page: The page number.
+
+        Returns:
+            list[T]: The decoded items on that page.
+
+        Raises:
+            RuntimeError: If no items were spilled yet.
+        """
+        if self._page_cache is not None and self._page_cache[0] == page:
+            return self._page_cache[1]
+
+        if self._segment is None:
+            msg = "No items were spilled to disk"
+            raise RuntimeError(msg)
+        count = min(PAGE_SIZE, self._spilled - page * PAGE_SIZE)
+        self._segment.seek(self._page_offsets[page])
+        items = []
+        for _ in range(count):
+            (length,) = _LENGTH.unpack(self._segment.read(_LENGTH.size))
+            items.append(self._decode(self._segment.read(length)))
+
+        self._page_cache = (page, items)
+        return items
+
+    def __len__(self) -> int:
+        """Get the total number of items, in memory and on disk.
+
+        Returns:
+            int: Number of items.
+        """
+        return self._spilled + len(self._window)
+
+    def __getitem__(self, index: int | slice) -> "T | list[T]":
+        """Get an item by position, or a list of items for a slice.
+
+        Args:
+            index: Position in the log, or a slice of positions.
+
+        Returns:
+            T | list[T]: The item, or the items in the slice.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "SpillLog index out of range"
+            raise IndexError(msg)
+
+        if index >= self._spilled:
+            return self._window[index - self._spilled]
+        page, slot = divmod(index, PAGE_SIZE)
+        return self._load_page(page)[slot]
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over all items, oldest first.
+
+        Returns:
+            Iterator[T]: Iterator over the items.
+        """
+        for page in range(len(self._page_offsets)):
+            yield from self._load_page(page)
+        yield from self._window
+
+    def __eq__(self, other: object) -> bool:
+        """Compare items with another sequence.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            bool: True if both hold equal items in the same order.
+        """
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Repr of the log.
+
+        Returns:
+            str: Log representation.
+        """
+        return f"SpillLog(count={len(self)}, spilled={self._spilled})"
+
+    def clear(self) -> None:
+        """Remove all items and release the on-disk segment."""
+        self._window.clear()
+        self._spilled = 0
+        self._page_offsets = array("Q")
+        self._page_cache = None
+        self.close()
+
+    def close(self) -> None:
+        """Close the on-disk segment, if one was opened."""
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+
+class ForkLog(Sequence[T]):
+    """Log that shares a parent log's items up to the fork point.
+
+    Items the parent held when the fork was taken are read from the parent; items
+    appended to the fork are kept in a local list. Forking is O(1) and neither log
+    sees the other's later appends. The parent must not be cleared while forks of
+    it are in use.
+    """
+
+    def __init__(self, parent: Sequence[T]) -> None:
+        """Fork a log.
+
+        Args:
+            parent: The log to share items with.
+        """
+        self._parent = parent
+        self._shared = len(parent)
+        self._items: list[T] = []
+
+    def append(self, item: T) -> None:
+        """Append an item to the fork.
+
+        Args:
+            item: The item to append.
+        """
+        self._items.append(item)
+
+    def extend(self, items: Iterator[T] | Sequence[T]) -> None:
+        """Append several items to the fork.
+
+        Args:
+            items: The items to append.
+        """
+        self._items.extend(items)
+
+    def __len__(self) -> int:
+        """Get the number of shared and local items.
+
+        Returns:
+            int: Number of items.
+        """
+        return self._shared + len(self._items)
+
+    def __getitem__(self, index: int | slice) -> "T | list[T]":
+        """Get an item by position, or a list of items for a slice.
+
+        Args:
+            index: Position in the log, or a slice of positions.
+
+        Returns:
+            T | list[T]: The item, or the items in the slice.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "ForkLog index out of range"
+            raise IndexError(msg)
+
+        if index < self._shared:
+            return self._parent[index]
+        return self._items[index - self._shared]
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over all items, oldest first.
+
+        Returns:
+            Iterator[T]: Iterator over the items.
+        """
+        for index in range(self._shared):
+            yield self._parent[index]
+        yield from self._items
+
+    def clear(self) -> None:
+        """Remove all items and stop sharing the parent's items."""
+        self._shared = 0
+        self._items.clear()
+
+
+def _encode_event(event: EventRecord) -> bytes:
+    """Serialize an event record for the on-disk segment.
+
+    Args:
+        event: The event record.
+
+    Returns:
+        bytes: The JSON encoded record.
+    """
+    return json.dumps(event.to_dict(), ensure_ascii=False).encode()
+
+
+def _decode_event(payload: bytes) -> EventRecord:
+    """Restore an event record from the on-disk segment.
+
+    Args:
+        payload: The JSON encoded record.
+
+    Returns:
+        EventRecord: The restored record.
+    """
+    return EventRecord.from_dict(json.loads(payload))
+
+
+def create_event_log(window: int = DEFAULT_WINDOW) -> SpillLog[EventRecord]:
+    """Create a spilling log for game events.
+
+    Args:
+        window: Number of recent events kept in memory.
+
+    Returns:
+        SpillLog[EventRecord]: An empty event log.
+    """
+    return SpillLog(encode=_encode_event, decode=_decode_event, window=window)
+
+
+def create_text_log(window: int = DEFAULT_WINDOW) -> SpillLog[str]:
+    """Create a spilling log for plain text lines, such as discussion history.
+
+    Args:
+        window: Number of recent lines kept in memory.
+
+    Returns:
+        SpillLog[str]: An empty text log.
+    """
+    return SpillLog(encode=str.encode, decode=bytes.decode, window=window)
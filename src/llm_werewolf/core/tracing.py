@@ -0,0 +1,186 @@
+"""Logfire spans that show where the wall-clock time of a game goes.
+
+Spans nest as game → round → phase → decision → LLM call:
+
+- ``game`` wraps ``play_game``, with one ``round`` span per round inside it.
+- ``phase`` wraps the handler of every phase.
+- ``decision`` wraps each request the engine makes to an agent, with the player,
+  model and role, and whether the agent failed or a random fallback was used.
+- ``llm call`` wraps each model request of an ``LLMAgent``, with token counts
+  and the retries the OpenAI client made.
+
+Spans are only recorded once ``configure_tracing`` (or ``enable_tracing``, for
+a logfire setup of your own) turns them on; until then they are no-ops, since a
+real span costs a few hundred microseconds and simulations and search agents
+play thousands of phases. They are logged at the ``trace`` level, below what
+the console shows, so they only reach the exporters: an OTLP collector or a
+JSON-lines file.
+"""
+
+from pathlib import Path
+from collections.abc import Sequence
+
+import logfire
+from typing_extensions import Self
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult, BatchSpanProcessor
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+from llm_werewolf.core.types import AgentProtocol
+
+SPAN_LEVEL = "trace"
+"""Log level of game spans; the console shows ``debug`` and above."""
+
+
+class _Tracing:
+    """Whether game spans are recorded."""
+
+    enabled = False
+
+
+class _NoopSpan:
+    """Stands in for a span while tracing is off."""
+
+    def __enter__(self) -> Self:
+        """Enter the span.
+
+        Returns:
+            _NoopSpan: This span.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Leave the span.
+
+        Args:
+            *exc_info: Exception information, if any.
+        """
+
+    def set_attribute(self, key: str, value: object) -> None:
+        """Ignore an attribute.
+
+        Args:
+            key: Attribute name.
+            value: Attribute value.
+        """
+
+    def set_attributes(self, attributes: dict[str, object]) -> None:
+        """Ignore attributes.
+
+        Args:
+            attributes: Attribute names and values.
+        """
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def enable_tracing(enabled: bool = True) -> None:
+    """Turn the recording of game spans on or off.
+
+    ``configure_tracing`` turns it on; call this directly when logfire is
+    configured some other way.
+
+    Args:
+        enabled: Whether to record spans.
+    """
+    _Tracing.enabled = enabled
+
+
+def trace_span(msg_template: str, **attributes: object) -> logfire.LogfireSpan | _NoopSpan:
+    """Start a game span at the tracing level, or a no-op one while tracing is off.
+
+    Args:
+        msg_template: Span message, with ``{name}`` placeholders for attributes.
+        **attributes: Span attributes.
+
+    Returns:
+        logfire.LogfireSpan | _NoopSpan: The span, to be used as a context manager.
+    """
+    if not _Tracing.enabled:
+        return _NOOP_SPAN
+    return logfire.span(msg_template, _level=SPAN_LEVEL, **attributes)
+
+
+def decision_span(
+    decision: str, agent: AgentProtocol, role: str = "", **attributes: object
+) -> logfire.LogfireSpan | _NoopSpan:
+    """Start the span of one request to an agent.
+
+    Args:
+        decision: Kind of decision, e.g. ``"speech"`` or ``"target"``.
+        agent: The agent asked.
+        role: Role of the agent's player, if known.
+        **attributes: Further span attributes.
+
+    Returns:
+        logfire.LogfireSpan | _NoopSpan: The span, to be used as a context manager.
+    """
+    return trace_span(
+        "decision {decision} by {player}",
+        decision=decision,
+        player=agent.name,
+        model=agent.model,
+        role=role,
+        **attributes,
+    )
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Span exporter that appends every finished span to a file as one JSON line."""
+
+    def __init__(self, file_path: str | Path) -> None:
+        """Initialize the exporter.
+
+        Args:
+            file_path: The file to append to; missing parent directories are created.
+        """
+        self.path = Path(file_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        """Append a batch of spans.
+
+        Args:
+            spans: The finished spans.
+
+        Returns:
+            SpanExportResult: Success, or failure if the file could not be written.
+        """
+        try:
+            with self.path.open("a", encoding="utf-8") as file:
+                file.writelines(f"{span.to_json(indent=None)}\n" for span in spans)
+        except OSError:
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+
+def span_exporter(target: str) -> SpanExporter:
+    """Create the exporter for a tracing target.
+
+    Args:
+        target: OTLP/HTTP collector URL (e.g. ``http://localhost:4318/v1/traces``)
+            or the path of a JSON-lines file.
+
+    Returns:
+        SpanExporter: An OTLP exporter for URLs, otherwise a file exporter.
+    """
+    if target.startswith(("http://", "https://")):
+        return OTLPSpanExporter(endpoint=target)
+    return JsonLinesSpanExporter(target)
+
+
+def configure_tracing(target: str) -> None:
+    """Record game spans and export them to a local collector or a file.
+
+    Spans are exported in batches on the span processor's own thread; call
+    ``logfire.force_flush`` before exiting to write the last batch.
+
+    Args:
+        target: OTLP/HTTP collector URL or JSON-lines file path.
+    """
+    logfire.configure(
+        send_to_logfire=False,
+        additional_span_processors=[BatchSpanProcessor(span_exporter(target))],
+    )
+    enable_tracing()
@@ -0,0 +1,151 @@
+from collections.abc import Iterator, Sequence
+
+from llm_werewolf.core.spill_log import DEFAULT_WINDOW, SpillLog
+
+
+class TranscriptView(Sequence[str]):
+    """Read-only view of a range of transcript lines.
+
+    The view holds only its bounds: lines are read from the transcript when they
+    are accessed, and joined only by ``render``. The range is fixed when the view
+    is created, so lines appended later are not part of it.
+    """
+
+    __slots__ = ("_start", "_stop", "_transcript")
+
+    def __init__(self, transcript: "Transcript", start: int, stop: int) -> None:
+        """Initialize the view.
+
+        Args:
+            transcript: The transcript to read from.
+            start: Position of the first line in the view.
+            stop: Position after the last line in the view.
+        """
+        self._transcript = transcript
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        """Get the number of lines in the view.
+
+        Returns:
+            int: Number of lines.
+        """
+        return self._stop - self._start
+
+    def __getitem__(self, index: int | slice) -> "str | list[str]":
+        """Get a line by position in the view, or a list of lines for a slice.
+
+        Args:
+            index: Position in the view, or a slice of positions.
+
+        Returns:
+            str | list[str]: The line, or the lines in the slice.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "TranscriptView index out of range"
+            raise IndexError(msg)
+        return self._transcript[self._start + index]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the lines, oldest first.
+
+        Returns:
+            Iterator[str]: Iterator over the lines.
+        """
+        for index in range(self._start, self._stop):
+            yield self._transcript[index]
+
+    def render(self) -> str:
+        """Get the lines of the view joined by newlines.
+
+        Returns:
+            str: The rendered lines, or an empty string if the view is empty.
+        """
+        return "\n".join(self)
+
+
+class Transcript(SpillLog[str]):
+    """Append-only text log that caches its newline-joined rendering.
+
+    Discussion prompts include the whole transcript, and joining every line again
+    for every speaker makes string building quadratic in the number of speeches
+    (and pages spilled lines back in from disk each time). The rendered text is
+    kept instead and only lines appended since the last render are joined onto
+    it.
+
+    A caller that only needs what is new, such as a per-agent delta prompt, keeps
+    a ``cursor`` (the line count it last saw) and reads the newer lines with
+    ``since``, which returns a view instead of copying or joining them.
+
+    The cached rendering is not bounded by the spill window: once rendered, the
+    whole transcript is held in memory as one string, on top of the windowed
+    lines. That is the size of the prompt built from it anyway; ``clear`` releases
+    it.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW) -> None:
+        """Initialize an empty transcript.
+
+        Args:
+            window: Number of recent lines kept in memory as separate items.
+        """
+        super().__init__(encode=str.encode, decode=bytes.decode, window=window)
+        self._rendered = ""
+        self._rendered_count = 0
+
+    @property
+    def cursor(self) -> int:
+        """Get a cursor to the current end of the transcript.
+
+        Returns:
+            int: The number of lines so far.
+        """
+        return len(self)
+
+    def since(self, cursor: int) -> TranscriptView:
+        """Get a view of the lines appended after a cursor.
+
+        Args:
+            cursor: A line count previously returned by ``cursor``.
+
+        Returns:
+            TranscriptView: The newer lines, up to the current end of the transcript.
+
+        Raises:
+            IndexError: If the cursor is outside the transcript.
+        """
+        if not 0 <= cursor <= len(self):
+            msg = f"Transcript cursor {cursor} out of range"
+            raise IndexError(msg)
+        return TranscriptView(self, cursor, len(self))
+
+    def render(self) -> str:
+        """Get all lines joined by newlines.
+
+        Returns:
+            str: The rendered transcript.
+        """
+        rendered_count = self._rendered_count
+        if rendered_count == len(self):
+            return self._rendered
+
+        parts = [self._rendered] if rendered_count else []
+        parts.extend(self[rendered_count:])
+        self._rendered = "\n".join(parts)
+        self._rendered_count = len(self)
+        return self._rendered
+
+    def clear(self) -> None:
+        """Remove all lines and the cached rendering; existing cursors and views are invalid."""
+        super().clear()
+        self._rendered = ""
+        self._rendered_count = 0
@@ -4,6 +4,8 @@ from llm_werewolf.core.types.enums import (
     EventType,
     GamePhase,
     ActionType,
+    Capability,
+    PlayerChange,
     PlayerStatus,
     ActionPriority,
 )
@@ -17,6 +19,9 @@ from llm_werewolf.core.types.models import (
     VictoryResult,
 )
 
+# Export lightweight records
+from llm_werewolf.core.types.records import USAGE_FIELDS, EventRecord
+
 # Export all protocols
 from llm_werewolf.core.types.protocols import (
     RoleProtocol,
@@ -24,9 +29,14 @@ from llm_werewolf.core.types.protocols import (
     ActionProtocol,
     PlayerProtocol,
     GameStateProtocol,
+    UsageAgentProtocol,
+    MemoryAgentProtocol,
+    GameAwareAgentProtocol,
+    CapabilityTableProtocol,
 )
 
 __all__ = [
+    "USAGE_FIELDS",
     # Enums
     "ActionPriority",
     # Protocols
@@ -34,16 +44,23 @@ __all__ = [
     "ActionType",
     "AgentProtocol",
     "Camp",
+    "Capability",
+    "CapabilityTableProtocol",
     # Models
     "Event",
+    "EventRecord",
     "EventType",
+    "GameAwareAgentProtocol",
     "GamePhase",
     "GameStateInfo",
     "GameStateProtocol",
+    "MemoryAgentProtocol",
+    "PlayerChange",
     "PlayerInfo",
     "PlayerProtocol",
     "PlayerStatus",
     "RoleConfig",
     "RoleProtocol",
+    "UsageAgentProtocol",
     "VictoryResult",
 ]
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntFlag
 
 
 class Camp(str, Enum):
@@ -9,6 +9,27 @@ class Camp(str, Enum):
     NEUTRAL = "neutral"
 
 
+class Capability(IntFlag):
+    """Bit flags for rule-relevant role capabilities.
+
+    Built from the ``RoleConfig`` flags and stored per player in the game's
+    capability table.
+    """
+
+    NONE = 0
+    APPEARS_AS_VILLAGER = 1
+    COUNTS_FOR_PARITY = 2
+    DEATH_SHOT = 4
+    SURVIVES_FIRST_VOTE = 8
+    EXECUTION_PENALTY = 16
+    EXTRA_LIFE = 32
+    BREWS_POTIONS = 64
+    PROTECTS = 128
+    LINKS_LOVERS = 256
+    CHARMS = 512
+    MARKS_FOR_VOTE = 1024
+
+
 class ActionPriority(int, Enum):
     """Enum representing the priority order of night actions.
 
@@ -55,6 +76,16 @@ class PlayerStatus(str, Enum):
     SHERIFF = "sheriff"
 
 
+class PlayerChange(str, Enum):
+    """Enum representing player state changes that observers may react to."""
+
+    KILLED = "killed"
+    REVIVED = "revived"
+    LOVER_LINKED = "lover_linked"
+    ROLE_TRANSFORMED = "role_transformed"
+    ROLE_REVEALED = "role_revealed"
+
+
 class ActionType(str, Enum):
     """Enum representing different types of actions."""
 
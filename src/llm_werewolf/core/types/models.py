@@ -1,12 +1,41 @@
 from datetime import datetime
+from functools import cached_property
+
+from pydantic import Field, BaseModel, ConfigDict, PrivateAttr, field_serializer
+
+from llm_werewolf.core.types.enums import (
+    Camp,
+    EventType,
+    GamePhase,
+    Capability,
+    PlayerStatus,
+    ActionPriority,
+)
+
+_CAPABILITY_FIELDS: dict[str, Capability] = {
+    "appears_as_villager": Capability.APPEARS_AS_VILLAGER,
+    "counts_for_parity": Capability.COUNTS_FOR_PARITY,
+    "death_shot": Capability.DEATH_SHOT,
+    "survives_first_vote": Capability.SURVIVES_FIRST_VOTE,
+    "execution_penalty": Capability.EXECUTION_PENALTY,
+    "extra_life": Capability.EXTRA_LIFE,
+    "brews_potions": Capability.BREWS_POTIONS,
+    "protects": Capability.PROTECTS,
+    "links_lovers": Capability.LINKS_LOVERS,
+    "charms": Capability.CHARMS,
+    "marks_for_vote": Capability.MARKS_FOR_VOTE,
+}
+"""``RoleConfig`` flag field for each capability."""
 
-from pydantic import Field, BaseModel, ConfigDict
 
-from llm_werewolf.core.types.enums import Camp, EventType, GamePhase, PlayerStatus, ActionPriority
+class RoleConfig(BaseModel):
+    """Configuration for a role.
 
+    Configs are immutable because a single instance is shared by every player that
+    has the role.
+    """
 
-class RoleConfig(BaseModel):
-    """Configuration for a role."""
+    model_config = ConfigDict(frozen=True)
 
     name: str = Field(..., description="Name of the role")
     camp: Camp = Field(..., description="Camp this role belongs to")
@@ -15,6 +44,50 @@ class RoleConfig(BaseModel):
     can_act_night: bool = Field(default=False, description="Can perform night actions")
     can_act_day: bool = Field(default=False, description="Can perform day actions")
     max_uses: int | None = Field(None, description="Max times ability can be used")
+    appears_as_villager: bool = Field(
+        default=False, description="Seer checks report the villager camp"
+    )
+    counts_for_parity: bool = Field(
+        default=True, description="Counts as a werewolf when comparing camp sizes"
+    )
+    death_shot: bool = Field(
+        default=False, description="Takes a player down when dying, unless poisoned"
+    )
+    survives_first_vote: bool = Field(
+        default=False, description="Is revealed instead of eliminated by the first vote"
+    )
+    execution_penalty: bool = Field(
+        default=False, description="Villagers lose their abilities if voted out"
+    )
+    extra_life: bool = Field(default=False, description="Survives the first werewolf attack")
+    brews_potions: bool = Field(
+        default=False, description="Holds one saving potion and one poison"
+    )
+    protects: bool = Field(
+        default=False, description="Protects a player from the werewolves each night"
+    )
+    links_lovers: bool = Field(
+        default=False, description="Links two players as lovers on the first night"
+    )
+    charms: bool = Field(default=False, description="Charms a player who dies along with it")
+    marks_for_vote: bool = Field(
+        default=False, description="Marks a player who starts the vote with extra votes"
+    )
+
+    @cached_property
+    def capabilities(self) -> Capability:
+        """Get the capability flags declared by this config.
+
+        Configs are frozen, so the flags are combined once per config.
+
+        Returns:
+            Capability: The combined flags.
+        """
+        flags = Capability.NONE
+        for field, flag in _CAPABILITY_FIELDS.items():
+            if getattr(self, field):
+                flags |= flag
+        return flags
 
 
 class GameStateInfo(BaseModel):
@@ -41,8 +114,6 @@ class PlayerInfo(BaseModel):
 class Event(BaseModel):
     """Represents a game event."""
 
-    model_config = ConfigDict(json_encoders={datetime: lambda v: v.isoformat()})
-
     event_type: EventType = Field(..., description="Type of the event")
     timestamp: datetime = Field(
         default_factory=datetime.now, description="When the event occurred"
@@ -55,6 +126,38 @@ class Event(BaseModel):
         None, description="Player IDs who can see this event (None = all)"
     )
 
+    _audience: frozenset[str] | None = PrivateAttr(default=None)
+
+    @field_serializer("timestamp")
+    def _serialize_timestamp(self, timestamp: datetime) -> str:
+        """Serialize the timestamp in ISO format.
+
+        Args:
+            timestamp: The event timestamp.
+
+        Returns:
+            str: The ISO formatted timestamp.
+        """
+        return timestamp.isoformat()
+
+    def model_post_init(self, context: object, /) -> None:
+        """Precompute the audience set used for visibility checks.
+
+        Args:
+            context: Pydantic validation context (unused).
+        """
+        if self.visible_to is not None:
+            self._audience = frozenset(self.visible_to)
+
+    @property
+    def audience(self) -> frozenset[str] | None:
+        """Get the set of player IDs who can see this event.
+
+        Returns:
+            frozenset[str] | None: The audience, or None if the event is public.
+        """
+        return self._audience
+
     def is_visible_to(self, player_id: str) -> bool:
         """Check if this event is visible to a specific player.
 
@@ -64,9 +167,9 @@ class Event(BaseModel):
         Returns:
             bool: True if the event is visible to the player.
         """
-        if self.visible_to is None:
+        if self._audience is None:
             return True
-        return player_id in self.visible_to
+        return player_id in self._audience
 
     def get_public_message(self) -> str:
         """Get the public version of the event message.
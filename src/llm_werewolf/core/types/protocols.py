@@ -14,10 +14,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+    from collections.abc import Callable
+
     from llm_werewolf.core.types.enums import (
         Camp,
         GamePhase,
         ActionType,
+        Capability,
+        PlayerChange,
         PlayerStatus,
         ActionPriority,
     )
@@ -43,6 +48,42 @@ class AgentProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class GameAwareAgentProtocol(Protocol):
+    """Protocol for agents that read the game they play in, such as search agents."""
+
+    def attach(self, engine: object, player_id: str) -> None:
+        """Attach the agent to the engine running the game.
+
+        Args:
+            engine: The game engine.
+            player_id: ID of the player the agent controls.
+        """
+        ...
+
+
+@runtime_checkable
+class MemoryAgentProtocol(Protocol):
+    """Protocol for agents that keep a conversation, such as LLM agents."""
+
+    chat_history: list[dict[str, str]]
+    decision_history: list[str]
+
+
+@runtime_checkable
+class UsageAgentProtocol(Protocol):
+    """Protocol for agents that measure the model calls behind their responses."""
+
+    def take_usage(self) -> dict[str, float]:
+        """Return the usage since the previous call and start counting again.
+
+        Returns:
+            dict[str, float]: Values for ``USAGE_FIELDS``, or an empty dict if
+                the agent made no model call since the previous call.
+        """
+        ...
+
+
 @runtime_checkable
 class RoleProtocol(Protocol):
     """Protocol for role objects."""
@@ -76,10 +117,18 @@ class RoleProtocol(Protocol):
         """Get the configuration for this role."""
         ...
 
+    def get_capabilities(self) -> Capability:
+        """Get the rule-relevant capabilities this role currently has."""
+        ...
+
     def can_act_tonight(self, player: PlayerProtocol, round_number: int) -> bool:
         """Check if this role can perform an action tonight."""
         ...
 
+    def clone(self, player: PlayerProtocol) -> RoleProtocol:
+        """Copy this role's state onto a new player."""
+        ...
+
     def can_act_today(self, player: PlayerProtocol) -> bool:
         """Check if this role can perform an action today."""
         ...
@@ -98,7 +147,7 @@ class PlayerProtocol(Protocol):
     role: RoleProtocol
     agent: AgentProtocol | None
     ai_model: str
-    statuses: set[PlayerStatus]
+    statuses: AbstractSet[PlayerStatus]
     lover_partner_id: str | None
     can_vote_flag: bool
 
@@ -114,6 +163,18 @@ class PlayerProtocol(Protocol):
         """Revive the player."""
         ...
 
+    def clone(self, agent: AgentProtocol | None = None) -> PlayerProtocol:
+        """Copy this player's state without listeners."""
+        ...
+
+    def add_listener(self, listener: Callable[[PlayerProtocol, PlayerChange], None]) -> None:
+        """Register a callback for state changes on this player."""
+        ...
+
+    def notify_change(self, change: PlayerChange) -> None:
+        """Notify registered listeners that this player's state changed."""
+        ...
+
     def add_status(self, status: PlayerStatus) -> None:
         """Add a status to the player."""
         ...
@@ -155,6 +216,15 @@ class PlayerProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class CapabilityTableProtocol(Protocol):
+    """Protocol for per-game capability tables."""
+
+    def has(self, player: PlayerProtocol, capability: Capability) -> bool:
+        """Check whether a player currently has a capability."""
+        ...
+
+
 @runtime_checkable
 class GameStateProtocol(Protocol):
     """Protocol for game state objects."""
@@ -183,6 +253,7 @@ class GameStateProtocol(Protocol):
     sheriff_id: str | None
     sheriff_election_done: bool
     sheriff_votes: dict[str, str]
+    capabilities: CapabilityTableProtocol
 
     def reset_deaths(self) -> None:
         """Reset the death sets for a new round."""
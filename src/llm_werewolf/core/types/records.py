@@ -0,0 +1,202 @@
+"""Lightweight records for high-volume game data."""
+
+import sys
+from typing import Any
+from datetime import datetime
+
+from llm_werewolf.core.types.enums import EventType
+from llm_werewolf.core.types.models import Event
+
+USAGE_FIELDS = ("prompt_tokens", "completion_tokens", "latency_ms")
+"""Keys the engine adds to the data of decision events for agents that measure usage."""
+
+
+class EventRecord:
+    """Slotted, validation-free representation of a game event.
+
+    This is what the engine logs on the hot path. It carries the same attributes as
+    the pydantic ``Event`` model but skips validation, and interns phase names and
+    player IDs so that thousands of records share the same string objects.
+    Convert with ``to_model``/``from_model`` at serialization and API boundaries.
+    """
+
+    __slots__ = (
+        "audience",
+        "data",
+        "event_type",
+        "message",
+        "phase",
+        "round_number",
+        "timestamp",
+        "visible_to",
+    )
+
+    def __init__(
+        self,
+        event_type: EventType,
+        round_number: int,
+        phase: str,
+        message: str,
+        data: dict | None = None,
+        visible_to: list[str] | None = None,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Initialize the record.
+
+        Args:
+            event_type: Type of the event.
+            round_number: Round number when the event occurred.
+            phase: Game phase when the event occurred.
+            message: Human-readable event message.
+            data: Additional event data.
+            visible_to: Player IDs who can see this event (None = all).
+            timestamp: When the event occurred; defaults to now.
+        """
+        self.event_type = event_type
+        self.round_number = round_number
+        self.phase = sys.intern(phase)
+        self.message = message
+        self.data = data if data is not None else {}
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
+
+        if visible_to is None:
+            self.visible_to: list[str] | None = None
+            self.audience: frozenset[str] | None = None
+        else:
+            self.visible_to = [sys.intern(player_id) for player_id in visible_to]
+            self.audience = frozenset(self.visible_to)
+
+    def is_visible_to(self, player_id: str) -> bool:
+        """Check if this event is visible to a specific player.
+
+        Args:
+            player_id: The player ID to check.
+
+        Returns:
+            bool: True if the event is visible to the player.
+        """
+        return self.audience is None or player_id in self.audience
+
+    def get_public_message(self) -> str:
+        """Get the public version of the event message.
+
+        Returns:
+            str: The public message.
+        """
+        return self.message
+
+    @classmethod
+    def from_model(cls, event: Event) -> "EventRecord":
+        """Create a record from a pydantic event.
+
+        Args:
+            event: The validated event model.
+
+        Returns:
+            EventRecord: The equivalent record.
+        """
+        return cls(
+            event_type=event.event_type,
+            round_number=event.round_number,
+            phase=event.phase,
+            message=event.message,
+            data=event.data,
+            visible_to=event.visible_to,
+            timestamp=event.timestamp,
+        )
+
+    def to_model(self) -> Event:
+        """Convert the record to a validated pydantic event.
+
+        Returns:
+            Event: The equivalent event model.
+        """
+        return Event(
+            event_type=self.event_type,
+            timestamp=self.timestamp,
+            round_number=self.round_number,
+            phase=self.phase,
+            message=self.message,
+            data=self.data,
+            visible_to=self.visible_to,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the record to a JSON-compatible dictionary.
+
+        Returns:
+            dict[str, Any]: The record fields, with the timestamp in ISO format.
+        """
+        return {
+            "event_type": self.event_type.value,
+            "timestamp": self.timestamp.isoformat(),
+            "round_number": self.round_number,
+            "phase": self.phase,
+            "message": self.message,
+            "data": self.data,
+            "visible_to": self.visible_to,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "EventRecord":
+        """Create a record from a dictionary produced by ``to_dict``.
+
+        Args:
+            payload: The record fields.
+
+        Returns:
+            EventRecord: The restored record.
+        """
+        return cls(
+            event_type=EventType(payload["event_type"]),
+            round_number=payload["round_number"],
+            phase=payload["phase"],
+            message=payload["message"],
+            data=payload.get("data"),
+            visible_to=payload.get("visible_to"),
+            timestamp=datetime.fromisoformat(payload["timestamp"]),
+        )
+
+    def _fields(self) -> tuple:
+        """Get the comparable fields of the record.
+
+        Returns:
+            tuple: The field values.
+        """
+        return (
+            self.event_type,
+            self.timestamp,
+            self.round_number,
+            self.phase,
+            self.message,
+            self.data,
+            self.visible_to,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another record or an equivalent pydantic event.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            bool: True if all event fields are equal.
+        """
+        if isinstance(other, Event):
+            other = EventRecord.from_model(other)
+        if not isinstance(other, EventRecord):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Repr of the record.
+
+        Returns:
+            str: Record representation.
+        """
+        return (
+            f"EventRecord(event_type={self.event_type.value}, round={self.round_number}, "
+            f"phase={self.phase!r}, message={self.message!r})"
+        )
@@ -1,8 +1,20 @@
-from llm_werewolf.core.types import VictoryResult, PlayerProtocol, GameStateProtocol
+from llm_werewolf.core.types import (
+    Capability,
+    PlayerChange,
+    VictoryResult,
+    PlayerProtocol,
+    GameStateProtocol,
+)
 
 
 class VictoryChecker:
-    """Checks for victory conditions in the Werewolf game."""
+    """Checks for victory conditions in the Werewolf game.
+
+    Instead of re-scanning every alive player on each check, the checker keeps
+    per-camp tallies that are updated whenever a player is killed, revived, linked
+    as a lover or has their role transformed. Checks are O(1) and the last result
+    is cached until the next state change.
+    """
 
     def __init__(self, game_state: GameStateProtocol) -> None:
         """Initialize the victory checker.
@@ -12,25 +24,125 @@ class VictoryChecker:
         """
         self.game_state = game_state
 
+        self._contributions: dict[str, tuple[int, int, int, int, int]] = {}
+        self._alive_count = 0
+        self._werewolf_count = 0
+        self._parity_werewolf_count = 0
+        self._villager_count = 0
+        self._lover_count = 0
+        self._cached_result: VictoryResult | None = None
+
+        for player in game_state.players:
+            player.add_listener(self._on_player_change)
+        self.recount()
+
+    def _contribution(self, player: PlayerProtocol) -> tuple[int, int, int, int, int]:
+        """Compute what a single player adds to each tally.
+
+        Args:
+            player: The player to classify.
+
+        Returns:
+            tuple[int, int, int, int, int]: Alive, werewolf, parity werewolf, villager
+                and lover contributions (each 0 or 1).
+        """
+        if not player.is_alive():
+            return (0, 0, 0, 0, 0)
+
+        camp = player.get_camp()
+        is_werewolf = camp == "werewolf"
+        return (
+            1,
+            int(is_werewolf),
+            int(
+                is_werewolf
+                and self.game_state.capabilities.has(player, Capability.COUNTS_FOR_PARITY)
+            ),
+            int(camp == "villager"),
+            int(player.is_lover()),
+        )
+
+    def _apply(self, player: PlayerProtocol) -> None:
+        """Replace a player's previous contribution with their current one.
+
+        Args:
+            player: The player whose state changed.
+        """
+        old = self._contributions.get(player.player_id, (0, 0, 0, 0, 0))
+        new = self._contribution(player)
+        if old == new:
+            return
+
+        self._contributions[player.player_id] = new
+        self._alive_count += new[0] - old[0]
+        self._werewolf_count += new[1] - old[1]
+        self._parity_werewolf_count += new[2] - old[2]
+        self._villager_count += new[3] - old[3]
+        self._lover_count += new[4] - old[4]
+        self._cached_result = None
+
+    def _on_player_change(self, player: PlayerProtocol, change: PlayerChange) -> None:
+        """Update tallies after a player state change.
+
+        Args:
+            player: The player that changed.
+            change: The kind of change that occurred.
+        """
+        self._apply(player)
+
+    def recount(self) -> None:
+        """Rebuild all tallies from scratch.
+
+        Only needed when player state is modified without going through the
+        player's change notifications (e.g. when restoring a snapshot).
+        """
+        self._contributions.clear()
+        self._alive_count = 0
+        self._werewolf_count = 0
+        self._parity_werewolf_count = 0
+        self._villager_count = 0
+        self._lover_count = 0
+        self._cached_result = None
+        for player in self.game_state.players:
+            self._apply(player)
+
+    def _alive_ids(self, camp: str | None = None, lovers_only: bool = False) -> list[str]:
+        """Collect alive player IDs for a winner list.
+
+        Args:
+            camp: Only include players from this camp.
+            lovers_only: Only include players with the lover status.
+
+        Returns:
+            list[str]: Matching player IDs in seating order.
+        """
+        return [
+            p.player_id
+            for p in self.game_state.players
+            if p.is_alive()
+            and (camp is None or p.get_camp() == camp)
+            and (not lovers_only or p.is_lover())
+        ]
+
     def check_victory(self) -> VictoryResult:
         """Check if any victory condition has been met.
 
         Returns:
             VictoryResult: The victory check result.
         """
-        lover_result = self.check_lover_victory()
-        if lover_result.has_winner:
-            return lover_result
-
-        werewolf_result = self.check_werewolf_victory()
-        if werewolf_result.has_winner:
-            return werewolf_result
+        if self._cached_result is not None:
+            return self._cached_result
 
-        villager_result = self.check_villager_victory()
-        if villager_result.has_winner:
-            return villager_result
+        result = self.check_lover_victory()
+        if not result.has_winner:
+            result = self.check_werewolf_victory()
+        if not result.has_winner:
+            result = self.check_villager_victory()
+        if not result.has_winner:
+            result = VictoryResult(has_winner=False, reason="Game continues")
 
-        return VictoryResult(has_winner=False, reason="Game continues")
+        self._cached_result = result
+        return result
 
     def check_werewolf_victory(self) -> VictoryResult:
         """Check if werewolves have won.
@@ -41,35 +153,15 @@ class VictoryChecker:
         Returns:
             VictoryResult: The victory check result.
         """
-        alive_players = self.game_state.get_alive_players()
-
-        # Count werewolves, excluding untransformed Blood Moon Apostle
-        werewolf_count = 0
-        for p in alive_players:
-            if p.get_camp() == "werewolf":
-                # Check if it's an untransformed Blood Moon Apostle
-                if (
-                    p.role.name == "Blood Moon Apostle"
-                    and hasattr(p.role, "transformed")
-                    and not p.role.transformed
-                ):
-                    continue  # Don't count untransformed apostle
-                werewolf_count += 1
-
-        villager_count = sum(1 for p in alive_players if p.get_camp() == "villager")
+        werewolf_count = self._parity_werewolf_count
+        villager_count = self._villager_count
 
         if werewolf_count >= villager_count and werewolf_count > 0:
-            # Include all werewolves (including transformed Blood Moon Apostle) in winner list
-            werewolf_ids = []
-            for p in alive_players:
-                if p.get_camp() == "werewolf":
-                    # Untransformed Blood Moon Apostle still wins with werewolves
-                    werewolf_ids.append(p.player_id)
-
+            # Untransformed Blood Moon Apostle still wins with werewolves
             return VictoryResult(
                 has_winner=True,
                 winner_camp="werewolf",
-                winner_ids=werewolf_ids,
+                winner_ids=self._alive_ids(camp="werewolf"),
                 reason=f"Werewolves ({werewolf_count}) equal or outnumber villagers ({villager_count})",
             )
 
@@ -84,17 +176,11 @@ class VictoryChecker:
         Returns:
             VictoryResult: The victory check result.
         """
-        alive_players = self.game_state.get_alive_players()
-
-        # Count all werewolves (including Blood Moon Apostle, even if untransformed)
-        werewolf_count = sum(1 for p in alive_players if p.get_camp() == "werewolf")
-
-        if werewolf_count == 0:
-            villager_ids = [p.player_id for p in alive_players if p.get_camp() == "villager"]
+        if self._werewolf_count == 0:
             return VictoryResult(
                 has_winner=True,
                 winner_camp="villager",
-                winner_ids=villager_ids,
+                winner_ids=self._alive_ids(camp="villager"),
                 reason="All werewolves have been eliminated",
             )
 
@@ -108,16 +194,11 @@ class VictoryChecker:
         Returns:
             VictoryResult: The victory check result.
         """
-        alive_players = self.game_state.get_alive_players()
-
-        lovers = [p for p in alive_players if p.is_lover()]
-
-        if len(lovers) == 2 and len(alive_players) == 2:
-            lover_ids = [p.player_id for p in lovers]
+        if self._lover_count == 2 and self._alive_count == 2:
             return VictoryResult(
                 has_winner=True,
                 winner_camp="lover",
-                winner_ids=lover_ids,
+                winner_ids=self._alive_ids(lovers_only=True),
                 reason="Only the lovers remain alive",
             )
 
@@ -160,9 +241,9 @@ class VictoryChecker:
             return []
 
         return [
-            self.game_state.get_player(player_id)
+            self.game_state.player_dict[player_id]
             for player_id in result.winner_ids
-            if self.game_state.get_player(player_id) is not None
+            if player_id in self.game_state.player_dict
         ]
 
     def get_losing_players(self) -> list[PlayerProtocol]:
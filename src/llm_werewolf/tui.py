@@ -8,15 +8,20 @@ from llm_werewolf.core import GameEngine
 from llm_werewolf.core.agent import create_agent
 from llm_werewolf.core.utils import load_config
 from llm_werewolf.core.config import create_game_config_from_player_count
+from llm_werewolf.core.tracing import configure_tracing
 from llm_werewolf.core.role_registry import create_roles
 
 
-def main(config: str) -> None:
+def main(config: str, trace: str | None = None) -> None:
     """Run Werewolf game with TUI interface.
 
     Args:
         config: Path to the YAML configuration file
+        trace: Optional OTLP/HTTP collector URL or JSON-lines file to export the game,
+            round, phase, decision and LLM call spans to
     """
+    if trace:
+        configure_tracing(trace)
     config_path = Path(config)
     players_config = load_config(config_path=config_path)
 
@@ -46,6 +51,8 @@ def main(config: str) -> None:
             num_players=num_players,
         )
         raise
+    finally:
+        logfire.force_flush()
 
 
 def entry() -> None:
@@ -1,21 +1,26 @@
 from typing import Any
 import datetime
+from collections import deque
 
 from rich.text import Text
 from textual.widgets import RichLog
 
 from llm_werewolf.core.types import EventType
-from llm_werewolf.core.events import Event
+from llm_werewolf.core.events import EventRecord
 from llm_werewolf.core.event_formatter import EventFormatter
 
+HISTORY_LIMIT = 1000
+"""Maximum number of events and rendered lines the chat panel keeps."""
+
 
 class ChatPanel(RichLog):
     """Widget displaying the game chat/event history."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
         """Initialize the chat panel."""
+        kwargs.setdefault("max_lines", HISTORY_LIMIT)
         super().__init__(*args, **kwargs)
-        self.events: list[Event] = []
+        self.events: deque[EventRecord] = deque(maxlen=HISTORY_LIMIT)
         self._streaming_line_count: int = 0
 
         # Buffers for grouped display
@@ -25,7 +30,7 @@ class ChatPanel(RichLog):
         self._vote_buffer: dict[str, list[str]] = {}  # target_name -> [voters]
         self._last_phase = ""
 
-    def add_event(self, event: Event) -> None:
+    def add_event(self, event: EventRecord) -> None:
         """Add an event to the chat history.
 
         Args:
@@ -69,7 +74,7 @@ class ChatPanel(RichLog):
             EventType.SHERIFF_BADGE_TRANSFERRED,
         }
 
-    def _handle_special_events(self, event: Event) -> bool:
+    def _handle_special_events(self, event: EventRecord) -> bool:
         """Handle special event types and return whether event was handled.
 
         Args:
@@ -95,7 +100,7 @@ class ChatPanel(RichLog):
 
         return False
 
-    def _handle_game_lifecycle_events(self, event: Event) -> bool:
+    def _handle_game_lifecycle_events(self, event: EventRecord) -> bool:
         """Handle game lifecycle events (start, end).
 
         Args:
@@ -112,7 +117,7 @@ class ChatPanel(RichLog):
             return True
         return False
 
-    def _handle_player_events(self, event: Event) -> bool:
+    def _handle_player_events(self, event: EventRecord) -> bool:
         """Handle player-related events (speech, death, elimination).
 
         Args:
@@ -135,7 +140,7 @@ class ChatPanel(RichLog):
             return True
         return False
 
-    def _handle_voting_events(self, event: Event) -> bool:
+    def _handle_voting_events(self, event: EventRecord) -> bool:
         """Handle voting-related events.
 
         Args:
@@ -153,7 +158,7 @@ class ChatPanel(RichLog):
             return True
         return False
 
-    def display_event(self, event: Event) -> None:
+    def display_event(self, event: EventRecord) -> None:
         """Display an event in the chat panel with grouped formatting.
 
         Args:
@@ -182,7 +187,7 @@ class ChatPanel(RichLog):
             text = EventFormatter.format_event(event, include_timestamp=True)
             self.write(text)
 
-    def _handle_phase_change(self, event: Event) -> None:
+    def _handle_phase_change(self, event: EventRecord) -> None:
         """Handle phase transition with visual separators."""
         if event.data and event.data.get("phase") == "night":
             # Flush any buffered content before night
@@ -210,7 +215,7 @@ class ChatPanel(RichLog):
             self.write(Text("═" * 70, style="yellow"))
             self.write("")
 
-    def _handle_narrator_message(self, event: Event) -> None:
+    def _handle_narrator_message(self, event: EventRecord) -> None:
         """Handle narrator messages."""
         if not event.data:
             text = Text(event.message, style="dim italic")
@@ -241,7 +246,7 @@ class ChatPanel(RichLog):
             text = Text(event.message, style="dim italic")
             self.write(text)
 
-    def _buffer_night_action(self, event: Event) -> None:
+    def _buffer_night_action(self, event: EventRecord) -> None:
         """Buffer night actions for grouped display."""
         self._night_actions.append((event.event_type, event.message))
 
@@ -280,14 +285,14 @@ class ChatPanel(RichLog):
         self.write("")
         self._night_actions = []
 
-    def _buffer_discussion(self, event: Event) -> None:
+    def _buffer_discussion(self, event: EventRecord) -> None:
         """Buffer discussion messages for grouped display."""
         if event.data:
             player_name = event.data.get("player_name", "Unknown")
             speech = event.data.get("speech", "")
             self._discussion_messages.append(f"{player_name}: {speech}")
 
-    def _buffer_werewolf_discussion(self, event: Event) -> None:
+    def _buffer_werewolf_discussion(self, event: EventRecord) -> None:
         """Buffer werewolf discussion for grouped display."""
         if event.data:
             player_name = event.data.get("player_name", "Unknown")
@@ -319,7 +324,7 @@ class ChatPanel(RichLog):
             self.write("")
             self._discussion_messages = []
 
-    def _buffer_vote(self, event: Event) -> None:
+    def _buffer_vote(self, event: EventRecord) -> None:
         """Buffer vote for grouped display."""
         if event.data:
             target_name = event.data.get("target_name", "Unknown")
@@ -361,7 +366,7 @@ class ChatPanel(RichLog):
         self.write("")
         self._vote_buffer = {}
 
-    def _present_game_start(self, event: Event) -> None:
+    def _present_game_start(self, event: EventRecord) -> None:
         """Present game start."""
         self.write("")
         self.write(Text("═" * 70, style="bold green"))
@@ -372,7 +377,7 @@ class ChatPanel(RichLog):
             self.write(Text(f"📋 玩家人數：{player_count} 人", style="green"))
         self.write("")
 
-    def _present_game_end(self, event: Event) -> None:
+    def _present_game_end(self, event: EventRecord) -> None:
         """Present game end."""
         self.write("")
         self.write(Text("═" * 70, style="bold magenta"))
@@ -382,11 +387,11 @@ class ChatPanel(RichLog):
         self.write(Text(event.message, style="bold magenta"))
         self.write("")
 
-    def _present_death(self, event: Event) -> None:
+    def _present_death(self, event: EventRecord) -> None:
         """Present player death."""
         self.write(Text(f"💀 {event.message}", style="bold red"))
 
-    def _present_elimination(self, event: Event) -> None:
+    def _present_elimination(self, event: EventRecord) -> None:
         """Present player elimination."""
         self.write("")
         self.write(Text(f"⚰️  {event.message}", style="bold red"))
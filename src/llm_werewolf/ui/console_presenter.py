@@ -8,7 +8,7 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.console import Console
 
-from llm_werewolf.core.types import Event, EventType
+from llm_werewolf.core.types import EventType, EventRecord
 
 if TYPE_CHECKING:
     from llm_werewolf.core.locale import Locale
@@ -69,7 +69,7 @@ class ConsolePresenter:
             EventType.SHERIFF_BADGE_TRANSFERRED,
         }
 
-    def _handle_special_events(self, event: Event) -> bool:
+    def _handle_special_events(self, event: EventRecord) -> bool:
         """Handle special event types and return whether event was handled.
 
         Args:
@@ -92,7 +92,7 @@ class ConsolePresenter:
 
         return False
 
-    def _handle_game_lifecycle_events(self, event: Event) -> bool:
+    def _handle_game_lifecycle_events(self, event: EventRecord) -> bool:
         """Handle game lifecycle events (start, end).
 
         Args:
@@ -109,7 +109,7 @@ class ConsolePresenter:
             return True
         return False
 
-    def _handle_player_events(self, event: Event) -> bool:
+    def _handle_player_events(self, event: EventRecord) -> bool:
         """Handle player-related events (speech, death, elimination).
 
         Args:
@@ -132,7 +132,7 @@ class ConsolePresenter:
             return True
         return False
 
-    def _handle_voting_events(self, event: Event) -> bool:
+    def _handle_voting_events(self, event: EventRecord) -> bool:
         """Handle voting-related events.
 
         Args:
@@ -150,7 +150,7 @@ class ConsolePresenter:
             return True
         return False
 
-    def present_event(self, event: Event) -> None:
+    def present_event(self, event: EventRecord) -> None:
         """Present an event with appropriate formatting.
 
         Args:
@@ -179,7 +179,7 @@ class ConsolePresenter:
             style = self._get_event_style(event.event_type)
             console.print(event.message, style=style)
 
-    def _handle_phase_change(self, event: Event) -> None:
+    def _handle_phase_change(self, event: EventRecord) -> None:
         """Handle phase transition with visual separators."""
         if event.data and event.data.get("phase") == "night":
             # Flush any buffered content before night (but NOT werewolf discussion)
@@ -205,7 +205,7 @@ class ConsolePresenter:
             console.print("═" * 70, style="yellow")
             console.print()
 
-    def _handle_narrator_message(self, event: Event) -> None:
+    def _handle_narrator_message(self, event: EventRecord) -> None:
         """Handle narrator messages."""
         if not event.data:
             console.print(event.message, style="dim italic")
@@ -234,7 +234,7 @@ class ConsolePresenter:
         else:
             console.print(event.message, style="dim italic")
 
-    def _buffer_night_action(self, event: Event) -> None:
+    def _buffer_night_action(self, event: EventRecord) -> None:
         """Buffer night actions for grouped display."""
         # Extract clean message (remove emoji if already present)
         message = event.message
@@ -272,14 +272,14 @@ class ConsolePresenter:
 
         self._night_actions = []
 
-    def _buffer_discussion(self, event: Event) -> None:
+    def _buffer_discussion(self, event: EventRecord) -> None:
         """Buffer discussion messages for grouped display."""
         if event.data:
             player_name = event.data.get("player_name", "Unknown")
             speech = event.data.get("speech", "")
             self._discussion_messages.append(f"{player_name}: {speech}")
 
-    def _buffer_werewolf_discussion(self, event: Event) -> None:
+    def _buffer_werewolf_discussion(self, event: EventRecord) -> None:
         """Buffer werewolf discussion for grouped display."""
         if event.data:
             player_name = event.data.get("player_name", "Unknown")
@@ -310,7 +310,7 @@ class ConsolePresenter:
             console.print()
             self._discussion_messages = []
 
-    def _buffer_vote(self, event: Event) -> None:
+    def _buffer_vote(self, event: EventRecord) -> None:
         """Buffer vote for grouped display."""
         if event.data:
             target_name = event.data.get("target_name", "Unknown")
@@ -355,7 +355,7 @@ class ConsolePresenter:
 
         self._vote_buffer = {}
 
-    def _present_game_start(self, event: Event) -> None:
+    def _present_game_start(self, event: EventRecord) -> None:
         """Present game start."""
         console.print()
         console.print("═" * 70, style="bold green")
@@ -365,7 +365,7 @@ class ConsolePresenter:
             player_count = event.data.get("player_count", 0)
             console.print(f"\n📋 玩家人數：{player_count} 人\n", style="green")
 
-    def _present_game_end(self, event: Event) -> None:
+    def _present_game_end(self, event: EventRecord) -> None:
         """Present game end."""
         console.print()
         console.print("═" * 70, style="bold magenta")
@@ -375,25 +375,25 @@ class ConsolePresenter:
         console.print(event.message, style="bold magenta")
         console.print()
 
-    def _present_death(self, event: Event) -> None:
+    def _present_death(self, event: EventRecord) -> None:
         """Present player death."""
         console.print(f"💀 {event.message}", style="bold red")
 
-    def _present_elimination(self, event: Event) -> None:
+    def _present_elimination(self, event: EventRecord) -> None:
         """Present player elimination."""
         console.print()
         console.print(f"⚰️  {event.message}", style="bold red")
         console.print()
 
-    def _present_hunter_revenge(self, event: Event) -> None:
+    def _present_hunter_revenge(self, event: EventRecord) -> None:
         """Present hunter revenge."""
         console.print(f"🏹 {event.message}", style="bold yellow")
 
-    def _present_sheriff_event(self, event: Event) -> None:
+    def _present_sheriff_event(self, event: EventRecord) -> None:
         """Present sheriff-related events."""
         console.print(f"🎖️  {event.message}", style="gold1")
 
-    def _present_role_reveal(self, event: Event) -> None:
+    def _present_role_reveal(self, event: EventRecord) -> None:
         """Present role reveal."""
         console.print(f"🎭 {event.message}", style="bold magenta")
 
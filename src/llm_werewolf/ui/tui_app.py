@@ -7,7 +7,7 @@ from textual.widgets import Footer, Header
 from textual.containers import Vertical, Horizontal
 
 from llm_werewolf.core.engine import GameEngine
-from llm_werewolf.core.events import Event
+from llm_werewolf.core.events import EventRecord
 from llm_werewolf.ui.components import ChatPanel, GamePanel, PlayerPanel
 
 
@@ -144,7 +144,7 @@ class WerewolfTUI(App):
         if self.game_panel:
             self.game_panel.set_game_state(self.game_engine.game_state)
 
-    def on_game_event(self, event: Event) -> None:
+    def on_game_event(self, event: EventRecord) -> None:
         """Handle a game event.
 
         Args:
@@ -0,0 +1,107 @@
+"""Shared engine and agent factories for the core tests."""
+
+from types import SimpleNamespace
+import random
+from pathlib import Path
+from collections.abc import Callable, Sequence
+
+import pytest
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.agent import LLMAgent, DemoAgent
+from llm_werewolf.core.types import AgentProtocol
+from llm_werewolf.core.config import GameConfig, create_game_config_from_player_count
+from llm_werewolf.core.game_state import GameState
+from llm_werewolf.core.role_registry import create_roles
+
+
+class _FakeCompletions:
+    """Chat completions endpoint that answers "1" to every request.
+
+    Every response reports 100 prompt tokens, 3 completion tokens and one retry.
+    """
+
+    def create(self, **kwargs: object) -> SimpleNamespace:
+        message = SimpleNamespace(content="1")
+        usage = SimpleNamespace(prompt_tokens=100, completion_tokens=3)
+        completion = SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+        return SimpleNamespace(parse=lambda: completion, retries_taken=1)
+
+
+@pytest.fixture
+def llm_agent() -> Callable[[str], LLMAgent]:
+    """Create LLM agents whose OpenAI client is replaced by a fake one."""
+
+    def create(name: str) -> LLMAgent:
+        agent = LLMAgent(
+            name=name, model="fake", api_key="k", base_url="http://x", language="en-US"
+        )
+        completions = SimpleNamespace(with_raw_response=_FakeCompletions())
+        agent.__dict__["client"] = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        return agent
+
+    return create
+
+
+@pytest.fixture
+def quiet_engine() -> Callable[..., GameEngine]:
+    """Create engines that do not display their events, optionally around a game state."""
+
+    def create(config: GameConfig | None = None, state: GameState | None = None) -> GameEngine:
+        engine = GameEngine(config)
+        engine.on_event = lambda event: None
+        if state is not None:
+            engine.game_state = state
+        return engine
+
+    return create
+
+
+@pytest.fixture
+def new_game(quiet_engine: Callable[..., GameEngine]) -> Callable[..., GameEngine]:
+    """Set up quiet games with demo agents, or with the agents given.
+
+    The factory takes the number of players or the agents, an optional seed for
+    the global ``random`` module, whether to play the game to the end, and engine
+    attributes (``journal``, ``checkpoint_dir``...) to set before the game is set up.
+    """
+
+    def create(
+        players: int | Sequence[AgentProtocol] = 9,
+        seed: int | None = None,
+        play: bool = False,
+        **attributes: object,
+    ) -> GameEngine:
+        if seed is not None:
+            random.seed(seed)
+        if isinstance(players, int):
+            players = [DemoAgent(name=f"P{i}") for i in range(players)]
+        config = create_game_config_from_player_count(len(players))
+        engine = quiet_engine(config)
+        for name, value in attributes.items():
+            setattr(engine, name, value)
+        engine.setup_game(players=list(players), roles=create_roles(config.role_names))
+        if play:
+            engine.play_game()
+        return engine
+
+    return create
+
+
+@pytest.fixture
+def resume_game(quiet_engine: Callable[..., GameEngine]) -> Callable[..., GameEngine]:
+    """Resume quiet games from a checkpoint with fresh demo agents.
+
+    The factory takes the game config, the checkpoint path and engine attributes
+    to set before the checkpoint is loaded.
+    """
+
+    def create(config: GameConfig, checkpoint: str | Path, **attributes: object) -> GameEngine:
+        engine = quiet_engine(config)
+        for name, value in attributes.items():
+            setattr(engine, name, value)
+        agents = {f"player_{i + 1}": DemoAgent(name=f"P{i}") for i in range(config.num_players)}
+        engine.load_checkpoint(checkpoint, agents)
+        return engine
+
+    return create
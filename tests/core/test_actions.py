@@ -0,0 +1,93 @@
+from collections.abc import Callable
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.roles import Seer, Guard, Witch, Villager, Werewolf, NightmareWolf
+from llm_werewolf.core.types import EventType, ActionPriority
+from llm_werewolf.core.player import Player
+from llm_werewolf.core.actions import (
+    VoteAction,
+    CupidLinkAction,
+    SeerCheckAction,
+    WitchSaveAction,
+    GuardProtectAction,
+    NightmareWolfBlockAction,
+)
+from llm_werewolf.core.game_state import GameState
+from llm_werewolf.core.engine.action_processor import _ACTION_LOGGERS
+
+
+def test_actions_declare_priority() -> None:
+    """Test that action classes carry their resolution priority."""
+    assert CupidLinkAction.priority == ActionPriority.CUPID
+    assert NightmareWolfBlockAction.priority == ActionPriority.NIGHTMARE_WOLF
+    assert GuardProtectAction.priority == ActionPriority.GUARD
+    assert SeerCheckAction.priority == ActionPriority.SEER
+    assert VoteAction.priority == 0
+
+
+def test_process_actions_orders_by_priority(quiet_engine: Callable[..., GameEngine]) -> None:
+    """Test that actions run in priority order regardless of input order."""
+    seer = Player("p1", "Seer", Seer)
+    guard = Player("p2", "Guard", Guard)
+    witch = Player("p3", "Witch", Witch)
+    wolf = Player("p4", "Wolf", Werewolf)
+    victim = Player("p5", "Victim", Villager)
+    engine = quiet_engine(state=GameState([seer, guard, witch, wolf, victim]))
+    engine.game_state.werewolf_target = victim.player_id
+
+    messages = engine.process_actions([
+        SeerCheckAction(seer, wolf, engine.game_state),
+        WitchSaveAction(witch, victim, engine.game_state),
+        GuardProtectAction(guard, victim, engine.game_state),
+    ])
+
+    assert messages[0].startswith("Guard")
+    assert messages[1].startswith("Witch")
+    assert len(messages) == 3
+
+
+def test_process_actions_logs_registered_events(quiet_engine: Callable[..., GameEngine]) -> None:
+    """Test that executed actions emit the event registered for their class."""
+    seer = Player("p1", "Seer", Seer)
+    wolf = Player("p2", "Wolf", Werewolf)
+    engine = quiet_engine(state=GameState([seer, wolf]))
+
+    engine.process_actions([SeerCheckAction(seer, wolf, engine.game_state)])
+
+    events = engine.event_logger.events
+    assert [event.event_type for event in events] == [EventType.SEER_CHECKED]
+    assert events[0].visible_to == [seer.player_id]
+
+
+def test_action_subclasses_inherit_event_emitters(quiet_engine: Callable[..., GameEngine]) -> None:
+    """Test that a subclass without its own emitter logs like its nearest base, then is cached."""
+
+    class CustomCheckAction(SeerCheckAction):
+        priority = 55
+
+    seer = Player("p1", "Seer", Seer)
+    wolf = Player("p2", "Wolf", Werewolf)
+    engine = quiet_engine(state=GameState([seer, wolf]))
+
+    engine.process_actions([CustomCheckAction(seer, wolf, engine.game_state)])
+
+    assert [event.event_type for event in engine.event_logger.events] == [EventType.SEER_CHECKED]
+    assert _ACTION_LOGGERS[CustomCheckAction] is _ACTION_LOGGERS[SeerCheckAction]
+    assert _ACTION_LOGGERS.pop(CustomCheckAction) is not None
+
+
+def test_nightmare_block_is_not_blockable(quiet_engine: Callable[..., GameEngine]) -> None:
+    """Test that blocked actors are skipped but the block itself still runs."""
+    nightmare = Player("p1", "Nightmare", NightmareWolf)
+    seer = Player("p2", "Seer", Seer)
+    engine = quiet_engine(state=GameState([nightmare, seer]))
+    engine.game_state.nightmare_blocked = nightmare.player_id
+
+    assert not NightmareWolfBlockAction.blockable
+    messages = engine.process_actions([
+        NightmareWolfBlockAction(nightmare, seer, engine.game_state)
+    ])
+    assert messages
+
+    engine.game_state.nightmare_blocked = seer.player_id
+    assert engine.process_actions([SeerCheckAction(seer, nightmare, engine.game_state)]) == []
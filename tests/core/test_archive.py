@@ -0,0 +1,79 @@
+from pathlib import Path
+import sqlite3
+from collections.abc import Callable
+
+import pytest
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.types import EventType
+from llm_werewolf.core.archive import GameArchive
+
+
+def test_game_rows_match_the_engine(new_game: Callable[..., GameEngine], tmp_path: Path) -> None:
+    """Test that players, events and votes of a game are archived."""
+    engine = new_game(seed=1, play=True)
+    with GameArchive(tmp_path / "games.db") as archive:
+        game_id = archive.add_game(engine, seed=1)
+
+    with GameArchive(tmp_path / "games.db") as archive:
+        assert archive.count_games() == 1
+        assert archive.query("SELECT seed, winner FROM games WHERE game_id = ?", [game_id]) == [
+            (1, engine.game_state.winner)
+        ]
+        roles = archive.query("SELECT player_id, role FROM players ORDER BY seat")
+        assert roles == [(p.player_id, p.get_role_name()) for p in engine.game_state.players]
+        (event_count,) = archive.query("SELECT COUNT(*) FROM events")[0]
+        assert event_count == len(engine.get_events())
+        votes = [e for e in engine.get_events() if e.event_type == EventType.VOTE_CAST]
+        assert archive.query("SELECT COUNT(*) FROM votes WHERE kind = 'day'") == [(len(votes),)]
+
+
+def test_win_rate_by_role_and_table_size(new_game: Callable[..., GameEngine]) -> None:
+    """Test that win rates count the seats on the winning side."""
+    engines = [new_game(seed=seed, play=True) for seed in range(4)]
+    archive = GameArchive()
+    archive.add_games(engines, seeds=range(4))
+
+    werewolves = archive.win_rate(role="Werewolf", model="demo", num_players=9)
+    expected = [
+        p.get_camp() == e.game_state.winner
+        for e in engines
+        for p in e.game_state.players
+        if p.get_role_name() == "Werewolf"
+    ]
+    assert werewolves.players == len(expected)
+    assert werewolves.wins == sum(expected)
+    assert 0.0 <= werewolves.rate <= 1.0
+    assert archive.win_rate(num_players=12).players == 0
+    assert archive.win_rate(num_players=12).rate == 0.0
+
+    plan = archive.query(
+        "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM players WHERE role = ? AND model = ?",
+        ["Werewolf", "demo"],
+    )
+    assert any("idx_players_role_model" in row[-1] for row in plan)
+
+
+def test_batch_is_rolled_back_on_error(new_game: Callable[..., GameEngine]) -> None:
+    """Test that a failing game undoes the whole batch and unfinished games are refused."""
+    archive = GameArchive()
+    unfinished = new_game(seed=5)
+
+    with pytest.raises(ValueError, match="finished"):
+        archive.add_games([new_game(seed=1, play=True), unfinished])
+
+    assert archive.count_games() == 0
+    assert archive.query("SELECT COUNT(*) FROM events") == [(0,)]
+
+
+def test_query_is_read_only(new_game: Callable[..., GameEngine]) -> None:
+    """Test that query refuses writes and leaves the archive writable afterwards."""
+    archive = GameArchive()
+    archive.add_game(new_game(seed=2, play=True))
+
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        archive.query("DELETE FROM games")
+
+    assert archive.count_games() == 1
+    archive.add_game(new_game(seed=3, play=True))
+    assert archive.count_games() == 2
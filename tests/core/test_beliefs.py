@@ -0,0 +1,95 @@
+import pytest
+
+from llm_werewolf.core.roles import Seer, Idiot, Villager, Werewolf, AlphaWolf, HiddenWolf
+from llm_werewolf.core.types import Camp, EventType, EventRecord
+from llm_werewolf.core.player import Player
+from llm_werewolf.core.beliefs import BeliefTracker
+from llm_werewolf.core.game_state import GameState
+
+
+def _event(event_type: EventType, data: dict, visible_to: list[str] | None = None) -> EventRecord:
+    return EventRecord(
+        event_type=event_type,
+        round_number=1,
+        phase="day_voting",
+        message="",
+        data=data,
+        visible_to=visible_to,
+    )
+
+
+def _state(roles: list) -> GameState:
+    return GameState([Player(f"p{i}", f"P{i}", role) for i, role in enumerate(roles)])
+
+
+def test_werewolf_knows_the_pack() -> None:
+    """Test that a werewolf starts with its pack known and no one else."""
+    state = _state([AlphaWolf, Werewolf, Seer, Villager, Villager])
+    beliefs = BeliefTracker.from_game_state(state, "p0")
+
+    assert beliefs.known_role("p0") is AlphaWolf
+    assert beliefs.known_role("p1") is Werewolf
+    assert beliefs.known_role("p2") is None
+    assert set(beliefs.candidates("p3")) == {Seer, Villager}
+    assert beliefs.known_camp("p4") == Camp.VILLAGER
+
+
+def test_revealed_roles_propagate_counts() -> None:
+    """Test that reveals fix roles and used-up roles leave the other players."""
+    state = _state([Villager, Werewolf, Seer, Idiot, Villager])
+    beliefs = BeliefTracker.from_game_state(state, "p0")
+
+    beliefs.observe(_event(EventType.PLAYER_ELIMINATED, {"player_id": "p1", "role": "Werewolf"}))
+    beliefs.observe(_event(EventType.ROLE_REVEALED, {"player_id": "p3", "role": "Idiot"}))
+
+    assert beliefs.known_role("p1") is Werewolf
+    assert beliefs.known_role("p3") is Idiot
+    assert set(beliefs.candidates("p2")) == {Seer, Villager}
+    assert beliefs.role_probabilities("p2") == pytest.approx({Seer: 0.5, Villager: 0.5}, abs=1e-3)
+    assert beliefs.camp_probability("p4", Camp.WEREWOLF) == 0.0
+
+    with pytest.raises(ValueError, match="contradicts"):
+        beliefs.fix_role("p1", Seer)
+
+
+def test_swapped_roles_reset_instead_of_raising() -> None:
+    """Test that evidence contradicting a player resets them and misfits are ignored."""
+    state = _state([Seer, Werewolf, Villager, Villager, Villager])
+    beliefs = BeliefTracker.from_game_state(state, "p0")
+    check = _event(EventType.SEER_CHECKED, {"target_id": "p1", "result": "werewolf"}, ["p0"])
+    beliefs.observe(check)
+    assert beliefs.known_role("p1") is Werewolf
+
+    beliefs.observe(_event(EventType.PLAYER_ELIMINATED, {"player_id": "p1", "role": "Villager"}))
+    assert beliefs.known_role("p1") is Villager
+
+    before = {pid: beliefs.candidates(pid) for pid in ("p2", "p3", "p4")}
+    beliefs.observe(_event(EventType.ROLE_REVEALED, {"player_id": "p2", "role": "Seer"}))
+    assert {pid: beliefs.candidates(pid) for pid in ("p2", "p3", "p4")} == before
+
+
+def test_seer_checks_are_private_and_respect_disguises() -> None:
+    """Test that Seer results only reach the Seer and keep disguised wolves possible."""
+    state = _state([Seer, HiddenWolf, Werewolf, Villager, Villager])
+    seer = BeliefTracker.from_game_state(state, "p0")
+    villager = BeliefTracker.from_game_state(state, "p3")
+
+    check = _event(EventType.SEER_CHECKED, {"target_id": "p1", "result": "villager"}, ["p0"])
+    seer.observe_all([check])
+    villager.observe_all([check])
+    seer.observe(_event(EventType.SEER_CHECKED, {"target_id": "p2", "result": "werewolf"}, ["p0"]))
+
+    assert set(seer.candidates("p1")) == {HiddenWolf, Villager}
+    assert seer.known_camp("p2") == Camp.WEREWOLF
+    assert len(villager.candidates("p1")) == 4
+    assert 0.0 < seer.camp_probability("p4", Camp.WEREWOLF) < 1.0
+
+
+def test_votes_are_tallied() -> None:
+    """Test that visible votes are counted per voter and target."""
+    beliefs = BeliefTracker.from_game_state(_state([Villager, Werewolf, Villager]), "p0")
+    vote = _event(EventType.VOTE_CAST, {"voter_id": "p1", "target_id": "p2"})
+    beliefs.observe_all([vote, vote])
+
+    assert beliefs.vote_count("p1", "p2") == 2
+    assert beliefs.vote_count("p2", "p1") == 0
@@ -0,0 +1,102 @@
+from pathlib import Path
+from collections.abc import Callable
+
+import pytest
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.types import GamePhase
+from llm_werewolf.core.serialization import (
+    GameStateSnapshot,
+    CheckpointSnapshot,
+    load_checkpoint,
+    save_checkpoint,
+    save_game_state,
+    serialize_checkpoint,
+    load_game_state_snapshot,
+)
+from llm_werewolf.core.binary_snapshot import MAGIC, decode_snapshot, encode_snapshot
+
+
+@pytest.fixture
+def played_engine(new_game: Callable[..., GameEngine]) -> Callable[..., GameEngine]:
+    def play(steps: int = 6) -> GameEngine:
+        engine = new_game(12, seed=3)
+        for _ in range(steps):
+            engine.step()
+        return engine
+
+    return play
+
+
+def _checkpoint(engine: GameEngine) -> CheckpointSnapshot:
+    return serialize_checkpoint(
+        engine.game_state,
+        engine.event_logger.events,
+        engine.public_discussion_history,
+        engine.werewolf_discussion_history,
+    )
+
+
+def test_game_state_reads_back_from_both_formats(
+    played_engine: Callable[..., GameEngine], tmp_path: Path
+) -> None:
+    """Test that one loader reads JSON and binary files to the same snapshot."""
+    engine = played_engine()
+    save_game_state(engine.game_state, tmp_path / "state.json")
+    save_game_state(engine.game_state, tmp_path / "state.snap", binary=True)
+
+    from_json = load_game_state_snapshot(tmp_path / "state.json")
+    assert load_game_state_snapshot(tmp_path / "state.snap") == from_json
+    assert load_game_state_snapshot(tmp_path / "state.snap", validate=False) == from_json
+    assert (tmp_path / "state.snap").read_bytes().startswith(MAGIC)
+    assert (tmp_path / "state.snap").stat().st_size * 4 < (tmp_path / "state.json").stat().st_size
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_checkpoint_round_trip(
+    played_engine: Callable[..., GameEngine], tmp_path: Path, compress: bool
+) -> None:
+    """Test that a checkpoint with events and transcripts survives the binary format."""
+    checkpoint = _checkpoint(played_engine())
+    save_checkpoint(checkpoint, tmp_path / "checkpoint.snap", binary=True, compress=compress)
+
+    assert load_checkpoint(tmp_path / "checkpoint.snap") == checkpoint
+    fast = load_checkpoint(tmp_path / "checkpoint.snap", validate=False)
+    assert fast == checkpoint
+    assert fast.game_state.players[0] == checkpoint.game_state.players[0]
+
+
+def test_engine_resumes_from_binary_checkpoints(
+    played_engine: Callable[..., GameEngine],
+    resume_game: Callable[..., GameEngine],
+    tmp_path: Path,
+) -> None:
+    """Test that binary phase checkpoints can be resumed like JSON ones."""
+    engine = played_engine(steps=0)
+    engine.checkpoint_dir = tmp_path
+    engine.binary_checkpoints = True
+    engine.play_game()
+    original = [(e.event_type, e.message) for e in engine.get_events()]
+
+    checkpoints = sorted(tmp_path.glob("round-*.snap"))
+    assert checkpoints
+    assert not list(tmp_path.glob("*.json"))
+    day_checkpoint = next(p for p in checkpoints if p.name.endswith("day_discussion.snap"))
+
+    resumed = resume_game(engine.config, day_checkpoint)
+    assert resumed.game_state.phase == GamePhase.DAY_DISCUSSION
+    resumed.play_game()
+
+    assert [(e.event_type, e.message) for e in resumed.get_events()] == original
+
+
+def test_rejects_foreign_data(played_engine: Callable[..., GameEngine]) -> None:
+    """Test that wrong magic, versions and snapshot classes are reported."""
+    data = encode_snapshot(_checkpoint(played_engine(steps=1)).game_state)
+
+    with pytest.raises(ValueError, match="Not a binary snapshot"):
+        decode_snapshot(b"{}" + data, GameStateSnapshot)
+    with pytest.raises(ValueError, match="version"):
+        decode_snapshot(data[:4] + b"\x63" + data[5:], GameStateSnapshot)
+    with pytest.raises(ValueError, match="CheckpointSnapshot"):
+        decode_snapshot(data, CheckpointSnapshot)
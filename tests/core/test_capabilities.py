@@ -0,0 +1,79 @@
+from collections.abc import Callable
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.roles import (
+    Seer,
+    Elder,
+    Idiot,
+    Hunter,
+    Villager,
+    Werewolf,
+    AlphaWolf,
+    HiddenWolf,
+    BloodMoonApostle,
+)
+from llm_werewolf.core.types import EventType, Capability
+from llm_werewolf.core.player import Player
+from llm_werewolf.core.actions import SeerCheckAction
+from llm_werewolf.core.game_state import GameState
+
+
+def test_role_configs_declare_capabilities() -> None:
+    """Test that rule-relevant roles declare their capability flags."""
+    assert Capability.DEATH_SHOT in Hunter.get_shared_config().capabilities
+    assert Capability.DEATH_SHOT in AlphaWolf.get_shared_config().capabilities
+    assert Capability.APPEARS_AS_VILLAGER in HiddenWolf.get_shared_config().capabilities
+    assert Capability.SURVIVES_FIRST_VOTE in Idiot.get_shared_config().capabilities
+    assert Capability.EXECUTION_PENALTY in Elder.get_shared_config().capabilities
+    assert Capability.COUNTS_FOR_PARITY in Werewolf.get_shared_config().capabilities
+    assert Capability.COUNTS_FOR_PARITY not in BloodMoonApostle.get_shared_config().capabilities
+
+
+def test_table_tracks_transformation() -> None:
+    """Test that a transformed Blood Moon Apostle loses the disguise."""
+    apostle = Player("p1", "Apostle", BloodMoonApostle)
+    state = GameState([apostle, Player("p2", "Villager", Villager)])
+
+    assert state.capabilities.has(apostle, Capability.APPEARS_AS_VILLAGER)
+    assert not state.capabilities.has(apostle, Capability.COUNTS_FOR_PARITY)
+
+    apostle.role.transform()
+
+    assert not state.capabilities.has(apostle, Capability.APPEARS_AS_VILLAGER)
+    assert state.capabilities.has(apostle, Capability.COUNTS_FOR_PARITY)
+
+
+def test_table_tracks_idiot_reveal() -> None:
+    """Test that a revealed Idiot no longer survives a vote."""
+    idiot = Player("p1", "Idiot", Idiot)
+    state = GameState([idiot])
+
+    assert state.capabilities.has(idiot, Capability.SURVIVES_FIRST_VOTE)
+    idiot.role.reveal()
+    assert not state.capabilities.has(idiot, Capability.SURVIVES_FIRST_VOTE)
+
+
+def test_seer_sees_hidden_wolf_as_villager() -> None:
+    """Test that the Seer check reports disguised werewolves as villagers."""
+    seer = Player("p1", "Seer", Seer)
+    hidden = Player("p2", "Hidden", HiddenWolf)
+    wolf = Player("p3", "Wolf", Werewolf)
+    state = GameState([seer, hidden, wolf])
+
+    assert SeerCheckAction(seer, hidden, state).get_result() == "villager"
+    assert SeerCheckAction(seer, wolf, state).get_result() == "werewolf"
+
+
+def test_alpha_wolf_shoots_when_voted_out(quiet_engine: Callable[..., GameEngine]) -> None:
+    """Test that the Alpha Wolf uses its death shot."""
+    alpha = Player("p1", "Alpha", AlphaWolf)
+    villagers = [Player(f"p{i}", f"V{i}", Villager) for i in range(2, 6)]
+    engine = quiet_engine(state=GameState([alpha, *villagers]))
+
+    engine._eliminate_voted_player(alpha)
+    engine._handle_death_abilities()
+
+    revenge = engine.event_logger.get_events_by_type(EventType.HUNTER_REVENGE)
+    assert len(revenge) == 1
+    assert revenge[0].data["shooter_id"] == alpha.player_id
+    assert sum(not v.is_alive() for v in villagers) == 1
@@ -0,0 +1,95 @@
+from pathlib import Path
+from collections.abc import Callable
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.agent import LLMAgent
+from llm_werewolf.core.roles import Villager, AlphaWolf
+from llm_werewolf.core.types import GamePhase
+from llm_werewolf.core.player import Player
+from llm_werewolf.core.journal import EventJournal, JournalReader, read_journal
+from llm_werewolf.core.game_state import GameState
+from llm_werewolf.core.serialization import restore_game_state, serialize_game_state
+
+
+def test_resume_replays_the_rest_of_the_game(
+    new_game: Callable[..., GameEngine], resume_game: Callable[..., GameEngine], tmp_path: Path
+) -> None:
+    """Test that resuming from a mid-game checkpoint plays the same game."""
+    engine = new_game(seed=7, play=True, checkpoint_dir=tmp_path)
+    original = [(e.event_type, e.message) for e in engine.get_events()]
+
+    checkpoints = sorted(tmp_path.glob("round-*.json"))
+    assert checkpoints[0].name == "round-00-0-setup.json"
+    day_checkpoint = next(p for p in checkpoints if p.name.endswith("day_discussion.json"))
+
+    resumed = resume_game(engine.config, day_checkpoint)
+    assert resumed.game_state.phase == GamePhase.DAY_DISCUSSION
+    resumed.play_game()
+
+    assert [(e.event_type, e.message) for e in resumed.get_events()] == original
+    assert resumed.game_state.winner == engine.game_state.winner
+
+
+def test_resume_rewinds_the_journal(
+    new_game: Callable[..., GameEngine], resume_game: Callable[..., GameEngine], tmp_path: Path
+) -> None:
+    """Test that resuming into the same journal does not journal events twice."""
+    engine = new_game(
+        seed=7,
+        play=True,
+        checkpoint_dir=tmp_path / "checkpoints",
+        journal=EventJournal(tmp_path / "journal", max_bytes=4096),
+    )
+    engine.journal.close()
+    original = [(e.event_type, e.message) for e in engine.get_events()]
+
+    checkpoints = sorted((tmp_path / "checkpoints").glob("round-*.json"))
+    day_checkpoint = next(p for p in checkpoints if p.name.endswith("day_discussion.json"))
+    for name in ("journal", "fresh"):
+        resumed = resume_game(
+            engine.config, day_checkpoint, journal=EventJournal(tmp_path / name, max_bytes=4096)
+        )
+        resumed.play_game()
+        resumed.journal.close()
+
+        assert [(e.event_type, e.message) for e in read_journal(tmp_path / name)] == original
+        assert JournalReader(tmp_path / name).game_count == 1
+
+
+def test_checkpoint_restores_agent_memory(
+    new_game: Callable[..., GameEngine],
+    quiet_engine: Callable[..., GameEngine],
+    llm_agent: Callable[[str], LLMAgent],
+    tmp_path: Path,
+) -> None:
+    """Test that conversation and decisions of LLM agents survive a checkpoint."""
+    agents = [llm_agent(f"P{i}") for i in range(9)]
+    engine = new_game(agents)
+    agents[0].chat_history.append({"role": "user", "content": "Who is the wolf?"})
+    agents[0].add_decision("Round 1: Voted for P3")
+    engine.public_discussion_history.append("P1: hello")
+    engine.save_checkpoint(tmp_path / "checkpoint.json")
+
+    fresh = {f"player_{i + 1}": llm_agent(f"P{i}") for i in range(9)}
+    restored = quiet_engine(engine.config)
+    restored.load_checkpoint(tmp_path / "checkpoint.json", fresh)
+
+    assert fresh["player_1"].chat_history == [{"role": "user", "content": "Who is the wolf?"}]
+    assert fresh["player_1"].decision_history == ["Round 1: Voted for P3"]
+    assert fresh["player_2"].chat_history == []
+    assert restored.public_discussion_history.render() == "P1: hello"
+    assert len(restored.get_events()) == len(engine.get_events())
+
+
+def test_roles_with_display_names_round_trip() -> None:
+    """Test that roles whose display name differs from the registry key restore."""
+    alpha = Player("p1", "Alpha", AlphaWolf)
+    state = GameState([alpha, Player("p2", "Villager", Villager)])
+    state.sheriff_id = "p2"
+    state.sheriff_election_done = True
+
+    restored = restore_game_state(serialize_game_state(state))
+
+    assert isinstance(restored.get_player("p1").role, AlphaWolf)
+    assert restored.sheriff_id == "p2"
+    assert restored.sheriff_election_done
@@ -0,0 +1,109 @@
+import json
+from pathlib import Path
+from collections.abc import Callable
+
+import pytest
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.agent import LLMAgent
+from llm_werewolf.core.types import EventType
+from llm_werewolf.core.archive import GameArchive
+
+np = pytest.importorskip("numpy")
+
+from llm_werewolf.core.dataset import (  # noqa: E402
+    DECISION_COLUMNS,
+    DecisionDataset,
+    PromptShardWriter,
+    load_decisions,
+)
+
+
+def test_rows_follow_the_decision_events(
+    new_game: Callable[..., GameEngine], tmp_path: Path
+) -> None:
+    """Test that votes and werewolf votes become rows and survive the npz format."""
+    engine = new_game(seed=2, play=True)
+    dataset = DecisionDataset()
+    assert dataset.add_engine(engine) == 0
+
+    arrays = dataset.to_arrays()
+    assert set(arrays) == set(DECISION_COLUMNS)
+    events = engine.get_events()
+    votes = [e for e in events if e.event_type == EventType.VOTE_CAST]
+    assert np.count_nonzero(arrays["decision"] == "vote") == len(votes)
+    wolf_votes = sum(
+        len(e.data["votes"]) for e in events if e.event_type == EventType.WEREWOLF_KILLED
+    )
+    assert np.count_nonzero(arrays["decision"] == "werewolf_kill") == wolf_votes
+    assert set(np.unique(arrays["correct"])) <= {-1, 0, 1}
+    assert (arrays["prompt_tokens"] == -1).all()
+    assert np.isnan(arrays["latency_ms"]).all()
+
+    wolf_rows = arrays["decision"] == "werewolf_kill"
+    assert (arrays["role"][wolf_rows] != "").all()
+
+    dataset.save_npz(tmp_path / "decisions.npz")
+    loaded = load_decisions(tmp_path / "decisions.npz")
+    for name, array in arrays.items():
+        np.testing.assert_array_equal(loaded[name], array)
+
+
+def test_archive_export_matches_live_export(new_game: Callable[..., GameEngine]) -> None:
+    """Test that archived games export the same rows as the live engine."""
+    engine = new_game(seed=4, play=True)
+    live = DecisionDataset()
+    live.add_engine(engine, game=1)
+
+    archive = GameArchive()
+    archive.add_game(engine)
+    archived = DecisionDataset()
+    assert archived.add_archive(archive) == 1
+
+    expected = live.to_arrays()
+    for name, array in archived.to_arrays().items():
+        np.testing.assert_array_equal(array, expected[name])
+
+
+def test_usage_and_prompt_shards(
+    new_game: Callable[..., GameEngine], llm_agent: Callable[[str], LLMAgent], tmp_path: Path
+) -> None:
+    """Test that LLM usage reaches the rows and conversations reach the shards."""
+    agents = [llm_agent(f"P{i}") for i in range(6)]
+    engine = new_game(agents, seed=2, play=True)
+
+    dataset = DecisionDataset()
+    dataset.add_engine(engine)
+    arrays = dataset.to_arrays()
+    measured = arrays["prompt_tokens"] > 0
+    assert measured.any()
+    assert (arrays["prompt_tokens"][measured] % 100 == 0).all()
+    assert (arrays["latency_ms"][measured] >= 0).all()
+
+    with PromptShardWriter(tmp_path, shard_size=10) as writer:
+        written = writer.add_engine(engine, game=3)
+    assert written == sum(len(agent.chat_history) // 2 for agent in agents)
+
+    shards = sorted(tmp_path.glob("shard-*.jsonl"))
+    assert len(shards) == -(-written // 10)
+    records = [json.loads(line) for shard in shards for line in shard.read_text().splitlines()]
+    assert len(records) == written
+    assert records[0]["game"] == 3
+    assert records[0]["completion"] == "1"
+    assert records[0]["prompt"].endswith("Please respond in en-US.")
+
+
+def test_shard_writer_never_overwrites_existing_shards(tmp_path: Path) -> None:
+    """Test that numbering continues after the highest shard even when one is missing."""
+    (tmp_path / "shard-00000.jsonl").write_text("first\n")
+    (tmp_path / "shard-00002.jsonl").write_text("third\n")
+
+    with PromptShardWriter(tmp_path, shard_size=1) as writer:
+        writer.write({"n": 1})
+        writer.write({"n": 2})
+
+    assert (tmp_path / "shard-00000.jsonl").read_text() == "first\n"
+    assert (tmp_path / "shard-00002.jsonl").read_text() == "third\n"
+    assert not (tmp_path / "shard-00001.jsonl").exists()
+    assert json.loads((tmp_path / "shard-00003.jsonl").read_text()) == {"n": 1}
+    assert json.loads((tmp_path / "shard-00004.jsonl").read_text()) == {"n": 2}
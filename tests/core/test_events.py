@@ -1,6 +1,6 @@
 """Tests for core/events.py module."""
 
-from llm_werewolf.core.types import Event, EventType
+from llm_werewolf.core.types import Event, EventType, EventRecord
 from llm_werewolf.core.events import EventLogger
 
 
@@ -284,3 +284,107 @@ class TestEventLogger:
         recent = logger.get_recent_events(count=5)
         assert len(recent) == 5
         assert recent[-1].message == "Event 9"
+
+    def test_player_index_tracks_new_events(self) -> None:
+        """Test that a player's index stays current after the first query."""
+        logger = EventLogger()
+        logger.create_event(EventType.GAME_STARTED, 1, "setup", "Public")
+        assert len(logger.get_events_for_player("p1")) == 1
+
+        logger.create_event(EventType.WITCH_SAVED, 1, "night", "Private", visible_to=["p1"])
+        logger.create_event(EventType.WITCH_SAVED, 1, "night", "Other", visible_to=["p2"])
+        logger.create_event(EventType.PLAYER_DIED, 2, "day", "Public")
+
+        messages = [e.message for e in logger.get_events_for_player("p1")]
+        assert messages == ["Public", "Private", "Public"]
+
+    def test_queries_with_out_of_order_rounds(self) -> None:
+        """Test round filters when events are not logged in round order."""
+        logger = EventLogger()
+        logger.create_event(EventType.PLAYER_DIED, 2, "day", "Round 2")
+        logger.create_event(EventType.PLAYER_DIED, 1, "day", "Round 1")
+        logger.create_event(EventType.PLAYER_DIED, 3, "day", "Round 3")
+
+        assert [e.message for e in logger.get_events_by_type(EventType.PLAYER_DIED, 1)] == [
+            "Round 1"
+        ]
+        assert [e.message for e in logger.get_events_for_player("p1", since_round=2)] == [
+            "Round 2",
+            "Round 3",
+        ]
+
+    def test_query_results_are_views(self) -> None:
+        """Test that query results support sequence access without copying."""
+        logger = EventLogger()
+        for i in range(5):
+            logger.create_event(EventType.MESSAGE, i, "day", f"Message {i}")
+
+        recent = logger.get_recent_events(3)
+        assert recent[0].message == "Message 2"
+        assert recent[-1].message == "Message 4"
+        assert [e.message for e in recent[1:]] == ["Message 3", "Message 4"]
+        assert logger.get_events_by_round(4)[0].message == "Message 4"
+        assert len(logger.get_events_by_round(9)) == 0
+
+    def test_clear_events_resets_indexes(self) -> None:
+        """Test that clearing events also clears the indexes."""
+        logger = EventLogger()
+        logger.create_event(EventType.GAME_STARTED, 1, "setup", "Start")
+        assert len(logger.get_events_for_player("p1")) == 1
+
+        logger.clear_events()
+        logger.create_event(EventType.GAME_ENDED, 1, "ended", "End")
+
+        assert len(logger.get_events_by_type(EventType.GAME_STARTED)) == 0
+        assert [e.message for e in logger.get_events_for_player("p1")] == ["End"]
+
+
+class TestEventRecord:
+    """Tests for EventRecord class."""
+
+    def test_logger_creates_records(self) -> None:
+        """Test that the logger stores lightweight records."""
+        logger = EventLogger()
+        event = logger.create_event(EventType.MESSAGE, 1, "day", "Hello", visible_to=["p1"])
+
+        assert isinstance(event, EventRecord)
+        assert event.audience == frozenset({"p1"})
+        assert event.data == {}
+
+    def test_log_event_converts_models(self) -> None:
+        """Test that pydantic events are converted on the way in."""
+        logger = EventLogger()
+        model = Event(
+            event_type=EventType.GAME_STARTED, round_number=0, phase="setup", message="Go"
+        )
+        logger.log_event(model)
+
+        assert isinstance(logger.events[0], EventRecord)
+        assert logger.events[0] == model
+
+    def test_model_round_trip(self) -> None:
+        """Test conversion to and from the pydantic model."""
+        record = EventRecord(
+            EventType.PLAYER_DIED, 2, "night", "Alice died", data={"cause": "werewolf"}
+        )
+        model = record.to_model()
+
+        assert isinstance(model, Event)
+        assert model.data == {"cause": "werewolf"}
+        assert EventRecord.from_model(model) == record
+        assert EventRecord.from_dict(record.to_dict()) == record
+
+    def test_ids_and_phase_are_interned(self) -> None:
+        """Test that repeated phase names and player IDs share one string object."""
+        first = EventRecord(EventType.MESSAGE, 1, "day", "a", visible_to=["p1"])
+        second = EventRecord(EventType.MESSAGE, 1, "day", "b", visible_to=["p1"])
+
+        assert first.phase is second.phase
+        assert first.visible_to[0] is second.visible_to[0]
+
+    def test_model_json_timestamp(self) -> None:
+        """Test that the pydantic model serializes timestamps in ISO format."""
+        record = EventRecord(EventType.MESSAGE, 1, "day", "Hi")
+        payload = record.to_model().model_dump_json()
+
+        assert record.timestamp.isoformat() in payload
@@ -0,0 +1,97 @@
+from collections.abc import Callable
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.agent import DemoAgent
+from llm_werewolf.core.roles import Idiot, Lover, Witch, Villager, Werewolf, BloodMoonApostle
+from llm_werewolf.core.types import EventType, GamePhase, Capability
+from llm_werewolf.core.player import Player
+from llm_werewolf.core.game_state import GameState
+
+
+def test_fork_is_independent() -> None:
+    """Test that changes to a fork do not leak into the original game."""
+    witch = Player("p1", "Witch", Witch)
+    wolf = Player("p2", "Wolf", Werewolf)
+    villager = Player("p3", "Villager", Villager)
+    state = GameState([witch, wolf, villager])
+    state.next_phase()
+    state.votes["p1"] = "p2"
+
+    fork = state.fork()
+    fork_witch = fork.get_player("p1")
+    fork.get_player("p3").kill()
+    fork_witch.role.has_save_potion = False
+    fork.votes["p2"] = "p1"
+    fork.next_phase()
+
+    assert villager.is_alive()
+    assert witch.role.has_save_potion
+    assert state.votes == {"p1": "p2"}
+    assert state.phase == GamePhase.NIGHT
+    assert fork_witch is not witch
+    assert fork_witch.role.player is fork_witch
+    assert fork_witch.role.config is witch.role.config
+
+
+def test_fork_copies_role_state_and_tracks_its_own_changes() -> None:
+    """Test that role state is copied and the fork's tables follow the fork."""
+    apostle = Player("p1", "Apostle", BloodMoonApostle)
+    idiot = Player("p2", "Idiot", Idiot)
+    state = GameState([apostle, idiot])
+    idiot.role.reveal()
+
+    fork = state.fork()
+    fork_apostle = fork.get_player("p1")
+    assert fork.get_player("p2").role.revealed
+
+    fork_apostle.role.transform()
+    assert not fork.capabilities.has(fork_apostle, Capability.APPEARS_AS_VILLAGER)
+    assert state.capabilities.has(apostle, Capability.APPEARS_AS_VILLAGER)
+    assert not apostle.role.transformed
+
+
+def test_fork_clones_nested_roles() -> None:
+    """Test that a Lover's original role is cloned onto the forked player."""
+    player = Player("p1", "Lover", Lover)
+    player.role.original_role = Villager(player)
+
+    fork_player = GameState([player]).fork().get_player("p1")
+
+    assert fork_player.role.original_role is not player.role.original_role
+    assert fork_player.role.original_role.player is fork_player
+
+
+def test_fork_shares_event_history_prefix(quiet_engine: Callable[..., GameEngine]) -> None:
+    """Test that a fork reads old events from the parent and keeps new ones apart."""
+    state = GameState([Player("p1", "A", Villager), Player("p2", "B", Werewolf)])
+    engine = quiet_engine(state=state)
+    first = engine.event_logger.create_event(
+        event_type=EventType.MESSAGE, round_number=0, phase="setup", message="first"
+    )
+    state.record_event(first)
+
+    fork = state.fork()
+    second = engine.event_logger.create_event(
+        event_type=EventType.MESSAGE, round_number=0, phase="setup", message="second"
+    )
+    fork.record_event(second)
+
+    assert list(fork.event_history) == [first, second]
+    assert list(state.event_history) == [first]
+
+
+def test_engine_fork_plays_to_the_end_with_policies(new_game: Callable[..., GameEngine]) -> None:
+    """Test that a forked engine can finish the game without touching the original."""
+    engine = new_game()
+    agents = [p.agent for p in engine.game_state.players]
+    engine.step()
+
+    policies = {p.player_id: DemoAgent(name=p.name) for p in engine.game_state.players}
+    fork = engine.fork(policies)
+    fork.play_game()
+
+    assert fork.game_state.winner is not None
+    assert engine.game_state.winner is None
+    assert engine.game_state.round_number == 1
+    assert all(p.is_alive() for p in engine.game_state.players)
+    assert all(p.agent in agents for p in engine.game_state.players)
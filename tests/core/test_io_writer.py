@@ -0,0 +1,145 @@
+from pathlib import Path
+import threading
+from collections.abc import Callable
+
+import pytest
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.journal import EventJournal, read_journal
+from llm_werewolf.core.io_writer import BackgroundWriter
+from llm_werewolf.core.serialization import load_checkpoint
+
+
+class _RecordingSink:
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.gate = gate
+        self.calls: list[tuple[list[object], bool]] = []
+
+    def write_batch(self, items: list[object], sync: bool) -> None:
+        if self.gate is not None:
+            self.gate.wait()
+        self.calls.append((list(items), sync))
+
+    @property
+    def items(self) -> list[object]:
+        return [item for items, _ in self.calls for item in items]
+
+
+class _FailingSink:
+    def __init__(self, error: BaseException | None = None) -> None:
+        self.error = error or OSError("disk full")
+
+    def write_batch(self, items: list[object], sync: bool) -> None:
+        raise self.error
+
+
+def test_items_are_written_in_order_and_synced_on_flush() -> None:
+    """Test that batches keep queue order across sinks and a flush fsyncs them all."""
+    first, second = _RecordingSink(), _RecordingSink()
+    with BackgroundWriter(batch_size=4) as writer:
+        for i in range(10):
+            writer.submit(first if i % 3 else second, i)
+        writer.flush()
+        assert sorted(first.items + second.items) == list(range(10))
+        assert first.items == [i for i in range(10) if i % 3]
+        assert first.calls[-1][1]
+        assert second.calls[-1][1]
+        assert all(len(items) <= 4 for items, _ in first.calls)
+
+
+def test_full_queue_blocks_until_the_writer_catches_up() -> None:
+    """Test that submit applies backpressure instead of queueing without bound."""
+    gate = threading.Event()
+    sink = _RecordingSink(gate)
+    writer = BackgroundWriter(max_pending=2, batch_size=1)
+    producer = threading.Thread(target=lambda: [writer.submit(sink, i) for i in range(6)])
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()
+    assert writer.pending == 2
+
+    gate.set()
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    writer.close()
+    assert sink.items == list(range(6))
+
+
+def test_close_drains_and_reports_errors() -> None:
+    """Test that close writes what is queued and re-raises sink errors."""
+    gate = threading.Event()
+    sink = _RecordingSink(gate)
+    writer = BackgroundWriter()
+    for i in range(50):
+        writer.submit(sink, i)
+    writer.submit(_FailingSink(), "lost")
+    gate.set()
+    with pytest.raises(RuntimeError, match="disk full"):
+        writer.close()
+    assert sink.items == list(range(50))
+
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.submit(sink, 50)
+    writer.close()
+
+
+def test_any_sink_error_leaves_the_writer_running() -> None:
+    """Test that an unexpected sink exception is reported without stopping the thread."""
+    sink = _RecordingSink()
+    with BackgroundWriter() as writer:
+        writer.submit(_FailingSink(KeyError("missing")), "lost")
+        with pytest.raises(RuntimeError, match="missing"):
+            writer.flush()
+
+        writer.submit(sink, 1)
+        writer.flush()
+    assert sink.items == [1]
+
+
+def test_dead_writer_thread_fails_instead_of_hanging() -> None:
+    """Test that flush, submit and close raise once the writer thread has died."""
+    writer = BackgroundWriter(max_pending=1)
+    writer.submit(_FailingSink(SystemExit(3)), "fatal")
+
+    with pytest.raises(RuntimeError, match="died"):
+        writer.flush()
+    with pytest.raises(RuntimeError, match="died"):
+        writer.submit(_RecordingSink(), 0)
+    with pytest.raises(RuntimeError, match="died"):
+        writer.close()
+
+
+def test_engine_shares_the_writer_with_the_journal(
+    new_game: Callable[..., GameEngine], resume_game: Callable[..., GameEngine], tmp_path: Path
+) -> None:
+    """Test that checkpoints and the journal written off-thread match a direct run."""
+    runs = {}
+    for name in ("direct", "background"):
+        writer = BackgroundWriter() if name == "background" else None
+        runs[name] = new_game(
+            seed=5,
+            play=True,
+            checkpoint_dir=tmp_path / name / "checkpoints",
+            delta_checkpoints=3,
+            io_writer=writer,
+            journal=EventJournal(tmp_path / name / "journal", writer=writer),
+        )
+
+    background = runs["background"]
+    last = sorted((tmp_path / "direct" / "checkpoints").iterdir())[-1]
+    resumed = resume_game(
+        background.config,
+        tmp_path / "background" / "checkpoints" / last.name,
+        io_writer=background.io_writer,
+    )
+    expected = load_checkpoint(last).game_state
+    assert resumed.game_state.phase == expected.phase
+    assert resumed.game_state.round_number == expected.round_number
+
+    background.journal.close()
+    background.io_writer.close()
+    runs["direct"].journal.close()
+
+    names = {path.name for path in (tmp_path / "direct" / "checkpoints").iterdir()}
+    assert {path.name for path in (tmp_path / "background" / "checkpoints").iterdir()} == names
+    assert list(read_journal(tmp_path / "background" / "journal")) == list(background.get_events())
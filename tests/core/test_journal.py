@@ -0,0 +1,152 @@
+import random
+from pathlib import Path
+from collections.abc import Callable
+
+import pytest
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.types import EventType, GamePhase, EventRecord
+from llm_werewolf.core.journal import (
+    INDEX_NAME,
+    EventJournal,
+    JournalReader,
+    read_journal,
+    list_segments,
+)
+
+
+def _event(index: int) -> EventRecord:
+    return EventRecord(
+        event_type=EventType.MESSAGE,
+        round_number=1,
+        phase="night",
+        message=f"message {index}",
+        data={"index": index, "text": "狼人"},
+    )
+
+
+@pytest.fixture
+def play_games(new_game: Callable[..., GameEngine]) -> Callable[..., list[list[EventRecord]]]:
+    def play(journal: EventJournal, games: int) -> list[list[EventRecord]]:
+        return [list(new_game(play=True, journal=journal).get_events()) for _ in range(games)]
+
+    return play
+
+
+def test_engine_journals_every_event(new_game: Callable[..., GameEngine], tmp_path: Path) -> None:
+    """Test that a journal attached to the engine holds the full transcript."""
+    engine = new_game(play=True, journal=EventJournal(tmp_path))
+    engine.journal.close()
+
+    assert list(read_journal(tmp_path)) == list(engine.get_events())
+
+
+def test_rotation_and_resume(tmp_path: Path) -> None:
+    """Test that full segments rotate and a reopened journal appends after them."""
+    with EventJournal(tmp_path, max_bytes=512) as journal:
+        for i in range(20):
+            journal.append(_event(i))
+        journal.sync()
+        assert journal.path != list_segments(tmp_path)[0]
+
+    segment_count = len(list_segments(tmp_path))
+    assert segment_count > 1
+
+    with EventJournal(tmp_path, max_bytes=512) as journal:
+        journal.append(_event(20))
+
+    assert len(list_segments(tmp_path)) >= segment_count
+    assert [event.data["index"] for event in read_journal(tmp_path)] == list(range(21))
+
+
+def test_torn_last_line_is_skipped(tmp_path: Path) -> None:
+    """Test that a partly written line left by a crash is ignored on read."""
+    with EventJournal(tmp_path) as journal:
+        journal.append(_event(0))
+    with list_segments(tmp_path)[-1].open("ab") as file:
+        file.write(b'{"event_type": "mess')
+
+    assert [event.message for event in read_journal(tmp_path)] == ["message 0"]
+
+
+def test_reopening_cuts_off_a_torn_line(
+    play_games: Callable[..., list[list[EventRecord]]], tmp_path: Path
+) -> None:
+    """Test that a journal reopened after a crash appends after its last whole line."""
+    random.seed(12)
+    with EventJournal(tmp_path) as journal:
+        games = play_games(journal, 1)
+    with list_segments(tmp_path)[-1].open("ab") as file:
+        file.write(b'{"event_type": "mess')
+
+    with EventJournal(tmp_path) as journal:
+        games += play_games(journal, 1)
+
+    flat = [event for game in games for event in game]
+    assert list(read_journal(tmp_path)) == flat
+    reader = JournalReader(tmp_path)
+    assert reader.game_count == 2
+    assert list(reader.events(game=1)) == games[1]
+
+
+def test_closed_journal_rejects_events(tmp_path: Path) -> None:
+    """Test that appending after close fails instead of losing the event."""
+    journal = EventJournal(tmp_path)
+    journal.close()
+    journal.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        journal.append(_event(0))
+
+
+def test_reader_seeks_to_game_round_and_phase(
+    play_games: Callable[..., list[list[EventRecord]]], tmp_path: Path
+) -> None:
+    """Test that the reader streams from the first event of a game, round or phase."""
+    random.seed(11)
+    with EventJournal(tmp_path, max_bytes=4096) as journal:
+        games = play_games(journal, 3)
+    reader = JournalReader(tmp_path)
+    flat = [event for game in games for event in game]
+
+    assert reader.game_count == 3
+    assert list(reader.events(game=1)) == flat[len(games[0]) :]
+
+    start = next(
+        i for i, event in enumerate(games[2]) if event.phase == GamePhase.DAY_VOTING.value
+    )
+    round_number = games[2][start].round_number
+    assert list(reader.events(2, round_number, GamePhase.DAY_VOTING)) == games[2][start:]
+    assert reader.seek(2, round_number, "day_voting").segment > 0
+
+    with pytest.raises(ValueError, match="no events"):
+        reader.seek(3)
+
+
+def test_lost_index_entries_are_rebuilt(
+    play_games: Callable[..., list[list[EventRecord]]], tmp_path: Path
+) -> None:
+    """Test that a missing or torn index is rebuilt from the segments."""
+    with EventJournal(tmp_path) as journal:
+        play_games(journal, 2)
+    positions = JournalReader(tmp_path).positions
+
+    index = tmp_path / INDEX_NAME
+    index.write_bytes(index.read_bytes()[:-30])
+    assert JournalReader(tmp_path).positions == positions
+
+    index.unlink()
+    assert JournalReader(tmp_path).positions == positions
+    EventJournal(tmp_path).close()
+    assert index.exists()
+
+    with EventJournal(tmp_path) as journal:
+        journal.append(_event(0))
+        journal.append(
+            EventRecord(
+                event_type=EventType.MESSAGE, round_number=9, phase="night", message="message 1"
+            )
+        )
+    reader = JournalReader(tmp_path)
+    assert reader.game_count == 2
+    assert [event.message for event in reader.events(1, 9, "night")] == ["message 1"]
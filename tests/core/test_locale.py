@@ -1,6 +1,11 @@
 """Tests for core/locale.py module."""
 
-from llm_werewolf.core.locale import Locale
+from types import SimpleNamespace
+
+import pytest
+
+from llm_werewolf.core.types import Camp
+from llm_werewolf.core.locale import Locale, Catalog, Template, get_catalog
 
 
 class TestLocale:
@@ -153,3 +158,73 @@ class TestLocale:
 
         message = locale.get("game_started", player_count=10)
         assert "10" in message
+
+
+class TestCatalog:
+    """Tests for compiled, shared message catalogs."""
+
+    def test_catalog_is_shared_per_language(self) -> None:
+        """Test that locales in the same language share one catalog."""
+        first = Locale("zh-CN")
+        second = Locale("zh-CN")
+        assert first.messages is second.messages
+        assert get_catalog("zh-CN") is get_catalog("zh-CN")
+
+    def test_set_language_does_not_affect_other_locales(self) -> None:
+        """Test that switching one locale leaves others on their language."""
+        first = Locale("en-US")
+        second = Locale("en-US")
+        first.set_language("zh-TW")
+        assert second.get("voting_phase") == "Voting Phase"
+
+    def test_messages_are_read_only(self) -> None:
+        """Test that shared message tables cannot be modified through a locale."""
+        locale = Locale("en-US")
+        with pytest.raises(TypeError):
+            locale.messages["voting_phase"] = "changed"  # type: ignore[index]
+
+    def test_template_fields(self) -> None:
+        """Test that templates record their placeholders."""
+        template = Template("{player1} and {player2} are lovers")
+        assert template.fields == {"player1", "player2"}
+        assert template.format({"player1": "A", "player2": "B"}) == "A and B are lovers"
+
+    def test_template_keeps_percent_signs(self) -> None:
+        """Test that literal percent signs survive compilation."""
+        template = Template("{player} has 100% certainty")
+        assert template.format({"player": "Alice"}) == "Alice has 100% certainty"
+
+    def test_template_with_format_spec(self) -> None:
+        """Test that templates with format specs still render."""
+        template = Template("{rate:.1%} win rate")
+        assert template.format({"rate": 0.5}) == "50.0% win rate"
+
+    def test_template_renders_like_str_format(self) -> None:
+        """Test that enum values and attribute fields render as ``str.format`` does."""
+        assert Template("{camp} wins").format({"camp": Camp.WEREWOLF}) == "werewolf wins"
+        player = SimpleNamespace(name="Ann")
+        assert Template("{player.name} died").format({"player": player}) == "Ann died"
+
+    def test_missing_argument_returns_the_template(self) -> None:
+        """Test that a message with a missing argument is returned unformatted."""
+        locale = Locale("en-US")
+        assert locale.get("player_died", player="Ann") != locale.messages["player_died"]
+        assert locale.get("player_died") == locale.messages["player_died"]
+
+    def test_validate_rejects_missing_keys(self) -> None:
+        """Test that a catalog missing keys fails validation."""
+        schema = Catalog("en-US", {"a": "A {x}", "b": "B"})
+        with pytest.raises(ValueError, match="missing"):
+            Catalog("xx", {"a": "A {x}"}).validate(schema)
+
+    def test_validate_rejects_placeholder_mismatch(self) -> None:
+        """Test that a catalog with different placeholders fails validation."""
+        schema = Catalog("en-US", {"a": "A {x}"})
+        with pytest.raises(ValueError, match="placeholders"):
+            Catalog("xx", {"a": "A {y}"}).validate(schema)
+
+    def test_all_languages_validate(self) -> None:
+        """Test that every shipped language matches the English schema."""
+        schema = get_catalog("en-US")
+        for language in Locale.MESSAGES:
+            get_catalog(language).validate(schema)
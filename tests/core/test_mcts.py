@@ -0,0 +1,151 @@
+import random
+from collections import Counter
+from collections.abc import Callable
+
+import pytest
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.mcts import (
+    SKIP,
+    Knowledge,
+    rollout,
+    answer_for,
+    parse_options,
+    collect_knowledge,
+    assign_hidden_roles,
+)
+from llm_werewolf.core.agent import DemoAgent, MCTSAgent, create_agent
+from llm_werewolf.core.roles import Seer, Villager, Werewolf
+from llm_werewolf.core.types import Camp
+from llm_werewolf.core.config import PlayerConfig
+from llm_werewolf.core.player import Player
+from llm_werewolf.core.victory import VictoryChecker
+from llm_werewolf.core.game_state import GameState
+from llm_werewolf.core.action_selector import ActionSelector
+
+
+@pytest.fixture
+def search_game(new_game: Callable[..., GameEngine]) -> Callable[[MCTSAgent], GameEngine]:
+    def create(search_agent: MCTSAgent) -> GameEngine:
+        return new_game([search_agent] + [DemoAgent(name=f"P{i}") for i in range(1, 9)])
+
+    return create
+
+
+def test_prompt_options_round_trip() -> None:
+    """Test that options are read from and answered in ActionSelector prompts."""
+    targets = [Player("p1", "Alice", Villager), Player("p2", "Bob", Villager)]
+    prompt = ActionSelector.build_target_selection_prompt(
+        "Guard", "Protect a player", targets, allow_skip=True
+    )
+
+    assert parse_options(prompt) == ["p1", "p2", SKIP]
+    assert answer_for(prompt, "p2") == "2"
+    assert answer_for(prompt, SKIP) == "3"
+    assert answer_for(prompt, "p9") is None
+
+    question = ActionSelector.build_yes_no_prompt("Witch", "Save Alice?")
+    assert parse_options(question) == ["YES", "NO"]
+    assert parse_options("Give a campaign speech.") == []
+
+
+def test_hidden_roles_respect_knowledge() -> None:
+    """Test that sampled deals keep known roles, known camps and the role pool."""
+    roles = [Seer, Werewolf, Werewolf, Villager, Villager, Villager]
+    state = GameState([Player(f"p{i}", f"P{i}", role) for i, role in enumerate(roles)])
+    knowledge = Knowledge(player_id="p0", roles={"p0": Seer}, camps={"p3": Camp.WEREWOLF})
+    pool = Counter(type(p.role) for p in state.players)
+
+    for seed in range(20):
+        fork = state.fork()
+        assign_hidden_roles(fork, knowledge, random.Random(seed))  # noqa: S311
+
+        assert isinstance(fork.get_player("p0").role, Seer)
+        assert isinstance(fork.get_player("p3").role, Werewolf)
+        assert Counter(type(p.role) for p in fork.players) == pool
+        assert all(p.role.player is p for p in fork.players)
+
+
+def test_fork_tallies_follow_the_hidden_role_deal(
+    search_game: Callable[[MCTSAgent], GameEngine],
+) -> None:
+    """Test that a fork's victory tallies count reassigned players by their dealt role."""
+    engine = search_game(MCTSAgent(name="Search", rollouts=2))
+    knowledge = collect_knowledge(engine, "player_1")
+    tallies = ("_alive_count", "_werewolf_count", "_parity_werewolf_count", "_villager_count")
+
+    for seed in range(20):
+        sim = engine.fork()
+        assign_hidden_roles(sim.game_state, knowledge, random.Random(seed))  # noqa: S311
+        # Villagers dealt a wolf role: killing them must lower the wolf tally
+        for player, original in zip(
+            sim.game_state.players, engine.game_state.players, strict=True
+        ):
+            if player.get_camp() == "werewolf" != original.get_camp():
+                player.kill()
+
+        fresh = VictoryChecker(sim.game_state)
+        assert [getattr(sim.victory_checker, name) for name in tallies] == [
+            getattr(fresh, name) for name in tallies
+        ]
+        assert sim.victory_checker.check_victory() == fresh.check_victory()
+
+
+def test_knowledge_of_a_werewolf_includes_the_pack(
+    search_game: Callable[[MCTSAgent], GameEngine],
+) -> None:
+    """Test that a werewolf's information set contains its teammates."""
+    engine = search_game(MCTSAgent(name="Search", rollouts=2))
+    wolf = next(p for p in engine.game_state.players if p.get_camp() == "werewolf")
+
+    knowledge = collect_knowledge(engine, wolf.player_id)
+
+    wolves = {p.player_id for p in engine.game_state.players if p.get_camp() == "werewolf"}
+    assert wolves <= knowledge.roles.keys()
+    assert len(knowledge.roles) == len(wolves)
+
+
+def test_rollout_leaves_the_game_untouched(search_game: Callable[[MCTSAgent], GameEngine]) -> None:
+    """Test that rollouts play on forks and return a reward."""
+    engine = search_game(MCTSAgent(name="Search", rollouts=2))
+    engine.step()
+    knowledge = collect_knowledge(engine, "player_1")
+    roles_before = [type(p.role) for p in engine.game_state.players]
+
+    rng = random.Random(0)  # noqa: S311
+    rewards = {rollout(engine, knowledge, "YES", rng) for _ in range(5)}
+
+    assert rewards <= {0.0, 0.5, 1.0}
+    assert [type(p.role) for p in engine.game_state.players] == roles_before
+    assert all(p.is_alive() for p in engine.game_state.players)
+    assert engine.game_state.winner is None
+
+
+def test_seeded_rollouts_are_reproducible(search_game: Callable[[MCTSAgent], GameEngine]) -> None:
+    """Test that a seeded rollout replays the same game and keeps the global RNG intact."""
+    engine = search_game(MCTSAgent(name="Search", rollouts=2))
+    engine.step()
+    knowledge = collect_knowledge(engine, "player_1")
+
+    runs = []
+    for noise in (1, 2):
+        random.seed(noise)
+        before = random.getstate()
+        rng = random.Random(7)  # noqa: S311
+        runs.append([rollout(engine, knowledge, "YES", rng) for _ in range(12)])
+        assert random.getstate() == before
+
+    assert runs[0] == runs[1]
+
+
+def test_search_agent_plays_a_full_game(search_game: Callable[[MCTSAgent], GameEngine]) -> None:
+    """Test that an MCTS agent created from config finishes a game."""
+    config = PlayerConfig(name="Search", model="mcts", rollouts=4)
+    agent = create_agent(config)
+    assert isinstance(agent, MCTSAgent)
+    assert agent.rollouts == 4
+
+    engine = search_game(agent)
+    engine.play_game()
+
+    assert engine.game_state.winner is not None
@@ -75,3 +75,34 @@ def test_player_public_info() -> None:
     assert info.name == "Bob"
     assert info.is_alive
     assert info.ai_model == "gpt-4"
+
+
+def test_player_statuses_property() -> None:
+    """Test that statuses are exposed as a set and can be replaced."""
+    player = Player("p1", "Alice", Villager)
+    player.make_sheriff()
+    player.kill()
+
+    assert player.statuses == {PlayerStatus.DEAD, PlayerStatus.SHERIFF}
+    assert PlayerStatus.ALIVE not in player.statuses
+
+    player.statuses = {PlayerStatus.ALIVE, PlayerStatus.LOVER}
+    assert player.is_lover()
+    assert not player.is_sheriff()
+    assert player.get_public_info().statuses == {PlayerStatus.ALIVE, PlayerStatus.LOVER}
+
+
+def test_player_and_role_are_slotted() -> None:
+    """Test that players and roles have no per-instance dict."""
+    player = Player("p1", "Alice", Werewolf)
+
+    assert not hasattr(player, "__dict__")
+    assert not hasattr(player.role, "__dict__")
+
+
+def test_role_config_is_shared() -> None:
+    """Test that players with the same role share one config instance."""
+    first = Player("p1", "Alice", Werewolf)
+    second = Player("p2", "Bob", Werewolf)
+
+    assert first.role.config is second.role.config
@@ -0,0 +1,72 @@
+from collections.abc import Callable
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.roles import Seer, Villager, Werewolf
+from llm_werewolf.core.types import GamePhase
+from llm_werewolf.core.player import Player
+from llm_werewolf.core.game_state import GameState
+
+
+def _make_state() -> GameState:
+    players = [
+        Player("p1", "Alice", Seer),
+        Player("p2", "Bob", Werewolf),
+        Player("p3", "Carol", Villager),
+        Player("p4", "Dave", Villager),
+    ]
+    state = GameState(players)
+    state.round_number = 1
+    state.set_phase(GamePhase.DAY_DISCUSSION)
+    return state
+
+
+def test_snapshot_is_shared_within_a_phase() -> None:
+    """Test that the public context is built once per phase."""
+    state = _make_state()
+
+    context = state.get_public_context()
+    assert state.get_public_context() is context
+    assert context.alive_names == ("Alice", "Bob", "Carol", "Dave")
+    assert context.night_deaths_text() == "No one died last night."
+
+    state.next_phase()
+    assert state.get_public_context() is not context
+
+
+def test_snapshot_is_rebuilt_after_a_death() -> None:
+    """Test that deaths and revivals invalidate the public context."""
+    state = _make_state()
+    context = state.get_public_context()
+
+    carol = state.get_player("p3")
+    carol.kill()
+    state.night_deaths.add(carol.player_id)
+
+    after_death = state.get_public_context()
+    assert after_death is not context
+    assert after_death.alive_text == "Alice, Bob, Dave"
+    assert after_death.night_deaths_text(":") == "Last night: Carol died."
+
+    carol.revive()
+    assert "Carol" in state.get_public_context().alive_names
+
+
+def test_prompts_use_the_snapshot(quiet_engine: Callable[..., GameEngine]) -> None:
+    """Test that discussion and voting prompts keep their public section."""
+    engine = quiet_engine(state=_make_state())
+    dave = engine.game_state.get_player("p4")
+    dave.kill()
+    engine.game_state.night_deaths.add(dave.player_id)
+    engine.public_discussion_history.append("Alice: I trust Carol.")
+    alice = engine.game_state.get_player("p1")
+
+    discussion = engine._build_discussion_context(alice)
+    assert "Round 1 - Day Discussion Phase" in discussion
+    assert "Last night, Dave died.\n\nAlive players: Alice, Bob, Carol" in discussion
+    assert "Previous discussion:\nAlice: I trust Carol." in discussion
+
+    engine.game_state.next_phase()
+    voting = engine._build_voting_context(alice)
+    assert "Round 1 - Voting Phase" in voting
+    assert "Last night: Dave died." in voting
+    assert voting == engine._build_voting_context(alice, engine._get_public_discussion_context())
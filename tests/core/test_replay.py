@@ -0,0 +1,111 @@
+import random
+from typing import ClassVar
+from pathlib import Path
+from collections.abc import Callable
+
+import pytest
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.agent import DemoAgent
+from llm_werewolf.core.config import create_game_config_from_player_count
+from llm_werewolf.core.replay import Cassette, load_cassette, save_cassette
+from llm_werewolf.core.journal import EventJournal
+
+
+class _FlakyAgent(DemoAgent):
+    # Calls made by all flaky agents; demo agents are asked only a few times each
+    calls: ClassVar[list[int]] = [0]
+
+    def get_response(self, message: str) -> str:
+        self.calls[0] += 1
+        if self.calls[0] % 3 == 0:
+            msg = f"timeout on call {self.calls[0]}"
+            raise TimeoutError(msg)
+        return super().get_response(message)
+
+
+@pytest.fixture
+def record(quiet_engine: Callable[..., GameEngine]) -> Callable[..., tuple[Cassette, GameEngine]]:
+    def play(
+        journal: EventJournal, seed: int, agent_cls: type[DemoAgent] = DemoAgent
+    ) -> tuple[Cassette, GameEngine]:
+        engine = quiet_engine(create_game_config_from_player_count(9))
+        engine.journal = journal
+        agents = [agent_cls(name=f"P{i}") for i in range(engine.config.num_players)]
+        cassette = engine.setup_recorded_game(agents, seed=seed)
+        engine.play_game()
+        return cassette, engine
+
+    return play
+
+
+def test_replay_reproduces_journaled_games(
+    record: Callable[..., tuple[Cassette, GameEngine]], tmp_path: Path
+) -> None:
+    """Test that each cassette replays its game from the journal exactly."""
+    journal = EventJournal(tmp_path / "journal")
+    recorded = [record(journal, seed) for seed in (7, 8)]
+    journal.close()
+
+    for game, (cassette, engine) in enumerate(recorded):
+        assert any(seat.responses for seat in cassette.players)
+        state = random.getstate()
+        result = GameEngine.replay(cassette, tmp_path / "journal", game=game)
+        assert random.getstate() == state
+        assert result.matched, result.divergence and result.divergence.describe()
+        assert [e.message for e in result.events] == [e.message for e in engine.get_events()]
+
+
+def test_changed_responses_are_reported(
+    record: Callable[..., tuple[Cassette, GameEngine]], tmp_path: Path
+) -> None:
+    """Test that edited or missing responses show up as a divergence or an error."""
+    journal = EventJournal(tmp_path)
+    cassette, engine = record(journal, seed=3)
+    journal.close()
+    events = engine.get_events()
+
+    edited = cassette.model_copy(deep=True)
+    seat = next(seat for seat in edited.players if len(seat.responses) > 1)
+    seat.responses[0] = "a response that was never given"
+    result = GameEngine.replay(edited, events)
+    assert not result.matched
+    assert result.divergence is not None
+    assert "recorded:" in result.divergence.describe()
+
+    truncated = cassette.model_copy(deep=True)
+    truncated.players[0].responses = []
+    result = GameEngine.replay(truncated, events)
+    assert result.error is not None
+    assert truncated.players[0].name in result.error
+    assert result.divergence is not None
+
+
+def test_failed_calls_replay_as_failures(
+    record: Callable[..., tuple[Cassette, GameEngine]], tmp_path: Path
+) -> None:
+    """Test that agent errors are recorded and raised again at the same calls."""
+    journal = EventJournal(tmp_path)
+    cassette, engine = record(journal, seed=4, agent_cls=_FlakyAgent)
+    journal.close()
+
+    errors = [error for seat in cassette.players for error in seat.errors.values()]
+    assert errors
+    assert all(error.startswith("timeout on call") for error in errors)
+
+    loaded = Cassette.model_validate_json(cassette.model_dump_json())
+    result = GameEngine.replay(loaded, engine.get_events())
+    assert result.matched, result.divergence and result.divergence.describe()
+    assert result.error is None
+
+
+def test_cassette_round_trip(
+    record: Callable[..., tuple[Cassette, GameEngine]], tmp_path: Path
+) -> None:
+    """Test that a saved cassette loads back unchanged and still replays."""
+    cassette, engine = record(EventJournal(tmp_path / "journal"), seed=5)
+    save_cassette(cassette, tmp_path / "game.cassette.json")
+
+    loaded = load_cassette(tmp_path / "game.cassette.json")
+    assert loaded == cassette
+    assert GameEngine.replay(loaded, engine.get_events()).matched
@@ -0,0 +1,97 @@
+from pathlib import Path
+from collections.abc import Callable
+
+import pytest
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.types import GamePhase
+from llm_werewolf.core.serialization import (
+    DELTA_SUFFIX,
+    CheckpointChain,
+    CheckpointDelta,
+    load_checkpoint,
+)
+from llm_werewolf.core.snapshot_delta import apply_delta, diff_values
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ({"a": 1, "b": [1, 2]}, {"a": 1, "b": [1, 2, 3]}),
+        ({"a": None, "b": {"x": True}}, {"a": "p1", "c": 0}),
+        (
+            [{"alive": True}, {"alive": True}, {"alive": True}],
+            [{"alive": True}, {}, {"alive": True}],
+        ),
+        ([1, 2, 3], [3, 2]),
+        ("night", "day_voting"),
+    ],
+)
+def test_apply_reverses_diff(old: object, new: object) -> None:
+    """Test that applying a delta turns the old value into the new one."""
+    delta = diff_values(old, new)
+    assert apply_delta(old, delta) == new
+    assert diff_values(new, new) is None
+
+
+def test_appends_and_changed_fields_only() -> None:
+    """Test that growing lists and single fields do not repeat unchanged data."""
+    old = {"events": [{"n": i} for i in range(100)], "players": [{"alive": True}] * 9}
+    new = {
+        "events": [*old["events"], {"n": 100}],
+        "players": [*old["players"][:4], {"alive": False}, *old["players"][5:]],
+    }
+    delta = diff_values(old, new)
+    assert delta == {
+        "*": {
+            "events": {"+": [{"n": 100}]},
+            "players": {"*": {"4": {"*": {"alive": {"=": False}}}}},
+        }
+    }
+    assert old["events"][-1] == {"n": 99}
+
+
+def _without_timestamps(path: Path) -> dict[str, object]:
+    payload = load_checkpoint(path).model_dump()
+    for event in payload["events"]:
+        event.pop("timestamp")
+    return payload
+
+
+def test_engine_writes_delta_chains(
+    new_game: Callable[..., GameEngine], resume_game: Callable[..., GameEngine], tmp_path: Path
+) -> None:
+    """Test that deltas rebuild the same checkpoints as full files and resume the game."""
+    engine = new_game(seed=11, play=True, checkpoint_dir=tmp_path / "deltas", delta_checkpoints=4)
+    new_game(seed=11, play=True, checkpoint_dir=tmp_path / "full", delta_checkpoints=1)
+    original = [(e.event_type, e.message) for e in engine.get_events()]
+
+    deltas = sorted((tmp_path / "deltas").glob(f"*{DELTA_SUFFIX}"))
+    full = sorted((tmp_path / "full").glob("round-*.json"))
+    assert deltas
+    written = list((tmp_path / "deltas").glob("round-*.json"))
+    assert len(written) == len(full)
+    for path in full:
+        stem = path.name.removesuffix(".json")
+        delta_path = tmp_path / "deltas" / f"{stem}{DELTA_SUFFIX}"
+        rebuilt = delta_path if delta_path.exists() else tmp_path / "deltas" / path.name
+        assert _without_timestamps(rebuilt) == _without_timestamps(path)
+        if delta_path.exists():
+            assert delta_path.stat().st_size * 2 < path.stat().st_size
+
+    day_delta = next(p for p in deltas if p.name.endswith(f"day_discussion{DELTA_SUFFIX}"))
+    resumed = resume_game(engine.config, day_delta)
+    assert resumed.game_state.phase == GamePhase.DAY_DISCUSSION
+    resumed.play_game()
+    assert [(e.event_type, e.message) for e in resumed.get_events()] == original
+
+
+def test_chain_rejects_bad_input(tmp_path: Path) -> None:
+    """Test that intervals below one and looping chains are refused."""
+    with pytest.raises(ValueError, match="at least 1"):
+        CheckpointChain(base_interval=0)
+
+    looping = tmp_path / f"loop{DELTA_SUFFIX}"
+    looping.write_text(CheckpointDelta(parent=looping.name).model_dump_json())
+    with pytest.raises(ValueError, match="does not end"):
+        load_checkpoint(looping)
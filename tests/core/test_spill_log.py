@@ -0,0 +1,104 @@
+"""Tests for core/spill_log.py module."""
+
+import pytest
+
+from llm_werewolf.core.types import EventType, EventRecord
+from llm_werewolf.core.events import EventLogger
+from llm_werewolf.core.spill_log import PAGE_SIZE, create_text_log, create_event_log
+
+
+class TestSpillLog:
+    """Tests for SpillLog class."""
+
+    def test_small_log_stays_in_memory(self) -> None:
+        """Test that nothing is spilled while the window has room."""
+        log = create_text_log(window=4)
+        log.extend(["a", "b", "c"])
+
+        assert log.spilled_count == 0
+        assert list(log) == ["a", "b", "c"]
+        assert log == ["a", "b", "c"]
+
+    def test_spilled_items_are_paged_back(self) -> None:
+        """Test that items older than the window can still be read."""
+        log = create_text_log(window=3)
+        lines = [f"line {i}\nwith newline" for i in range(PAGE_SIZE * 2 + 5)]
+        log.extend(lines)
+
+        assert len(log) == len(lines)
+        assert log.spilled_count == len(lines) - 3
+        assert log[0] == lines[0]
+        assert log[PAGE_SIZE + 1] == lines[PAGE_SIZE + 1]
+        assert log[-1] == lines[-1]
+        assert log[-4] == lines[-4]
+        assert log[2:6] == lines[2:6]
+        assert list(log) == lines
+        assert "\n".join(log) == "\n".join(lines)
+
+    def test_reads_between_appends(self) -> None:
+        """Test that a cached page is refreshed when more items are spilled into it."""
+        log = create_text_log(window=1)
+        log.extend(["a", "b"])
+        assert log[0] == "a"
+
+        log.append("c")
+        assert log[1] == "b"
+        assert list(log) == ["a", "b", "c"]
+
+    def test_index_out_of_range(self) -> None:
+        """Test that out-of-range positions raise IndexError."""
+        log = create_text_log(window=2)
+        log.append("a")
+
+        with pytest.raises(IndexError):
+            log[1]
+        with pytest.raises(IndexError):
+            log[-2]
+
+    def test_invalid_window(self) -> None:
+        """Test that a window smaller than one item is rejected."""
+        with pytest.raises(ValueError, match="at least one item"):
+            create_text_log(window=0)
+
+    def test_clear(self) -> None:
+        """Test that clearing drops both memory and disk contents."""
+        log = create_text_log(window=1)
+        log.extend(["a", "b", "c"])
+        log.clear()
+
+        assert len(log) == 0
+        assert log.spilled_count == 0
+        log.append("d")
+        assert list(log) == ["d"]
+
+    def test_event_round_trip(self) -> None:
+        """Test that spilled events come back intact."""
+        log = create_event_log(window=1)
+        event = EventRecord(
+            event_type=EventType.WITCH_SAVED,
+            round_number=2,
+            phase="night",
+            message="Saved",
+            data={"target": "p2"},
+            visible_to=["p1"],
+        )
+        log.extend([event, event])
+
+        restored = log[0]
+        assert restored == event
+        assert restored.is_visible_to("p1")
+        assert not restored.is_visible_to("p2")
+
+    def test_event_logger_queries_reach_spilled_events(self) -> None:
+        """Test that logger queries page spilled events back in."""
+        logger = EventLogger(window=2)
+        for i in range(10):
+            logger.create_event(EventType.MESSAGE, i, "day", f"Message {i}")
+        logger.create_event(EventType.WITCH_SAVED, 10, "night", "Secret", visible_to=["p1"])
+
+        assert logger.events.spilled_count == 9
+        assert logger.get_events_by_type(EventType.MESSAGE, round_number=3)[0].message == (
+            "Message 3"
+        )
+        assert len(logger.get_events_for_player("p1")) == 11
+        assert len(logger.get_events_for_player("p2")) == 10
@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+from collections.abc import Callable, Iterator
+
+import pytest
+from logfire.testing import CaptureLogfire
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.agent import LLMAgent
+from llm_werewolf.core.tracing import JsonLinesSpanExporter, span_exporter, enable_tracing
+
+
+@pytest.fixture
+def play_traced(
+    new_game: Callable[..., GameEngine], llm_agent: Callable[[str], LLMAgent]
+) -> Callable[[], None]:
+    def play() -> None:
+        new_game([llm_agent(f"P{i}") for i in range(6)], seed=3, play=True)
+
+    return play
+
+
+@pytest.fixture
+def traced(capfire: CaptureLogfire) -> Iterator[CaptureLogfire]:
+    enable_tracing()
+    yield capfire
+    enable_tracing(False)
+
+
+def test_spans_nest_from_game_to_llm_call(
+    traced: CaptureLogfire, play_traced: Callable[[], None]
+) -> None:
+    """Test that LLM calls sit under decisions, phases, rounds and one game span."""
+    play_traced()
+    spans = {span.context.span_id: span for span in traced.exporter.exported_spans}
+
+    def parent_name(span: object) -> str:
+        parent = spans.get(span.parent.span_id) if span.parent else None
+        return parent.attributes["logfire.msg_template"] if parent else ""
+
+    by_template: dict[str, list] = {}
+    for span in spans.values():
+        if span.attributes.get("logfire.span_type") == "span":
+            by_template.setdefault(span.attributes["logfire.msg_template"], []).append(span)
+
+    assert len(by_template["game"]) == 1
+    assert by_template["game"][0].attributes["winner"]
+    assert {parent_name(span) for span in by_template["round {round}"]} == {"game"}
+    assert {parent_name(span) for span in by_template["{phase} phase"]} == {"round {round}"}
+    assert {parent_name(span) for span in by_template["llm call {model}"]} == {
+        "decision {decision} by {player}"
+    }
+
+    decisions = by_template["decision {decision} by {player}"]
+    assert {parent_name(span) for span in decisions} == {"{phase} phase"}
+    assert {"speech", "target"} <= {span.attributes["decision"] for span in decisions}
+    assert all(span.attributes["model"] == "fake" for span in decisions)
+
+    call = by_template["llm call {model}"][0]
+    assert call.attributes["prompt_tokens"] == 100
+    assert call.attributes["retries"] == 1
+    assert call.attributes["player"].startswith("P")
+
+
+def test_spans_export_to_a_file_or_a_collector(
+    traced: CaptureLogfire, play_traced: Callable[[], None], tmp_path: Path
+) -> None:
+    """Test that a file target gets one JSON line per span and a URL an OTLP exporter."""
+    play_traced()
+    spans = traced.exporter.exported_spans
+    exporter = span_exporter(str(tmp_path / "traces" / "game.jsonl"))
+    assert isinstance(exporter, JsonLinesSpanExporter)
+    exporter.export(spans)
+
+    lines = (tmp_path / "traces" / "game.jsonl").read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == [span.name for span in spans]
+    assert isinstance(span_exporter("http://localhost:4318/v1/traces"), OTLPSpanExporter)
+
+
+def test_no_spans_until_tracing_is_enabled(
+    capfire: CaptureLogfire, play_traced: Callable[[], None]
+) -> None:
+    """Test that games are not traced unless tracing was turned on."""
+    play_traced()
+    assert not capfire.exporter.exported_spans
+
+
+def test_werewolf_discussion_spans_carry_each_wolf_role(
+    traced: CaptureLogfire, new_game: Callable[..., GameEngine]
+) -> None:
+    """Test that werewolf discussion spans are tagged with the speaker's own role."""
+    engine = new_game(seed=3, play=True)
+    roles = {p.name: p.get_role_name() for p in engine.game_state.players}
+
+    discussion = [
+        span
+        for span in traced.exporter.exported_spans
+        if span.attributes.get("logfire.span_type") == "span"
+        and span.attributes.get("decision") == "werewolf_discussion"
+    ]
+    assert discussion
+    assert all(span.attributes["role"] == roles[span.attributes["player"]] for span in discussion)
+    assert {span.attributes["role"] for span in discussion} - {"Werewolf"}
@@ -0,0 +1,66 @@
+"""Tests for core/transcript.py module."""
+
+import pytest
+
+from llm_werewolf.core.spill_log import PAGE_SIZE
+from llm_werewolf.core.transcript import Transcript
+
+
+class TestTranscript:
+    """Tests for Transcript class."""
+
+    def test_render_matches_join(self) -> None:
+        """Test that the cached rendering grows with the transcript."""
+        transcript = Transcript()
+        assert transcript.render() == ""
+
+        transcript.append("Alice: hello")
+        assert transcript.render() == "Alice: hello"
+
+        transcript.extend(["", "Bob: hi"])
+        assert transcript.render() == "Alice: hello\n\nBob: hi"
+        assert transcript.render() is transcript.render()
+
+    def test_render_includes_spilled_lines(self) -> None:
+        """Test that lines spilled before the first render are still rendered."""
+        transcript = Transcript(window=2)
+        lines = [f"P{i}: speech {i}" for i in range(PAGE_SIZE + 3)]
+        transcript.extend(lines)
+
+        assert transcript.spilled_count > 0
+        assert transcript.render() == "\n".join(lines)
+
+    def test_since_cursor(self) -> None:
+        """Test that a cursor returns a view of only the newer lines."""
+        transcript = Transcript(window=2)
+        transcript.extend(["a", "bb"])
+        cursor = transcript.cursor
+        transcript.render()
+        transcript.extend(["ccc", "d"])
+
+        newer = transcript.since(cursor)
+        assert list(newer) == ["ccc", "d"]
+        assert newer[-1] == "d"
+        assert newer[:1] == ["ccc"]
+        assert newer.render() == "ccc\nd"
+        assert transcript.since(0).render() == "a\nbb\nccc\nd"
+        assert transcript.since(transcript.cursor).render() == ""
+
+        transcript.append("e")
+        assert len(newer) == 2
+        with pytest.raises(IndexError):
+            transcript.since(transcript.cursor + 1)
+        with pytest.raises(IndexError):
+            newer[2]
+
+    def test_clear_resets_rendering(self) -> None:
+        """Test that clearing drops the cached rendering."""
+        transcript = Transcript()
+        transcript.extend(["a", "b"])
+        transcript.render()
+        transcript.clear()
+
+        assert transcript.render() == ""
+        transcript.append("c")
+        assert transcript.render() == "c"
+        assert list(transcript.since(0)) == ["c"]
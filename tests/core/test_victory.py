@@ -1,6 +1,6 @@
 """Tests for core/victory.py module."""
 
-from llm_werewolf.core.roles import Seer, Witch, Villager, Werewolf
+from llm_werewolf.core.roles import Seer, Witch, Villager, Werewolf, BloodMoonApostle
 from llm_werewolf.core.player import Player
 from llm_werewolf.core.victory import VictoryChecker
 from llm_werewolf.core.game_state import GameState
@@ -353,3 +353,91 @@ class TestVictoryChecker:
         losing_players = checker.get_losing_players()
 
         assert len(losing_players) == 0
+
+    def test_tallies_follow_kill_and_revive(self) -> None:
+        """Test victory is re-evaluated after players die or are revived."""
+        players = [
+            self.create_mock_player("w1", "Wolf1", Werewolf),
+            self.create_mock_player("v1", "Villager1", Villager),
+            self.create_mock_player("v2", "Villager2", Villager),
+        ]
+        game_state = GameState(players=players)
+        checker = VictoryChecker(game_state)
+
+        assert checker.check_victory().has_winner is False
+
+        players[1].kill()
+        result = checker.check_victory()
+        assert result.winner_camp == "werewolf"
+        assert result.winner_ids == ["w1"]
+
+        players[1].revive()
+        assert checker.check_victory().has_winner is False
+
+        players[0].kill()
+        assert checker.check_victory().winner_camp == "villager"
+
+    def test_repeated_kill_does_not_double_count(self) -> None:
+        """Test killing an already dead player leaves the tallies unchanged."""
+        players = [
+            self.create_mock_player("w1", "Wolf1", Werewolf),
+            self.create_mock_player("v1", "Villager1", Villager),
+            self.create_mock_player("v2", "Villager2", Villager),
+            self.create_mock_player("v3", "Villager3", Villager),
+        ]
+        game_state = GameState(players=players)
+        checker = VictoryChecker(game_state)
+
+        players[1].kill()
+        players[1].kill()
+
+        assert checker.check_victory().has_winner is False
+
+    def test_result_cached_until_state_change(self) -> None:
+        """Test the same result object is returned until a player changes."""
+        players = [
+            self.create_mock_player("w1", "Wolf1", Werewolf),
+            self.create_mock_player("v1", "Villager1", Villager),
+            self.create_mock_player("v2", "Villager2", Villager),
+        ]
+        game_state = GameState(players=players)
+        checker = VictoryChecker(game_state)
+
+        first = checker.check_victory()
+        assert checker.check_victory() is first
+
+        players[2].kill()
+        assert checker.check_victory() is not first
+
+    def test_blood_moon_apostle_transformation(self) -> None:
+        """Test untransformed apostle only counts toward parity after transforming."""
+        players = [
+            self.create_mock_player("a1", "Apostle", BloodMoonApostle),
+            self.create_mock_player("v1", "Villager1", Villager),
+        ]
+        game_state = GameState(players=players)
+        checker = VictoryChecker(game_state)
+
+        assert checker.check_victory().has_winner is False
+
+        players[0].role.transform()
+        result = checker.check_victory()
+        assert result.winner_camp == "werewolf"
+        assert result.winner_ids == ["a1"]
+
+    def test_lover_link_after_creation(self) -> None:
+        """Test linking lovers after the checker was created is picked up."""
+        players = [
+            self.create_mock_player("p1", "Player1", Villager),
+            self.create_mock_player("p2", "Player2", Werewolf),
+            self.create_mock_player("p3", "Player3", Villager, is_alive=False),
+        ]
+        game_state = GameState(players=players)
+        checker = VictoryChecker(game_state)
+
+        assert checker.check_victory().winner_camp == "werewolf"
+
+        players[0].set_lover("p2")
+        players[1].set_lover("p1")
+
+        assert checker.check_victory().winner_camp == "lover"
@@ -0,0 +1,115 @@
+"""Tests for core/sim/batch.py and core/sim/balance.py modules."""
+
+import pytest
+
+from llm_werewolf.core.roles import (
+    Cupid,
+    Guard,
+    Witch,
+    Villager,
+    Werewolf,
+    WolfBeauty,
+    BloodMoonApostle,
+)
+
+np = pytest.importorskip("numpy")
+
+from llm_werewolf.core.sim import (  # noqa: E402
+    Outcome,
+    BalanceReport,
+    ArrayGameState,
+    BatchSimulator,
+    sweep_presets,
+    shuffled_batch,
+    simulate_composition,
+)
+
+ROLES = [Werewolf, Werewolf, WolfBeauty, Villager, Villager, Villager, Witch, Guard, Cupid]
+
+
+def test_shuffled_batch_keeps_composition() -> None:
+    """Test that every game in a shuffled batch has the same roles."""
+    state = shuffled_batch(ROLES, 50, np.random.default_rng(0))
+
+    assert state.role_id.shape == (50, len(ROLES))
+    counts = np.sort(state.role_id, axis=1)
+    assert (counts == counts[0]).all()
+    assert not (state.role_id == state.role_id[0]).all()
+
+
+def test_run_resolves_every_game() -> None:
+    """Test that random play ends every game with a winner."""
+    state = shuffled_batch(ROLES, 500, np.random.default_rng(1))
+    result = BatchSimulator(state, rng=np.random.default_rng(2)).run()
+
+    assert (result.outcomes != Outcome.NONE).all()
+    assert (result.rounds >= 1).all()
+    assert (result.survivors == state.alive.sum(axis=1)).all()
+    assert (state.outcomes() == result.outcomes).all()
+
+
+def test_finished_games_are_masked() -> None:
+    """Test that a game which is already over is left untouched."""
+    state = shuffled_batch(ROLES, 20, np.random.default_rng(3))
+    wolves = np.isin(state.role_id, [0, 1])
+    state.alive[0] &= ~wolves[0]
+    before = state.alive[0].copy()
+
+    result = BatchSimulator(state, rng=np.random.default_rng(4)).run()
+
+    assert result.outcomes[0] == Outcome.VILLAGER
+    assert result.rounds[0] == 0
+    assert (state.alive[0] == before).all()
+
+
+def test_round_limit_leaves_games_unfinished() -> None:
+    """Test that games still running at the round limit report no outcome."""
+    state = shuffled_batch([Werewolf, *[Villager] * 11], 10, np.random.default_rng(5))
+    result = BatchSimulator(state, rng=np.random.default_rng(6), max_rounds=1).run()
+
+    wolf_alive = (state.alive & (state.role_id == 0)).any(axis=1)
+    assert wolf_alive.any()
+    assert (result.outcomes[wolf_alive] == Outcome.NONE).all()
+    assert (result.rounds == 1).all()
+
+
+def test_lone_blood_moon_apostle_transforms_and_hunts_next_night() -> None:
+    """Test that the Apostle transforms once the werewolves are dead and then hunts."""
+    state = ArrayGameState.from_roles([[Werewolf, BloodMoonApostle, *[Villager] * 4]] * 2)
+    state.alive[0, 0] = False
+    simulator = BatchSimulator(state, rng=np.random.default_rng(9))
+    active = np.ones(2, dtype=bool)
+
+    simulator.run_night(active, 1)
+    assert state.parity[:, 1].tolist() == [True, False]
+    assert state.werewolf_target[0] == -1
+    assert state.werewolf_target[1] != -1
+
+    simulator.run_night(active, 2)
+    assert state.werewolf_target[0] != -1
+
+
+def test_simulate_composition_is_reproducible() -> None:
+    """Test that a seeded simulation gives the same report twice."""
+    names = ["Werewolf", "Werewolf", "Villager", "Villager", "Seer", "Witch"]
+    first = simulate_composition(names, games=200, rng=np.random.default_rng(7))
+    second = simulate_composition(names, games=200, rng=np.random.default_rng(7))
+
+    assert first == second
+    assert first.num_players == 6
+    total = (
+        first.werewolf_win_rate
+        + first.villager_win_rate
+        + first.lover_win_rate
+        + first.unfinished_rate
+    )
+    assert total == pytest.approx(1.0)
+
+
+def test_sweep_presets_reports_every_player_count() -> None:
+    """Test that the preset sweep returns one report per player count."""
+    reports = sweep_presets(range(6, 21), games=50, seed=8)
+
+    assert [report.num_players for report in reports] == list(range(6, 21))
+    assert all(isinstance(report, BalanceReport) for report in reports)
+    assert all(report.games == 50 for report in reports)
@@ -0,0 +1,192 @@
+"""Tests for core/sim/kernel.py module."""
+
+import pytest
+
+from llm_werewolf.core import GameEngine
+from llm_werewolf.core.roles import (
+    Elder,
+    Guard,
+    Idiot,
+    Witch,
+    Hunter,
+    Villager,
+    Werewolf,
+    WolfBeauty,
+    BloodMoonApostle,
+)
+from llm_werewolf.core.player import Player
+from llm_werewolf.core.victory import VictoryChecker
+from llm_werewolf.core.game_state import GameState
+
+np = pytest.importorskip("numpy")
+
+from llm_werewolf.core.sim import NO_PLAYER, Outcome, ArrayGameState  # noqa: E402
+
+ROLES = [Werewolf, Werewolf, WolfBeauty, Villager, Villager, Witch, Guard, Elder, Idiot]
+
+
+def make_state(roles: list[type], dead: tuple[int, ...] = ()) -> GameState:
+    """Create an object-model game state with agent-less players."""
+    players = [Player(f"player_{i + 1}", f"P{i + 1}", role) for i, role in enumerate(roles)]
+    for i in dead:
+        players[i].kill()
+    return GameState(players)
+
+
+def make_engine(state: GameState) -> GameEngine:
+    """Create a silent engine around an existing game state."""
+    engine = GameEngine()
+    engine.on_event = lambda event: None
+    engine.game_state = state
+    return engine
+
+
+def alive_mask(state: GameState) -> list[bool]:
+    """Get the alive flags of an object-model game state."""
+    return [p.is_alive() for p in state.players]
+
+
+@pytest.mark.parametrize(
+    ("roles", "dead", "lovers"),
+    [
+        ([Werewolf, Werewolf, Villager, Villager], (), None),
+        ([Werewolf, Werewolf, Villager], (), None),
+        ([Werewolf, Villager, Villager, Villager], (), None),
+        ([Werewolf, Villager, Villager], (0,), None),
+        ([Werewolf, Villager, Villager, Villager], (2, 3), (0, 1)),
+        ([Werewolf, Villager, Villager, Villager], (3,), (0, 1)),
+        ([BloodMoonApostle, Werewolf, Villager, Villager, Villager], (4,), None),
+        ([BloodMoonApostle, Villager], (), None),
+    ],
+)
+def test_victory_matches_object_model(
+    roles: list[type], dead: tuple[int, ...], lovers: tuple[int, int] | None
+) -> None:
+    """Test that victory results match VictoryChecker."""
+    state = make_state(roles, dead)
+    if lovers:
+        first, second = (state.players[i] for i in lovers)
+        first.set_lover(second.player_id)
+        second.set_lover(first.player_id)
+
+    expected = VictoryChecker(state).check_victory()
+    result = ArrayGameState.from_game_states([state]).check_victory()
+
+    assert result == expected
+
+
+def test_vote_counts_match_object_model() -> None:
+    """Test that weighted vote counts match GameState.get_vote_counts."""
+    state = make_state(ROLES)
+    state.set_sheriff("player_4")
+    for voter, target in [(0, 3), (1, 3), (3, 0), (4, 0), (5, 6)]:
+        state.add_vote(f"player_{voter + 1}", f"player_{target + 1}")
+    state.raven_marked = "player_9"
+
+    counts = ArrayGameState.from_game_states([state]).vote_counts()[0]
+    expected = state.get_vote_counts()
+
+    assert {f"player_{i + 1}": c for i, c in enumerate(counts) if c} == expected
+
+
+@pytest.mark.parametrize(
+    ("werewolf_target", "saved", "protected", "poisoned"),
+    [
+        ("player_4", None, None, None),
+        ("player_4", "player_4", None, None),
+        ("player_4", None, "player_4", None),
+        ("player_8", None, None, None),
+        ("player_4", None, None, "player_1"),
+        ("player_4", None, None, "player_3"),
+    ],
+)
+def test_night_resolution_matches_object_model(
+    werewolf_target: str, saved: str | None, protected: str | None, poisoned: str | None
+) -> None:
+    """Test that night deaths match DeathHandlerMixin.resolve_deaths."""
+    state = make_state(ROLES)
+    state.players[2].role.charmed_player = "player_5"
+    state.players[3].set_lover("player_6")
+    state.players[5].set_lover("player_4")
+    state.werewolf_target = werewolf_target
+    state.witch_saved_target = saved
+    state.guard_protected = protected
+    state.witch_poison_target = poisoned
+
+    batch = ArrayGameState.from_game_states([state])
+    make_engine(state).resolve_deaths()
+    batch.resolve_night(np.random.default_rng(0))
+
+    assert batch.alive[0].tolist() == alive_mask(state)
+    assert batch.lives[0, 7] == state.players[7].role.lives
+
+
+def test_vote_elimination_matches_object_model() -> None:
+    """Test that eliminating the top vote-getter matches the voting phase."""
+    state = make_state(ROLES)
+    state.players[2].role.charmed_player = "player_5"
+    state.players[7].set_lover("player_1")
+    state.players[0].set_lover("player_8")
+    for voter in range(5):
+        state.add_vote(f"player_{voter + 1}", "player_8")
+
+    batch = ArrayGameState.from_game_states([state])
+    eliminated = batch.resolve_vote(np.random.default_rng(0))
+    make_engine(state)._eliminate_voted_player(state.players[7])
+
+    assert eliminated.tolist() == [7]
+    assert batch.alive[0].tolist() == alive_mask(state)
+    assert batch.disabled[0].tolist() == [p.role.disabled for p in state.players]
+
+
+def test_idiot_is_revealed_instead_of_eliminated() -> None:
+    """Test that an unrevealed Idiot survives the vote but loses their vote."""
+    batch = ArrayGameState.from_roles([ROLES])
+    batch.votes[0, :3] = 8
+
+    eliminated = batch.resolve_vote(np.random.default_rng(0))
+
+    assert eliminated.tolist() == [NO_PLAYER]
+    assert batch.alive[0, 8]
+    assert batch.revealed[0, 8]
+    assert not batch.can_vote()[0, 8]
+
+
+def test_tied_vote_eliminates_no_one() -> None:
+    """Test that a tie leaves everyone alive."""
+    batch = ArrayGameState.from_roles([ROLES])
+    batch.votes[0, [0, 1]] = [3, 4]
+
+    assert batch.resolve_vote(np.random.default_rng(0)).tolist() == [NO_PLAYER]
+    assert batch.alive.all()
+
+
+def test_hunter_shoots_unless_poisoned() -> None:
+    """Test that a dead Hunter takes one player down unless poisoned."""
+    roles = [Werewolf, Hunter, Villager, Villager, Villager]
+    batch = ArrayGameState.from_roles([roles, roles])
+    batch.werewolf_target[0] = 1
+    batch.witch_poison[1] = 1
+
+    batch.resolve_night(np.random.default_rng(0))
+
+    assert batch.alive.sum(axis=1).tolist() == [3, 4]
+    assert batch.ability_used[:, 1].all()
+
+
+def test_batch_outcomes() -> None:
+    """Test that outcomes are computed per game in one call."""
+    roles = [Werewolf, Villager, Villager]
+    batch = ArrayGameState.from_roles([roles, roles, roles])
+    batch.kill(np.array([0, 1]), np.array([0, 1]))
+
+    assert batch.outcomes().tolist() == [Outcome.VILLAGER, Outcome.WEREWOLF, Outcome.NONE]
+
+
+def test_blood_moon_apostle_transform_counts_for_parity() -> None:
+    """Test that a transformed Blood Moon Apostle counts toward parity."""
+    batch = ArrayGameState.from_roles([[BloodMoonApostle, Villager]])
+    assert batch.outcomes().tolist() == [Outcome.NONE]
+
+    batch.transform(np.array([0]), np.array([0]))
+    assert batch.outcomes().tolist() == [Outcome.WEREWOLF]